@@ -14,8 +14,15 @@ def create_app(config_name='development'):
     # Load configuration
     app.config.from_object(config[config_name])
     
-    # Initialize extensions
+    # Initialize extensions (engine options come from the DB_ENGINE profile,
+    # the optional read replica is registered as an extra bind)
+    from app.engine import configure_engine, init_engine
+    from app.replica import configure_replica, init_replica
+    configure_engine(app)
+    configure_replica(app)
     db.init_app(app)
+    init_engine(app)
+    init_replica(app)
     ma.init_app(app)
     login_manager.init_app(app)
     migrate.init_app(app, db)
@@ -31,6 +38,18 @@ def create_app(config_name='development'):
     # Register blueprints
     register_blueprints(app)
     
+    # Response encoding (orjson when installed)
+    from app.json_provider import init_json
+    init_json(app)
+    
+    # Per-request SQL and serialization timing
+    from app.instrumentation import init_instrumentation
+    init_instrumentation(app)
+    
+    # Register CLI commands
+    from app.commands import register_commands
+    register_commands(app)
+    
     # Health check endpoint
     @app.route('/health')
     def health_check():
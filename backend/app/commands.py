@@ -0,0 +1,147 @@
+"""
+Flask CLI commands
+
+Maintenance commands run with `flask <group> <command>`.
+"""
+import click
+from flask.cli import AppGroup
+
+rounds_cli = AppGroup('rounds', help='Round maintenance commands.')
+email_cli = AppGroup('email', help='Email outbox commands.')
+imports_cli = AppGroup('imports', help='CSV/XLSX import commands.')
+holes_cli = AppGroup('holes', help='Hole maintenance commands.')
+
+
+@rounds_cli.command('backfill-summary')
+def backfill_round_summary():
+    """Recompute holes_played, expected_holes and is_complete for all rounds"""
+    from app.services.round_service import RoundService
+    
+    updated = RoundService.backfill_completion()
+    click.echo(f"Backfilled completion summary for {updated} round(s)")
+
+
+@rounds_cli.command('recalculate-points')
+@click.option('--course-id', type=int, help='Only rounds played on this course.')
+@click.option('--tee-set-id', type=int, help='Only rounds played from this tee set.')
+@click.option('--hole-id', type=int, help='Only scores on this hole.')
+@click.option('--date-from', type=click.DateTime(formats=['%Y-%m-%d']), help='Only rounds played on or after this date.')
+@click.option('--date-to', type=click.DateTime(formats=['%Y-%m-%d']), help='Only rounds played on or before this date.')
+@click.option('--batch-size', type=int, default=5000, show_default=True, help='Rows per fetch and UPDATE batch.')
+def recalculate_points(course_id, tee_set_id, hole_id, date_from, date_to, batch_size):
+    """Recalculate Stableford points and round totals in bulk"""
+    from app.services.score_service import ScoreService
+    
+    try:
+        result = ScoreService.bulk_recalculate_points(
+            course_id=course_id,
+            tee_set_id=tee_set_id,
+            hole_id=hole_id,
+            date_from=date_from.date() if date_from else None,
+            date_to=date_to.date() if date_to else None,
+            batch_size=batch_size
+        )
+    except ValueError as e:
+        raise click.BadParameter(str(e))
+    
+    click.echo(
+        f"Checked {result['scores_checked']} score(s): updated {result['scores_updated']} "
+        f"score(s) across {result['rounds_updated']} round(s)"
+    )
+
+
+@email_cli.command('send-outbox')
+@click.option('--max-batches', type=int, default=None, help='Stop after this many batches.')
+def send_outbox(max_batches):
+    """Send all due messages in the email outbox and exit"""
+    from app.services.email_outbox_service import EmailOutboxService
+    
+    result = EmailOutboxService.send_due(max_batches=max_batches)
+    click.echo(
+        f"Sent {result['sent']} email(s), {result['retried']} scheduled for retry, "
+        f"{result['failed']} failed permanently"
+    )
+
+
+@email_cli.command('worker')
+@click.option('--workers', type=int, default=None, help='Worker threads (defaults to MAIL_OUTBOX_WORKERS, minimum 1).')
+def run_outbox_worker(workers):
+    """Run outbox worker threads in the foreground until interrupted"""
+    import time
+    from flask import current_app
+    from app.services.email_outbox_service import EmailOutboxWorker
+    
+    app = current_app._get_current_object()
+    count = EmailOutboxWorker.start(app, workers=max(workers or app.config.get('MAIL_OUTBOX_WORKERS', 1), 1))
+    click.echo(f"Started {count} email outbox worker(s); press Ctrl+C to stop")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        EmailOutboxWorker.stop()
+
+
+
+@imports_cli.command('run')
+def run_imports():
+    """Run all pending import jobs and exit"""
+    from app.services.import_service import ImportService
+    
+    count = ImportService.run_pending()
+    click.echo(f"Ran {count} import job(s)")
+
+
+@imports_cli.command('file')
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--kind', required=True, help='What the file contains (clubs, courses, holes, tee_sets, tee_positions, rounds).')
+def import_file(path, kind):
+    """Import a local CSV/XLSX file in the foreground"""
+    import os
+    from werkzeug.datastructures import FileStorage
+    from app.services.import_service import ImportService
+    
+    try:
+        with open(path, 'rb') as stream:
+            job = ImportService.create_job(FileStorage(stream, filename=os.path.basename(path)), kind, notify=False)
+    except ValueError as e:
+        raise click.BadParameter(str(e))
+    
+    job = ImportService.run_job(job['id'])
+    click.echo(
+        f"Import {job['status']}: {job['rows_imported']} row(s) imported, {job['rows_failed']} failed"
+    )
+    for error in job['errors']:
+        click.echo(f"  row {error['row']}: {error['errors']}")
+    if job['last_error']:
+        click.echo(f"  {job['last_error']}")
+
+
+
+@holes_cli.command('rebuild-stats')
+@click.option('--check', is_flag=True, help='Only compare the statistics with the scores; write nothing.')
+def rebuild_hole_statistics(check):
+    """Recompute materialized hole statistics from all scores"""
+    from app.services.hole_statistics_service import HoleStatisticsService
+    
+    if check:
+        mismatches = HoleStatisticsService.check()
+        for mismatch in mismatches:
+            click.echo(
+                f"hole {mismatch['hole_id']}, {mismatch['strokes']} strokes: "
+                f"stored {mismatch['stored']}, actual {mismatch['actual']}"
+            )
+        click.echo(f"Found {len(mismatches)} mismatching count(s)")
+        if mismatches:
+            raise SystemExit(1)
+        return
+    
+    rows = HoleStatisticsService.rebuild()
+    click.echo(f"Rebuilt hole statistics: {rows} count row(s)")
+
+
+def register_commands(app):
+    """Register CLI command groups with the application"""
+    app.cli.add_command(rounds_cli)
+    app.cli.add_command(email_cli)
+    app.cli.add_command(imports_cli)
+    app.cli.add_command(holes_cli)
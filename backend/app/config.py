@@ -2,6 +2,7 @@
 Application configuration
 """
 import os
+import tempfile
 from datetime import timedelta
 from dotenv import load_dotenv
 
@@ -9,6 +10,68 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+# Database engine settings shared by every profile
+ENGINE_DEFAULTS = {
+    'pool': 'queue',              # 'queue', 'null' (no pooling) or 'default' (SQLAlchemy's choice)
+    'pool_size': 5,
+    'max_overflow': 10,
+    'pool_timeout': 30,           # Seconds to wait for a free connection
+    'pool_recycle': 300,          # Seconds before a connection is replaced
+    'pool_use_lifo': False,       # Reuse the most recent connection so surplus ones go idle and expire
+    'pre_ping': 'always',         # 'always', 'idle' (only after ping_idle_seconds unused) or 'none'
+    'ping_idle_seconds': 30,
+    'statement_timeout_ms': None,  # PostgreSQL statement_timeout
+    'pgbouncer': False,           # PgBouncer transaction mode: no startup options, SET LOCAL per transaction
+}
+
+# Engine profiles per environment and worker model, chosen with DB_ENGINE_PROFILE
+ENGINE_PROFILES = {
+    # Let SQLAlchemy pick the pool (in-memory SQLite uses a single static connection)
+    'testing': {'pool': 'default'},
+    # Local server: small pool, ping on every checkout, no statement limit
+    'development': {},
+    # One request at a time per process (gunicorn sync workers); overflow covers background threads
+    'sync': {
+        'pool_size': 1, 'max_overflow': 3, 'pool_timeout': 10, 'pool_use_lifo': True,
+        'pre_ping': 'idle', 'statement_timeout_ms': 30000,
+    },
+    # Many request threads per process (gunicorn gthread workers)
+    'threaded': {
+        'pool_size': 10, 'max_overflow': 20, 'pool_timeout': 10, 'pool_use_lifo': True,
+        'pre_ping': 'idle', 'statement_timeout_ms': 30000,
+    },
+    # Behind PgBouncer in transaction mode: PgBouncer pools, the app opens a connection per checkout
+    'pgbouncer': {'pool': 'null', 'pre_ping': 'none', 'statement_timeout_ms': 30000, 'pgbouncer': True},
+}
+
+# Environment variables overriding single profile settings
+ENGINE_OVERRIDES = {
+    'DB_POOL_SIZE': ('pool_size', int),
+    'DB_MAX_OVERFLOW': ('max_overflow', int),
+    'DB_POOL_TIMEOUT': ('pool_timeout', int),
+    'DB_POOL_RECYCLE': ('pool_recycle', int),
+    'DB_PRE_PING': ('pre_ping', str),
+    'DB_STATEMENT_TIMEOUT': ('statement_timeout_ms', int),
+}
+
+
+def engine_profile(name):
+    """
+    Resolve an engine profile with its environment overrides.
+
+    gunicorn.conf.py picks the profile and DB_POOL_SIZE from the worker model,
+    so every worker process holds at most pool_size + max_overflow connections.
+    """
+    if name not in ENGINE_PROFILES:
+        raise ValueError(f"Unknown DB_ENGINE_PROFILE '{name}'; use one of {', '.join(ENGINE_PROFILES)}")
+
+    settings = {**ENGINE_DEFAULTS, **ENGINE_PROFILES[name], 'name': name}
+    for variable, (key, cast) in ENGINE_OVERRIDES.items():
+        if os.environ.get(variable):
+            settings[key] = cast(os.environ[variable])
+    return settings
+
+
 class Config:
     """Base configuration class"""
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'dev-secret-key-change-in-production'
@@ -30,11 +93,24 @@ class Config:
     # Upload settings
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max file size
     
-    # Database settings
-    SQLALCHEMY_ENGINE_OPTIONS = {
-        'pool_pre_ping': True,
-        'pool_recycle': 300,
-    }
+    # Database settings: pool and timeouts come from the engine profile (see
+    # app/engine.py); SQLALCHEMY_ENGINE_OPTIONS adds driver-specific options
+    DB_ENGINE = engine_profile(os.environ.get('DB_ENGINE_PROFILE', 'development'))
+    SQLALCHEMY_ENGINE_OPTIONS = {}
+    
+    # Optional read replica for read-only service methods (see app/replica.py);
+    # clients that wrote keep reading the primary for REPLICA_STICKY_SECONDS
+    SQLALCHEMY_REPLICA_URI = os.environ.get('DATABASE_REPLICA_URL')
+    REPLICA_STICKY_SECONDS = int(os.environ.get('REPLICA_STICKY_SECONDS', 5))
+    
+    # Seconds an active non-admin user's flags may be reused outside a JWT request
+    ADMIN_STATUS_CACHE_TTL = int(os.environ.get('ADMIN_STATUS_CACHE_TTL', 5))
+    
+    # Response encoder: 'auto' (orjson when installed), 'orjson' or 'stdlib'
+    JSON_BACKEND = os.environ.get('JSON_BACKEND', 'auto')
+    
+    # Request instrumentation (Server-Timing headers, timing logs, /api/v1/metrics)
+    INSTRUMENTATION_ENABLED = os.environ.get('INSTRUMENTATION_ENABLED', 'true').lower() in ['true', 'on', '1']
     
     # Email configuration
     MAIL_SERVER = os.environ.get('MAIL_SERVER', 'smtp.gmail.com')
@@ -46,6 +122,27 @@ class Config:
     MAIL_DEFAULT_SENDER = os.environ.get('MAIL_DEFAULT_SENDER') or MAIL_USERNAME
     MAIL_MAX_EMAILS = int(os.environ.get('MAIL_MAX_EMAILS', 10))
     MAIL_SUPPRESS_SEND = os.environ.get('MAIL_SUPPRESS_SEND', 'false').lower() in ['true', 'on', '1']
+    
+    # Course catalog snapshot cache: 'memory' (per-process LRU), 'redis' or 'none'
+    COURSE_CACHE_BACKEND = os.environ.get('COURSE_CACHE_BACKEND', 'memory')
+    COURSE_CACHE_MAX_ENTRIES = int(os.environ.get('COURSE_CACHE_MAX_ENTRIES', 512))
+    COURSE_CACHE_MAX_BYTES = int(os.environ.get('COURSE_CACHE_MAX_BYTES', 32 * 1024 * 1024))
+    COURSE_CACHE_REDIS_URL = os.environ.get('COURSE_CACHE_REDIS_URL', 'redis://localhost:6379/0')
+    COURSE_CACHE_TTL = int(os.environ.get('COURSE_CACHE_TTL', 86400))  # Seconds (redis only)
+    
+    # Email outbox (batches of MAIL_MAX_EMAILS per SMTP connection)
+    MAIL_OUTBOX_WORKERS = int(os.environ.get('MAIL_OUTBOX_WORKERS', 2))  # 0 = only `flask email worker`
+    MAIL_OUTBOX_MAX_ATTEMPTS = int(os.environ.get('MAIL_OUTBOX_MAX_ATTEMPTS', 5))
+    MAIL_OUTBOX_RETRY_DELAY = int(os.environ.get('MAIL_OUTBOX_RETRY_DELAY', 30))  # Seconds, doubled per attempt
+    MAIL_OUTBOX_POLL_INTERVAL = int(os.environ.get('MAIL_OUTBOX_POLL_INTERVAL', 5))
+    MAIL_OUTBOX_CLAIM_TIMEOUT = int(os.environ.get('MAIL_OUTBOX_CLAIM_TIMEOUT', 300))
+    
+    # CSV/XLSX imports (streamed and written in chunks by background workers)
+    IMPORT_UPLOAD_FOLDER = os.environ.get('IMPORT_UPLOAD_FOLDER') or os.path.join(tempfile.gettempdir(), 'rgs-imports')
+    IMPORT_WORKERS = int(os.environ.get('IMPORT_WORKERS', 1))  # 0 = only `flask imports run`
+    IMPORT_CHUNK_SIZE = int(os.environ.get('IMPORT_CHUNK_SIZE', 1000))  # Rows per bulk insert and commit
+    IMPORT_MAX_ERRORS = int(os.environ.get('IMPORT_MAX_ERRORS', 500))  # Row errors kept per job
+    IMPORT_POLL_INTERVAL = int(os.environ.get('IMPORT_POLL_INTERVAL', 5))
 
 
 class DevelopmentConfig(Config):
@@ -62,10 +159,16 @@ class TestingConfig(Config):
     TESTING = True
     WTF_CSRF_ENABLED = False
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
+    SQLALCHEMY_REPLICA_URI = None
+    DB_ENGINE = engine_profile('testing')
     # Use faster password hashing for tests
     BCRYPT_LOG_ROUNDS = 4
     # Disable email sending in tests
     MAIL_SUPPRESS_SEND = True
+    # Outbox is drained explicitly in tests
+    MAIL_OUTBOX_WORKERS = 0
+    # Imports are run explicitly in tests
+    IMPORT_WORKERS = 0
     # Use a simple secret for tests
     SECRET_KEY = 'test-secret-key-for-testing'
     JWT_SECRET_KEY = 'test-jwt-secret-key-for-testing'
@@ -90,11 +193,8 @@ class ProductionConfig(Config):
     PREFERRED_URL_SCHEME = 'https'
     
     # Database connection settings for production
+    DB_ENGINE = engine_profile(os.environ.get('DB_ENGINE_PROFILE', 'threaded'))
     SQLALCHEMY_ENGINE_OPTIONS = {
-        'pool_pre_ping': True,
-        'pool_recycle': 300,
-        'pool_size': 10,
-        'max_overflow': 20,
         'connect_args': {
             'sslmode': 'require'  # Require SSL for database connections
         }
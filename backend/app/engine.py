@@ -0,0 +1,229 @@
+"""
+Database engine setup
+
+Turns the DB_ENGINE profile (see app/config.py) into SQLAlchemy engine
+options and installs the behaviour plain options can't express: pinging
+only connections that sat idle, server-side statement timeouts (as a
+startup option, or per transaction behind PgBouncer) and pool metrics.
+
+Checkout wait time, timeouts and saturation are collected per process and
+exposed through /api/v1/metrics/pool.
+"""
+import threading
+import time
+from typing import Any, Dict, Optional
+from flask import Flask
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import NullPool, QueuePool
+from app.extensions import db
+
+
+class PoolMetrics:
+    """Connection checkout aggregates (per process)"""
+
+    _stats: Dict[str, float] = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def record_checkout(elapsed: float, timed_out: bool = False) -> None:
+        """
+        Fold one checkout into the aggregates.
+
+        Args:
+            elapsed: Seconds spent waiting for the connection
+            timed_out: True if no connection became free within pool_timeout
+        """
+        wait_ms = elapsed * 1000
+        with PoolMetrics._lock:
+            stats = PoolMetrics._stats
+            stats['checkouts'] = stats.get('checkouts', 0) + 1
+            stats['timeouts'] = stats.get('timeouts', 0) + int(timed_out)
+            stats['wait_ms'] = stats.get('wait_ms', 0.0) + wait_ms
+            stats['max_wait_ms'] = max(stats.get('max_wait_ms', 0.0), wait_ms)
+
+    @staticmethod
+    def record_ping(failed: bool) -> None:
+        """Count an idle-connection ping"""
+        with PoolMetrics._lock:
+            stats = PoolMetrics._stats
+            stats['pings'] = stats.get('pings', 0) + 1
+            stats['ping_failures'] = stats.get('ping_failures', 0) + int(failed)
+
+    @staticmethod
+    def snapshot(engine: Engine, settings: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Get the pool's live state and the checkout aggregates.
+
+        Args:
+            engine: Engine whose pool to inspect
+            settings: The DB_ENGINE profile the pool was built from
+
+        Returns:
+            Dictionary with the profile, live pool counts, saturation and
+            checkout wait totals and averages
+        """
+        with PoolMetrics._lock:
+            stats = dict(PoolMetrics._stats)
+
+        pool = engine.pool
+        data = {
+            'profile': settings['name'],
+            'pool_class': type(pool).__name__,
+            'checkouts': stats.get('checkouts', 0),
+            'timeouts': stats.get('timeouts', 0),
+            'wait_ms': round(stats.get('wait_ms', 0.0), 3),
+            'avg_wait_ms': round(stats.get('wait_ms', 0.0) / stats['checkouts'], 3) if stats.get('checkouts') else 0.0,
+            'max_wait_ms': round(stats.get('max_wait_ms', 0.0), 3),
+            'pings': stats.get('pings', 0),
+            'ping_failures': stats.get('ping_failures', 0),
+        }
+        if isinstance(pool, QueuePool):
+            capacity = pool.size() + max(settings['max_overflow'], 0)
+            data.update({
+                'pool_size': pool.size(),
+                'max_overflow': settings['max_overflow'],
+                'checked_out': pool.checkedout(),
+                'checked_in': pool.checkedin(),
+                'overflow': max(pool.overflow(), 0),
+                'saturation': round(pool.checkedout() / capacity, 3) if capacity else None,
+            })
+        return data
+
+    @staticmethod
+    def reset() -> None:
+        """Clear the checkout aggregates"""
+        with PoolMetrics._lock:
+            PoolMetrics._stats.clear()
+
+
+class _TimedCheckout:
+    """Pool mixin timing how long each checkout waits for a connection"""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            PoolMetrics.record_checkout(time.perf_counter() - start, timed_out=True)
+            raise
+        PoolMetrics.record_checkout(time.perf_counter() - start)
+        return connection
+
+
+class TimedQueuePool(_TimedCheckout, QueuePool):
+    """QueuePool reporting checkout waits to PoolMetrics"""
+
+
+class TimedNullPool(_TimedCheckout, NullPool):
+    """NullPool reporting connect times to PoolMetrics"""
+
+
+def engine_options(settings: Dict[str, Any], database_uri: Optional[str],
+                   extra: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Build SQLAlchemy engine options from an engine profile.
+
+    Args:
+        settings: Resolved DB_ENGINE profile
+        database_uri: The database URI (statement timeouts are PostgreSQL only)
+        extra: Driver-specific options merged in (connect_args are combined)
+
+    Returns:
+        Keyword arguments for create_engine
+    """
+    options: Dict[str, Any] = {
+        'pool_pre_ping': settings['pre_ping'] == 'always',
+        'pool_recycle': settings['pool_recycle'],
+    }
+    if settings['pool'] == 'queue':
+        options.update({
+            'poolclass': TimedQueuePool,
+            'pool_size': settings['pool_size'],
+            'max_overflow': settings['max_overflow'],
+            'pool_timeout': settings['pool_timeout'],
+            'pool_use_lifo': settings['pool_use_lifo'],
+        })
+    elif settings['pool'] == 'null':
+        options['poolclass'] = TimedNullPool
+
+    extra = dict(extra or {})
+    connect_args = dict(extra.pop('connect_args', {}))
+    is_postgresql = database_uri and make_url(database_uri).get_backend_name() == 'postgresql'
+    if is_postgresql and settings['statement_timeout_ms'] and not settings['pgbouncer']:
+        # Startup option: applies to every statement on the connection, no extra round-trip
+        options_arg = connect_args.get('options', '')
+        connect_args['options'] = f"{options_arg} -c statement_timeout={int(settings['statement_timeout_ms'])}".strip()
+    if connect_args:
+        options['connect_args'] = connect_args
+
+    options.update(extra)
+    return options
+
+
+def configure_engine(app: Flask) -> None:
+    """
+    Derive SQLALCHEMY_ENGINE_OPTIONS from the DB_ENGINE profile.
+
+    Call before db.init_app so the engine is created with these options.
+
+    Args:
+        app: Flask application
+    """
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options(
+        app.config['DB_ENGINE'],
+        app.config.get('SQLALCHEMY_DATABASE_URI'),
+        app.config.get('SQLALCHEMY_ENGINE_OPTIONS')
+    )
+
+
+def _install_idle_ping(engine: Engine, idle_seconds: float) -> None:
+    """Ping connections on checkout that sat idle for at least idle_seconds"""
+
+    @event.listens_for(engine, 'checkin')
+    def _mark_idle(dbapi_connection, connection_record):
+        connection_record.info['checked_in_at'] = time.monotonic()
+
+    @event.listens_for(engine, 'checkout')
+    def _ping_if_idle(dbapi_connection, connection_record, connection_proxy):
+        checked_in_at = connection_record.info.get('checked_in_at')
+        if checked_in_at is None or time.monotonic() - checked_in_at < idle_seconds:
+            return
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute('SELECT 1')
+        except Exception:
+            PoolMetrics.record_ping(failed=True)
+            # The pool discards this connection and checks out another
+            raise exc.DisconnectionError()
+        finally:
+            cursor.close()
+        PoolMetrics.record_ping(failed=False)
+
+
+def init_engine(app: Flask) -> None:
+    """
+    Install idle pings and per-transaction statement timeouts on the engines.
+
+    Call after db.init_app.
+
+    Args:
+        app: Flask application
+    """
+    settings = app.config['DB_ENGINE']
+    with app.app_context():
+        engine = db.engine
+        # The primary plus any binds (e.g. the read replica)
+        engines = list(db.engines.values())
+
+    if settings['pre_ping'] == 'idle':
+        for bind_engine in engines:
+            _install_idle_ping(bind_engine, settings['ping_idle_seconds'])
+
+    if settings['pgbouncer'] and settings['statement_timeout_ms'] and engine.dialect.name == 'postgresql':
+        timeout = int(settings['statement_timeout_ms'])
+
+        # Startup options don't survive PgBouncer's transaction pooling
+        @event.listens_for(db.session, 'after_begin')
+        def _set_statement_timeout(session, transaction, connection):
+            connection.exec_driver_sql(f'SET LOCAL statement_timeout = {timeout}')
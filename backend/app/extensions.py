@@ -7,9 +7,10 @@ from flask_login import LoginManager
 from flask_migrate import Migrate
 from flask_jwt_extended import JWTManager
 from flask_mail import Mail
+from app.replica import RoutingSession
 
-# Initialize extensions
-db = SQLAlchemy()
+# Initialize extensions (the session routes read-only queries to the replica bind, if any)
+db = SQLAlchemy(session_options={'class_': RoutingSession})
 ma = Marshmallow()
 login_manager = LoginManager()
 migrate = Migrate()
@@ -0,0 +1,198 @@
+"""
+Request instrumentation
+
+Per-request hot-path timing: SQL statement count and time (via SQLAlchemy
+engine events), JSON serialization time, and the remaining application
+time. Results are exposed as a Server-Timing header, written as a
+structured log line and folded into per-endpoint aggregates.
+
+Cost per request is a few perf_counter() calls and one locked dict
+update, so it can stay enabled in production.
+"""
+import logging
+import threading
+import time
+from typing import Dict, Any
+from flask import Flask, g, has_request_context, request
+from flask.json.provider import JSONProvider
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger('app.instrumentation')
+
+
+class RequestMetrics:
+    """Per-endpoint aggregates of instrumented requests (per process)"""
+
+    _endpoints: Dict[str, Dict[str, float]] = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def record(endpoint: str, timings: Dict[str, float], sql_count: int) -> None:
+        """
+        Fold one request's timings into the endpoint aggregate.
+
+        Args:
+            endpoint: Flask endpoint name
+            timings: Milliseconds spent per section (db, json, app, total)
+            sql_count: Number of SQL statements executed
+        """
+        with RequestMetrics._lock:
+            stats = RequestMetrics._endpoints.get(endpoint)
+            if stats is None:
+                stats = RequestMetrics._endpoints[endpoint] = {
+                    'requests': 0, 'sql_count': 0, 'db_ms': 0.0, 'json_ms': 0.0,
+                    'app_ms': 0.0, 'total_ms': 0.0, 'max_total_ms': 0.0
+                }
+            stats['requests'] += 1
+            stats['sql_count'] += sql_count
+            stats['db_ms'] += timings['db']
+            stats['json_ms'] += timings['json']
+            stats['app_ms'] += timings['app']
+            stats['total_ms'] += timings['total']
+            stats['max_total_ms'] = max(stats['max_total_ms'], timings['total'])
+
+    @staticmethod
+    def snapshot() -> Dict[str, Dict[str, Any]]:
+        """
+        Get per-endpoint totals and averages.
+
+        Returns:
+            Dictionary keyed by endpoint with request counts, totals and averages
+        """
+        with RequestMetrics._lock:
+            endpoints = {name: dict(stats) for name, stats in RequestMetrics._endpoints.items()}
+
+        for stats in endpoints.values():
+            count = stats['requests']
+            stats['avg_sql_count'] = round(stats['sql_count'] / count, 2)
+            for section in ('db', 'json', 'app', 'total'):
+                stats[f'{section}_ms'] = round(stats[f'{section}_ms'], 3)
+                stats[f'avg_{section}_ms'] = round(stats[f'{section}_ms'] / count, 3)
+            stats['max_total_ms'] = round(stats['max_total_ms'], 3)
+        return endpoints
+
+    @staticmethod
+    def reset() -> None:
+        """Clear all aggregates"""
+        with RequestMetrics._lock:
+            RequestMetrics._endpoints.clear()
+
+
+class TimedJSONProvider(JSONProvider):
+    """JSON provider that times serialization done by the wrapped provider"""
+
+    def __init__(self, app: Flask, provider: JSONProvider):
+        super().__init__(app)
+        self.provider = provider
+
+    def dumps(self, obj, **kwargs):
+        start = time.perf_counter()
+        try:
+            return self.provider.dumps(obj, **kwargs)
+        finally:
+            _add_json_time(time.perf_counter() - start)
+
+    def loads(self, s, **kwargs):
+        return self.provider.loads(s, **kwargs)
+
+    def response(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return self.provider.response(*args, **kwargs)
+        finally:
+            _add_json_time(time.perf_counter() - start)
+
+
+def _add_json_time(elapsed: float) -> None:
+    """Add serialization time to the current request, if instrumented"""
+    if has_request_context() and 'request_started' in g:
+        g.json_time += elapsed
+
+
+# Start times live on the statement's execution context rather than on the
+# pooled connection, so a statement that raises cannot leave one behind.
+_QUERY_START = '_instrumentation_query_start'
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None and has_request_context() and 'request_started' in g:
+        setattr(context, _QUERY_START, time.perf_counter())
+
+
+def _record_query(context) -> None:
+    started = getattr(context, _QUERY_START, None) if context is not None else None
+    if started is None:
+        return
+    delattr(context, _QUERY_START)
+    if has_request_context() and 'request_started' in g:
+        g.sql_time += time.perf_counter() - started
+        g.sql_count += 1
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    _record_query(context)
+
+
+def _handle_error(exception_context):
+    # after_cursor_execute does not fire for failed statements
+    _record_query(exception_context.execution_context)
+
+
+def _start_request():
+    g.request_started = time.perf_counter()
+    g.sql_count = 0
+    g.sql_time = 0.0
+    g.json_time = 0.0
+
+
+def _finish_request(response):
+    if 'request_started' not in g:
+        return response
+
+    total = time.perf_counter() - g.pop('request_started')
+    timings = {
+        'db': g.sql_time * 1000,
+        'json': g.json_time * 1000,
+        'total': total * 1000
+    }
+    timings['app'] = max(timings['total'] - timings['db'] - timings['json'], 0.0)
+    endpoint = request.endpoint or 'unmatched'
+
+    response.headers['Server-Timing'] = (
+        f'db;dur={timings["db"]:.3f};desc="{g.sql_count} queries", '
+        f'json;dur={timings["json"]:.3f}, '
+        f'app;dur={timings["app"]:.3f}, '
+        f'total;dur={timings["total"]:.3f}'
+    )
+    logger.info(
+        'request method=%s path=%s endpoint=%s status=%s sql_count=%d db_ms=%.3f json_ms=%.3f app_ms=%.3f total_ms=%.3f',
+        request.method, request.path, endpoint, response.status_code, g.sql_count,
+        timings['db'], timings['json'], timings['app'], timings['total'],
+        extra={'endpoint': endpoint, 'sql_count': g.sql_count, 'timings': timings}
+    )
+    RequestMetrics.record(endpoint, timings, g.sql_count)
+    return response
+
+
+def init_instrumentation(app: Flask) -> None:
+    """
+    Install request instrumentation on the application.
+
+    Controlled by the INSTRUMENTATION_ENABLED config setting.
+
+    Args:
+        app: Flask application
+    """
+    if not app.config.get('INSTRUMENTATION_ENABLED', True):
+        return
+
+    # Engine events are global, so every engine the app creates is covered
+    if not event.contains(Engine, 'before_cursor_execute', _before_cursor_execute):
+        event.listen(Engine, 'before_cursor_execute', _before_cursor_execute)
+        event.listen(Engine, 'after_cursor_execute', _after_cursor_execute)
+        event.listen(Engine, 'handle_error', _handle_error)
+
+    app.json = TimedJSONProvider(app, app.json)
+    app.before_request(_start_request)
+    app.after_request(_finish_request)
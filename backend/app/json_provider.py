@@ -0,0 +1,107 @@
+"""
+JSON response encoding
+
+FastJSONProvider replaces Flask's default provider. It encodes with orjson
+when the package is installed (JSON_BACKEND 'auto' or 'orjson') and with the
+stdlib encoder otherwise. Both backends handle datetime, date and time
+natively as ISO 8601, so serializers (see app/serializers.py) can hand over
+column values without calling isoformat() per field.
+
+Key order follows the payload (no sorting), and responses are compact
+unless the app runs in debug mode.
+"""
+import dataclasses
+import decimal
+import json
+import uuid
+from datetime import date, datetime, time
+from typing import Any, Union
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # Optional: the stdlib encoder is used instead
+    orjson = None
+
+JSON_BACKENDS = ('auto', 'orjson', 'stdlib')
+
+
+def _default(o: Any) -> Any:
+    """Encode the types both backends agree on that JSON lacks"""
+    if isinstance(o, (datetime, date, time)):
+        return o.isoformat()
+    if isinstance(o, (decimal.Decimal, uuid.UUID)):
+        return str(o)
+    if dataclasses.is_dataclass(o) and not isinstance(o, type):
+        return dataclasses.asdict(o)
+    if hasattr(o, '__html__'):
+        return str(o.__html__())
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """JSON provider encoding with orjson when available"""
+
+    sort_keys = False
+
+    def __init__(self, app: Flask, backend: str = 'auto'):
+        super().__init__(app)
+        if backend not in JSON_BACKENDS:
+            raise ValueError(f"Unknown JSON_BACKEND '{backend}'; use one of {', '.join(JSON_BACKENDS)}")
+        if backend == 'orjson' and orjson is None:
+            raise RuntimeError("JSON_BACKEND=orjson requires the 'orjson' package")
+        self.use_orjson = orjson is not None and backend != 'stdlib'
+
+    @property
+    def backend(self) -> str:
+        """Name of the encoder in use"""
+        return 'orjson' if self.use_orjson else 'stdlib'
+
+    def _orjson_options(self, indent: bool = False) -> int:
+        options = orjson.OPT_NON_STR_KEYS
+        if indent:
+            options |= orjson.OPT_INDENT_2
+        if self.sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+        return options
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        # Custom encoder arguments are only understood by the stdlib encoder
+        if self.use_orjson and not kwargs:
+            return orjson.dumps(obj, default=_default, option=self._orjson_options()).decode()
+        kwargs.setdefault('default', _default)
+        kwargs.setdefault('ensure_ascii', self.ensure_ascii)
+        kwargs.setdefault('sort_keys', self.sort_keys)
+        return json.dumps(obj, **kwargs)
+
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        if self.use_orjson and not kwargs:
+            return orjson.loads(s)
+        return json.loads(s, **kwargs)
+
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = self.compact is False or (self.compact is None and self._app.debug)
+
+        if self.use_orjson:
+            data = orjson.dumps(obj, default=_default,
+                                option=self._orjson_options(indent) | orjson.OPT_APPEND_NEWLINE)
+        else:
+            data = json.dumps(
+                obj, default=_default, ensure_ascii=self.ensure_ascii, sort_keys=self.sort_keys,
+                indent=2 if indent else None, separators=None if indent else (',', ':')
+            ) + '\n'
+        return self._app.response_class(data, mimetype=self.mimetype)
+
+
+def init_json(app: Flask) -> None:
+    """
+    Install FastJSONProvider as the application's JSON provider.
+
+    Call before init_instrumentation, which wraps the provider for timing.
+
+    Args:
+        app: Flask application
+    """
+    app.json = FastJSONProvider(app, app.config.get('JSON_BACKEND', 'auto'))
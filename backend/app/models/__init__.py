@@ -14,7 +14,10 @@ from .tee_set import TeeSet
 from .tee_position import TeePosition
 from .round import Round
 from .score import Score
+from .hole_statistics import HoleStatistics
 from .handicap import Handicap
+from .email_outbox import EmailOutbox
+from .import_job import ImportJob
 
 # Make models available when importing from this package
 __all__ = [
@@ -27,5 +30,8 @@ __all__ = [
     'TeePosition',
     'Round',
     'Score',
-    'Handicap'
+    'HoleStatistics',
+    'Handicap',
+    'EmailOutbox',
+    'ImportJob'
 ] 
\ No newline at end of file
@@ -16,6 +16,8 @@ class Course(db.Model):
     description = db.Column(db.Text)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Bumped on every layout write; keys the course catalog cache
+    catalog_version = db.Column(db.Integer, nullable=False, default=1, server_default='1')
     
     # Foreign Keys
     club_id = db.Column(db.Integer, db.ForeignKey('clubs.id'), nullable=False)
@@ -29,6 +31,11 @@ class Course(db.Model):
     default_tee_set = db.relationship('TeeSet', foreign_keys=[default_tee_set_id], post_update=True)
     rounds = db.relationship('Round', back_populates='course')
 
+    __table_args__ = (
+        # Keyset pagination of the course list by name
+        db.Index('ix_courses_name_id', 'name', 'id'),
+    )
+
     def __repr__(self):
         return f'<Course {self.name}>'
 
@@ -0,0 +1,61 @@
+import json
+from datetime import datetime
+from app.extensions import db
+
+class EmailOutbox(db.Model):
+    """
+    Email Outbox Model
+    
+    Persistent queue of outgoing emails. Requests enqueue a row and return;
+    background workers claim pending rows, send them over a reused SMTP
+    connection and retry failures with exponential backoff.
+    """
+    __tablename__ = 'email_outbox'
+
+    STATUS_PENDING = 'pending'
+    STATUS_SENDING = 'sending'
+    STATUS_SENT = 'sent'
+    STATUS_FAILED = 'failed'
+
+    id = db.Column(db.Integer, primary_key=True)
+    subject = db.Column(db.String(255), nullable=False)
+    sender = db.Column(db.String(255), nullable=True)
+    recipients = db.Column(db.Text, nullable=False)  # JSON list of addresses
+    html = db.Column(db.Text, nullable=True)
+    body = db.Column(db.Text, nullable=True)
+    status = db.Column(db.String(20), nullable=False, default=STATUS_PENDING)
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    next_attempt_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    claimed_at = db.Column(db.DateTime, nullable=True)
+    claim_token = db.Column(db.String(32), nullable=True, index=True)
+    last_error = db.Column(db.Text, nullable=True)
+    sent_at = db.Column(db.DateTime, nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    # Workers poll for due pending rows
+    __table_args__ = (
+        db.Index('ix_email_outbox_status_next_attempt_at', 'status', 'next_attempt_at'),
+    )
+
+    def __repr__(self):
+        return f'<EmailOutbox {self.id} {self.subject!r} ({self.status})>'
+
+    @property
+    def recipient_list(self):
+        """Decoded list of recipient addresses"""
+        return json.loads(self.recipients) if self.recipients else []
+
+    def to_dict(self):
+        """Convert model to dictionary for JSON serialization"""
+        return {
+            'id': self.id,
+            'subject': self.subject,
+            'sender': self.sender,
+            'recipients': self.recipient_list,
+            'status': self.status,
+            'attempts': self.attempts,
+            'next_attempt_at': self.next_attempt_at.isoformat() if self.next_attempt_at else None,
+            'last_error': self.last_error,
+            'sent_at': self.sent_at.isoformat() if self.sent_at else None,
+            'created_at': self.created_at.isoformat() if self.created_at else None
+        }
@@ -12,6 +12,7 @@ class Handicap(db.Model):
 
     id = db.Column(db.Integer, primary_key=True)
     handicap_value = db.Column(db.Float, nullable=False)
+    # Valid over the half-open range [start_date, end_date); a user's ranges never overlap
     start_date = db.Column(db.Date, nullable=False, default=date.today)
     end_date = db.Column(db.Date, nullable=True)  # NULL means current handicap
     reason = db.Column(db.String(200))  # e.g., "initial", "update from external source", "manual adjustment"
@@ -26,6 +27,20 @@ class Handicap(db.Model):
     user = db.relationship('User', back_populates='handicaps', foreign_keys=[user_id])
     created_by = db.relationship('User', back_populates='created_handicaps', foreign_keys=[created_by_id])
 
+    __table_args__ = (
+        # Timeline lookups (get_handicap_on_date, history, temporal insertion);
+        # one entry per user and start date. PostgreSQL additionally enforces
+        # non-overlapping ranges with an exclusion constraint (see migrations).
+        db.Index('ix_handicaps_user_id_start_date', 'user_id', 'start_date', unique=True),
+        db.Index('ix_handicaps_user_id_end_date', 'user_id', 'end_date'),
+        # Current handicap per user (end_date IS NULL)
+        db.Index(
+            'ix_handicaps_current_user_id', 'user_id',
+            postgresql_where=db.text('end_date IS NULL'),
+            sqlite_where=db.text('end_date IS NULL')
+        ),
+    )
+
     def __repr__(self):
         status = "Current" if self.end_date is None else "Historical"
         return f'<Handicap {self.handicap_value} ({status})>'
@@ -44,7 +59,7 @@ class Handicap(db.Model):
         if check_date < self.start_date:
             return False
         
-        if self.end_date and check_date > self.end_date:
+        if self.end_date and check_date >= self.end_date:
             return False
             
         return True
@@ -59,16 +74,16 @@ class Handicap(db.Model):
         """Get user's handicap that was valid on a specific date"""
         if check_date is None:
             check_date = date.today()
-            
+
+        # Ranges don't overlap: the latest entry starting on or before the
+        # date is the only candidate, found with one probe of the start index
         handicap = Handicap.query.filter(
             Handicap.user_id == user_id,
-            Handicap.start_date <= check_date,
-            db.or_(
-                Handicap.end_date.is_(None),
-                Handicap.end_date >= check_date
-            )
-        ).first()
-        
+            Handicap.start_date <= check_date
+        ).order_by(Handicap.start_date.desc()).first()
+
+        if handicap is None or (handicap.end_date is not None and handicap.end_date <= check_date):
+            return None
         return handicap
 
     def to_dict(self):
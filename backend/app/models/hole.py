@@ -24,6 +24,7 @@ class Hole(db.Model):
     course = db.relationship('Course', back_populates='holes')
     tee_positions = db.relationship('TeePosition', back_populates='hole', cascade='all, delete-orphan')
     scores = db.relationship('Score', back_populates='hole')
+    statistics = db.relationship('HoleStatistics', back_populates='hole', cascade='all, delete-orphan')
 
     # Unique constraint to prevent duplicate hole numbers per course
     __table_args__ = (
@@ -0,0 +1,25 @@
+from datetime import datetime
+from app.extensions import db
+
+class HoleStatistics(db.Model):
+    """
+    Hole Statistics Model
+    
+    Materialized scoring statistics of a hole: the number of recorded scores
+    per strokes value. ScoreService keeps the counts up to date as scores are
+    written, so reading a hole's statistics touches at most 20 rows however
+    many scores were recorded. Buckets relative to par are derived when
+    reading, so changing a hole's par needs no rebuild.
+    """
+    __tablename__ = 'hole_statistics'
+
+    hole_id = db.Column(db.Integer, db.ForeignKey('holes.id'), primary_key=True)
+    strokes = db.Column(db.Integer, primary_key=True)
+    score_count = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # Relationships
+    hole = db.relationship('Hole', back_populates='statistics')
+
+    def __repr__(self):
+        return f'<HoleStatistics hole {self.hole_id}: {self.score_count} x {self.strokes}>'
@@ -0,0 +1,80 @@
+import json
+from datetime import datetime
+from app.extensions import db
+
+class ImportJob(db.Model):
+    """
+    Import Job Model
+    
+    An uploaded CSV/XLSX file queued for import. Background workers claim
+    pending jobs, stream the file in chunks and record progress and
+    per-row errors here as they go.
+    """
+    __tablename__ = 'import_jobs'
+
+    STATUS_PENDING = 'pending'
+    STATUS_RUNNING = 'running'
+    STATUS_COMPLETED = 'completed'
+    STATUS_FAILED = 'failed'
+
+    id = db.Column(db.Integer, primary_key=True)
+    kind = db.Column(db.String(20), nullable=False)  # clubs, courses, holes, tee_sets, tee_positions, rounds
+    filename = db.Column(db.String(255), nullable=False)
+    file_path = db.Column(db.String(500), nullable=False)
+    file_format = db.Column(db.String(10), nullable=False)  # csv or xlsx
+    status = db.Column(db.String(20), nullable=False, default=STATUS_PENDING, index=True)
+    
+    # Progress
+    bytes_total = db.Column(db.Integer, nullable=False, default=0)
+    bytes_processed = db.Column(db.Integer, nullable=False, default=0)
+    rows_processed = db.Column(db.Integer, nullable=False, default=0)
+    rows_imported = db.Column(db.Integer, nullable=False, default=0)
+    rows_failed = db.Column(db.Integer, nullable=False, default=0)
+    errors = db.Column(db.Text, nullable=True)  # JSON list of {'row', 'errors'}, capped at IMPORT_MAX_ERRORS
+    last_error = db.Column(db.Text, nullable=True)  # Why a failed job stopped
+    
+    created_by_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=True)
+    started_at = db.Column(db.DateTime, nullable=True)
+    finished_at = db.Column(db.DateTime, nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f'<ImportJob {self.id} {self.kind} {self.filename!r} ({self.status})>'
+
+    @property
+    def error_list(self):
+        """Decoded list of per-row errors"""
+        return json.loads(self.errors) if self.errors else []
+
+    @property
+    def progress(self):
+        """Fraction of the file processed, from 0.0 to 1.0"""
+        if self.status == self.STATUS_COMPLETED:
+            return 1.0
+        if not self.bytes_total:
+            return 0.0
+        return round(min(self.bytes_processed / self.bytes_total, 1.0), 3)
+
+    def to_dict(self, include_errors=False):
+        """Convert model to dictionary for JSON serialization"""
+        data = {
+            'id': self.id,
+            'kind': self.kind,
+            'filename': self.filename,
+            'file_format': self.file_format,
+            'status': self.status,
+            'progress': self.progress,
+            'rows_processed': self.rows_processed,
+            'rows_imported': self.rows_imported,
+            'rows_failed': self.rows_failed,
+            'last_error': self.last_error,
+            'created_by_id': self.created_by_id,
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None,
+            'created_at': self.created_at.isoformat() if self.created_at else None
+        }
+        
+        if include_errors:
+            data['errors'] = self.error_list
+            
+        return data
@@ -26,13 +26,18 @@ class Round(db.Model):
     total_points = db.Column(db.Integer, nullable=True)  # Total Stableford points
     differential = db.Column(db.Float, nullable=True)  # Handicap differential = (Score - Course Rating) * 113 / Slope Rating
     
+    # Completion summary (denormalized, kept current by update_completion)
+    holes_played = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    expected_holes = db.Column(db.Integer, nullable=False, default=18, server_default='18')
+    is_complete = db.Column(db.Boolean, nullable=False, default=False, server_default=db.false(), index=True)
+    
     # Timestamps
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Foreign Keys
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
-    course_id = db.Column(db.Integer, db.ForeignKey('courses.id'), nullable=False)
+    course_id = db.Column(db.Integer, db.ForeignKey('courses.id'), nullable=False, index=True)
     tee_set_id = db.Column(db.Integer, db.ForeignKey('tee_sets.id'), nullable=False)
 
     # Relationships
@@ -41,14 +46,18 @@ class Round(db.Model):
     tee_set = db.relationship('TeeSet', back_populates='rounds')
     scores = db.relationship('Score', back_populates='round', cascade='all, delete-orphan')
 
+    __table_args__ = (
+        # Keyset pagination of a player's rounds, newest first
+        db.Index('ix_rounds_user_id_date_played_id', 'user_id', 'date_played', 'id'),
+    )
+
     def __repr__(self):
         return f'<Round {self.user.email if self.user else "?"} - {self.date_played}>'
 
-    @property
-    def is_complete(self):
-        """Check if the round is complete (has scores for all holes)"""
-        expected_holes = self.course.holes_count if self.course else 18
-        return len(self.scores) == expected_holes
+    def update_completion(self, holes_played=None):
+        """Refresh holes_played and is_complete from the round's scores (or a known score count)"""
+        self.holes_played = len(self.scores) if holes_played is None else holes_played
+        self.is_complete = self.holes_played == (self.expected_holes or 0)
 
     @property
     def net_score(self):
@@ -99,6 +108,8 @@ class Round(db.Model):
             'total_points': self.total_points,
             'net_score': self.net_score,
             'differential': self.differential,
+            'holes_played': self.holes_played,
+            'expected_holes': self.expected_holes,
             'is_complete': self.is_complete,
             'user_id': self.user_id,
             'course_id': self.course_id,
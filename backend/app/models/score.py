@@ -18,7 +18,7 @@ class Score(db.Model):
     
     # Foreign Keys
     round_id = db.Column(db.Integer, db.ForeignKey('rounds.id'), nullable=False)
-    hole_id = db.Column(db.Integer, db.ForeignKey('holes.id'), nullable=False)
+    hole_id = db.Column(db.Integer, db.ForeignKey('holes.id'), nullable=False, index=True)
 
     # Relationships
     round = db.relationship('Round', back_populates='scores')
@@ -79,18 +79,33 @@ class Score(db.Model):
         """
         if not self.hole:
             return 0
-            
+        
+        return Score.stableford_points(self.strokes, self.hole.par, self.hole.stroke_index, course_handicap)
+
+    @staticmethod
+    def stableford_points(strokes, par, stroke_index, course_handicap=0):
+        """
+        Calculate Stableford points from plain values.
+        
+        Shared by the per-score calculation and the bulk recalculation,
+        which works on columns of values instead of loaded Score objects.
+        
+        Args:
+            strokes: Strokes taken on the hole
+            par: Par of the hole
+            stroke_index: Stroke index of the hole
+            course_handicap: Player's course handicap for stroke allocation
+        """
         # Calculate strokes received on this hole
         strokes_received = 0
         if course_handicap > 0:
-            if course_handicap >= self.hole.stroke_index:
+            if course_handicap >= stroke_index:
                 strokes_received = 1
-            if course_handicap >= self.hole.stroke_index + 18:
+            if course_handicap >= stroke_index + 18:
                 strokes_received = 2
                 
         # Net strokes = actual strokes - strokes received
-        net_strokes = self.strokes - strokes_received
-        par = self.hole.par
+        net_strokes = strokes - strokes_received
         
         # Stableford scoring (correct points)
         if net_strokes <= par - 3:
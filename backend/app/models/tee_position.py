@@ -17,7 +17,7 @@ class TeePosition(db.Model):
     
     # Foreign Keys
     hole_id = db.Column(db.Integer, db.ForeignKey('holes.id'), nullable=False)
-    tee_set_id = db.Column(db.Integer, db.ForeignKey('tee_sets.id'), nullable=False)
+    tee_set_id = db.Column(db.Integer, db.ForeignKey('tee_sets.id'), nullable=False, index=True)
 
     # Relationships
     hole = db.relationship('Hole', back_populates='tee_positions')
@@ -27,7 +27,7 @@ class User(db.Model):
     last_login = db.Column(db.DateTime)
     
     # Password reset
-    password_reset_token = db.Column(db.String(255))
+    password_reset_token = db.Column(db.String(255), index=True)
     password_reset_expires = db.Column(db.DateTime)
     
     # Preferences
@@ -50,6 +50,17 @@ class User(db.Model):
     rounds = db.relationship('Round', back_populates='user', cascade='all, delete-orphan')
     handicaps = db.relationship('Handicap', foreign_keys='Handicap.user_id', back_populates='user', cascade='all, delete-orphan')
     created_handicaps = db.relationship('Handicap', foreign_keys='Handicap.created_by_id', back_populates='created_by')
+    current_handicap_record = db.relationship(
+        'Handicap',
+        primaryjoin='and_(User.id == Handicap.user_id, Handicap.end_date.is_(None))',
+        viewonly=True,
+        uselist=False
+    )
+
+    __table_args__ = (
+        # Keyset pagination of the user list by name
+        db.Index('ix_users_last_name_first_name_id', 'last_name', 'first_name', 'id'),
+    )
 
     def __repr__(self):
         return f'<User {self.email}>'
@@ -69,12 +80,8 @@ class User(db.Model):
 
     @property
     def current_handicap(self):
-        """Get user's current handicap"""
-        from app.models.handicap import Handicap
-        current = Handicap.query.filter(
-            Handicap.user_id == self.id,
-            Handicap.end_date.is_(None)
-        ).first()
+        """Get user's current handicap (eager-loadable via current_handicap_record)"""
+        current = self.current_handicap_record
         return current.handicap_value if current else None
 
     @property
@@ -0,0 +1,141 @@
+"""
+Read replica routing
+
+With SQLALCHEMY_REPLICA_URI set, SELECTs issued by read-only service
+methods (marked with @read_only) during GET requests are sent to the
+replica engine. Everything else goes to the primary:
+
+- writes, flushes and SELECT ... FOR UPDATE;
+- every statement of a request after it has written;
+- requests from a client that wrote within the last REPLICA_STICKY_SECONDS
+  (tracked with a short-lived cookie), so players read their own writes;
+- CLI commands and background workers (no request).
+
+Without a replica URI all statements use the primary as before.
+"""
+import time
+from contextlib import contextmanager
+from functools import wraps
+from typing import Iterator
+from flask import Flask, current_app, g, has_request_context, request
+from flask_sqlalchemy.session import Session
+from sqlalchemy.sql import CompoundSelect, Select
+from sqlalchemy.sql.dml import UpdateBase
+
+# SQLALCHEMY_BINDS key of the replica engine
+REPLICA_BIND = 'replica'
+
+# Cookie holding the time until which the client reads from the primary
+STICKY_COOKIE = 'rgs_primary_until'
+
+
+class ReplicaRouter:
+    """Per-request routing state"""
+
+    @staticmethod
+    @contextmanager
+    def reads() -> Iterator[None]:
+        """Allow SELECTs inside the block to use the replica"""
+        if not has_request_context():
+            yield
+            return
+        g.replica_reads = g.get('replica_reads', 0) + 1
+        try:
+            yield
+        finally:
+            g.replica_reads -= 1
+
+    @staticmethod
+    def mark_write() -> None:
+        """Pin the rest of the request, and the client's next reads, to the primary"""
+        if has_request_context():
+            g.replica_wrote = True
+
+    @staticmethod
+    def use_replica() -> bool:
+        """
+        Check whether the current statement may read from the replica.
+
+        Returns:
+            True inside a read-only block of a GET request that has not
+            written, from a client outside its stickiness window
+        """
+        if not has_request_context() or not g.get('replica_reads') or g.get('replica_wrote'):
+            return False
+        if request.method not in ('GET', 'HEAD'):
+            return False
+        try:
+            primary_until = float(request.cookies.get(STICKY_COOKIE, 0))
+        except ValueError:
+            primary_until = 0
+        return primary_until <= time.time()
+
+
+def read_only(f):
+    """Decorator marking a service method whose SELECTs may use the replica"""
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        with ReplicaRouter.reads():
+            return f(*args, **kwargs)
+    return decorated_function
+
+
+class RoutingSession(Session):
+    """Flask-SQLAlchemy session sending eligible reads to the replica bind"""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None:
+            if self._flushing or isinstance(clause, UpdateBase):
+                ReplicaRouter.mark_write()
+            elif _is_plain_read(clause) and ReplicaRouter.use_replica():
+                replica = self._db.engines.get(REPLICA_BIND)
+                if replica is not None:
+                    return replica
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+def _is_plain_read(clause) -> bool:
+    """A SELECT that takes no row locks"""
+    return isinstance(clause, (Select, CompoundSelect)) and clause._for_update_arg is None
+
+
+def _set_sticky_cookie(response):
+    """Keep a client that wrote on the primary for REPLICA_STICKY_SECONDS"""
+    if g.get('replica_wrote'):
+        seconds = current_app.config.get('REPLICA_STICKY_SECONDS', 5)
+        response.set_cookie(
+            STICKY_COOKIE, f'{time.time() + seconds:.3f}',
+            max_age=seconds, httponly=True, samesite='Lax'
+        )
+    return response
+
+
+def configure_replica(app: Flask) -> None:
+    """
+    Register the replica as the 'replica' bind.
+
+    Call before db.init_app. Does nothing without SQLALCHEMY_REPLICA_URI.
+
+    Args:
+        app: Flask application
+    """
+    uri = app.config.get('SQLALCHEMY_REPLICA_URI')
+    if uri:
+        app.config['SQLALCHEMY_BINDS'] = {**(app.config.get('SQLALCHEMY_BINDS') or {}), REPLICA_BIND: uri}
+
+
+def init_replica(app: Flask) -> None:
+    """
+    Install the read-your-writes cookie.
+
+    Call after db.init_app.
+
+    Args:
+        app: Flask application
+    """
+    if not app.config.get('SQLALCHEMY_REPLICA_URI'):
+        return
+    # The replica mirrors the primary's tables and has no models of its own;
+    # drop the empty metadata so create_all/drop_all skip it
+    app.extensions['sqlalchemy'].metadatas.pop(REPLICA_BIND, None)
+    app.after_request(_set_sticky_cookie)
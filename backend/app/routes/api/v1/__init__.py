@@ -29,6 +29,9 @@ from .tee_set_routes import tee_set_api
 from .tee_position_routes import tee_position_api
 from .round_routes import round_api
 from .score_routes import score_api
+from .metrics_routes import metrics_api
+from .import_routes import import_api
+from .export_routes import export_api
 
 api_v1_bp.register_blueprint(auth_bp, url_prefix='/auth')
 api_v1_bp.register_blueprint(user_bp, url_prefix='/users')
@@ -40,4 +43,7 @@ api_v1_bp.register_blueprint(hole_api, url_prefix='/holes')
 api_v1_bp.register_blueprint(tee_set_api, url_prefix='/tee-sets')
 api_v1_bp.register_blueprint(tee_position_api, url_prefix='/tee-positions')
 api_v1_bp.register_blueprint(round_api, url_prefix='/rounds')
-api_v1_bp.register_blueprint(score_api, url_prefix='/scores') 
\ No newline at end of file
+api_v1_bp.register_blueprint(score_api, url_prefix='/scores')
+api_v1_bp.register_blueprint(metrics_api, url_prefix='/metrics')
+api_v1_bp.register_blueprint(import_api, url_prefix='/imports')
+api_v1_bp.register_blueprint(export_api, url_prefix='/exports') 
\ No newline at end of file
@@ -8,6 +8,8 @@ from flask import Blueprint, request, jsonify
 from marshmallow import ValidationError
 from app.services.club_service import ClubService
 from app.services.auth_service import admin_required, token_required
+from app.services.conditional_service import ConditionalService, conditional
+from app.services.pagination import KeysetPagination
 from app.schemas.club_schema import (
     ClubCreateSchema, ClubUpdateSchema, ClubResponseSchema, 
     ClubWithCoursesSchema, ClubSearchSchema
@@ -25,26 +27,34 @@ club_search_schema = ClubSearchSchema()
 
 @club_api.route("", methods=["GET"])
 @token_required
+@conditional(ConditionalService.clubs, collection=True)
 def list_clubs():
-    """Get all clubs - requires authentication"""
+    """Get clubs ordered by name with cursor pagination - requires authentication"""
     try:
-        # Check for search parameters
-        search_query = request.args.get('search')
-        country = request.args.get('country')
-        
-        if search_query:
-            clubs = ClubService.search_clubs(search_query)
-        elif country:
-            clubs = ClubService.get_clubs_by_country(country)
-        else:
-            clubs = ClubService.get_all_clubs()
+        clubs, meta = ClubService.list_clubs(
+            search=request.args.get('search'),
+            country=request.args.get('country'),
+            cursor=request.args.get('cursor'),
+            limit=request.args.get('limit', KeysetPagination.DEFAULT_LIMIT, type=int),
+            total=request.args.get('total'),
+            fields=request.args.get('fields'),
+            include=request.args.get('include')
+        )
             
         return jsonify({
             "success": True,
             "data": clubs,
-            "count": len(clubs)
+            "count": len(clubs),
+            "meta": meta
         }), 200
         
+    except ValueError as e:
+        return jsonify({
+            "success": False,
+            "error": "Invalid query parameters",
+            "message": str(e)
+        }), 400
+        
     except Exception as e:
         return jsonify({
             "success": False,
@@ -55,16 +65,20 @@ def list_clubs():
 
 @club_api.route("/<int:club_id>", methods=["GET"])
 @token_required
+@conditional(ConditionalService.club, collection=True)
 def get_club(club_id):
     """Get a specific club - requires authentication"""
     try:
         # Check if courses should be included
         include_courses = request.args.get('include_courses', 'false').lower() == 'true'
         
+        fields = request.args.get('fields')
+        include = request.args.get('include')
+        
         if include_courses:
-            club = ClubService.get_club_with_courses(club_id)
+            club = ClubService.get_club_with_courses(club_id, fields, include)
         else:
-            club = ClubService.get_club_by_id(club_id)
+            club = ClubService.get_club_by_id(club_id, fields, include)
             
         if not club:
             return jsonify({
@@ -77,6 +91,13 @@ def get_club(club_id):
             "data": club
         }), 200
         
+    except ValueError as e:
+        return jsonify({
+            "success": False,
+            "error": "Invalid query parameters",
+            "message": str(e)
+        }), 400
+        
     except Exception as e:
         return jsonify({
             "success": False,
@@ -8,6 +8,8 @@ from flask import Blueprint, request, jsonify
 from marshmallow import ValidationError
 from app.services.course_service import CourseService
 from app.services.auth_service import admin_required, token_required
+from app.services.conditional_service import ConditionalService, conditional
+from app.services.pagination import KeysetPagination
 from app.schemas.course_schema import (
     CourseCreateSchema, CourseUpdateSchema, CourseResponseSchema,
     CourseSearchSchema, DefaultTeeSetSchema
@@ -25,29 +27,34 @@ default_tee_set_schema = DefaultTeeSetSchema()
 
 @course_api.route("", methods=["GET"])
 @token_required
+@conditional(ConditionalService.courses, collection=True)
 def list_courses():
-    """Get all courses with optional filtering"""
+    """Get courses ordered by name with optional filtering and cursor pagination"""
     try:
-        # Parse query parameters
-        club_id = request.args.get('club_id', type=int)
-        search = request.args.get('search')
-        
-        if club_id:
-            # Get courses for specific club
-            courses = CourseService.get_courses_by_club(club_id)
-        elif search:
-            # Search courses
-            courses = CourseService.search_courses(search)
-        else:
-            # Get all courses
-            courses = CourseService.get_all_courses()
+        courses, meta = CourseService.list_courses(
+            club_id=request.args.get('club_id', type=int),
+            search=request.args.get('search'),
+            cursor=request.args.get('cursor'),
+            limit=request.args.get('limit', KeysetPagination.DEFAULT_LIMIT, type=int),
+            total=request.args.get('total'),
+            fields=request.args.get('fields'),
+            include=request.args.get('include')
+        )
             
         return jsonify({
             "success": True,
             "data": courses,
-            "count": len(courses)
+            "count": len(courses),
+            "meta": meta
         }), 200
         
+    except ValueError as e:
+        return jsonify({
+            "success": False,
+            "error": "Invalid query parameters",
+            "message": str(e)
+        }), 400
+        
     except Exception as e:
         return jsonify({
             "success": False,
@@ -58,6 +65,7 @@ def list_courses():
 
 @course_api.route("/<int:course_id>", methods=["GET"])
 @token_required
+@conditional(ConditionalService.course)
 def get_course(course_id):
     """Get a specific course with optional details"""
     try:
@@ -65,13 +73,18 @@ def get_course(course_id):
         include_holes = request.args.get('include_holes', 'false').lower() == 'true'
         include_tee_sets = request.args.get('include_tee_sets', 'false').lower() == 'true'
         full_details = request.args.get('full_details', 'false').lower() == 'true'
+        fields = request.args.get('fields')
         
         if full_details:
             # Get course with complete details including club info
-            course = CourseService.get_course_with_full_details(course_id)
+            course = CourseService.get_course_with_full_details(course_id, fields)
         else:
             # Get course with optional includes
-            course = CourseService.get_course_by_id(course_id, include_holes, include_tee_sets)
+            course = CourseService.get_course_by_id(
+                course_id, include_holes, include_tee_sets,
+                fields=fields,
+                include=request.args.get('include')
+            )
             
         if not course:
             return jsonify({
@@ -84,6 +97,13 @@ def get_course(course_id):
             "data": course
         }), 200
         
+    except ValueError as e:
+        return jsonify({
+            "success": False,
+            "error": "Invalid query parameters",
+            "message": str(e)
+        }), 400
+        
     except Exception as e:
         return jsonify({
             "success": False,
@@ -252,6 +272,7 @@ def set_default_tee_set(course_id):
 
 @course_api.route("/search", methods=["GET"])
 @token_required
+@conditional(ConditionalService.courses, collection=True)
 def search_courses():
     """Search courses by name or club name"""
     try:
@@ -0,0 +1,77 @@
+"""
+Export API Routes
+
+Thin routes that handle HTTP concerns only.
+All business logic is delegated to ExportService.
+"""
+from flask import Blueprint, Response, request, jsonify, stream_with_context
+from flask_jwt_extended import get_jwt_identity
+from marshmallow import ValidationError
+from app.services.export_service import ExportService
+from app.services.auth_service import AuthorizationCache, token_required
+from app.schemas.round_schema import RoundExportQuerySchema
+
+export_api = Blueprint('export_api', __name__)
+
+# Initialize schemas
+round_export_query_schema = RoundExportQuerySchema()
+
+MIMETYPES = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv',
+}
+
+
+@export_api.route("/rounds", methods=["GET"])
+@token_required
+def export_rounds():
+    """
+    Stream rounds with scores as NDJSON or CSV.
+    
+    Players may export their own rounds; exports of other players, clubs
+    or date ranges across players are admin only. The body is gzipped when
+    the client accepts it.
+    """
+    try:
+        params = round_export_query_schema.load(request.args)
+        
+        current_user_id = int(get_jwt_identity())
+        status = AuthorizationCache.get_status(current_user_id)
+        is_admin = bool(status and status[1])
+        if not is_admin and params.get('user_id') != current_user_id:
+            return jsonify({
+                "success": False,
+                "error": "Insufficient permissions"
+            }), 403
+        
+        export_format = params.pop('format')
+        rounds = ExportService.iter_rounds(**params)
+        if export_format == 'csv':
+            body = ExportService.csv_lines(rounds)
+        else:
+            body = ExportService.ndjson_lines(rounds)
+        
+        headers = {
+            'Content-Disposition': f'attachment; filename=rounds.{export_format}',
+            'Cache-Control': 'no-store',
+            'Vary': 'Accept-Encoding',
+        }
+        if request.accept_encodings['gzip']:
+            body = ExportService.gzip_stream(body)
+            headers['Content-Encoding'] = 'gzip'
+        
+        return Response(stream_with_context(body), mimetype=MIMETYPES[export_format], headers=headers)
+        
+    except ValidationError as e:
+        return jsonify({
+            "success": False,
+            "error": "Validation failed",
+            "details": e.messages
+        }), 400
+        
+    except Exception as e:
+        return jsonify({
+            "success": False,
+            "error": "Failed to export rounds",
+            "message": str(e)
+        }), 500
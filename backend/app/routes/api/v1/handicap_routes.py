@@ -11,6 +11,7 @@ from marshmallow import ValidationError
 from app.services.handicap_service import HandicapService
 from app.services.user_service import UserService
 from app.services.auth_service import token_required, admin_required
+from app.services.conditional_service import ConditionalService, conditional
 from app.schemas.handicap_schema import (
     HandicapCreateSchema, HandicapUpdateSchema, HandicapResponseSchema
 )
@@ -26,10 +27,11 @@ handicap_response_schema = HandicapResponseSchema()
 # Admin Routes - Can manage all users' handicaps
 @handicap_bp.route('/admin/users/<int:user_id>/handicaps', methods=['GET'])
 @admin_required
+@conditional(ConditionalService.handicaps, collection=True)
 def admin_get_user_handicaps(user_id):
     """Get handicap history for any user (admin only)"""
     try:
-        handicaps = HandicapService.get_user_handicap_history(user_id)
+        handicaps = HandicapService.get_user_handicap_history(user_id, request.args.get('fields'))
         
         return jsonify({
             'success': True,
@@ -37,6 +39,13 @@ def admin_get_user_handicaps(user_id):
             'count': len(handicaps)
         }), 200
         
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': 'Invalid query parameters',
+            'message': str(e)
+        }), 400
+        
     except Exception as e:
         return jsonify({
             'success': False,
@@ -92,10 +101,11 @@ def admin_create_user_handicap(user_id):
 
 @handicap_bp.route('/admin/users/<int:user_id>/handicaps/current', methods=['GET'])
 @admin_required
+@conditional(ConditionalService.handicaps, collection=True)
 def admin_get_user_current_handicap(user_id):
     """Get current handicap for any user (admin only)"""
     try:
-        handicap = HandicapService.get_current_handicap(user_id)
+        handicap = HandicapService.get_current_handicap(user_id, request.args.get('fields'))
         
         if not handicap:
             return jsonify({
@@ -108,6 +118,13 @@ def admin_get_user_current_handicap(user_id):
             'data': handicap
         }), 200
         
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': 'Invalid query parameters',
+            'message': str(e)
+        }), 400
+        
     except Exception as e:
         return jsonify({
             'success': False,
@@ -195,11 +212,12 @@ def admin_delete_handicap(handicap_id):
 # User Routes - Can only manage their own handicap
 @handicap_bp.route('/my-handicaps', methods=['GET'])
 @token_required
+@conditional(ConditionalService.handicaps, collection=True)
 def get_my_handicaps():
     """Get current user's handicap history"""
     try:
         current_user_id = int(get_jwt_identity())
-        handicaps = HandicapService.get_user_handicap_history(current_user_id)
+        handicaps = HandicapService.get_user_handicap_history(current_user_id, request.args.get('fields'))
         
         return jsonify({
             'success': True,
@@ -207,6 +225,13 @@ def get_my_handicaps():
             'count': len(handicaps)
         }), 200
         
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': 'Invalid query parameters',
+            'message': str(e)
+        }), 400
+        
     except Exception as e:
         return jsonify({
             'success': False,
@@ -218,10 +243,11 @@ def get_my_handicaps():
 # Admin accessible route for any user's handicaps
 @handicap_bp.route('/user/<int:user_id>', methods=['GET'])
 @admin_required
+@conditional(ConditionalService.handicaps, collection=True)
 def get_user_handicaps(user_id):
     """Get handicap history for any user (admin only)"""
     try:
-        handicaps = HandicapService.get_user_handicap_history(user_id)
+        handicaps = HandicapService.get_user_handicap_history(user_id, request.args.get('fields'))
         
         return jsonify({
             'success': True,
@@ -229,6 +255,13 @@ def get_user_handicaps(user_id):
             'count': len(handicaps)
         }), 200
         
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': 'Invalid query parameters',
+            'message': str(e)
+        }), 400
+        
     except Exception as e:
         return jsonify({
             'success': False,
@@ -239,11 +272,12 @@ def get_user_handicaps(user_id):
 
 @handicap_bp.route('/my-handicaps/current', methods=['GET'])
 @token_required
+@conditional(ConditionalService.handicaps, collection=True)
 def get_my_current_handicap():
     """Get current user's current handicap"""
     try:
         current_user_id = int(get_jwt_identity())
-        handicap = HandicapService.get_current_handicap(current_user_id)
+        handicap = HandicapService.get_current_handicap(current_user_id, request.args.get('fields'))
         
         if not handicap:
             return jsonify({
@@ -256,6 +290,13 @@ def get_my_current_handicap():
             'data': handicap
         }), 200
         
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': 'Invalid query parameters',
+            'message': str(e)
+        }), 400
+        
     except Exception as e:
         return jsonify({
             'success': False,
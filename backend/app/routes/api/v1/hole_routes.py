@@ -8,6 +8,7 @@ from flask import Blueprint, request, jsonify
 from marshmallow import ValidationError
 from app.services.hole_service import HoleService
 from app.services.auth_service import admin_required, token_required
+from app.services.conditional_service import ConditionalService, conditional
 from app.schemas.hole_schema import (
     HoleCreateSchema, HoleUpdateSchema, HoleResponseSchema,
     StandardHolesCreateSchema, HoleStatisticsSchema, CourseValidationSchema
@@ -26,13 +27,18 @@ course_validation_schema = CourseValidationSchema()
 
 @hole_api.route("/course/<int:course_id>", methods=["GET"])
 @token_required
+@conditional(ConditionalService.course)
 def get_holes_by_course(course_id):
     """Get all holes for a specific course"""
     try:
         # Parse query parameters
         include_tee_positions = request.args.get('include_tee_positions', 'false').lower() == 'true'
         
-        holes = HoleService.get_holes_by_course(course_id, include_tee_positions)
+        holes = HoleService.get_holes_by_course(
+            course_id, include_tee_positions,
+            fields=request.args.get('fields'),
+            include=request.args.get('include')
+        )
         
         return jsonify({
             "success": True,
@@ -41,6 +47,13 @@ def get_holes_by_course(course_id):
             "course_id": course_id
         }), 200
         
+    except ValueError as e:
+        return jsonify({
+            "success": False,
+            "error": "Invalid query parameters",
+            "message": str(e)
+        }), 400
+        
     except Exception as e:
         return jsonify({
             "success": False,
@@ -51,13 +64,18 @@ def get_holes_by_course(course_id):
 
 @hole_api.route("/<int:hole_id>", methods=["GET"])
 @token_required
+@conditional(ConditionalService.hole)
 def get_hole(hole_id):
     """Get a specific hole"""
     try:
         # Parse query parameters
         include_tee_positions = request.args.get('include_tee_positions', 'false').lower() == 'true'
         
-        hole = HoleService.get_hole_by_id(hole_id, include_tee_positions)
+        hole = HoleService.get_hole_by_id(
+            hole_id, include_tee_positions,
+            fields=request.args.get('fields'),
+            include=request.args.get('include')
+        )
         
         if not hole:
             return jsonify({
@@ -70,6 +88,13 @@ def get_hole(hole_id):
             "data": hole
         }), 200
         
+    except ValueError as e:
+        return jsonify({
+            "success": False,
+            "error": "Invalid query parameters",
+            "message": str(e)
+        }), 400
+        
     except Exception as e:
         return jsonify({
             "success": False,
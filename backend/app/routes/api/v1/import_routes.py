@@ -0,0 +1,93 @@
+"""
+Import API Routes
+
+Thin routes that handle HTTP concerns only.
+All business logic is delegated to ImportService.
+"""
+from flask import Blueprint, request, jsonify
+from flask_jwt_extended import get_jwt_identity
+from app.services.import_service import ImportService
+from app.services.auth_service import admin_required
+
+import_api = Blueprint('import_api', __name__)
+
+
+@import_api.route("", methods=["POST"])
+@admin_required
+def create_import():
+    """Upload a CSV/XLSX file and queue it for import (admin only)"""
+    try:
+        job = ImportService.create_job(
+            request.files.get('file'),
+            request.form.get('kind', ''),
+            created_by_id=int(get_jwt_identity())
+        )
+        
+        return jsonify({
+            "success": True,
+            "data": job,
+            "message": "Import queued"
+        }), 202
+        
+    except ValueError as e:
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 400
+        
+    except Exception as e:
+        return jsonify({
+            "success": False,
+            "error": "Failed to queue import",
+            "message": str(e)
+        }), 500
+
+
+@import_api.route("", methods=["GET"])
+@admin_required
+def list_imports():
+    """List recent import jobs (admin only)"""
+    try:
+        status = request.args.get('status')
+        limit = min(request.args.get('limit', 50, type=int), 100)
+        
+        jobs = ImportService.list_jobs(status=status, limit=limit)
+        
+        return jsonify({
+            "success": True,
+            "data": jobs,
+            "count": len(jobs)
+        }), 200
+        
+    except Exception as e:
+        return jsonify({
+            "success": False,
+            "error": "Failed to retrieve imports",
+            "message": str(e)
+        }), 500
+
+
+@import_api.route("/<int:job_id>", methods=["GET"])
+@admin_required
+def get_import(job_id):
+    """Get an import job's progress and row errors (admin only)"""
+    try:
+        job = ImportService.get_job(job_id)
+        
+        if not job:
+            return jsonify({
+                "success": False,
+                "error": "Import not found"
+            }), 404
+            
+        return jsonify({
+            "success": True,
+            "data": job
+        }), 200
+        
+    except Exception as e:
+        return jsonify({
+            "success": False,
+            "error": "Failed to retrieve import",
+            "message": str(e)
+        }), 500
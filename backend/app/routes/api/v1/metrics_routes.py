@@ -0,0 +1,62 @@
+"""
+Metrics API Routes
+
+Admin-only access to per-endpoint request instrumentation aggregates and
+database connection pool metrics.
+"""
+from flask import Blueprint, current_app, jsonify
+from app.engine import PoolMetrics
+from app.extensions import db
+from app.instrumentation import RequestMetrics
+from app.services.auth_service import admin_required
+
+metrics_api = Blueprint('metrics_api', __name__)
+
+
+@metrics_api.route("/requests", methods=["GET"])
+@admin_required
+def get_request_metrics():
+    """Get per-endpoint SQL, serialization and total timings (admin only)"""
+    endpoints = RequestMetrics.snapshot()
+    
+    return jsonify({
+        "success": True,
+        "data": endpoints,
+        "count": len(endpoints)
+    }), 200
+
+
+@metrics_api.route("/requests", methods=["DELETE"])
+@admin_required
+def reset_request_metrics():
+    """Reset the request aggregates (admin only)"""
+    RequestMetrics.reset()
+    
+    return jsonify({
+        "success": True,
+        "message": "Request metrics reset"
+    }), 200
+
+
+@metrics_api.route("/pool", methods=["GET"])
+@admin_required
+def get_pool_metrics():
+    """Get connection pool state, saturation and checkout wait times (admin only)"""
+    data = PoolMetrics.snapshot(db.engine, current_app.config['DB_ENGINE'])
+    
+    return jsonify({
+        "success": True,
+        "data": data
+    }), 200
+
+
+@metrics_api.route("/pool", methods=["DELETE"])
+@admin_required
+def reset_pool_metrics():
+    """Reset the checkout aggregates (admin only)"""
+    PoolMetrics.reset()
+    
+    return jsonify({
+        "success": True,
+        "message": "Pool metrics reset"
+    }), 200
@@ -8,6 +8,8 @@ from flask import Blueprint, request, jsonify
 from marshmallow import ValidationError
 from app.services.round_service import RoundService
 from app.services.auth_service import token_required
+from app.services.conditional_service import ConditionalService, conditional
+from app.services.pagination import KeysetPagination
 from app.schemas.round_schema import (
     RoundCreateSchema, RoundUpdateSchema, RoundResponseSchema
 )
@@ -22,21 +24,40 @@ round_response_schema = RoundResponseSchema()
 
 @round_api.route("/user/<int:user_id>", methods=["GET"])
 @token_required
+@conditional(ConditionalService.rounds, collection=True)
 def get_user_rounds(user_id):
-    """Get rounds for a user"""
+    """Get rounds for a user, most recent first, with cursor pagination"""
     try:
         # Parse query parameters
-        limit = min(int(request.args.get('limit', 20)), 100)  # Cap at 100
+        completed = request.args.get('completed')
+        if completed is not None:
+            completed = completed.lower() == 'true'
         
-        rounds = RoundService.get_rounds_by_user(user_id, limit)
+        rounds, meta = RoundService.list_rounds_by_user(
+            user_id,
+            limit=request.args.get('limit', KeysetPagination.DEFAULT_LIMIT, type=int),
+            completed=completed,
+            cursor=request.args.get('cursor'),
+            total=request.args.get('total'),
+            fields=request.args.get('fields'),
+            include=request.args.get('include')
+        )
         
         return jsonify({
             "success": True,
             "data": rounds,
             "count": len(rounds),
-            "user_id": user_id
+            "user_id": user_id,
+            "meta": meta
         }), 200
         
+    except ValueError as e:
+        return jsonify({
+            "success": False,
+            "error": "Invalid query parameters",
+            "message": str(e)
+        }), 400
+        
     except Exception as e:
         return jsonify({
             "success": False,
@@ -47,13 +68,18 @@ def get_user_rounds(user_id):
 
 @round_api.route("/<int:round_id>", methods=["GET"])
 @token_required
+@conditional(ConditionalService.round, collection=True)
 def get_round(round_id):
     """Get a specific round"""
     try:
         # Parse query parameters
         include_scores = request.args.get('include_scores', 'false').lower() == 'true'
         
-        round = RoundService.get_round_by_id(round_id, include_scores)
+        round = RoundService.get_round_by_id(
+            round_id, include_scores,
+            fields=request.args.get('fields'),
+            include=request.args.get('include')
+        )
         
         if not round:
             return jsonify({
@@ -66,6 +92,13 @@ def get_round(round_id):
             "data": round
         }), 200
         
+    except ValueError as e:
+        return jsonify({
+            "success": False,
+            "error": "Invalid query parameters",
+            "message": str(e)
+        }), 400
+        
     except Exception as e:
         return jsonify({
             "success": False,
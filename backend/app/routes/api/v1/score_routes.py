@@ -10,7 +10,7 @@ from app.services.score_service import ScoreService
 from app.services.auth_service import token_required
 from app.schemas.score_schema import (
     ScoreCreateSchema, ScoreUpdateSchema, ScoreResponseSchema,
-    BulkScoreCreateSchema
+    BulkScoreCreateSchema, ScorecardSubmitSchema
 )
 
 score_api = Blueprint('score_api', __name__)
@@ -20,6 +20,7 @@ score_create_schema = ScoreCreateSchema()
 score_update_schema = ScoreUpdateSchema()
 score_response_schema = ScoreResponseSchema()
 bulk_score_schema = BulkScoreCreateSchema()
+scorecard_schema = ScorecardSubmitSchema()
 
 
 @score_api.route("/round/<int:round_id>", methods=["GET"])
@@ -27,7 +28,7 @@ bulk_score_schema = BulkScoreCreateSchema()
 def get_round_scores(round_id):
     """Get all scores for a round"""
     try:
-        scores = ScoreService.get_scores_by_round(round_id)
+        scores = ScoreService.get_scores_by_round(round_id, fields=request.args.get('fields'))
         
         return jsonify({
             "success": True,
@@ -36,6 +37,13 @@ def get_round_scores(round_id):
             "round_id": round_id
         }), 200
         
+    except ValueError as e:
+        return jsonify({
+            "success": False,
+            "error": "Invalid query parameters",
+            "message": str(e)
+        }), 400
+        
     except Exception as e:
         return jsonify({
             "success": False,
@@ -49,7 +57,7 @@ def get_round_scores(round_id):
 def get_score(score_id):
     """Get a specific score"""
     try:
-        score = ScoreService.get_score_by_id(score_id)
+        score = ScoreService.get_score_by_id(score_id, fields=request.args.get('fields'))
         
         if not score:
             return jsonify({
@@ -62,6 +70,13 @@ def get_score(score_id):
             "data": score
         }), 200
         
+    except ValueError as e:
+        return jsonify({
+            "success": False,
+            "error": "Invalid query parameters",
+            "message": str(e)
+        }), 400
+        
     except Exception as e:
         return jsonify({
             "success": False,
@@ -220,6 +235,45 @@ def create_bulk_scores():
         }), 500
 
 
+@score_api.route("/round/<int:round_id>/scorecard", methods=["PUT"])
+@token_required
+def submit_scorecard(round_id):
+    """Submit a full or partial scorecard for a round"""
+    try:
+        # Validate request data
+        data = scorecard_schema.load(request.json)
+        
+        # Upsert the card via service
+        result = ScoreService.submit_scorecard(round_id, data['hole_scores'])
+        
+        return jsonify({
+            "success": True,
+            "data": result,
+            "count": len(result['scores']),
+            "message": "Scorecard saved successfully"
+        }), 200
+        
+    except ValidationError as e:
+        return jsonify({
+            "success": False,
+            "error": "Validation failed",
+            "details": e.messages
+        }), 400
+        
+    except ValueError as e:
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 400
+        
+    except Exception as e:
+        return jsonify({
+            "success": False,
+            "error": "Failed to save scorecard",
+            "message": str(e)
+        }), 500
+
+
 @score_api.route("/round/<int:round_id>/recalculate", methods=["POST"])
 @token_required
 def recalculate_round_points(round_id):
@@ -11,7 +11,8 @@ from app.services.auth_service import admin_required, token_required
 from app.schemas.tee_position_schema import (
     TeePositionCreateSchema, TeePositionUpdateSchema, TeePositionResponseSchema,
     TeePositionBulkCreateSchema, StandardDistancesCreateSchema,
-    TeePositionBulkUpdateSchema, TeePositionStatisticsSchema, UnitQuerySchema
+    TeePositionBulkUpdateSchema, TeePositionBatchCreateSchema, TeePositionBatchUpdateSchema,
+    TeePositionStatisticsSchema, UnitQuerySchema
 )
 
 tee_position_api = Blueprint('tee_position_api', __name__)
@@ -23,6 +24,8 @@ tee_position_response_schema = TeePositionResponseSchema()
 bulk_create_schema = TeePositionBulkCreateSchema()
 standard_distances_schema = StandardDistancesCreateSchema()
 bulk_update_schema = TeePositionBulkUpdateSchema()
+batch_create_schema = TeePositionBatchCreateSchema()
+batch_update_schema = TeePositionBatchUpdateSchema()
 statistics_schema = TeePositionStatisticsSchema()
 unit_query_schema = UnitQuerySchema()
 
@@ -234,15 +237,18 @@ def delete_tee_position(position_id):
 @tee_position_api.route("/bulk", methods=["POST"])
 @admin_required
 def create_bulk_tee_positions():
-    """Create tee positions for all holes in a tee set (admin only)"""
+    """Create tee positions for all holes in one or many tee sets (admin only)"""
     try:
-        # Validate request data
-        data = bulk_create_schema.load(request.json)
+        # Validate request data: one tee set, or many under 'tee_sets'
+        payload = request.json or {}
+        if 'tee_sets' in payload:
+            batches = batch_create_schema.load(payload)['tee_sets']
+        else:
+            batches = [bulk_create_schema.load(payload)]
         
         # Create tee positions via service
-        positions = TeePositionService.create_tee_positions_for_tee_set(
-            data['tee_set_id'], 
-            data['distances']
+        positions = TeePositionService.create_tee_positions_for_tee_sets(
+            {batch['tee_set_id']: batch['distances'] for batch in batches}
         )
         
         return jsonify({
@@ -345,15 +351,18 @@ def get_tee_position_statistics(tee_set_id):
 @tee_position_api.route("/bulk-update", methods=["PUT"])
 @admin_required
 def bulk_update_distances():
-    """Bulk update distances for a tee set (admin only)"""
+    """Bulk update distances for one or many tee sets (admin only)"""
     try:
-        # Validate request data
-        data = bulk_update_schema.load(request.json)
+        # Validate request data: one tee set, or many under 'tee_sets'
+        payload = request.json or {}
+        if 'tee_sets' in payload:
+            batches = batch_update_schema.load(payload)['tee_sets']
+        else:
+            batches = [bulk_update_schema.load(payload)]
         
         # Bulk update distances via service
-        positions = TeePositionService.bulk_update_distances(
-            data['tee_set_id'], 
-            data['distances']
+        positions = TeePositionService.bulk_update_distances_for_tee_sets(
+            {batch['tee_set_id']: batch['distances'] for batch in batches}
         )
         
         return jsonify({
@@ -8,6 +8,7 @@ from flask import Blueprint, request, jsonify
 from marshmallow import ValidationError
 from app.services.tee_set_service import TeeSetService
 from app.services.auth_service import admin_required, token_required
+from app.services.conditional_service import ConditionalService, conditional
 from app.schemas.tee_set_schema import (
     TeeSetCreateSchema, TeeSetUpdateSchema, TeeSetResponseSchema,
     StandardTeeSetsCreateSchema, GenderRatingQuerySchema, 
@@ -28,13 +29,18 @@ tee_set_validation_schema = TeeSetValidationSchema()
 
 @tee_set_api.route("/course/<int:course_id>", methods=["GET"])
 @token_required
+@conditional(ConditionalService.course)
 def get_tee_sets_by_course(course_id):
     """Get all tee sets for a specific course"""
     try:
         # Parse query parameters
         include_positions = request.args.get('include_positions', 'false').lower() == 'true'
         
-        tee_sets = TeeSetService.get_tee_sets_by_course(course_id, include_positions)
+        tee_sets = TeeSetService.get_tee_sets_by_course(
+            course_id, include_positions,
+            fields=request.args.get('fields'),
+            include=request.args.get('include')
+        )
         
         return jsonify({
             "success": True,
@@ -43,6 +49,13 @@ def get_tee_sets_by_course(course_id):
             "course_id": course_id
         }), 200
         
+    except ValueError as e:
+        return jsonify({
+            "success": False,
+            "error": "Invalid query parameters",
+            "message": str(e)
+        }), 400
+        
     except Exception as e:
         return jsonify({
             "success": False,
@@ -53,13 +66,18 @@ def get_tee_sets_by_course(course_id):
 
 @tee_set_api.route("/<int:tee_set_id>", methods=["GET"])
 @token_required
+@conditional(ConditionalService.tee_set)
 def get_tee_set(tee_set_id):
     """Get a specific tee set"""
     try:
         # Parse query parameters
         include_positions = request.args.get('include_positions', 'false').lower() == 'true'
         
-        tee_set = TeeSetService.get_tee_set_by_id(tee_set_id, include_positions)
+        tee_set = TeeSetService.get_tee_set_by_id(
+            tee_set_id, include_positions,
+            fields=request.args.get('fields'),
+            include=request.args.get('include')
+        )
         
         if not tee_set:
             return jsonify({
@@ -72,6 +90,13 @@ def get_tee_set(tee_set_id):
             "data": tee_set
         }), 200
         
+    except ValueError as e:
+        return jsonify({
+            "success": False,
+            "error": "Invalid query parameters",
+            "message": str(e)
+        }), 400
+        
     except Exception as e:
         return jsonify({
             "success": False,
@@ -8,6 +8,7 @@ from flask import Blueprint, request, jsonify
 from marshmallow import ValidationError
 from app.services.theme_service import ThemeService
 from app.services.auth_service import admin_required, token_required
+from app.services.conditional_service import ConditionalService, conditional
 from app.schemas.theme_schema import (
     ThemeCreateSchema, ThemeUpdateSchema, ThemeResponseSchema
 )
@@ -22,6 +23,7 @@ theme_response_schema = ThemeResponseSchema()
 
 @theme_api.route("", methods=["GET"])
 @token_required
+@conditional(ConditionalService.themes, collection=True)
 def list_themes():
     """Get all themes - requires authentication"""
     try:
@@ -43,6 +45,7 @@ def list_themes():
 
 @theme_api.route("/<int:theme_id>", methods=["GET"])
 @token_required
+@conditional(ConditionalService.theme)
 def get_theme(theme_id):
     """Get a specific theme - requires authentication"""
     try:
@@ -28,19 +28,35 @@ user_search_schema = UserSearchSchema()
 @user_bp.route('/', methods=['GET'])
 @admin_required
 def get_users():
-    """Get all users (admin only)"""
+    """Get all users (admin only)
+    
+    Paginated by cursor (cursor, limit) unless a page number is given.
+    """
     try:
         # Parse and validate query parameters
         search_params = user_search_schema.load(request.args)
-        
-        users, meta = UserService.get_all_users(
-            page=search_params.get('page', 1),
-            per_page=search_params.get('per_page', 20),
-            search=search_params.get('search'),
-            club_id=search_params.get('club_id'),
-            is_active=search_params.get('is_active'),
-            is_admin=search_params.get('is_admin')
-        )
+        filters = {
+            'search': search_params.get('search'),
+            'club_id': search_params.get('club_id'),
+            'is_active': search_params.get('is_active'),
+            'is_admin': search_params.get('is_admin')
+        }
+        
+        if 'page' in search_params:
+            users, meta = UserService.get_all_users(
+                page=search_params['page'],
+                per_page=search_params['per_page'],
+                fields=search_params.get('field_names'),
+                **filters
+            )
+        else:
+            users, meta = UserService.list_users(
+                cursor=search_params.get('cursor'),
+                limit=search_params.get('limit', search_params['per_page']),
+                total=search_params.get('total'),
+                fields=search_params.get('field_names'),
+                **filters
+            )
         
         return jsonify({
             'success': True,
@@ -57,6 +73,13 @@ def get_users():
             'details': e.messages
         }), 400
         
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': 'Invalid query parameters',
+            'message': str(e)
+        }), 400
+        
     except Exception as e:
         return jsonify({
             'success': False,
@@ -128,7 +151,9 @@ def get_user(user_id):
             }), 403
         
         # Get target user data
-        target_user = UserService.get_user_by_id(user_id, include_sensitive=is_admin)
+        target_user = UserService.get_user_by_id(
+            user_id, include_sensitive=is_admin, fields=request.args.get('fields')
+        )
         
         if not target_user:
             return jsonify({
@@ -141,6 +166,13 @@ def get_user(user_id):
             'data': target_user
         }), 200
         
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': 'Invalid query parameters',
+            'message': str(e)
+        }), 400
+        
     except Exception as e:
         return jsonify({
             'success': False,
@@ -3,6 +3,7 @@ Admin web interface routes
 """
 from flask import Blueprint, render_template, request, redirect, url_for, flash
 from flask_login import login_required, current_user
+from app.services.import_service import ImportService
 
 admin_bp = Blueprint('admin', __name__)
 
@@ -81,21 +82,21 @@ def users():
 @admin_bp.route('/upload', methods=['GET', 'POST'])
 @login_required
 def upload():
-    """CSV upload page"""
+    """CSV/XLSX upload page: queues the file for a background import"""
     if request.method == 'POST':
-        # TODO: Handle file upload
-        # TODO: Process CSV file
-        # TODO: Validate data
-        # TODO: Import to database
-        
-        file = request.files.get('file')
-        if file and file.filename.endswith('.csv'):
-            flash('File uploaded successfully', 'success')
+        # TODO: Check if current user is admin
+        try:
+            job = ImportService.create_job(
+                request.files.get('file'),
+                request.form.get('kind', ''),
+                created_by_id=getattr(current_user, 'id', None)
+            )
+            flash(f"File uploaded; import #{job['id']} is running in the background", 'success')
             return redirect(url_for('admin.dashboard'))
-        else:
-            flash('Please upload a valid CSV file', 'error')
+        except ValueError as e:
+            flash(str(e), 'error')
     
-    return render_template('admin/upload.html', title='Upload CSV')
+    return render_template('admin/upload.html', title='Upload CSV', kinds=list(ImportService.KINDS))
 
 
 @admin_bp.route('/settings')
@@ -3,7 +3,7 @@ Round Schema
 
 Simple Marshmallow schemas for round validation and serialization.
 """
-from marshmallow import Schema, fields, validate
+from marshmallow import Schema, ValidationError, fields, validate, validates_schema
 from datetime import date
 
 
@@ -34,6 +34,8 @@ class RoundResponseSchema(Schema):
     total_points = fields.Int(allow_none=True)
     net_score = fields.Int(allow_none=True, dump_only=True)
     differential = fields.Float(allow_none=True)
+    holes_played = fields.Int(dump_only=True)
+    expected_holes = fields.Int(dump_only=True)
     is_complete = fields.Bool(dump_only=True)
     user_id = fields.Int()
     course_id = fields.Int()
@@ -44,4 +46,19 @@ class RoundResponseSchema(Schema):
 
 class RoundWithScoresSchema(RoundResponseSchema):
     """Schema for round response with scores"""
-    scores = fields.List(fields.Dict(), dump_only=True) 
\ No newline at end of file
+    scores = fields.List(fields.Dict(), dump_only=True) 
+
+
+class RoundExportQuerySchema(Schema):
+    """Schema for round export query parameters"""
+    user_id = fields.Int()
+    club_id = fields.Int()
+    date_from = fields.Date()
+    date_to = fields.Date()
+    format = fields.Str(validate=validate.OneOf(['ndjson', 'csv']), missing='ndjson')
+
+    @validates_schema
+    def validate_date_range(self, data, **kwargs):
+        """date_from may not be after date_to"""
+        if data.get('date_from') and data.get('date_to') and data['date_from'] > data['date_to']:
+            raise ValidationError('date_from must be on or before date_to', 'date_from')
@@ -42,4 +42,9 @@ class BulkScoreCreateSchema(Schema):
 class HoleScoreSchema(Schema):
     """Schema for individual hole score in bulk operations"""
     hole_number = fields.Int(required=True, validate=validate.Range(min=1, max=18))
-    strokes = fields.Int(required=True, validate=validate.Range(min=1, max=20)) 
\ No newline at end of file
+    strokes = fields.Int(required=True, validate=validate.Range(min=1, max=20))
+
+
+class ScorecardSubmitSchema(Schema):
+    """Schema for submitting a full or partial scorecard"""
+    hole_scores = fields.List(fields.Nested(HoleScoreSchema), required=True, validate=validate.Length(min=1))
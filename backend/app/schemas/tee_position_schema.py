@@ -3,7 +3,7 @@ TeePosition Schema
 
 Marshmallow schemas for tee position validation and serialization.
 """
-from marshmallow import Schema, fields, validate, post_load
+from marshmallow import Schema, fields, validate, validates_schema, ValidationError
 
 
 class TeePositionCreateSchema(Schema):
@@ -53,6 +53,34 @@ class TeePositionBulkUpdateSchema(Schema):
     distances = fields.List(fields.Dict(), required=True, validate=validate.Length(min=1))
 
 
+class TeePositionBatchCreateSchema(Schema):
+    """Schema for bulk creating tee positions for many tee sets"""
+    tee_sets = fields.List(fields.Nested(TeePositionBulkCreateSchema), required=True,
+                           validate=validate.Length(min=1))
+
+    @validates_schema
+    def validate_unique_tee_sets(self, data, **kwargs):
+        """Each tee set may appear only once"""
+        _validate_unique_tee_sets(data)
+
+
+class TeePositionBatchUpdateSchema(Schema):
+    """Schema for bulk updating distances of many tee sets"""
+    tee_sets = fields.List(fields.Nested(TeePositionBulkUpdateSchema), required=True,
+                           validate=validate.Length(min=1))
+
+    @validates_schema
+    def validate_unique_tee_sets(self, data, **kwargs):
+        """Each tee set may appear only once"""
+        _validate_unique_tee_sets(data)
+
+
+def _validate_unique_tee_sets(data):
+    tee_set_ids = [entry['tee_set_id'] for entry in data.get('tee_sets', [])]
+    if len(tee_set_ids) != len(set(tee_set_ids)):
+        raise ValidationError('Each tee set may appear only once', 'tee_sets')
+
+
 class DistanceUpdateSchema(Schema):
     """Schema for individual distance update"""
     hole_number = fields.Int(required=True, validate=validate.Range(min=1, max=18))
@@ -95,9 +95,14 @@ class UserListSchema(Schema):
 
 class UserSearchSchema(Schema):
     """Schema for user search parameters"""
-    page = fields.Int(missing=1, validate=validate.Range(min=1))
+    page = fields.Int(validate=validate.Range(min=1))
     per_page = fields.Int(missing=20, validate=validate.Range(min=1, max=100))
+    cursor = fields.Str()
+    limit = fields.Int(validate=validate.Range(min=1, max=100))
+    total = fields.Str(validate=validate.OneOf(['exact', 'estimate']))
     search = fields.Str()
     club_id = fields.Int()
     is_active = fields.Bool()
-    is_admin = fields.Bool() 
\ No newline at end of file
+    is_admin = fields.Bool()
+    # Sparse fieldset (?fields=id,email); 'fields' would shadow the marshmallow module here
+    field_names = fields.Str(data_key='fields') 
\ No newline at end of file
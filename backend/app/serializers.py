@@ -0,0 +1,402 @@
+"""
+Compiled model serializers
+
+A ModelSerializer turns a field declaration (output key -> attribute path
+or callable) into one generated function per field set, the way
+namedtuple and dataclasses generate their methods:
+
+    def serialize(obj):
+        return {'id': obj.id, 'date_played': obj.date_played, ...}
+
+That builds the response dict in a single expression with no per-field
+isoformat() calls or loops; dates and datetimes stay native and are encoded
+by FastJSONProvider (see app/json_provider.py). The encoded JSON matches
+the model's to_dict().
+
+Field sets are chosen per request with fields= and include= (see
+ModelSerializer.select); load_options() then restricts the query to the
+columns and relationships those fields read, so computed properties and
+their data are skipped unless asked for. Payloads served from the course
+catalog cache are already serialized and are trimmed with pick() instead.
+"""
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from sqlalchemy import inspect
+from sqlalchemy.orm import joinedload, load_only, selectinload
+from app.models.club import Club
+from app.models.course import Course
+from app.models.handicap import Handicap
+from app.models.hole import Hole
+from app.models.round import Round
+from app.models.score import Score
+from app.models.tee_position import TeePosition
+from app.models.tee_set import TeeSet
+from app.models.user import User
+
+# Output key -> dotted attribute path or callable(obj)
+FieldSource = Union[str, Callable[[Any], Any]]
+
+
+class ModelSerializer:
+    """Field extraction for one model, compiled per field set"""
+
+    def __init__(self, name: str, model: type, fields: Dict[str, FieldSource],
+                 expansions: Optional[Dict[str, FieldSource]] = None,
+                 needs: Optional[Dict[str, Sequence[str]]] = None,
+                 loaders: Optional[Dict[str, Callable[[], Any]]] = None):
+        """
+        Args:
+            name: Resource name used in errors and generated function names
+            model: Mapped class the serializer reads
+            fields: Output keys in order, each with an attribute path
+                ('hole.par') or a callable taking the object
+            expansions: Extra keys only serialized when included (include=)
+            needs: Mapped attributes (columns or relationships) read by a
+                field or expansion; defaults to its own attribute
+            loaders: Relationship name -> factory of its loader option
+        """
+        for key, source in {**fields, **(expansions or {})}.items():
+            if not callable(source) and not all(part.isidentifier() for part in source.split('.')):
+                raise ValueError(f"Invalid attribute path '{source}' for field '{key}'")
+        self.name = name
+        self.model = model
+        self.default = tuple(fields)
+        self.expansions = tuple(expansions or ())
+        self.fields = {**fields, **(expansions or {})}
+        self.needs = dict(needs or {})
+        self.loaders = dict(loaders or {})
+        self._compiled: Dict[Tuple[str, ...], Callable[[Any], Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        self.serialize = self.compile(self.default)
+
+    def compile(self, keys: Tuple[str, ...]) -> Callable[[Any], Dict[str, Any]]:
+        """
+        Get the generated function for a field set (cached).
+
+        Args:
+            keys: Output keys to include, in output order
+
+        Returns:
+            Function mapping an object to its dict
+
+        Raises:
+            ValueError: If a key is not a declared field
+        """
+        function = self._compiled.get(keys)
+        if function is not None:
+            return function
+
+        unknown = [key for key in keys if key not in self.fields]
+        if unknown:
+            raise ValueError(f"Unknown {self.name} fields: {', '.join(unknown)}")
+
+        namespace: Dict[str, Any] = {}
+        items = []
+        for position, key in enumerate(keys):
+            source = self.fields[key]
+            if callable(source):
+                namespace[f'_field{position}'] = source
+                items.append(f'{key!r}: _field{position}(obj)')
+            else:
+                items.append(f'{key!r}: obj.{source}')
+        code = f"def serialize_{self.name}(obj):\n    return {{{', '.join(items)}}}\n"
+        exec(compile(code, f'<serializer {self.name}>', 'exec'), namespace)
+        function = namespace[f'serialize_{self.name}']
+
+        with self._lock:
+            return self._compiled.setdefault(keys, function)
+
+    def select(self, fields: Optional[str] = None, include: Optional[str] = None,
+               expand: Iterable[str] = ()) -> Tuple[str, ...]:
+        """
+        Resolve fields= and include= query parameters to a field set.
+
+        Keys come out in declaration order, so every request for the same
+        set shares one compiled function.
+
+        Args:
+            fields: Comma-separated fields, or None/empty for all fields
+            include: Comma-separated expansions
+            expand: Expansions requested by other means (e.g. include_scores)
+
+        Returns:
+            Output keys to serialize
+
+        Raises:
+            ValueError: If a field or expansion is unknown
+        """
+        requested = {key.strip() for key in (fields or '').split(',') if key.strip()}
+        unknown = requested.difference(self.default)
+        if unknown:
+            raise ValueError(f"Unknown {self.name} fields: {', '.join(sorted(unknown))}")
+
+        included = {key.strip() for key in (include or '').split(',') if key.strip()} | set(expand)
+        unknown = included.difference(self.expansions)
+        if unknown:
+            raise ValueError(f"Unknown {self.name} includes: {', '.join(sorted(unknown))}")
+
+        keys = tuple(key for key in self.default if key in requested) if requested else self.default
+        return keys + tuple(key for key in self.expansions if key in included)
+
+    def load_options(self, keys: Sequence[str], always: Sequence[str] = (), eager: bool = True) -> List[Any]:
+        """
+        Loader options fetching only what a field set reads.
+
+        Args:
+            keys: Output keys that will be serialized
+            always: Columns needed regardless of the fields (e.g. sort keys)
+            eager: Add the relationship loaders (False when the caller
+                loads relationships itself, e.g. with contains_eager)
+
+        Returns:
+            load_only() over the needed columns plus relationship loaders
+        """
+        mapper = inspect(self.model)
+        columns, relationships = set(always), []
+        for key in keys:
+            source = self.fields[key]
+            default = (source.split('.')[0],) if isinstance(source, str) else ()
+            for name in self.needs.get(key, default):
+                if name in mapper.relationships:
+                    if name not in relationships:
+                        relationships.append(name)
+                else:
+                    columns.add(mapper.column_attrs[name].key)
+
+        # Foreign keys the relationship loaders join on
+        for name in relationships:
+            for column in mapper.relationships[name].local_columns:
+                columns.add(mapper.get_property_by_column(column).key)
+
+        options = [load_only(*[getattr(self.model, name) for name in sorted(columns)])] if columns else []
+        if eager:
+            options.extend(self.loaders[name]() for name in relationships)
+        return options
+
+    def many(self, objects: Iterable[Any], keys: Optional[Tuple[str, ...]] = None) -> List[Dict[str, Any]]:
+        """Serialize a sequence of objects with a field set (default: all fields)"""
+        function = self.compile(keys) if keys is not None else self.serialize
+        return list(map(function, objects))
+
+    def one(self, obj: Any, keys: Optional[Tuple[str, ...]] = None) -> Dict[str, Any]:
+        """Serialize one object with a field set (default: all fields)"""
+        return (self.compile(keys) if keys is not None else self.serialize)(obj)
+
+    @staticmethod
+    def pick(data: Dict[str, Any], keys: Sequence[str]) -> Dict[str, Any]:
+        """Trim an already serialized dict (e.g. a cached snapshot) to a field set"""
+        return {key: data[key] for key in keys if key in data}
+
+
+def _hole_attribute(name: str) -> Callable[[Any], Any]:
+    def get(score):
+        hole = score.hole
+        return getattr(hole, name) if hole else None
+    return get
+
+
+SCORE = ModelSerializer('score', Score, {
+    'id': 'id',
+    'strokes': 'strokes',
+    'points': 'points',
+    'score_to_par': 'score_to_par',
+    'score_name': 'score_name',
+    'round_id': 'round_id',
+    'hole_id': 'hole_id',
+    'hole_number': _hole_attribute('hole_number'),
+    'hole_par': _hole_attribute('par'),
+    'created_at': 'created_at',
+    'updated_at': 'updated_at',
+}, needs={
+    'score_to_par': ('strokes', 'hole'),
+    'score_name': ('strokes', 'hole'),
+    'hole_number': ('hole',),
+    'hole_par': ('hole',),
+}, loaders={
+    'hole': lambda: joinedload(Score.hole),
+})
+
+ROUND = ModelSerializer('round', Round, {
+    'id': 'id',
+    'date_played': 'date_played',
+    'handicap_used': 'handicap_used',
+    'course_handicap': 'course_handicap',
+    'course_rating': 'course_rating',
+    'slope_rating': 'slope_rating',
+    'total_score': 'total_score',
+    'total_points': 'total_points',
+    'net_score': 'net_score',
+    'differential': 'differential',
+    'holes_played': 'holes_played',
+    'expected_holes': 'expected_holes',
+    'is_complete': 'is_complete',
+    'user_id': 'user_id',
+    'course_id': 'course_id',
+    'tee_set_id': 'tee_set_id',
+    'created_at': 'created_at',
+    'updated_at': 'updated_at',
+}, expansions={
+    # Round.to_dict(include_scores=True)
+    'scores': lambda round: SCORE.many(round.scores),
+}, needs={
+    'net_score': ('total_score', 'course_handicap'),
+    'scores': ('scores',),
+}, loaders={
+    'scores': lambda: selectinload(Round.scores).joinedload(Score.hole),
+})
+
+def _tee_positions(parent: Any) -> List[Dict[str, Any]]:
+    return [position.to_dict() for position in parent.tee_positions]
+
+
+HOLE = ModelSerializer('hole', Hole, {
+    'id': 'id',
+    'hole_number': 'hole_number',
+    'par': 'par',
+    'stroke_index': 'stroke_index',
+    'course_id': 'course_id',
+    'created_at': 'created_at',
+    'updated_at': 'updated_at',
+}, expansions={
+    # Hole.to_dict(include_tee_positions=True)
+    'tee_positions': _tee_positions,
+}, needs={
+    'tee_positions': ('tee_positions',),
+}, loaders={
+    'tee_positions': lambda: selectinload(Hole.tee_positions),
+})
+
+TEE_SET = ModelSerializer('tee_set', TeeSet, {
+    'id': 'id',
+    'name': 'name',
+    'slope_rating': 'slope_rating',
+    'course_rating': 'course_rating',
+    'women_slope_rating': 'women_slope_rating',
+    'women_course_rating': 'women_course_rating',
+    'course_id': 'course_id',
+    'total_length_meters': 'total_length_meters',
+    'created_at': 'created_at',
+    'updated_at': 'updated_at',
+}, expansions={
+    # TeeSet.to_dict(include_positions=True)
+    'tee_positions': _tee_positions,
+}, needs={
+    'total_length_meters': ('tee_positions',),
+    'tee_positions': ('tee_positions',),
+}, loaders={
+    'tee_positions': lambda: selectinload(TeeSet.tee_positions).joinedload(TeePosition.hole),
+})
+
+COURSE = ModelSerializer('course', Course, {
+    'id': 'id',
+    'name': 'name',
+    'holes_count': 'holes_count',
+    'description': 'description',
+    'club_id': 'club_id',
+    'default_tee_set_id': 'default_tee_set_id',
+    'total_par': 'total_par',
+    'created_at': 'created_at',
+    'updated_at': 'updated_at',
+}, expansions={
+    # Course.to_dict(include_holes=True, include_tee_sets=True); club as in full_details
+    'holes': lambda course: HOLE.many(course.holes),
+    'tee_sets': lambda course: TEE_SET.many(course.tee_sets),
+    'club': lambda course: course.club.to_dict() if course.club else None,
+}, needs={
+    'total_par': ('holes',),
+    'holes': ('holes',),
+    'tee_sets': ('tee_sets',),
+    'club': ('club',),
+}, loaders={
+    'holes': lambda: selectinload(Course.holes),
+    'tee_sets': lambda: selectinload(Course.tee_sets).selectinload(TeeSet.tee_positions),
+    'club': lambda: joinedload(Course.club),
+})
+
+CLUB = ModelSerializer('club', Club, {
+    'id': 'id',
+    'name': 'name',
+    'description': 'description',
+    'website': 'website',
+    'email': 'email',
+    'phone': 'phone',
+    'address': 'address',
+    'city': 'city',
+    'country': 'country',
+    'postal_code': 'postal_code',
+    'timezone': 'timezone',
+    'full_address': 'full_address',
+    'created_at': 'created_at',
+    'updated_at': 'updated_at',
+}, expansions={
+    # ClubService.get_club_with_courses()
+    'courses': lambda club: COURSE.many(club.courses),
+    'course_count': lambda club: len(club.courses),
+}, needs={
+    'full_address': ('address', 'city', 'postal_code', 'country'),
+    'courses': ('courses',),
+    'course_count': ('courses',),
+}, loaders={
+    # Course summaries compute total_par from holes
+    'courses': lambda: selectinload(Club.courses).selectinload(Course.holes),
+})
+
+HANDICAP = ModelSerializer('handicap', Handicap, {
+    'id': 'id',
+    'handicap_value': 'handicap_value',
+    'start_date': 'start_date',
+    'end_date': 'end_date',
+    'reason': 'reason',
+    'is_current': 'is_current',
+    'days_active': lambda handicap: handicap.days_active(),
+    'user_id': 'user_id',
+    'created_by_id': 'created_by_id',
+    'created_at': 'created_at',
+    'updated_at': 'updated_at',
+}, needs={
+    'is_current': ('end_date',),
+    'days_active': ('start_date', 'end_date'),
+})
+
+_USER_FIELDS: Dict[str, FieldSource] = {
+    'id': 'id',
+    'email': 'email',
+    'first_name': 'first_name',
+    'last_name': 'last_name',
+    'full_name': 'full_name',
+    'sex': 'sex',
+    'is_active': 'is_active',
+    'distance_unit': 'distance_unit',
+    'timezone': 'timezone',
+    'country': 'country',
+    'city': 'city',
+    'address': 'address',
+    'postal_code': 'postal_code',
+    'full_address': 'full_address',
+    'home_club_id': 'home_club_id',
+    'preferred_theme_id': 'preferred_theme_id',
+    'current_handicap': 'current_handicap',
+    'created_at': 'created_at',
+    'updated_at': 'updated_at',
+    'last_login': 'last_login',
+}
+
+_USER_NEEDS = {
+    'full_name': ('first_name', 'last_name'),
+    'full_address': ('address', 'city', 'postal_code', 'country'),
+    'current_handicap': ('current_handicap_record',),
+}
+
+_USER_LOADERS = {
+    'current_handicap_record': lambda: selectinload(User.current_handicap_record),
+}
+
+USER = ModelSerializer('user', User, _USER_FIELDS, needs=_USER_NEEDS, loaders=_USER_LOADERS)
+
+# User.to_dict(include_sensitive=True)
+USER_SENSITIVE = ModelSerializer('user', User, {
+    **_USER_FIELDS,
+    'is_admin': 'is_admin',
+    'password_reset_token': 'password_reset_token',
+    'password_reset_expires': 'password_reset_expires',
+}, needs=_USER_NEEDS, loaders=_USER_LOADERS)
@@ -4,10 +4,15 @@ Authentication Service
 Contains authentication and authorization logic.
 Provides decorators for protecting routes.
 """
-from flask import request, jsonify, current_app
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from flask import request, jsonify, current_app, has_request_context
 from functools import wraps
-from flask_jwt_extended import verify_jwt_in_request, get_jwt_identity, get_jwt
+from flask_jwt_extended import verify_jwt_in_request, get_jwt_identity, get_jwt, get_current_user
 import jwt
+from app.extensions import db
+from app.models.user import User
 
 
 def token_required(f):
@@ -46,26 +51,28 @@ def admin_required(f):
             current_user_id = int(get_jwt_identity())
             
             # SECURITY FIX: Always check current admin status from database
-            # Don't trust JWT claims for admin verification
-            from app.services.user_service import UserService
-            current_user = UserService.get_user_by_id(current_user_id, include_sensitive=True)
+            # Don't trust JWT claims for admin verification. The flags come
+            # from the user row the JWT user lookup loaded for this request.
+            status = AuthorizationCache.get_status(current_user_id)
             
-            if not current_user:
+            if not status:
                 return jsonify({
                     "success": False,
                     "error": "User not found",
                     "message": "Invalid user token"
                 }), 401
             
+            is_active, is_admin = status
+            
             # Verify user is active and admin based on current database state
-            if not current_user.get('is_active', False):
+            if not is_active:
                 return jsonify({
                     "success": False,
                     "error": "Account deactivated",
                     "message": "User account has been deactivated"
                 }), 403
                 
-            if not current_user.get('is_admin', False):
+            if not is_admin:
                 return jsonify({
                     "success": False,
                     "error": "Admin access required",
@@ -147,4 +154,86 @@ class AuthService:
             claims = get_jwt()
             return claims.get('is_admin', False)
         except Exception:
-            return False
\ No newline at end of file
+            return False
+
+
+class AuthorizationCache:
+    """
+    Lookup of users' (is_active, is_admin) flags for authorization checks.
+    
+    Inside a JWT-protected request the flags are read from the user row the
+    JWT user lookup already loaded, so every process sees changes on the
+    next request without a second query. Other lookups go to the database;
+    only active non-admin results are cached, for ADMIN_STATUS_CACHE_TTL
+    seconds, so a revoked admin or deactivated account is never served
+    from the cache and a grant made by another process waits a few seconds
+    at most.
+    """
+    
+    DEFAULT_TTL = 5
+    
+    # user_id -> (expires_at, is_active, is_admin)
+    _entries: Dict[int, Tuple[float, bool, bool]] = {}
+    _lock = threading.Lock()
+    
+    @staticmethod
+    def get_status(user_id: int) -> Optional[Tuple[bool, bool]]:
+        """
+        Get a user's authorization flags.
+        
+        Args:
+            user_id: The user ID
+            
+        Returns:
+            Tuple of (is_active, is_admin), or None if the user does not exist
+        """
+        user = AuthorizationCache._request_user(user_id)
+        if user is not None:
+            return bool(user.is_active), bool(user.is_admin)
+        
+        now = time.monotonic()
+        with AuthorizationCache._lock:
+            entry = AuthorizationCache._entries.get(user_id)
+        if entry and entry[0] > now:
+            return entry[1], entry[2]
+        
+        row = db.session.query(User.is_active, User.is_admin).filter(User.id == user_id).first()
+        if row is None:
+            AuthorizationCache.invalidate(user_id)
+            return None
+        
+        is_active, is_admin = bool(row.is_active), bool(row.is_admin)
+        ttl = current_app.config.get('ADMIN_STATUS_CACHE_TTL', AuthorizationCache.DEFAULT_TTL)
+        if ttl > 0 and is_active and not is_admin:
+            with AuthorizationCache._lock:
+                AuthorizationCache._entries[user_id] = (now + ttl, is_active, is_admin)
+        else:
+            AuthorizationCache.invalidate(user_id)
+        return is_active, is_admin
+    
+    @staticmethod
+    def invalidate(user_id: Optional[int] = None) -> None:
+        """
+        Drop cached flags after they change.
+        
+        Args:
+            user_id: User whose entry to drop (all users if None)
+        """
+        with AuthorizationCache._lock:
+            if user_id is None:
+                AuthorizationCache._entries.clear()
+            else:
+                AuthorizationCache._entries.pop(user_id, None)
+    
+    @staticmethod
+    def _request_user(user_id: int) -> Optional[User]:
+        """The user loaded by the current request's JWT, if it is user_id"""
+        if not has_request_context():
+            return None
+        try:
+            user = get_current_user()
+        except RuntimeError:
+            return None
+        if user is None or user.id != user_id:
+            return None
+        return user
@@ -0,0 +1,125 @@
+"""
+Background Worker
+
+Shared thread pool for in-process background work such as the email outbox
+and queued imports. Subclasses name their config keys and implement
+`run_once`; every subclass gets its own threads and wake/stop events.
+"""
+import threading
+from typing import List, Optional
+from flask import Flask
+from app.extensions import db
+
+
+class BackgroundWorker:
+    """
+    Base class for a lazily started pool of daemon worker threads.
+
+    Subclasses set:
+        NAME: Thread name prefix and log label
+        WORKERS_CONFIG: Config key holding the default number of threads
+        POLL_INTERVAL_CONFIG: Config key holding the idle poll interval in seconds
+    """
+
+    NAME = 'worker'
+    WORKERS_CONFIG = ''
+    POLL_INTERVAL_CONFIG = ''
+    DEFAULT_POLL_INTERVAL = 5
+
+    _threads: List[threading.Thread] = []
+    _wake = threading.Event()
+    _stop = threading.Event()
+    _lock = threading.Lock()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._threads = []
+        cls._wake = threading.Event()
+        cls._stop = threading.Event()
+        cls._lock = threading.Lock()
+
+    @classmethod
+    def run_once(cls) -> int:
+        """
+        Do one batch of work inside an application context.
+
+        Returns:
+            Number of items handled; 0 makes the worker sleep until notified
+        """
+        raise NotImplementedError
+
+    @classmethod
+    def start(cls, app: Flask, workers: Optional[int] = None) -> int:
+        """
+        Start the worker threads if they are not already running.
+
+        Args:
+            app: Flask application the workers run in
+            workers: Number of threads (defaults to the WORKERS_CONFIG setting)
+
+        Returns:
+            Number of running worker threads
+        """
+        if workers is None:
+            workers = app.config.get(cls.WORKERS_CONFIG, 0)
+
+        with cls._lock:
+            alive = [thread for thread in cls._threads if thread.is_alive()]
+            if not alive and workers > 0:
+                cls._stop.clear()
+                for number in range(workers):
+                    thread = threading.Thread(
+                        target=cls._run,
+                        args=(app,),
+                        name=f'{cls.NAME}-{number + 1}',
+                        daemon=True
+                    )
+                    thread.start()
+                    alive.append(thread)
+            cls._threads = alive
+            return len(alive)
+
+    @classmethod
+    def notify(cls, app: Flask) -> None:
+        """
+        Wake idle workers, starting them on first use or if they have died.
+
+        Args:
+            app: Flask application the workers run in
+        """
+        cls.start(app)
+        cls._wake.set()
+
+    @classmethod
+    def stop(cls, timeout: float = 5.0) -> None:
+        """
+        Stop the worker threads after their current batch.
+
+        Args:
+            timeout: Seconds to wait for each thread
+        """
+        cls._stop.set()
+        cls._wake.set()
+        with cls._lock:
+            threads, cls._threads = cls._threads, []
+        for thread in threads:
+            thread.join(timeout)
+
+    @classmethod
+    def _run(cls, app: Flask) -> None:
+        """Worker loop: run batches back to back, sleep when there is no work"""
+        poll_interval = app.config.get(cls.POLL_INTERVAL_CONFIG, cls.DEFAULT_POLL_INTERVAL)
+        while not cls._stop.is_set():
+            handled = 0
+            with app.app_context():
+                try:
+                    handled = cls.run_once()
+                except Exception as e:
+                    db.session.rollback()
+                    app.logger.error(f"{cls.NAME} worker error: {str(e)}")
+                finally:
+                    db.session.remove()
+
+            if not handled:
+                cls._wake.wait(poll_interval)
+                cls._wake.clear()
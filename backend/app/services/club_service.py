@@ -4,10 +4,13 @@ Club Service
 Contains all business logic for club operations.
 Follows the "Fat Services, Thin Routes" pattern.
 """
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from sqlalchemy.exc import IntegrityError
 from app.extensions import db
 from app.models.club import Club
+from app.serializers import CLUB
+from app.services.course_catalog_cache import CourseCatalogCache
+from app.services.pagination import KeysetPagination
 
 
 class ClubService:
@@ -25,38 +28,91 @@ class ClubService:
         return [club.to_dict() for club in clubs]
 
     @staticmethod
-    def get_club_by_id(club_id: int) -> Optional[Dict[str, Any]]:
+    def list_clubs(search: Optional[str] = None, country: Optional[str] = None,
+                   cursor: Optional[str] = None, limit: int = KeysetPagination.DEFAULT_LIMIT,
+                   total: Optional[str] = None, fields: Optional[str] = None,
+                   include: Optional[str] = None) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Get clubs ordered by name with keyset (cursor) pagination.
+        
+        Args:
+            search: Match on name or city
+            country: Match on country
+            cursor: Cursor from the previous page, or None for the first page
+            limit: Page size
+            total: 'exact' or 'estimate' to include a total count
+            fields: Comma-separated club fields to return (default: all)
+            include: Comma-separated expansions ('courses', 'course_count')
+            
+        Returns:
+            Tuple of (clubs, meta) with next_cursor and has_more in meta
+            
+        Raises:
+            ValueError: If the cursor, paging parameters or fields are invalid
+        """
+        keys = CLUB.select(fields, include)
+        # Only the requested columns, plus the sort key for the next cursor
+        query = Club.query.options(*CLUB.load_options(keys, always=('name',)))
+        if search:
+            query = query.filter(
+                db.or_(
+                    Club.name.ilike(f'%{search}%'),
+                    Club.city.ilike(f'%{search}%')
+                )
+            )
+        if country:
+            query = query.filter(Club.country.ilike(f'%{country}%'))
+        
+        clubs, meta = KeysetPagination.paginate(
+            query,
+            [(Club.name, False), (Club.id, False)],
+            limit=limit,
+            cursor=cursor,
+            total=total
+        )
+        return CLUB.many(clubs, keys), meta
+
+    @staticmethod
+    def get_club_by_id(club_id: int, fields: Optional[str] = None,
+                       include: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
         Get a specific club by ID.
         
         Args:
             club_id: The club ID
+            fields: Comma-separated club fields to return (default: all)
+            include: Comma-separated expansions ('courses', 'course_count')
             
         Returns:
             Club dictionary or None if not found
+            
+        Raises:
+            ValueError: If a field or expansion is unknown
         """
-        club = Club.query.get(club_id)
-        return club.to_dict() if club else None
+        keys = CLUB.select(fields, include)
+        club = Club.query.options(*CLUB.load_options(keys)).get(club_id)
+        return CLUB.one(club, keys) if club else None
 
     @staticmethod
-    def get_club_with_courses(club_id: int) -> Optional[Dict[str, Any]]:
+    def get_club_with_courses(club_id: int, fields: Optional[str] = None,
+                              include: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
         Get a club with all its courses.
         
         Args:
             club_id: The club ID
+            fields: Comma-separated club fields to return (default: all)
+            include: Further expansions (courses and course_count are always included)
             
         Returns:
-            Club dictionary with courses or None if not found
-        """
-        club = Club.query.get(club_id)
-        if not club:
-            return None
+            Club dictionary with courses and course_count or None if not found
             
-        club_data = club.to_dict()
-        club_data['courses'] = [course.to_dict() for course in club.courses]
-        club_data['course_count'] = len(club.courses)
-        return club_data
+        Raises:
+            ValueError: If a field or expansion is unknown
+        """
+        keys = CLUB.select(fields, include, expand=('courses', 'course_count'))
+        club = Club.query.options(*CLUB.load_options(keys)).get(club_id)
+        return CLUB.one(club, keys) if club else None
 
     @staticmethod
     def create_club(club_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -139,6 +195,8 @@ class ClubService:
             if 'country' in club_data:
                 club.country = club_data['country']
 
+            # Course snapshots embed the club
+            CourseCatalogCache.bump(club_id=club.id)
             db.session.commit()
             return club.to_dict()
             
@@ -161,8 +219,11 @@ class ClubService:
         if not club:
             return False
 
+        course_ids = [course.id for course in club.courses]
         db.session.delete(club)
         db.session.commit()
+        for course_id in course_ids:
+            CourseCatalogCache.discard(course_id)
         return True
 
     @staticmethod
@@ -0,0 +1,290 @@
+"""
+Conditional Request Service
+
+ETag / Last-Modified validators for read endpoints. Validators come from
+cheap aggregate queries (max(updated_at), row counts, the course catalog
+version) instead of the serialized payload, so a request whose validators
+still match is answered with 304 Not Modified before the view runs.
+"""
+import hashlib
+import logging
+from datetime import date, datetime, timezone
+from functools import wraps
+from typing import Any, Callable, Optional, Tuple
+from flask import make_response, request
+from flask_jwt_extended import get_jwt_identity
+from sqlalchemy import func, select
+from app.extensions import db
+from app.models.club import Club
+from app.models.course import Course
+from app.models.handicap import Handicap
+from app.models.hole import Hole
+from app.models.round import Round
+from app.models.score import Score
+from app.models.tee_set import TeeSet
+from app.models.theme import Theme
+from app.replica import ReplicaRouter
+from app.services.auth_service import AuthorizationCache
+
+logger = logging.getLogger(__name__)
+
+# (last modified, version token) of a resource
+Validators = Tuple[Optional[datetime], Any]
+
+
+def conditional(validator: Callable[..., Optional[Validators]], collection: bool = False):
+    """
+    Decorator adding ETag / Last-Modified support to a GET route.
+
+    Place it below the authentication and permission decorators: a 304 is
+    sent before the view body runs. The validator is called with the view's
+    URL arguments and returns (last_modified, token), or None when the
+    resource does not exist or the current user may not read it (the view
+    then runs unchanged and makes its own checks).
+
+    Args:
+        validator: Function computing the resource's validators
+        collection: The resource is or embeds a set of rows; deleting one does
+            not move its Last-Modified, so only If-None-Match can produce a 304
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            try:
+                # Validators read the same database as the read-only view
+                with ReplicaRouter.reads():
+                    validators = validator(**kwargs)
+            except Exception as e:
+                logger.warning(f"Validator for {request.endpoint} failed: {e}")
+                validators = None
+            if validators is None:
+                return f(*args, **kwargs)
+
+            last_modified, token = validators
+            etag = ConditionalService.make_etag(token)
+            last_modified = ConditionalService.http_date(last_modified)
+
+            if ConditionalService.is_not_modified(etag, last_modified, collection):
+                response = make_response('', 304)
+            else:
+                response = make_response(f(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+
+            response.set_etag(etag, weak=True)
+            if last_modified:
+                response.last_modified = last_modified
+            # Stored per user, always revalidated
+            response.headers['Cache-Control'] = 'private, no-cache'
+            response.vary.add('Authorization')
+            return response
+        return decorated_function
+    return decorator
+
+
+class ConditionalService:
+    """Service class for conditional request validators"""
+
+    @staticmethod
+    def make_etag(token: Any) -> str:
+        """
+        Build an entity tag for the current request's representation.
+
+        The path and query string are part of the tag, so different
+        filters, pages and includes of one resource never share a tag.
+
+        Args:
+            token: Version token of the resource
+
+        Returns:
+            Opaque entity tag value (without quotes)
+        """
+        arguments = sorted(request.args.items(multi=True))
+        seed = repr((request.path, arguments, token))
+        return hashlib.sha1(seed.encode()).hexdigest()
+
+    @staticmethod
+    def http_date(value: Optional[datetime]) -> Optional[datetime]:
+        """
+        Convert a naive UTC timestamp to the one-second precision of HTTP dates.
+
+        Args:
+            value: Naive UTC datetime (as stored in updated_at columns)
+
+        Returns:
+            Timezone-aware datetime without microseconds, or None
+        """
+        if value is None:
+            return None
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.replace(microsecond=0)
+
+    @staticmethod
+    def is_not_modified(etag: str, last_modified: Optional[datetime], collection: bool = False) -> bool:
+        """
+        Check the request's preconditions against the current validators.
+
+        If-None-Match takes precedence over If-Modified-Since (RFC 9110).
+
+        Args:
+            etag: Current entity tag
+            last_modified: Current Last-Modified date
+            collection: Whether If-Modified-Since should be ignored
+
+        Returns:
+            True if the client's copy is still current
+        """
+        if request.if_none_match:
+            return request.if_none_match.contains_weak(etag)
+        if collection or not last_modified or not request.if_modified_since:
+            return False
+        return last_modified <= request.if_modified_since
+
+    @staticmethod
+    def _aggregate(model, *criteria) -> Validators:
+        """(max(updated_at), (count, max(updated_at))) of a filtered table"""
+        last_modified, count = db.session.execute(
+            select(func.max(model.updated_at), func.count(model.id)).where(*criteria)
+        ).one()
+        return last_modified, (count, str(last_modified))
+
+    @staticmethod
+    def _may_read(owner_id: int) -> bool:
+        """Whether the current user owns a player's records or is an admin"""
+        current_user_id = int(get_jwt_identity())
+        if current_user_id == owner_id:
+            return True
+        status = AuthorizationCache.get_status(current_user_id)
+        return bool(status and status[0] and status[1])
+
+    # Clubs
+
+    @staticmethod
+    def clubs() -> Validators:
+        """Validators of the club list"""
+        return ConditionalService._aggregate(Club)
+
+    @staticmethod
+    def club(club_id: int) -> Optional[Validators]:
+        """Validators of a club, including its courses"""
+        row = db.session.execute(
+            select(Club.updated_at, func.max(Course.updated_at), func.count(Course.id))
+            .outerjoin(Course, Course.club_id == Club.id)
+            .where(Club.id == club_id)
+            .group_by(Club.id)
+        ).first()
+        if row is None:
+            return None
+        club_updated, courses_updated, course_count = row
+        last_modified = max(value for value in (club_updated, courses_updated) if value is not None)
+        return last_modified, (str(club_updated), str(courses_updated), course_count)
+
+    # Courses and their layout
+
+    @staticmethod
+    def courses() -> Validators:
+        """Validators of course lists and searches (which match club names)"""
+        last_modified, token = ConditionalService._aggregate(Course)
+        clubs_modified, clubs_token = ConditionalService._aggregate(Club)
+        if clubs_modified and (last_modified is None or clubs_modified > last_modified):
+            last_modified = clubs_modified
+        return last_modified, (token, clubs_token)
+
+    @staticmethod
+    def course(course_id: int) -> Optional[Validators]:
+        """
+        Validators of a course's details, holes and tee sets.
+
+        Every layout write bumps the course's catalog_version (and with it
+        updated_at), so one primary key lookup covers the whole layout.
+        """
+        row = db.session.execute(
+            select(Course.updated_at, Course.catalog_version).where(Course.id == course_id)
+        ).first()
+        if row is None:
+            return None
+        return row.updated_at, (course_id, row.catalog_version)
+
+    @staticmethod
+    def hole(hole_id: int) -> Optional[Validators]:
+        """Validators of a hole, from its course's catalog version"""
+        row = db.session.execute(
+            select(Course.id, Course.updated_at, Course.catalog_version)
+            .join(Hole, Hole.course_id == Course.id)
+            .where(Hole.id == hole_id)
+        ).first()
+        if row is None:
+            return None
+        return row.updated_at, (row.id, row.catalog_version)
+
+    @staticmethod
+    def tee_set(tee_set_id: int) -> Optional[Validators]:
+        """Validators of a tee set, from its course's catalog version"""
+        row = db.session.execute(
+            select(Course.id, Course.updated_at, Course.catalog_version)
+            .join(TeeSet, TeeSet.course_id == Course.id)
+            .where(TeeSet.id == tee_set_id)
+        ).first()
+        if row is None:
+            return None
+        return row.updated_at, (row.id, row.catalog_version)
+
+    # Themes
+
+    @staticmethod
+    def themes() -> Validators:
+        """Validators of the theme list"""
+        return ConditionalService._aggregate(Theme)
+
+    @staticmethod
+    def theme(theme_id: int) -> Optional[Validators]:
+        """Validators of a theme"""
+        updated_at = db.session.execute(
+            select(Theme.updated_at).where(Theme.id == theme_id)
+        ).first()
+        if updated_at is None:
+            return None
+        return updated_at[0], str(updated_at[0])
+
+    # Player history
+
+    @staticmethod
+    def handicaps(user_id: Optional[int] = None) -> Validators:
+        """
+        Validators of a user's handicap history (the current user by default).
+
+        The date is part of the token: is_current and days_active change daily.
+        """
+        if user_id is None:
+            user_id = int(get_jwt_identity())
+        last_modified, token = ConditionalService._aggregate(Handicap, Handicap.user_id == user_id)
+        return last_modified, (user_id, token, date.today().isoformat())
+
+    @staticmethod
+    def rounds(user_id: int) -> Optional[Validators]:
+        """Validators of a user's round list, and of their scores with include=scores"""
+        if not ConditionalService._may_read(user_id):
+            return None
+        last_modified, token = ConditionalService._aggregate(Round, Round.user_id == user_id)
+        if 'scores' not in {key.strip() for key in request.args.get('include', '').split(',')}:
+            return last_modified, (user_id, token)
+
+        scores_modified, scores_token = ConditionalService._aggregate(
+            Score, Score.round_id.in_(select(Round.id).where(Round.user_id == user_id))
+        )
+        if scores_modified and (last_modified is None or scores_modified > last_modified):
+            last_modified = scores_modified
+        return last_modified, (user_id, token, scores_token)
+
+    @staticmethod
+    def round(round_id: int) -> Optional[Validators]:
+        """Validators of a round, including its scores"""
+        row = db.session.execute(
+            select(Round.updated_at, Round.user_id).where(Round.id == round_id)
+        ).first()
+        if row is None or not ConditionalService._may_read(row.user_id):
+            return None
+        scores_updated, token = ConditionalService._aggregate(Score, Score.round_id == round_id)
+        last_modified = max(value for value in (row.updated_at, scores_updated) if value is not None)
+        return last_modified, (str(row.updated_at), token)
@@ -0,0 +1,294 @@
+"""
+Course Catalog Cache
+
+Read-through cache of serialized course snapshots: the course with its
+club, holes, tee sets and tee positions. Snapshots are keyed by course id
+and the course's catalog_version, which the course, hole, tee set and tee
+position services bump in the same transaction as every layout write, so
+a stale snapshot is never served once the write has committed - in any
+process, whichever backend is used.
+
+Backends (COURSE_CACHE_BACKEND):
+    memory: per-process LRU bounded by entry count and total size
+    redis:  shared Redis-compatible server (requires the `redis` package)
+    none:   caching disabled
+"""
+import json
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional
+from flask import current_app
+from sqlalchemy import update
+from sqlalchemy.orm.attributes import set_committed_value
+from app.extensions import db
+from app.models.course import Course
+from app.models.hole import Hole
+from app.models.tee_position import TeePosition
+from app.services.loader_profiles import LoaderProfiles
+
+logger = logging.getLogger(__name__)
+
+
+class MemoryCatalogBackend:
+    """Thread-safe in-process LRU of serialized snapshots"""
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        if len(value) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous)
+            self._entries[key] = value
+            self._bytes += len(value)
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            value = self._entries.pop(key, None)
+            if value is not None:
+                self._bytes -= len(value)
+
+    def delete_prefix(self, prefix: str) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                self._bytes -= len(self._entries.pop(key))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def size(self) -> Dict[str, int]:
+        with self._lock:
+            return {'entries': len(self._entries), 'bytes': self._bytes}
+
+
+class RedisCatalogBackend:
+    """Snapshots in a Redis-compatible server, shared by all processes"""
+
+    def __init__(self, url: str, ttl: int, prefix: str = 'rgs:course-catalog:'):
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError("COURSE_CACHE_BACKEND=redis requires the 'redis' package")
+        self.client = redis.Redis.from_url(url)
+        self.ttl = ttl
+        self.prefix = prefix
+        self._errors = redis.RedisError
+
+    def get(self, key: str) -> Optional[str]:
+        try:
+            value = self.client.get(self.prefix + key)
+        except self._errors as e:
+            # A cache outage degrades to database reads
+            logger.warning(f"Course catalog cache read failed: {e}")
+            return None
+        return value.decode() if value is not None else None
+
+    def set(self, key: str, value: str) -> None:
+        try:
+            self.client.set(self.prefix + key, value, ex=self.ttl or None)
+        except self._errors as e:
+            logger.warning(f"Course catalog cache write failed: {e}")
+
+    def delete(self, key: str) -> None:
+        try:
+            self.client.delete(self.prefix + key)
+        except self._errors as e:
+            logger.warning(f"Course catalog cache delete failed: {e}")
+
+    def delete_prefix(self, prefix: str) -> None:
+        try:
+            keys = list(self.client.scan_iter(match=f'{self.prefix}{prefix}*'))
+            if keys:
+                self.client.delete(*keys)
+        except self._errors as e:
+            logger.warning(f"Course catalog cache delete failed: {e}")
+
+    def clear(self) -> None:
+        self.delete_prefix('')
+
+    def size(self) -> Dict[str, int]:
+        return {}
+
+
+class CourseCatalogCache:
+    """Versioned read-through cache of course catalog snapshots"""
+
+    BACKENDS = ('memory', 'redis', 'none')
+
+    @staticmethod
+    def get_snapshot(course_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Get the catalog snapshot of a course, building it on a miss.
+
+        A hit costs one primary key lookup of the course's version.
+
+        Args:
+            course_id: The course ID
+
+        Returns:
+            Dictionary with 'course' (full details including club), 'holes'
+            and 'tee_sets' (both including tee positions), or None if the
+            course does not exist
+        """
+        version = db.session.query(Course.catalog_version).filter(Course.id == course_id).scalar()
+        if version is None:
+            return None
+
+        backend = CourseCatalogCache.backend()
+        stats = CourseCatalogCache._stats()
+        if backend is None:
+            stats['misses'] += 1
+            return CourseCatalogCache._build_snapshot(course_id)
+
+        key = CourseCatalogCache._key(course_id, version)
+        cached = backend.get(key)
+        if cached is not None:
+            stats['hits'] += 1
+            return json.loads(cached)
+
+        stats['misses'] += 1
+        snapshot = CourseCatalogCache._build_snapshot(course_id)
+        if snapshot is None:
+            return None
+        backend.set(key, json.dumps(snapshot, separators=(',', ':')))
+        if version > 1:
+            backend.delete(CourseCatalogCache._key(course_id, version - 1))
+        return snapshot
+
+    @staticmethod
+    def bump(course_id: Optional[int] = None, club_id: Optional[int] = None,
+             course_ids: Optional[Iterable[int]] = None) -> None:
+        """
+        Bump the catalog version of courses, or of all courses of a club.
+
+        Call before committing a layout write so the new version becomes
+        visible together with the data.
+
+        Args:
+            course_id: Course whose layout changed
+            club_id: Club whose details changed (all its courses)
+            course_ids: Several courses whose layouts changed (one UPDATE)
+        """
+        statement = update(Course).values(catalog_version=Course.catalog_version + 1)
+        if course_id is not None:
+            statement = statement.where(Course.id == course_id)
+        elif course_ids is not None:
+            statement = statement.where(Course.id.in_(sorted(set(course_ids))))
+        elif club_id is not None:
+            statement = statement.where(Course.club_id == club_id)
+        else:
+            return
+        db.session.execute(statement.execution_options(synchronize_session=False))
+
+    @staticmethod
+    def discard(course_id: int) -> None:
+        """
+        Drop every cached snapshot of a deleted course.
+
+        Args:
+            course_id: The course ID
+        """
+        backend = CourseCatalogCache.backend()
+        if backend is not None:
+            backend.delete_prefix(f'course:{course_id}:')
+
+    @staticmethod
+    def clear() -> None:
+        """Drop all cached snapshots"""
+        backend = CourseCatalogCache.backend()
+        if backend is not None:
+            backend.clear()
+
+    @staticmethod
+    def stats() -> Dict[str, Any]:
+        """
+        Get cache hit/miss counters for this process.
+
+        Returns:
+            Dictionary with backend, hits, misses and backend size details
+        """
+        backend = CourseCatalogCache.backend()
+        stats = dict(CourseCatalogCache._stats())
+        stats['backend'] = current_app.config.get('COURSE_CACHE_BACKEND', 'memory')
+        if backend is not None:
+            stats.update(backend.size())
+        return stats
+
+    @staticmethod
+    def backend():
+        """Get the application's cache backend, creating it on first use"""
+        extensions = current_app.extensions
+        if 'course_catalog_cache' not in extensions:
+            extensions['course_catalog_cache'] = CourseCatalogCache._create_backend(current_app.config)
+        return extensions['course_catalog_cache']
+
+    @staticmethod
+    def _create_backend(config):
+        name = config.get('COURSE_CACHE_BACKEND', 'memory')
+        if name not in CourseCatalogCache.BACKENDS:
+            raise ValueError(f"COURSE_CACHE_BACKEND must be one of: {', '.join(CourseCatalogCache.BACKENDS)}")
+        if name == 'memory':
+            return MemoryCatalogBackend(
+                config.get('COURSE_CACHE_MAX_ENTRIES', 512),
+                config.get('COURSE_CACHE_MAX_BYTES', 32 * 1024 * 1024)
+            )
+        if name == 'redis':
+            return RedisCatalogBackend(
+                config.get('COURSE_CACHE_REDIS_URL', 'redis://localhost:6379/0'),
+                config.get('COURSE_CACHE_TTL', 86400)
+            )
+        return None
+
+    @staticmethod
+    def _stats() -> Dict[str, int]:
+        return current_app.extensions.setdefault('course_catalog_cache_stats', {'hits': 0, 'misses': 0})
+
+    @staticmethod
+    def _key(course_id: int, version: int) -> str:
+        return f'course:{course_id}:v{version}'
+
+    @staticmethod
+    def _build_snapshot(course_id: int) -> Optional[Dict[str, Any]]:
+        """Load and serialize a course's full layout in three queries"""
+        course = LoaderProfiles.apply(Course.query, 'course_catalog').get(course_id)
+        if not course:
+            return None
+
+        # One query for all tee positions, shared by holes and tee sets
+        positions = TeePosition.query.join(Hole).filter(Hole.course_id == course_id).all()
+        for hole in course.holes:
+            set_committed_value(hole, 'tee_positions', [p for p in positions if p.hole_id == hole.id])
+        for tee_set in course.tee_sets:
+            set_committed_value(tee_set, 'tee_positions', [p for p in positions if p.tee_set_id == tee_set.id])
+
+        course_data = course.to_dict(include_holes=True, include_tee_sets=True)
+        if course.club:
+            course_data['club'] = course.club.to_dict()
+
+        return {
+            'course': course_data,
+            'holes': [hole.to_dict(include_tee_positions=True)
+                      for hole in sorted(course.holes, key=lambda hole: hole.hole_number)],
+            'tee_sets': [tee_set.to_dict(include_positions=True)
+                         for tee_set in sorted(course.tee_sets, key=lambda tee_set: tee_set.id)]
+        }
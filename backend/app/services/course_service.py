@@ -4,11 +4,17 @@ Course Service
 Contains all business logic for course operations.
 Follows the "Fat Services, Thin Routes" pattern.
 """
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from sqlalchemy.exc import IntegrityError
 from app.extensions import db
 from app.models.course import Course
 from app.models.club import Club
+from app.models.round import Round
+from app.serializers import COURSE
+from app.services.loader_profiles import LoaderProfiles
+from app.services.course_catalog_cache import CourseCatalogCache
+from app.services.pagination import KeysetPagination
+from app.replica import read_only
 
 
 class CourseService:
@@ -22,24 +28,79 @@ class CourseService:
         Returns:
             List of course dictionaries
         """
-        courses = Course.query.all()
+        courses = LoaderProfiles.apply(Course.query, 'course_summary').all()
         return [course.to_dict() for course in courses]
 
     @staticmethod
-    def get_course_by_id(course_id: int, include_holes: bool = False, include_tee_sets: bool = False) -> Optional[Dict[str, Any]]:
+    @read_only
+    def list_courses(club_id: Optional[int] = None, search: Optional[str] = None,
+                     cursor: Optional[str] = None, limit: int = KeysetPagination.DEFAULT_LIMIT,
+                     total: Optional[str] = None, fields: Optional[str] = None,
+                     include: Optional[str] = None) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Get courses ordered by name with keyset (cursor) pagination.
+        
+        Args:
+            club_id: Only courses of this club
+            search: Match on course or club name
+            cursor: Cursor from the previous page, or None for the first page
+            limit: Page size
+            total: 'exact' or 'estimate' to include a total count
+            fields: Comma-separated course fields to return (default: all)
+            include: Comma-separated expansions ('holes', 'tee_sets', 'club')
+            
+        Returns:
+            Tuple of (courses, meta) with next_cursor and has_more in meta
+            
+        Raises:
+            ValueError: If the cursor, paging parameters or fields are invalid
+        """
+        keys = COURSE.select(fields, include)
+        # Holes are only loaded for total_par or include=holes
+        query = Course.query.options(*COURSE.load_options(keys, always=('name',)))
+        if club_id:
+            query = query.filter(Course.club_id == club_id)
+        if search:
+            query = query.join(Club).filter(
+                db.or_(
+                    Course.name.ilike(f'%{search}%'),
+                    Club.name.ilike(f'%{search}%')
+                )
+            )
+        
+        courses, meta = KeysetPagination.paginate(
+            query,
+            [(Course.name, False), (Course.id, False)],
+            limit=limit,
+            cursor=cursor,
+            total=total
+        )
+        return COURSE.many(courses, keys), meta
+
+    @staticmethod
+    @read_only
+    def get_course_by_id(course_id: int, include_holes: bool = False, include_tee_sets: bool = False,
+                         fields: Optional[str] = None, include: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
         Get a specific course by ID.
         
         Args:
             course_id: The course ID
-            include_holes: Whether to include hole information
-            include_tee_sets: Whether to include tee set information
+            include_holes: Whether to include hole information (same as include='holes')
+            include_tee_sets: Whether to include tee set information (same as include='tee_sets')
+            fields: Comma-separated course fields to return (default: all)
+            include: Comma-separated expansions ('holes', 'tee_sets', 'club')
             
         Returns:
             Course dictionary or None if not found
+            
+        Raises:
+            ValueError: If a field or expansion is unknown
         """
-        course = Course.query.get(course_id)
-        return course.to_dict(include_holes=include_holes, include_tee_sets=include_tee_sets) if course else None
+        expand = [name for name, flag in (('holes', include_holes), ('tee_sets', include_tee_sets)) if flag]
+        keys = COURSE.select(fields, include, expand)
+        course = Course.query.options(*COURSE.load_options(keys)).get(course_id)
+        return COURSE.one(course, keys) if course else None
 
     @staticmethod
     def get_courses_by_club(club_id: int) -> List[Dict[str, Any]]:
@@ -52,7 +113,7 @@ class CourseService:
         Returns:
             List of course dictionaries
         """
-        courses = Course.query.filter_by(club_id=club_id).all()
+        courses = LoaderProfiles.apply(Course.query, 'course_summary').filter_by(club_id=club_id).all()
         return [course.to_dict() for course in courses]
 
     @staticmethod
@@ -129,6 +190,12 @@ class CourseService:
                 holes_count = course_data['holes_count']
                 if holes_count not in [6, 9, 18]:
                     raise ValueError("Holes count must be 6, 9, or 18")
+                if holes_count != course.holes_count:
+                    # Keep denormalized round completion in step with the course layout
+                    Round.query.filter_by(course_id=course_id).update({
+                        Round.expected_holes: holes_count,
+                        Round.is_complete: Round.holes_played == holes_count
+                    }, synchronize_session=False)
                 course.holes_count = holes_count
             
             if 'description' in course_data:
@@ -144,6 +211,7 @@ class CourseService:
             if 'default_tee_set_id' in course_data:
                 course.default_tee_set_id = course_data['default_tee_set_id']
 
+            CourseCatalogCache.bump(course_id=course.id)
             db.session.commit()
             return course.to_dict()
             
@@ -175,6 +243,7 @@ class CourseService:
 
         db.session.delete(course)
         db.session.commit()
+        CourseCatalogCache.discard(course_id)
         return True
 
     @staticmethod
@@ -188,7 +257,7 @@ class CourseService:
         Returns:
             List of matching course dictionaries
         """
-        courses = Course.query.join(Club).filter(
+        courses = LoaderProfiles.apply(Course.query, 'course_summary').join(Club).filter(
             db.or_(
                 Course.name.ilike(f'%{query}%'),
                 Club.name.ilike(f'%{query}%')
@@ -198,27 +267,27 @@ class CourseService:
         return [course.to_dict() for course in courses]
 
     @staticmethod
-    def get_course_with_full_details(course_id: int) -> Optional[Dict[str, Any]]:
+    @read_only
+    def get_course_with_full_details(course_id: int, fields: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
         Get course with complete hole and tee set information.
         
+        The cached snapshot is already serialized, so fields= only trims the
+        payload.
+        
         Args:
             course_id: The course ID
+            fields: Comma-separated course fields to return (default: all)
             
         Returns:
             Complete course dictionary or None if not found
-        """
-        course = Course.query.get(course_id)
-        if not course:
-            return None
-            
-        course_data = course.to_dict(include_holes=True, include_tee_sets=True)
-        
-        # Add club information
-        if course.club:
-            course_data['club'] = course.club.to_dict()
             
-        return course_data
+        Raises:
+            ValueError: If a field is unknown
+        """
+        keys = COURSE.select(fields, expand=('holes', 'tee_sets', 'club'))
+        snapshot = CourseCatalogCache.get_snapshot(course_id)
+        return COURSE.pick(snapshot['course'], keys) if snapshot else None
 
     @staticmethod
     def set_default_tee_set(course_id: int, tee_set_id: int) -> Optional[Dict[str, Any]]:
@@ -246,6 +315,7 @@ class CourseService:
             raise ValueError("Tee set not found or doesn't belong to this course")
             
         course.default_tee_set_id = tee_set_id
+        CourseCatalogCache.bump(course_id=course_id)
         db.session.commit()
         
         return course.to_dict() 
\ No newline at end of file
@@ -0,0 +1,240 @@
+"""
+Email Outbox Service
+
+Persistent outbox for outgoing email. Requests enqueue messages and return
+immediately; a background worker pool claims due messages in batches of up
+to MAIL_MAX_EMAILS, sends them over a reused SMTP connection and retries
+failures with exponential backoff.
+"""
+import json
+import secrets
+import smtplib
+from datetime import datetime, timedelta
+from email.utils import formataddr
+from typing import Dict, List, Optional
+from flask import current_app
+from flask_mail import BadHeaderError, Message
+from sqlalchemy import and_, func, or_, select, update
+from app.extensions import db, mail
+from app.models.email_outbox import EmailOutbox
+from app.services.background_worker import BackgroundWorker
+
+# Errors that concern one message; the connection stays usable
+MESSAGE_ERRORS = (
+    smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused, smtplib.SMTPDataError,
+    BadHeaderError, AssertionError  # Flask-Mail rejects messages without sender/recipients
+)
+
+
+class EmailOutboxService:
+    """Service class for the persistent email outbox"""
+
+    MAX_RETRY_DELAY = 3600
+
+    @staticmethod
+    def enqueue(message: Message) -> int:
+        """
+        Store a message in the outbox and wake the workers.
+
+        Args:
+            message: Flask-Mail message to send
+
+        Returns:
+            Outbox entry ID
+        """
+        entry = EmailOutbox(
+            subject=message.subject,
+            sender=formataddr(message.sender) if isinstance(message.sender, tuple) else message.sender,
+            recipients=json.dumps(list(message.recipients)),
+            html=message.html,
+            body=message.body
+        )
+        db.session.add(entry)
+        db.session.commit()
+
+        EmailOutboxWorker.notify(current_app._get_current_object())
+        return entry.id
+
+    @staticmethod
+    def claim_batch(limit: int) -> List[EmailOutbox]:
+        """
+        Atomically claim up to `limit` due messages for this worker.
+
+        Pending messages whose next attempt is due are claimed, as are
+        messages left in 'sending' by a worker that died mid-batch.
+
+        Args:
+            limit: Maximum number of messages to claim
+
+        Returns:
+            Claimed outbox entries, oldest first
+        """
+        now = datetime.utcnow()
+        stale = now - timedelta(seconds=current_app.config.get('MAIL_OUTBOX_CLAIM_TIMEOUT', 300))
+        token = secrets.token_hex(16)
+
+        due = or_(
+            and_(EmailOutbox.status == EmailOutbox.STATUS_PENDING, EmailOutbox.next_attempt_at <= now),
+            and_(EmailOutbox.status == EmailOutbox.STATUS_SENDING, EmailOutbox.claimed_at < stale)
+        )
+        candidates = select(EmailOutbox.id)\
+            .where(due)\
+            .order_by(EmailOutbox.id)\
+            .limit(limit)\
+            .with_for_update(skip_locked=True)
+
+        # Re-checking `due` makes concurrent claims of the same rows lose cleanly
+        db.session.execute(
+            update(EmailOutbox)
+            .where(EmailOutbox.id.in_(candidates), due)
+            .values(status=EmailOutbox.STATUS_SENDING, claimed_at=now, claim_token=token)
+            .execution_options(synchronize_session=False)
+        )
+        db.session.commit()
+
+        return EmailOutbox.query.filter_by(claim_token=token).order_by(EmailOutbox.id).all()
+
+    @staticmethod
+    def send_due(max_batches: Optional[int] = None) -> Dict[str, int]:
+        """
+        Send due messages in batches of MAIL_MAX_EMAILS over a reused SMTP connection.
+
+        Batches are claimed one at a time while the connection stays open;
+        Flask-Mail reopens it after every MAIL_MAX_EMAILS messages.
+
+        Args:
+            max_batches: Stop after this many batches (until none are due if None)
+
+        Returns:
+            Dictionary with claimed, sent, retried and failed counts
+        """
+        batch_size = current_app.config.get('MAIL_MAX_EMAILS') or 10
+        result = {'claimed': 0, 'sent': 0, 'retried': 0, 'failed': 0}
+
+        entries = EmailOutboxService.claim_batch(batch_size)
+        if not entries:
+            return result
+
+        batches = 0
+        try:
+            with mail.connect() as connection:
+                while entries:
+                    result['claimed'] += len(entries)
+                    batches += 1
+                    if not EmailOutboxService._send_batch(connection, entries, result):
+                        break
+                    if max_batches is not None and batches >= max_batches:
+                        break
+                    entries = EmailOutboxService.claim_batch(batch_size)
+        except (smtplib.SMTPException, OSError) as e:
+            # Could not connect, or the connection broke on close
+            for entry in entries:
+                if entry.status == EmailOutbox.STATUS_SENDING:
+                    EmailOutboxService._record_failure(entry, e, result)
+
+        db.session.commit()
+        return result
+
+    @staticmethod
+    def _send_batch(connection, entries: List[EmailOutbox], result: Dict[str, int]) -> bool:
+        """
+        Send claimed entries over an open connection.
+
+        Returns:
+            False if the connection failed and the batch was abandoned
+        """
+        for index, entry in enumerate(entries):
+            try:
+                connection.send(EmailOutboxService._to_message(entry))
+            except MESSAGE_ERRORS as e:
+                EmailOutboxService._record_failure(entry, e, result)
+                continue
+            except (smtplib.SMTPException, OSError) as e:
+                # Connection-level failure: retry this one, release the rest untouched
+                EmailOutboxService._record_failure(entry, e, result)
+                for remaining in entries[index + 1:]:
+                    EmailOutboxService._release(remaining)
+                db.session.commit()
+                return False
+
+            entry.status = EmailOutbox.STATUS_SENT
+            entry.sent_at = datetime.utcnow()
+            entry.claim_token = None
+            entry.last_error = None
+            result['sent'] += 1
+            # Commit per message so a crash never re-sends delivered mail
+            db.session.commit()
+        return True
+
+    @staticmethod
+    def get_status_counts() -> Dict[str, int]:
+        """
+        Get the number of outbox entries per status.
+
+        Returns:
+            Dictionary of status -> count
+        """
+        rows = db.session.query(EmailOutbox.status, func.count(EmailOutbox.id))\
+            .group_by(EmailOutbox.status)\
+            .all()
+        return {status: count for status, count in rows}
+
+    @staticmethod
+    def _to_message(entry: EmailOutbox) -> Message:
+        """Rebuild a Flask-Mail message from an outbox entry"""
+        return Message(
+            subject=entry.subject,
+            sender=entry.sender or current_app.config['MAIL_DEFAULT_SENDER'],
+            recipients=entry.recipient_list,
+            html=entry.html,
+            body=entry.body
+        )
+
+    @staticmethod
+    def _record_failure(entry: EmailOutbox, error: Exception, result: Dict[str, int]) -> None:
+        """Schedule a retry with exponential backoff, or give up after the last attempt"""
+        max_attempts = current_app.config.get('MAIL_OUTBOX_MAX_ATTEMPTS', 5)
+        base_delay = current_app.config.get('MAIL_OUTBOX_RETRY_DELAY', 30)
+
+        entry.attempts += 1
+        entry.last_error = f"{type(error).__name__}: {error}"[:1000]
+        entry.claim_token = None
+        entry.claimed_at = None
+
+        if entry.attempts >= max_attempts:
+            entry.status = EmailOutbox.STATUS_FAILED
+            result['failed'] += 1
+            current_app.logger.error(f"Giving up on email {entry.id} after {entry.attempts} attempts: {entry.last_error}")
+        else:
+            delay = min(base_delay * 2 ** (entry.attempts - 1), EmailOutboxService.MAX_RETRY_DELAY)
+            entry.status = EmailOutbox.STATUS_PENDING
+            entry.next_attempt_at = datetime.utcnow() + timedelta(seconds=delay)
+            result['retried'] += 1
+            current_app.logger.warning(f"Email {entry.id} failed, retrying in {delay}s: {entry.last_error}")
+        db.session.commit()
+
+    @staticmethod
+    def _release(entry: EmailOutbox) -> None:
+        """Return an unattempted entry to the queue"""
+        entry.status = EmailOutbox.STATUS_PENDING
+        entry.claim_token = None
+        entry.claimed_at = None
+
+
+class EmailOutboxWorker(BackgroundWorker):
+    """
+    Background thread pool draining the outbox.
+
+    Started lazily by the first enqueue in a process when MAIL_OUTBOX_WORKERS
+    is positive, or run standalone with `flask email worker`. Several
+    processes may run workers; claims are atomic.
+    """
+
+    NAME = 'email-outbox'
+    WORKERS_CONFIG = 'MAIL_OUTBOX_WORKERS'
+    POLL_INTERVAL_CONFIG = 'MAIL_OUTBOX_POLL_INTERVAL'
+
+    @classmethod
+    def run_once(cls) -> int:
+        """Send one batch of due messages and return how many were claimed"""
+        return EmailOutboxService.send_due()['claimed']
@@ -3,6 +3,7 @@ Email Service
 
 Contains all business logic for email operations.
 Handles password reset emails, welcome emails, etc.
+Messages are queued in the email outbox and sent by background workers.
 """
 import os
 import secrets
@@ -10,8 +11,9 @@ from datetime import datetime, timedelta
 from typing import Optional, Union
 from flask import current_app, render_template_string
 from flask_mail import Message
-from app.extensions import mail, db
+from app.extensions import db
 from app.models.user import User
+from app.services.email_outbox_service import EmailOutboxService
 
 
 class EmailService:
@@ -69,11 +71,11 @@ class EmailService:
             )
             
             msg.html = email_body
-            mail.send(msg)
+            EmailOutboxService.enqueue(msg)
             return True
             
         except Exception as e:
-            current_app.logger.error(f"Failed to send password reset email: {str(e)}")
+            current_app.logger.error(f"Failed to queue password reset email: {str(e)}")
             return False
 
     @staticmethod
@@ -273,11 +275,11 @@ class EmailService:
             )
             
             msg.html = email_body
-            mail.send(msg)
+            EmailOutboxService.enqueue(msg)
             return True
             
         except Exception as e:
-            current_app.logger.error(f"Failed to send welcome email: {str(e)}")
+            current_app.logger.error(f"Failed to queue welcome email: {str(e)}")
             return False
 
     @staticmethod
@@ -344,9 +346,9 @@ class EmailService:
             )
             
             msg.html = email_body
-            mail.send(msg)
+            EmailOutboxService.enqueue(msg)
             return True
             
         except Exception as e:
-            current_app.logger.error(f"Failed to send password change notification: {str(e)}")
+            current_app.logger.error(f"Failed to queue password change notification: {str(e)}")
             return False 
\ No newline at end of file
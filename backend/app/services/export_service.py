@@ -0,0 +1,180 @@
+"""
+Export Service
+
+Streaming exports of rounds with their scores. Rounds are read through a
+server-side cursor (yield_per) and the scores of each fetched batch are
+loaded with one query, so memory stays flat however many rounds match.
+Output is produced as NDJSON or CSV lines by generators meant to be
+returned as a streamed response, optionally gzip-compressed on the fly.
+"""
+import csv
+import io
+import json
+import zlib
+from collections import defaultdict
+from datetime import date
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from sqlalchemy import select
+from app.extensions import db
+from app.models.course import Course
+from app.models.hole import Hole
+from app.models.round import Round
+from app.models.score import Score
+
+# Round columns in export order; CSV files can be imported again as 'rounds'
+ROUND_COLUMNS = (
+    Round.id, Round.user_id, Round.course_id, Round.tee_set_id, Round.date_played,
+    Round.handicap_used, Round.course_handicap, Round.course_rating, Round.slope_rating,
+    Round.total_score, Round.total_points, Round.differential,
+    Round.holes_played, Round.expected_holes, Round.is_complete,
+)
+
+# Widest course layout; CSV exports carry one strokes column per hole
+MAX_HOLES = 18
+
+# A round's columns and its scores
+ExportedRound = Tuple[Dict[str, Any], List[Dict[str, Any]]]
+
+
+class ExportService:
+    """Service class for streaming exports"""
+
+    DEFAULT_BATCH_SIZE = 1000
+
+    @staticmethod
+    def iter_rounds(user_id: Optional[int] = None, club_id: Optional[int] = None,
+                    date_from: Optional[date] = None, date_to: Optional[date] = None,
+                    batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[ExportedRound]:
+        """
+        Stream rounds with their scores, oldest first.
+
+        Rounds are fetched batch_size rows at a time through a server-side
+        cursor; each batch costs one extra query for its scores.
+
+        Args:
+            user_id: Only this player's rounds
+            club_id: Only rounds played on this club's courses
+            date_from: Only rounds played on or after this date
+            date_to: Only rounds played on or before this date
+            batch_size: Rows per fetch
+
+        Yields:
+            Tuples of (round columns, scores ordered by hole number)
+        """
+        criteria = []
+        if user_id is not None:
+            criteria.append(Round.user_id == user_id)
+        if club_id is not None:
+            criteria.append(Round.course_id.in_(select(Course.id).where(Course.club_id == club_id)))
+        if date_from is not None:
+            criteria.append(Round.date_played >= date_from)
+        if date_to is not None:
+            criteria.append(Round.date_played <= date_to)
+
+        rounds = db.session.execute(
+            select(*ROUND_COLUMNS).where(*criteria).order_by(Round.date_played, Round.id),
+            execution_options={'yield_per': batch_size}
+        )
+        try:
+            for partition in rounds.partitions():
+                scores = ExportService._scores_for([row.id for row in partition])
+                for row in partition:
+                    yield dict(row._mapping), scores.get(row.id, [])
+        finally:
+            rounds.close()
+
+    @staticmethod
+    def _scores_for(round_ids: List[int]) -> Dict[int, List[Dict[str, Any]]]:
+        """Scores of a batch of rounds, grouped by round"""
+        rows = db.session.execute(
+            select(Score.round_id, Hole.hole_number, Hole.par, Score.strokes, Score.points)
+            .join(Hole, Hole.id == Score.hole_id)
+            .where(Score.round_id.in_(round_ids))
+            .order_by(Score.round_id, Hole.hole_number)
+        )
+        scores = defaultdict(list)
+        for row in rows:
+            scores[row.round_id].append({
+                'hole_number': row.hole_number,
+                'hole_par': row.par,
+                'strokes': row.strokes,
+                'points': row.points,
+                'score_to_par': row.strokes - row.par
+            })
+        return scores
+
+    @staticmethod
+    def ndjson_lines(rounds: Iterable[ExportedRound]) -> Iterator[bytes]:
+        """
+        Encode rounds as newline-delimited JSON, one round per line.
+
+        Args:
+            rounds: Rounds from iter_rounds
+
+        Yields:
+            Encoded lines
+        """
+        for columns, scores in rounds:
+            record = dict(columns)
+            record['date_played'] = record['date_played'].isoformat()
+            record['net_score'] = ExportService._net_score(record)
+            record['scores'] = scores
+            yield (json.dumps(record, separators=(',', ':')) + '\n').encode()
+
+    @staticmethod
+    def csv_lines(rounds: Iterable[ExportedRound]) -> Iterator[bytes]:
+        """
+        Encode rounds as CSV, one round per row with hole_1 ... hole_18 strokes.
+
+        Args:
+            rounds: Rounds from iter_rounds
+
+        Yields:
+            Encoded header and rows
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        names = [column.key for column in ROUND_COLUMNS] + ['net_score']
+
+        def flush() -> bytes:
+            value = buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            return value.encode()
+
+        writer.writerow(names + [f'hole_{number}' for number in range(1, MAX_HOLES + 1)])
+        yield flush()
+
+        for columns, scores in rounds:
+            strokes = [''] * MAX_HOLES
+            for score in scores:
+                strokes[score['hole_number'] - 1] = score['strokes']
+            row = [columns[column.key] for column in ROUND_COLUMNS]
+            writer.writerow(row + [ExportService._net_score(columns)] + strokes)
+            yield flush()
+
+    @staticmethod
+    def gzip_stream(chunks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+        """
+        Gzip-compress a byte stream incrementally.
+
+        Args:
+            chunks: Uncompressed chunks
+            level: zlib compression level
+
+        Yields:
+            Compressed chunks, as the compressor produces them
+        """
+        compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        for chunk in chunks:
+            data = compressor.compress(chunk)
+            if data:
+                yield data
+        yield compressor.flush()
+
+    @staticmethod
+    def _net_score(columns: Dict[str, Any]) -> Optional[int]:
+        """Gross score minus course handicap, as Round.net_score"""
+        if columns['total_score'] and columns['course_handicap']:
+            return columns['total_score'] - columns['course_handicap']
+        return None
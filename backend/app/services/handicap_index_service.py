@@ -0,0 +1,213 @@
+"""
+Handicap Index Service
+
+World Handicap System (WHS) index computation from round differentials.
+Finalizing a round reads the player's rolling window of the 20 most recent
+differentials as of the round's date with one LIMIT 20 query, so the index
+never depends on state held outside the database. A backdated round also
+shifts the window of every later round; those later indexes are replayed
+from the same history in memory.
+"""
+from datetime import date, timedelta
+from decimal import Decimal, ROUND_HALF_UP
+from typing import List, Optional, Dict, Any, Tuple
+from sqlalchemy import func
+from app.extensions import db
+from app.models.handicap import Handicap
+from app.models.round import Round
+
+
+class HandicapIndexService:
+    """Service class for WHS handicap index calculations"""
+
+    WINDOW_SIZE = 20
+    MAX_HANDICAP_INDEX = 54.0
+    SOFT_CAP = 3.0
+    HARD_CAP = 5.0
+    LOW_INDEX_PERIOD_DAYS = 365
+
+    @staticmethod
+    def differentials_used(score_count: int) -> Tuple[int, float]:
+        """
+        Get how many of the lowest differentials count and the adjustment to apply.
+
+        Args:
+            score_count: Number of scores in the window (3-20)
+
+        Returns:
+            Tuple of (number of lowest differentials, adjustment)
+        """
+        if score_count <= 3:
+            return 1, -2.0
+        if score_count == 4:
+            return 1, -1.0
+        if score_count == 5:
+            return 1, 0.0
+        if score_count == 6:
+            return 2, -1.0
+        if score_count <= 8:
+            return 2, 0.0
+        if score_count <= 11:
+            return 3, 0.0
+        if score_count <= 14:
+            return 4, 0.0
+        if score_count <= 16:
+            return 5, 0.0
+        if score_count <= 18:
+            return 6, 0.0
+        if score_count == 19:
+            return 7, 0.0
+        return 8, 0.0
+
+    @staticmethod
+    def calculate_index(differentials: List[float], low_handicap_index: Optional[float] = None) -> Optional[float]:
+        """
+        Calculate a handicap index from the most recent differentials.
+
+        Args:
+            differentials: Up to 20 most recent score differentials
+            low_handicap_index: Lowest index of the past 365 days, for capping
+
+        Returns:
+            Handicap index rounded to one decimal, or None with fewer than 3 scores
+        """
+        recent = list(differentials)[-HandicapIndexService.WINDOW_SIZE:]
+        if len(recent) < 3:
+            return None
+
+        count, adjustment = HandicapIndexService.differentials_used(len(recent))
+        lowest = sorted(recent)[:count]
+        index = sum(lowest) / count + adjustment
+
+        # Soft and hard caps only apply once a full scoring record exists
+        if low_handicap_index is not None and len(recent) >= HandicapIndexService.WINDOW_SIZE:
+            increase = index - low_handicap_index
+            if increase > HandicapIndexService.SOFT_CAP:
+                index = low_handicap_index + HandicapIndexService.SOFT_CAP + \
+                    (increase - HandicapIndexService.SOFT_CAP) / 2
+            index = min(index, low_handicap_index + HandicapIndexService.HARD_CAP)
+
+        index = min(index, HandicapIndexService.MAX_HANDICAP_INDEX)
+        return float(Decimal(str(index)).quantize(Decimal('0.1'), rounding=ROUND_HALF_UP))
+
+    @staticmethod
+    def get_window(user_id: int, as_of: Optional[date] = None) -> List[Tuple[date, int, float]]:
+        """
+        Get the user's rolling window of recent differentials.
+
+        Args:
+            user_id: The user ID
+            as_of: Only rounds played on or before this date (default: all)
+
+        Returns:
+            List of (date_played, round_id, differential) tuples, oldest first
+        """
+        query = db.session.query(Round.date_played, Round.id, Round.differential)\
+            .filter(*HandicapIndexService._scored_rounds(user_id))
+        if as_of is not None:
+            query = query.filter(Round.date_played <= as_of)
+        rows = query.order_by(Round.date_played.desc(), Round.id.desc())\
+            .limit(HandicapIndexService.WINDOW_SIZE)\
+            .all()
+        return [(row.date_played, row.id, row.differential) for row in reversed(rows)]
+
+    @staticmethod
+    def record_round(round: Round) -> Optional[Dict[str, Any]]:
+        """
+        Write the user's index after a round is finalized.
+
+        The index is computed from the window as of the round's date and
+        inserted into the handicap timeline from that date through
+        HandicapService's temporal insertion logic. When later rounds exist
+        (a backdated round), the index on each later playing date is
+        recomputed too, so the current index reflects the new round.
+
+        Args:
+            round: A finalized, committed round
+
+        Returns:
+            The handicap index details for the round's date, or None if no
+            index could be computed
+        """
+        if not round.is_complete or round.differential is None:
+            return None
+
+        user_id = round.user_id
+        history = HandicapIndexService.get_window(user_id, round.date_played - timedelta(days=1)) + \
+            HandicapIndexService._load_from(user_id, round.date_played)
+
+        result = None
+        for played, window in HandicapIndexService._windows_by_date(history, round.date_played):
+            details = HandicapIndexService._write_index(user_id, played, window)
+            if played == round.date_played:
+                result = details
+        return result
+
+    @staticmethod
+    def _scored_rounds(user_id: int) -> List[Any]:
+        """Filters for the rounds that count towards the index"""
+        return [Round.user_id == user_id, Round.is_complete.is_(True), Round.differential.isnot(None)]
+
+    @staticmethod
+    def _load_from(user_id: int, start: date) -> List[Tuple[date, int, float]]:
+        """Load the user's scored rounds played on or after start, oldest first"""
+        rows = db.session.query(Round.date_played, Round.id, Round.differential)\
+            .filter(*HandicapIndexService._scored_rounds(user_id), Round.date_played >= start)\
+            .order_by(Round.date_played, Round.id)\
+            .all()
+        return [(row.date_played, row.id, row.differential) for row in rows]
+
+    @staticmethod
+    def _windows_by_date(history: List[Tuple[date, int, float]],
+                         start: date) -> List[Tuple[date, List[Tuple[date, int, float]]]]:
+        """Slide the window over history: the window at the end of each playing date from start on"""
+        windows = []
+        for position, entry in enumerate(history):
+            is_last_of_day = position + 1 == len(history) or history[position + 1][0] != entry[0]
+            if entry[0] >= start and is_last_of_day:
+                first = max(0, position + 1 - HandicapIndexService.WINDOW_SIZE)
+                windows.append((entry[0], history[first:position + 1]))
+        return windows
+
+    @staticmethod
+    def _write_index(user_id: int, played: date,
+                     window: List[Tuple[date, int, float]]) -> Optional[Dict[str, Any]]:
+        """Compute the index for a window and insert it into the timeline if it changed"""
+        low_index = None
+        if len(window) >= HandicapIndexService.WINDOW_SIZE:
+            low_index = HandicapIndexService._low_handicap_index(user_id, played)
+
+        index = HandicapIndexService.calculate_index([item[2] for item in window], low_index)
+        if index is None:
+            return None
+
+        current = Handicap.get_handicap_on_date(user_id, played)
+        if current is None or current.handicap_value != index:
+            from app.services.handicap_service import HandicapService
+            HandicapService._insert_handicap_into_timeline(
+                user_id,
+                index,
+                played,
+                user_id,
+                f"WHS index calculated from {len(window)} score differential(s)"
+            )
+
+        return {
+            'user_id': user_id,
+            'handicap_index': index,
+            'effective_date': played.isoformat(),
+            'scores_used': len(window),
+            'low_handicap_index': low_index
+        }
+
+    @staticmethod
+    def _low_handicap_index(user_id: int, as_of: date) -> Optional[float]:
+        """Lowest handicap index in effect during the 365 days before as_of"""
+        period_start = as_of - timedelta(days=HandicapIndexService.LOW_INDEX_PERIOD_DAYS)
+        return db.session.query(func.min(Handicap.handicap_value))\
+            .filter(
+                Handicap.user_id == user_id,
+                Handicap.start_date <= as_of,
+                db.or_(Handicap.end_date.is_(None), Handicap.end_date > period_start)
+            )\
+            .scalar()
@@ -4,46 +4,65 @@ Handicap Service
 Contains all business logic for handicap operations including temporal data management.
 Follows the "Fat Services, Thin Routes" pattern.
 """
-from typing import List, Optional, Dict, Any
+from typing import Iterable, List, Optional, Dict, Any, Tuple
 from datetime import date, datetime
+from sqlalchemy import Date, Integer, and_, column, func, or_, select, update, values
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.exc import IntegrityError
 from app.extensions import db
 from app.models.handicap import Handicap
 from app.models.user import User
+from app.replica import read_only
+from app.serializers import HANDICAP
 
 
 class HandicapService:
     """Service class for handicap business logic with temporal data management"""
 
     @staticmethod
-    def get_user_handicap_history(user_id: int) -> List[Dict[str, Any]]:
+    @read_only
+    def get_user_handicap_history(user_id: int, fields: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Get complete handicap history for a user.
         
         Args:
             user_id: The user ID
+            fields: Comma-separated handicap fields to return (default: all)
             
         Returns:
             List of handicap dictionaries ordered by start_date
+            
+        Raises:
+            ValueError: If a field is unknown
         """
-        handicaps = Handicap.query.filter_by(user_id=user_id).order_by(Handicap.start_date.desc()).all()
-        return [handicap.to_dict() for handicap in handicaps]
+        keys = HANDICAP.select(fields)
+        handicaps = Handicap.query.options(*HANDICAP.load_options(keys))\
+            .filter_by(user_id=user_id).order_by(Handicap.start_date.desc()).all()
+        return HANDICAP.many(handicaps, keys)
 
     @staticmethod
-    def get_current_handicap(user_id: int) -> Optional[Dict[str, Any]]:
+    @read_only
+    def get_current_handicap(user_id: int, fields: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
         Get user's current handicap.
         
         Args:
             user_id: The user ID
+            fields: Comma-separated handicap fields to return (default: all)
             
         Returns:
             Current handicap dictionary or None if not found
+            
+        Raises:
+            ValueError: If a field is unknown
         """
-        handicap = Handicap.query.filter_by(user_id=user_id, end_date=None).first()
-        return handicap.to_dict() if handicap else None
+        keys = HANDICAP.select(fields)
+        handicap = Handicap.query.options(*HANDICAP.load_options(keys))\
+            .filter_by(user_id=user_id, end_date=None).first()
+        return HANDICAP.one(handicap, keys) if handicap else None
 
     @staticmethod
+    @read_only
     def get_handicap_on_date(user_id: int, check_date: date = None) -> Optional[Dict[str, Any]]:
         """
         Get user's handicap that was valid on a specific date.
@@ -143,49 +162,92 @@ class HandicapService:
         - If hcp 10 is valid from 1st Jan 2024, and new hcp 11 is entered on 1st Jan 2025
         - When hcp 12 is entered on 1st June 2024, the 10 hcp gets end_date of 1st June
         - The 12 hcp runs from 1st June to 1st Jan 2025, then 11 hcp takes over
+
+        Entries cover [start_date, end_date). The user's row is locked so
+        concurrent edits of the same timeline are serialized; the entry
+        covering start_date is then cut short with one UPDATE and the new
+        entry is written with one INSERT whose end date is the next entry's
+        start. An entry that already starts on start_date is replaced.
         """
-        
-        # Find all existing handicaps for this user
-        existing_handicaps = Handicap.query.filter_by(user_id=user_id).order_by(Handicap.start_date).all()
-        
-        # Find handicap that should end when this one starts
-        handicap_to_end = None
-        handicap_to_adjust = None
-        
-        for hcp in existing_handicaps:
-            # If this handicap starts before or on the new start date
-            if hcp.start_date <= start_date:
-                # And either has no end date or ends after the new start date
-                if hcp.end_date is None or hcp.end_date > start_date:
-                    handicap_to_end = hcp
-            
-            # If this handicap starts after the new start date, it might need adjustment
-            elif hcp.start_date > start_date:
-                if handicap_to_adjust is None:
-                    handicap_to_adjust = hcp
-                break
-        
-        # Create the new handicap
-        new_handicap = Handicap(
+        # Serializes timeline edits per user (no-op on SQLite, which locks the database)
+        db.session.execute(select(User.id).where(User.id == user_id).with_for_update())
+
+        # End the entry covering the new start date (updated first so ranges never overlap)
+        db.session.execute(
+            update(Handicap)
+            .where(
+                Handicap.user_id == user_id,
+                Handicap.start_date < start_date,
+                or_(Handicap.end_date.is_(None), Handicap.end_date > start_date)
+            )
+            .values(end_date=start_date, updated_at=datetime.utcnow())
+            .execution_options(synchronize_session='fetch')
+        )
+
+        next_start = select(func.min(Handicap.start_date))\
+            .where(Handicap.user_id == user_id, Handicap.start_date > start_date)\
+            .scalar_subquery()
+        now = datetime.utcnow()
+
+        # PostgreSQL and SQLite share the ON CONFLICT syntax
+        dialect = db.session.get_bind().dialect.name
+        stmt = postgresql.insert(Handicap) if dialect == 'postgresql' else sqlite.insert(Handicap)
+        stmt = stmt.values(
             user_id=user_id,
             handicap_value=value,
             start_date=start_date,
-            end_date=handicap_to_adjust.start_date if handicap_to_adjust else None,
+            end_date=next_start,
             reason=reason,
-            created_by_id=created_by_id
+            created_by_id=created_by_id,
+            created_at=now,
+            updated_at=now
         )
-        
-        # If there's a handicap to end, set its end date
-        if handicap_to_end:
-            # Only set end date if it's currently None (current handicap) or if the new date is earlier
-            if handicap_to_end.end_date is None:
-                handicap_to_end.end_date = start_date
-            elif start_date < handicap_to_end.end_date:
-                handicap_to_end.end_date = start_date
-        
-        db.session.add(new_handicap)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Handicap.user_id, Handicap.start_date],
+            set_={
+                'handicap_value': stmt.excluded.handicap_value,
+                'reason': stmt.excluded.reason,
+                'created_by_id': stmt.excluded.created_by_id,
+                'updated_at': stmt.excluded.updated_at
+            }
+        )
+        db.session.execute(stmt)
         db.session.commit()
 
+    @staticmethod
+    def get_handicap_values_on_dates(lookups: Iterable[Tuple[int, date]]) -> Dict[Tuple[int, date], Optional[float]]:
+        """
+        Get the handicap valid on a date for many (user, date) pairs at once.
+
+        The pairs are sent as a VALUES list and joined against the timeline
+        in one query; ranges don't overlap, so each pair matches at most one
+        entry.
+
+        Args:
+            lookups: (user_id, date) pairs
+
+        Returns:
+            Dictionary mapping each pair to the handicap value valid on that
+            date, or None if the user had no handicap then
+        """
+        lookups = set(lookups)
+        if not lookups:
+            return {}
+
+        pairs = values(
+            column('user_id', Integer), column('on_date', Date), name='lookups'
+        ).data(sorted(lookups)).cte('lookups')
+        rows = db.session.execute(
+            select(pairs.c.user_id, pairs.c.on_date, Handicap.handicap_value)
+            .select_from(pairs)
+            .outerjoin(Handicap, and_(
+                Handicap.user_id == pairs.c.user_id,
+                Handicap.start_date <= pairs.c.on_date,
+                or_(Handicap.end_date.is_(None), Handicap.end_date > pairs.c.on_date)
+            ))
+        )
+        return {(user_id, on_date): value for user_id, on_date, value in rows}
+
     @staticmethod
     def update_handicap(handicap_id: int, handicap_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
@@ -9,40 +9,64 @@ from sqlalchemy.exc import IntegrityError
 from app.extensions import db
 from app.models.hole import Hole
 from app.models.course import Course
+from app.serializers import HOLE
+from app.services.course_catalog_cache import CourseCatalogCache
+from app.services.hole_statistics_service import HoleStatisticsService
+from app.services.score_service import ScoreService
+from app.replica import read_only
 
 
 class HoleService:
     """Service class for hole business logic"""
 
     @staticmethod
-    def get_holes_by_course(course_id: int, include_tee_positions: bool = False) -> List[Dict[str, Any]]:
+    def get_holes_by_course(course_id: int, include_tee_positions: bool = False, fields: Optional[str] = None,
+                            include: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Get all holes for a specific course.
         
+        Holes come from the cached course snapshot, which is already
+        serialized, so fields= only trims the payload.
+        
         Args:
             course_id: The course ID
-            include_tee_positions: Whether to include tee position data
+            include_tee_positions: Whether to include tee position data (same as include='tee_positions')
+            fields: Comma-separated hole fields to return (default: all)
+            include: Comma-separated expansions ('tee_positions')
             
         Returns:
             List of hole dictionaries ordered by hole number
+            
+        Raises:
+            ValueError: If a field or expansion is unknown
         """
-        holes = Hole.query.filter_by(course_id=course_id).order_by(Hole.hole_number).all()
-        return [hole.to_dict(include_tee_positions=include_tee_positions) for hole in holes]
+        keys = HOLE.select(fields, include, expand=('tee_positions',) if include_tee_positions else ())
+        snapshot = CourseCatalogCache.get_snapshot(course_id)
+        if not snapshot:
+            return []
+        return [HOLE.pick(hole, keys) for hole in snapshot['holes']]
 
     @staticmethod
-    def get_hole_by_id(hole_id: int, include_tee_positions: bool = False) -> Optional[Dict[str, Any]]:
+    def get_hole_by_id(hole_id: int, include_tee_positions: bool = False, fields: Optional[str] = None,
+                       include: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
         Get a specific hole by ID.
         
         Args:
             hole_id: The hole ID
-            include_tee_positions: Whether to include tee position data
+            include_tee_positions: Whether to include tee position data (same as include='tee_positions')
+            fields: Comma-separated hole fields to return (default: all)
+            include: Comma-separated expansions ('tee_positions')
             
         Returns:
             Hole dictionary or None if not found
+            
+        Raises:
+            ValueError: If a field or expansion is unknown
         """
-        hole = Hole.query.get(hole_id)
-        return hole.to_dict(include_tee_positions=include_tee_positions) if hole else None
+        keys = HOLE.select(fields, include, expand=('tee_positions',) if include_tee_positions else ())
+        hole = Hole.query.options(*HOLE.load_options(keys)).get(hole_id)
+        return HOLE.one(hole, keys) if hole else None
 
     @staticmethod
     def create_hole(hole_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -93,6 +117,7 @@ class HoleService:
             )
             
             db.session.add(hole)
+            CourseCatalogCache.bump(course_id=hole.course_id)
             db.session.commit()
             
             return hole.to_dict()
@@ -120,6 +145,8 @@ class HoleService:
         if not hole:
             return None
 
+        previous_scoring = (hole.par, hole.stroke_index)
+
         try:
             # Update fields if provided
             if 'hole_number' in hole_data:
@@ -140,7 +167,16 @@ class HoleService:
                     raise ValueError("Stroke index must be between 1 and 18")
                 hole.stroke_index = stroke_index
 
+            # Stableford points depend on par and stroke index
+            scoring_changed = (hole.par, hole.stroke_index) != previous_scoring
+
+            CourseCatalogCache.bump(course_id=hole.course_id)
             db.session.commit()
+            
+            if scoring_changed:
+                # Bring historical rounds on this hole in line with the correction
+                ScoreService.bulk_recalculate_points(hole_id=hole.id)
+            
             return hole.to_dict()
             
         except IntegrityError:
@@ -169,6 +205,7 @@ class HoleService:
         if hole.scores:
             raise ValueError(f"Cannot delete hole {hole.hole_number} - it has {len(hole.scores)} associated score(s)")
 
+        CourseCatalogCache.bump(course_id=hole.course_id)
         db.session.delete(hole)
         db.session.commit()
         return True
@@ -232,6 +269,7 @@ class HoleService:
                 db.session.add(hole)
                 created_holes.append(hole)
             
+            CourseCatalogCache.bump(course_id=course_id)
             db.session.commit()
             return [hole.to_dict() for hole in created_holes]
             
@@ -240,6 +278,7 @@ class HoleService:
             raise ValueError(f"Failed to create holes: {str(e)}")
 
     @staticmethod
+    @read_only
     def get_hole_statistics(hole_id: int) -> Dict[str, Any]:
         """
         Get statistics for a specific hole.
@@ -257,22 +296,8 @@ class HoleService:
         # Basic hole info
         stats = hole.to_dict(include_tee_positions=True)
         
-        # Add scoring statistics if there are scores
-        if hole.scores:
-            scores = [score.strokes for score in hole.scores]
-            stats['scoring_stats'] = {
-                'total_rounds': len(scores),
-                'average_score': round(sum(scores) / len(scores), 2),
-                'best_score': min(scores),
-                'worst_score': max(scores),
-                'eagles_or_better': len([s for s in scores if s <= hole.par - 2]),
-                'birdies': len([s for s in scores if s == hole.par - 1]),
-                'pars': len([s for s in scores if s == hole.par]),
-                'bogeys': len([s for s in scores if s == hole.par + 1]),
-                'double_bogeys_or_worse': len([s for s in scores if s >= hole.par + 2])
-            }
-        else:
-            stats['scoring_stats'] = None
+        # Scoring statistics are materialized, not computed from every score
+        stats['scoring_stats'] = HoleStatisticsService.get_scoring_stats(hole.id, hole.par)
             
         return stats
 
@@ -0,0 +1,175 @@
+"""
+Hole Statistics Service
+
+Incrementally maintained scoring statistics per hole. Score writes record
+per-(hole, strokes) count deltas that are applied with one upsert in the
+same transaction as the write; reads derive averages, extremes and
+score-to-par buckets from at most 20 count rows. rebuild() recomputes
+everything from the scores table for verification.
+"""
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from sqlalchemy import delete, func, insert, literal, select
+from sqlalchemy.dialects import postgresql, sqlite
+from app.extensions import db
+from app.models.hole_statistics import HoleStatistics
+from app.models.score import Score
+
+# (hole_id, strokes) -> change in the number of scores
+Deltas = Counter
+
+
+class HoleStatisticsService:
+    """Service class for materialized hole statistics"""
+
+    @staticmethod
+    def record(deltas: Deltas, hole_id: int, old_strokes: Optional[int] = None,
+               new_strokes: Optional[int] = None) -> None:
+        """
+        Record one score change in a delta collection.
+
+        Args:
+            deltas: Deltas to add to
+            hole_id: Hole of the score
+            old_strokes: Strokes before the change (None for a new score)
+            new_strokes: Strokes after the change (None for a deleted score)
+        """
+        if old_strokes == new_strokes:
+            return
+        if old_strokes is not None:
+            deltas[(hole_id, old_strokes)] -= 1
+        if new_strokes is not None:
+            deltas[(hole_id, new_strokes)] += 1
+
+    @staticmethod
+    def apply(deltas: Deltas) -> None:
+        """
+        Apply count deltas with a single upsert.
+
+        Call inside the transaction that writes the scores, before commit.
+        Concurrent writers are safe: counts are incremented in SQL.
+
+        Args:
+            deltas: (hole_id, strokes) -> change in the number of scores
+        """
+        now = datetime.utcnow()
+        rows = [
+            {'hole_id': hole_id, 'strokes': strokes, 'score_count': change, 'updated_at': now}
+            for (hole_id, strokes), change in sorted(deltas.items()) if change
+        ]
+        if not rows:
+            return
+
+        # PostgreSQL and SQLite share the ON CONFLICT syntax
+        dialect = db.session.get_bind().dialect.name
+        stmt = postgresql.insert(HoleStatistics) if dialect == 'postgresql' else sqlite.insert(HoleStatistics)
+        stmt = stmt.values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[HoleStatistics.hole_id, HoleStatistics.strokes],
+            set_={
+                'score_count': HoleStatistics.score_count + stmt.excluded.score_count,
+                'updated_at': stmt.excluded.updated_at
+            }
+        )
+        db.session.execute(stmt)
+
+    @staticmethod
+    def remove_scores(*criteria) -> None:
+        """
+        Subtract the scores matching the criteria, before they are deleted.
+
+        Used where scores go away through cascades (rounds, users) rather
+        than through ScoreService.
+
+        Args:
+            criteria: Filters on Score selecting the scores about to be deleted
+        """
+        rows = db.session.execute(
+            select(Score.hole_id, Score.strokes, func.count(Score.id))
+            .where(*criteria)
+            .group_by(Score.hole_id, Score.strokes)
+        )
+        HoleStatisticsService.apply(Counter({(hole_id, strokes): -count for hole_id, strokes, count in rows}))
+
+    @staticmethod
+    def get_scoring_stats(hole_id: int, par: int) -> Optional[Dict[str, Any]]:
+        """
+        Get a hole's scoring statistics from the materialized counts.
+
+        Args:
+            hole_id: The hole ID
+            par: The hole's current par
+
+        Returns:
+            Dictionary of scoring statistics, or None if no scores are recorded
+        """
+        counts = dict(db.session.execute(
+            select(HoleStatistics.strokes, HoleStatistics.score_count)
+            .where(HoleStatistics.hole_id == hole_id, HoleStatistics.score_count > 0)
+        ).all())
+        if not counts:
+            return None
+
+        total = sum(counts.values())
+
+        def bucket(low: float, high: float) -> int:
+            return sum(count for strokes, count in counts.items() if low <= strokes - par <= high)
+
+        return {
+            'total_rounds': total,
+            'average_score': round(sum(strokes * count for strokes, count in counts.items()) / total, 2),
+            'best_score': min(counts),
+            'worst_score': max(counts),
+            'eagles_or_better': bucket(float('-inf'), -2),
+            'birdies': bucket(-1, -1),
+            'pars': bucket(0, 0),
+            'bogeys': bucket(1, 1),
+            'double_bogeys_or_worse': bucket(2, float('inf'))
+        }
+
+    @staticmethod
+    def rebuild() -> int:
+        """
+        Recompute all hole statistics from the scores table.
+
+        Returns:
+            Number of (hole, strokes) rows written
+        """
+        db.session.execute(delete(HoleStatistics))
+        result = db.session.execute(
+            insert(HoleStatistics).from_select(
+                ['hole_id', 'strokes', 'score_count', 'updated_at'],
+                select(Score.hole_id, Score.strokes, func.count(Score.id), literal(datetime.utcnow()))
+                .group_by(Score.hole_id, Score.strokes)
+            )
+        )
+        db.session.commit()
+        return result.rowcount
+
+    @staticmethod
+    def check() -> List[Dict[str, Any]]:
+        """
+        Compare the materialized counts with the scores table.
+
+        Returns:
+            One entry per mismatching (hole, strokes) pair with the stored
+            and actual counts; empty when the statistics are consistent
+        """
+        actual = {
+            (hole_id, strokes): count for hole_id, strokes, count in db.session.execute(
+                select(Score.hole_id, Score.strokes, func.count(Score.id)).group_by(Score.hole_id, Score.strokes)
+            )
+        }
+        stored = {
+            (hole_id, strokes): count for hole_id, strokes, count in db.session.execute(
+                select(HoleStatistics.hole_id, HoleStatistics.strokes, HoleStatistics.score_count)
+            )
+        }
+
+        mismatches = []
+        for key in sorted(set(actual) | set(stored)):
+            expected, recorded = actual.get(key, 0), stored.get(key, 0)
+            if expected != recorded:
+                mismatches.append({'hole_id': key[0], 'strokes': key[1], 'stored': recorded, 'actual': expected})
+        return mismatches
@@ -0,0 +1,589 @@
+"""
+Import Service
+
+Streaming CSV/XLSX importer for onboarding clubs, courses, course layouts
+and historical rounds. Uploads are saved to disk and queued as ImportJob
+rows; background workers read them row by row, validate each row with the
+existing create schemas and write valid rows in chunks of IMPORT_CHUNK_SIZE
+with one multi-row INSERT per chunk. Progress and per-row errors are
+committed with every chunk, so memory stays bounded by the chunk size no
+matter how large the file is.
+"""
+import csv
+import io
+import json
+import os
+import re
+import uuid
+from collections import Counter
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from flask import current_app
+from marshmallow import EXCLUDE, Schema, ValidationError
+from sqlalchemy import insert, select, tuple_, update
+from sqlalchemy.exc import IntegrityError
+from werkzeug.datastructures import FileStorage
+from app.extensions import db
+from app.models.club import Club
+from app.models.course import Course
+from app.models.hole import Hole
+from app.models.import_job import ImportJob
+from app.models.score import Score
+from app.models.tee_position import TeePosition
+from app.models.tee_set import TeeSet
+from app.schemas.club_schema import ClubCreateSchema
+from app.schemas.course_schema import CourseCreateSchema
+from app.schemas.hole_schema import HoleCreateSchema
+from app.schemas.round_schema import RoundCreateSchema
+from app.schemas.tee_position_schema import TeePositionCreateSchema
+from app.schemas.tee_set_schema import TeeSetCreateSchema
+from app.services.background_worker import BackgroundWorker
+from app.services.course_catalog_cache import CourseCatalogCache
+from app.services.hole_statistics_service import HoleStatisticsService
+from app.services.round_service import RoundService
+
+ALLOWED_FORMATS = ('csv', 'xlsx')
+
+# Optional per-hole stroke columns of round imports: hole_1 ... hole_18
+HOLE_COLUMN = re.compile(r'^hole_(\d{1,2})$')
+
+# (row number, cleaned row) of a validated row
+ParsedRow = Tuple[int, Dict[str, Any]]
+
+
+class ImportService:
+    """Service class for CSV/XLSX imports"""
+
+    # Import kind -> row schema. Rows are written by ImportService._write_<kind>.
+    KINDS: Dict[str, Callable[[], Schema]] = {
+        'clubs': ClubCreateSchema,
+        'courses': CourseCreateSchema,
+        'holes': HoleCreateSchema,
+        'tee_sets': TeeSetCreateSchema,
+        'tee_positions': TeePositionCreateSchema,
+        'rounds': RoundCreateSchema,
+    }
+
+    @staticmethod
+    def create_job(file: FileStorage, kind: str, created_by_id: Optional[int] = None,
+                   notify: bool = True) -> Dict[str, Any]:
+        """
+        Save an uploaded file and queue it for import.
+
+        The upload is streamed to IMPORT_UPLOAD_FOLDER; it is never read
+        into memory.
+
+        Args:
+            file: Uploaded CSV or XLSX file
+            kind: What the file contains (one of ImportService.KINDS)
+            created_by_id: ID of the user who uploaded the file
+            notify: Wake the background workers (False when the caller runs the job itself)
+
+        Returns:
+            Dictionary representation of the queued job
+
+        Raises:
+            ValueError: If the kind or file type is not supported
+        """
+        if kind not in ImportService.KINDS:
+            raise ValueError(f"Unknown import kind '{kind}'. Choose one of: {', '.join(ImportService.KINDS)}")
+        if not file or not file.filename:
+            raise ValueError("No file uploaded")
+
+        file_format = os.path.splitext(file.filename)[1].lower().lstrip('.')
+        if file_format not in ALLOWED_FORMATS:
+            raise ValueError("Only .csv and .xlsx files can be imported")
+
+        folder = current_app.config['IMPORT_UPLOAD_FOLDER']
+        os.makedirs(folder, exist_ok=True)
+        file_path = os.path.join(folder, f"{uuid.uuid4().hex}.{file_format}")
+        file.save(file_path)
+
+        job = ImportJob(
+            kind=kind,
+            filename=os.path.basename(file.filename)[:255],
+            file_path=file_path,
+            file_format=file_format,
+            bytes_total=os.path.getsize(file_path),
+            created_by_id=created_by_id
+        )
+        db.session.add(job)
+        db.session.commit()
+
+        if notify:
+            ImportWorker.notify(current_app._get_current_object())
+        return job.to_dict()
+
+    @staticmethod
+    def get_job(job_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Get an import job with its row errors.
+
+        Args:
+            job_id: Import job ID
+
+        Returns:
+            Job dictionary or None if not found
+        """
+        job = db.session.get(ImportJob, job_id)
+        return job.to_dict(include_errors=True) if job else None
+
+    @staticmethod
+    def list_jobs(status: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
+        """
+        List recent import jobs, newest first.
+
+        Args:
+            status: Only jobs with this status
+            limit: Maximum number of jobs
+
+        Returns:
+            List of job dictionaries (without row errors)
+        """
+        query = ImportJob.query
+        if status:
+            query = query.filter_by(status=status)
+        jobs = query.order_by(ImportJob.id.desc()).limit(limit).all()
+        return [job.to_dict() for job in jobs]
+
+    @staticmethod
+    def claim_next() -> Optional[int]:
+        """
+        Atomically claim the oldest pending job.
+
+        Returns:
+            Claimed job ID, or None if no job is pending
+        """
+        while True:
+            job_id = db.session.execute(
+                select(ImportJob.id)
+                .where(ImportJob.status == ImportJob.STATUS_PENDING)
+                .order_by(ImportJob.id)
+                .limit(1)
+            ).scalar()
+            if job_id is None:
+                db.session.commit()
+                return None
+
+            # Another worker may claim the same job first; its UPDATE then matches nothing
+            claimed = db.session.execute(
+                update(ImportJob)
+                .where(ImportJob.id == job_id, ImportJob.status == ImportJob.STATUS_PENDING)
+                .values(status=ImportJob.STATUS_RUNNING, started_at=datetime.utcnow())
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            db.session.commit()
+            if claimed:
+                return job_id
+
+    @staticmethod
+    def run_pending() -> int:
+        """
+        Run pending jobs one after another until none are left.
+
+        Returns:
+            Number of jobs run
+        """
+        count = 0
+        job_id = ImportService.claim_next()
+        while job_id is not None:
+            ImportService.run_job(job_id)
+            count += 1
+            job_id = ImportService.claim_next()
+        return count
+
+    @staticmethod
+    def run_job(job_id: int) -> Dict[str, Any]:
+        """
+        Import a claimed job's file.
+
+        Rows are validated as they are read; valid rows are written and
+        committed together with the job's progress every IMPORT_CHUNK_SIZE
+        rows. Invalid rows are skipped and recorded with their spreadsheet
+        row number (the header is row 1). A missing required column fails
+        the whole job before anything is written.
+
+        Args:
+            job_id: Import job ID
+
+        Returns:
+            Dictionary representation of the finished job
+
+        Raises:
+            ValueError: If the job does not exist
+        """
+        job = db.session.get(ImportJob, job_id)
+        if not job:
+            raise ValueError("Import job not found")
+
+        chunk_size = max(current_app.config.get('IMPORT_CHUNK_SIZE', 1000), 1)
+        max_errors = current_app.config.get('IMPORT_MAX_ERRORS', 500)
+        schema = ImportService.KINDS[job.kind](unknown=EXCLUDE)
+        writer = getattr(ImportService, f'_write_{job.kind}')
+        errors: List[Dict[str, Any]] = []
+
+        def record(row_number: int, messages: Any) -> None:
+            job.rows_failed += 1
+            if len(errors) < max_errors:
+                errors.append({'row': row_number, 'errors': messages})
+
+        def flush(chunk: List[ParsedRow], position: int) -> None:
+            if chunk:
+                imported, failed = writer(chunk)
+                job.rows_imported += imported
+                for row_number, messages in failed:
+                    record(row_number, messages)
+            job.bytes_processed = position
+            job.errors = json.dumps(errors) if errors else None
+            db.session.commit()
+
+        job.status = ImportJob.STATUS_RUNNING
+        job.started_at = job.started_at or datetime.utcnow()
+        db.session.commit()
+
+        try:
+            with _RowReader(job.file_path, job.file_format) as (header, rows):
+                ImportService._check_header(job.kind, schema, header)
+
+                chunk: List[ParsedRow] = []
+                position = 0
+                for row_number, values, position in rows:
+                    job.rows_processed += 1
+                    data = {key: value for key, value in zip(header, values) if key and value != ''}
+                    try:
+                        chunk.append((row_number, ImportService._load_row(job.kind, schema, data)))
+                    except ValidationError as e:
+                        record(row_number, e.messages)
+
+                    if len(chunk) >= chunk_size:
+                        flush(chunk, position)
+                        chunk = []
+                flush(chunk, position)
+
+            job.status = ImportJob.STATUS_COMPLETED
+        except Exception as e:
+            db.session.rollback()
+            job.status = ImportJob.STATUS_FAILED
+            job.last_error = (str(e) if isinstance(e, ValueError) else f"{type(e).__name__}: {e}")[:1000]
+            current_app.logger.error(f"Import job {job.id} failed: {job.last_error}")
+
+        job.finished_at = datetime.utcnow()
+        job.bytes_processed = job.bytes_total
+        db.session.commit()
+
+        if os.path.exists(job.file_path):
+            os.remove(job.file_path)
+        return job.to_dict(include_errors=True)
+
+    @staticmethod
+    def _check_header(kind: str, schema: Schema, header: List[str]) -> None:
+        """Fail the job when required columns are missing"""
+        if not any(header):
+            raise ValueError("The file is empty")
+        missing = [name for name, field in schema.fields.items() if field.required and name not in header]
+        if missing:
+            raise ValueError(f"Missing required column(s) for {kind}: {', '.join(missing)}")
+
+    @staticmethod
+    def _load_row(kind: str, schema: Schema, data: Dict[str, str]) -> Dict[str, Any]:
+        """
+        Validate one row with the kind's create schema.
+
+        Round rows may carry hole_1 ... hole_18 stroke columns, which are
+        returned under 'strokes' as {hole_number: strokes}.
+
+        Raises:
+            ValidationError: If the row is invalid
+        """
+        row = schema.load(data)
+        if kind != 'rounds':
+            return row
+
+        strokes, errors = {}, {}
+        for key, value in data.items():
+            match = HOLE_COLUMN.match(key)
+            if not match:
+                continue
+            try:
+                strokes[int(match.group(1))] = int(value)
+            except ValueError:
+                errors[key] = ['Not a valid integer.']
+                continue
+            if not 1 <= strokes[int(match.group(1))] <= 20:
+                errors[key] = ['Strokes must be between 1 and 20.']
+        if errors:
+            raise ValidationError(errors)
+        row['strokes'] = strokes
+        return row
+
+    # Writers: one per kind. Each checks references for the whole chunk with
+    # set-based queries, inserts the rows that pass and returns
+    # (rows imported, [(row number, errors), ...]).
+
+    @staticmethod
+    def _write_clubs(chunk: List[ParsedRow]) -> Tuple[int, List[Tuple[int, Any]]]:
+        names = {row['name'] for _, row in chunk}
+        existing = set(db.session.scalars(select(Club.name).where(Club.name.in_(names))))
+
+        failed, valid, seen = [], [], set()
+        for row_number, row in chunk:
+            if row['name'] in existing or row['name'] in seen:
+                failed.append((row_number, {'name': [f"Club '{row['name']}' already exists"]}))
+                continue
+            seen.add(row['name'])
+            valid.append((row_number, row))
+        return ImportService._insert(Club, valid, failed)
+
+    @staticmethod
+    def _write_courses(chunk: List[ParsedRow]) -> Tuple[int, List[Tuple[int, Any]]]:
+        club_ids = set(db.session.scalars(
+            select(Club.id).where(Club.id.in_({row['club_id'] for _, row in chunk}))
+        ))
+
+        failed, valid = [], []
+        for row_number, row in chunk:
+            if row['club_id'] not in club_ids:
+                failed.append((row_number, {'club_id': ['Club not found']}))
+            else:
+                valid.append((row_number, row))
+        return ImportService._insert(Course, valid, failed)
+
+    @staticmethod
+    def _write_holes(chunk: List[ParsedRow]) -> Tuple[int, List[Tuple[int, Any]]]:
+        courses = dict(db.session.execute(
+            select(Course.id, Course.holes_count).where(Course.id.in_({row['course_id'] for _, row in chunk}))
+        ).all())
+        keys = {(row['course_id'], row['hole_number']) for _, row in chunk}
+        existing = set(db.session.execute(
+            select(Hole.course_id, Hole.hole_number).where(tuple_(Hole.course_id, Hole.hole_number).in_(keys))
+        ).all())
+
+        failed, valid = [], []
+        for row_number, row in chunk:
+            key = (row['course_id'], row['hole_number'])
+            if row['course_id'] not in courses:
+                failed.append((row_number, {'course_id': ['Course not found']}))
+            elif row['hole_number'] > courses[row['course_id']]:
+                failed.append((row_number, {'hole_number': [f"Course only has {courses[row['course_id']]} holes"]}))
+            elif key in existing:
+                failed.append((row_number, {'hole_number': [f"Hole {row['hole_number']} already exists"]}))
+            else:
+                existing.add(key)
+                valid.append((row_number, row))
+        return ImportService._insert(Hole, valid, failed, course_ids={row['course_id'] for _, row in valid})
+
+    @staticmethod
+    def _write_tee_sets(chunk: List[ParsedRow]) -> Tuple[int, List[Tuple[int, Any]]]:
+        course_ids = set(db.session.scalars(
+            select(Course.id).where(Course.id.in_({row['course_id'] for _, row in chunk}))
+        ))
+
+        failed, valid = [], []
+        for row_number, row in chunk:
+            if row['course_id'] not in course_ids:
+                failed.append((row_number, {'course_id': ['Course not found']}))
+            else:
+                valid.append((row_number, row))
+        return ImportService._insert(TeeSet, valid, failed, course_ids={row['course_id'] for _, row in valid})
+
+    @staticmethod
+    def _write_tee_positions(chunk: List[ParsedRow]) -> Tuple[int, List[Tuple[int, Any]]]:
+        hole_courses = dict(db.session.execute(
+            select(Hole.id, Hole.course_id).where(Hole.id.in_({row['hole_id'] for _, row in chunk}))
+        ).all())
+        tee_set_courses = dict(db.session.execute(
+            select(TeeSet.id, TeeSet.course_id).where(TeeSet.id.in_({row['tee_set_id'] for _, row in chunk}))
+        ).all())
+        keys = {(row['hole_id'], row['tee_set_id']) for _, row in chunk}
+        existing = set(db.session.execute(
+            select(TeePosition.hole_id, TeePosition.tee_set_id)
+            .where(tuple_(TeePosition.hole_id, TeePosition.tee_set_id).in_(keys))
+        ).all())
+
+        failed, valid = [], []
+        for row_number, row in chunk:
+            key = (row['hole_id'], row['tee_set_id'])
+            if row['hole_id'] not in hole_courses:
+                failed.append((row_number, {'hole_id': ['Hole not found']}))
+            elif row['tee_set_id'] not in tee_set_courses:
+                failed.append((row_number, {'tee_set_id': ['Tee set not found']}))
+            elif hole_courses[row['hole_id']] != tee_set_courses[row['tee_set_id']]:
+                failed.append((row_number, {'tee_set_id': ['Tee set and hole must belong to the same course']}))
+            elif key in existing:
+                failed.append((row_number, {'hole_id': ['Tee position already exists for this hole and tee set']}))
+            else:
+                existing.add(key)
+                valid.append((row_number, row))
+        course_ids = {tee_set_courses[row['tee_set_id']] for _, row in valid}
+        return ImportService._insert(TeePosition, valid, failed, course_ids=course_ids)
+
+    @staticmethod
+    def _write_rounds(chunk: List[ParsedRow]) -> Tuple[int, List[Tuple[int, Any]]]:
+        """
+        Write historical rounds, with scores from optional hole_N columns.
+
+        Rounds are built and stamped by RoundService.import_rounds (one
+        handicap timeline join per chunk); holes are loaded once per chunk and
+        Stableford points and totals are computed in memory.
+        """
+        built, rejected = RoundService.import_rounds([row for _, row in chunk])
+        failed = [(chunk[position][0], errors) for position, errors in rejected]
+        holes: Dict[Tuple[int, int], Hole] = {
+            (hole.course_id, hole.hole_number): hole
+            for hole in Hole.query.filter(Hole.course_id.in_({round.course_id for _, round in built}))
+        }
+
+        rounds = []
+        for position, round in built:
+            row_number, row = chunk[position]
+            missing = sorted(number for number in row['strokes'] if (round.course_id, number) not in holes)
+            if missing:
+                failed.append((row_number, {'strokes': [f"Course has no hole(s) {', '.join(map(str, missing))}"]}))
+                continue
+
+            for number, strokes in sorted(row['strokes'].items()):
+                hole = holes[(round.course_id, number)]
+                points = Score.stableford_points(strokes, hole.par, hole.stroke_index, round.course_handicap or 0)
+                round.scores.append(Score(hole_id=hole.id, strokes=strokes, points=points))
+            round.calculate_totals()
+            round.update_completion()
+            rounds.append((row_number, round))
+        failed.sort(key=lambda item: item[0])
+
+        try:
+            with db.session.begin_nested():
+                db.session.add_all([round for _, round in rounds])
+            saved = [round for _, round in rounds]
+        except IntegrityError:
+            saved = []
+            for row_number, round in rounds:
+                try:
+                    with db.session.begin_nested():
+                        db.session.add(round)
+                    saved.append(round)
+                except IntegrityError as e:
+                    failed.append((row_number, {'_row': [str(e.orig)]}))
+
+        deltas = Counter()
+        for round in saved:
+            for score in round.scores:
+                HoleStatisticsService.record(deltas, score.hole_id, new_strokes=score.strokes)
+        HoleStatisticsService.apply(deltas)
+        return len(saved), failed
+
+    @staticmethod
+    def _insert(model, valid: List[ParsedRow], failed: List[Tuple[int, Any]],
+                course_ids: Optional[set] = None) -> Tuple[int, List[Tuple[int, Any]]]:
+        """
+        Insert rows with one multi-row INSERT, falling back to one savepoint
+        per row when a constraint the checks could not see is violated.
+        """
+        if not valid:
+            return 0, failed
+
+        imported = 0
+        try:
+            with db.session.begin_nested():
+                db.session.execute(insert(model), [row for _, row in valid])
+            imported = len(valid)
+        except IntegrityError:
+            for row_number, row in valid:
+                try:
+                    with db.session.begin_nested():
+                        db.session.execute(insert(model), [row])
+                    imported += 1
+                except IntegrityError as e:
+                    failed.append((row_number, {'_row': [str(e.orig)]}))
+
+        if course_ids and imported:
+            CourseCatalogCache.bump(course_ids=course_ids)
+        return imported, failed
+
+
+class _RowReader:
+    """
+    Context manager yielding (header, rows) for a CSV or XLSX file.
+
+    rows is an iterator of (row number, [cell strings], bytes read so far);
+    only the current row is held in memory.
+    """
+
+    def __init__(self, path: str, file_format: str):
+        self.path = path
+        self.file_format = file_format
+        self._close: List[Callable[[], None]] = []
+
+    def __enter__(self) -> Tuple[List[str], Iterator[Tuple[int, List[str], int]]]:
+        if self.file_format == 'xlsx':
+            rows = self._xlsx_rows()
+        else:
+            rows = self._csv_rows()
+
+        header = next(rows, None)
+        if header is None:
+            return [], iter(())
+        return [cell.strip().lower() for cell in header[1]], rows
+
+    def __exit__(self, *exc_info) -> None:
+        for close in self._close:
+            close()
+
+    def _csv_rows(self) -> Iterator[Tuple[int, List[str], int]]:
+        raw = open(self.path, 'rb')
+        text = io.TextIOWrapper(raw, encoding='utf-8-sig', newline='')
+        self._close.append(text.close)
+
+        for row_number, values in enumerate(csv.reader(text), start=1):
+            if any(value.strip() for value in values):
+                yield row_number, [value.strip() for value in values], raw.tell()
+
+    def _xlsx_rows(self) -> Iterator[Tuple[int, List[str], int]]:
+        try:
+            from openpyxl import load_workbook
+        except ImportError:
+            raise ValueError("XLSX imports require the openpyxl package; upload a CSV file instead")
+
+        # Read-only mode streams rows from the sheet XML instead of building the workbook
+        workbook = load_workbook(self.path, read_only=True, data_only=True)
+        self._close.append(workbook.close)
+        sheet = workbook.active
+        size = os.path.getsize(self.path)
+        total_rows = sheet.max_row or 0
+
+        for row_number, cells in enumerate(sheet.iter_rows(values_only=True), start=1):
+            values = [_cell_to_str(cell) for cell in cells]
+            if any(values):
+                position = size * row_number // total_rows if total_rows else 0
+                yield row_number, values, min(position, size)
+
+
+def _cell_to_str(value: Any) -> str:
+    """Normalise an XLSX cell to the string a CSV cell would hold"""
+    if value is None:
+        return ''
+    if isinstance(value, datetime):
+        return value.date().isoformat() if value.time() == datetime.min.time() else value.isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value).strip()
+
+
+class ImportWorker(BackgroundWorker):
+    """
+    Background thread running queued import jobs.
+
+    Started lazily by the first upload in a process when IMPORT_WORKERS is
+    positive, or run with `flask imports run`. Jobs are claimed atomically,
+    so several processes may run workers.
+    """
+
+    NAME = 'import'
+    WORKERS_CONFIG = 'IMPORT_WORKERS'
+    POLL_INTERVAL_CONFIG = 'IMPORT_POLL_INTERVAL'
+
+    @classmethod
+    def run_once(cls) -> int:
+        """Run pending jobs and return how many were run"""
+        return ImportService.run_pending()
@@ -0,0 +1,93 @@
+"""
+Loader Profiles
+
+Named eager-loading option sets for service read paths.
+Each profile matches what the corresponding to_dict() call will touch,
+so serializing a page of results never falls back to per-row lazy loads.
+"""
+from typing import Callable, Dict, Tuple
+from sqlalchemy.orm import joinedload, selectinload
+from app.models.course import Course
+from app.models.round import Round
+from app.models.score import Score
+from app.models.tee_position import TeePosition
+from app.models.user import User
+
+
+class LoaderProfiles:
+    """Registry of named loader option sets applied by the services"""
+
+    # Profile name -> factory returning the loader options.
+    # Factories are used so options are built against mapped attributes lazily.
+    _PROFILES: Dict[str, Callable[[], Tuple]] = {
+        # Round.to_dict(include_scores=True): Score.to_dict() touches hole
+        'round_with_scores': lambda: (
+            selectinload(Round.scores).joinedload(Score.hole),
+        ),
+        # User.to_dict(): current_handicap
+        'user_summary': lambda: (
+            selectinload(User.current_handicap_record),
+        ),
+        # UserService.get_user_statistics(): current handicap, home club
+        'user_statistics': lambda: (
+            selectinload(User.current_handicap_record),
+            joinedload(User.home_club),
+        ),
+        # Course.to_dict(): total_par
+        'course_summary': lambda: (
+            selectinload(Course.holes),
+        ),
+        # Course catalog snapshot; tee positions are loaded once and shared
+        'course_catalog': lambda: (
+            joinedload(Course.club),
+            joinedload(Course.tee_sets),
+            selectinload(Course.holes),
+        ),
+        # TeePosition.to_dict(): hole_number, par
+        'tee_position_with_hole': lambda: (
+            joinedload(TeePosition.hole),
+        ),
+    }
+
+    @staticmethod
+    def names() -> Tuple[str, ...]:
+        """
+        Get the names of all registered profiles.
+
+        Returns:
+            Tuple of profile names
+        """
+        return tuple(LoaderProfiles._PROFILES)
+
+    @staticmethod
+    def options(profile: str) -> Tuple:
+        """
+        Get the loader options for a named profile.
+
+        Args:
+            profile: Profile name
+
+        Returns:
+            Tuple of SQLAlchemy loader options
+
+        Raises:
+            ValueError: If the profile is unknown
+        """
+        factory = LoaderProfiles._PROFILES.get(profile)
+        if factory is None:
+            raise ValueError(f"Unknown loader profile '{profile}'")
+        return factory()
+
+    @staticmethod
+    def apply(query, profile: str):
+        """
+        Apply a named profile to a query.
+
+        Args:
+            query: SQLAlchemy query
+            profile: Profile name
+
+        Returns:
+            Query with the profile's loader options applied
+        """
+        return query.options(*LoaderProfiles.options(profile))
@@ -0,0 +1,175 @@
+"""
+Keyset Pagination
+
+Cursor-based pagination for listing endpoints. Pages are fetched with a
+`WHERE (sort keys) > (last seen keys)` predicate instead of OFFSET, so the
+cost of a page stays flat however deep the client pages, and no COUNT(*)
+runs unless a total is asked for.
+"""
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from sqlalchemy import and_, literal, or_, tuple_
+from app.extensions import db
+
+
+class KeysetPagination:
+    """Opaque-cursor keyset pagination over ordered queries"""
+
+    DEFAULT_LIMIT = 20
+    MAX_LIMIT = 100
+    TOTAL_MODES = ('exact', 'estimate')
+
+    @staticmethod
+    def paginate(query, order_by: Sequence[Tuple[Any, bool]], limit: int = DEFAULT_LIMIT,
+                 cursor: Optional[str] = None, total: Optional[str] = None) -> Tuple[List[Any], Dict[str, Any]]:
+        """
+        Fetch one page of a query in keyset order.
+
+        Args:
+            query: Filtered query (without ORDER BY or LIMIT)
+            order_by: (column, descending) pairs; must end in a unique column
+            limit: Page size (capped at MAX_LIMIT)
+            cursor: Cursor from the previous page's meta, or None for the first page
+            total: 'exact' for a COUNT, 'estimate' for the planner's row estimate, None for neither
+
+        Returns:
+            Tuple of (rows, meta) where meta has limit, next_cursor, has_more
+            and, when requested, total and total_is_estimate
+
+        Raises:
+            ValueError: If the cursor, limit or total mode is invalid
+        """
+        if limit < 1:
+            raise ValueError("limit must be positive")
+        if total is not None and total not in KeysetPagination.TOTAL_MODES:
+            raise ValueError(f"total must be one of: {', '.join(KeysetPagination.TOTAL_MODES)}")
+        limit = min(limit, KeysetPagination.MAX_LIMIT)
+
+        page_query = query
+        if cursor:
+            keys = KeysetPagination.decode_cursor(cursor, len(order_by))
+            page_query = page_query.filter(KeysetPagination._after(order_by, keys))
+
+        page_query = page_query.order_by(*[column.desc() if descending else column.asc()
+                                           for column, descending in order_by])
+        rows = page_query.limit(limit + 1).all()
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        next_cursor = None
+        if has_more:
+            last = rows[-1]
+            next_cursor = KeysetPagination.encode_cursor([getattr(last, column.key) for column, _ in order_by])
+
+        meta = {
+            'limit': limit,
+            'next_cursor': next_cursor,
+            'has_more': has_more
+        }
+        if total:
+            meta['total'], meta['total_is_estimate'] = KeysetPagination.count(query, estimate=total == 'estimate')
+        return rows, meta
+
+    @staticmethod
+    def count(query, estimate: bool = False) -> Tuple[int, bool]:
+        """
+        Count the rows of a query, optionally from the planner's estimate.
+
+        Estimates come from PostgreSQL's EXPLAIN; other databases fall back
+        to an exact COUNT.
+
+        Args:
+            query: Filtered query
+            estimate: Whether an estimate is acceptable
+
+        Returns:
+            Tuple of (row count, whether it is an estimate)
+        """
+        query = query.order_by(None)
+        bind = db.session.get_bind()
+        if estimate and bind.dialect.name == 'postgresql':
+            compiled = query.statement.compile(dialect=bind.dialect)
+            plan = db.session.connection().exec_driver_sql(
+                f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params
+            ).scalar()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            return int(plan[0]['Plan']['Plan Rows']), True
+        return query.count(), False
+
+    @staticmethod
+    def encode_cursor(values: Sequence[Any]) -> str:
+        """
+        Encode sort key values into an opaque cursor.
+
+        Args:
+            values: Sort key values of the last row on a page
+
+        Returns:
+            URL-safe cursor string
+        """
+        encoded = []
+        for value in values:
+            if isinstance(value, datetime):
+                encoded.append({'dt': value.isoformat()})
+            elif isinstance(value, date):
+                encoded.append({'d': value.isoformat()})
+            else:
+                encoded.append(value)
+        raw = json.dumps(encoded, separators=(',', ':')).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+    @staticmethod
+    def decode_cursor(cursor: str, size: int) -> List[Any]:
+        """
+        Decode a cursor produced by encode_cursor.
+
+        Args:
+            cursor: Cursor string
+            size: Expected number of sort keys
+
+        Returns:
+            List of sort key values
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        try:
+            raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+            values = json.loads(raw)
+            if not isinstance(values, list) or len(values) != size:
+                raise ValueError
+            decoded = []
+            for value in values:
+                if isinstance(value, dict) and 'dt' in value:
+                    decoded.append(datetime.fromisoformat(value['dt']))
+                elif isinstance(value, dict) and 'd' in value:
+                    decoded.append(date.fromisoformat(value['d']))
+                else:
+                    decoded.append(value)
+            return decoded
+        except (ValueError, TypeError):
+            raise ValueError("Invalid cursor")
+
+    @staticmethod
+    def _after(order_by: Sequence[Tuple[Any, bool]], keys: Sequence[Any]):
+        """Predicate selecting rows that sort after the given keys"""
+        directions = {descending for _, descending in order_by}
+        columns = [column for column, _ in order_by]
+
+        # Uniform direction: a row-value comparison an index range scan can serve
+        if len(directions) == 1:
+            values = tuple_(*[literal(key, column.type) for column, key in zip(columns, keys)])
+            if directions.pop():
+                return tuple_(*columns) < values
+            return tuple_(*columns) > values
+
+        # Mixed directions: expand into (a > x) OR (a = x AND b < y) ...
+        clauses = []
+        for i, (column, descending) in enumerate(order_by):
+            equal = [order_by[j][0] == keys[j] for j in range(i)]
+            beyond = column < keys[i] if descending else column > keys[i]
+            clauses.append(and_(*equal, beyond))
+        return or_(*clauses)
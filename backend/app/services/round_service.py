@@ -4,32 +4,102 @@ Round Service
 Contains all business logic for round operations.
 Simple and focused on core golf functionality.
 """
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import date
+from sqlalchemy import func, select
 from sqlalchemy.exc import IntegrityError
 from app.extensions import db
+from app.models.handicap import Handicap
 from app.models.round import Round
+from app.models.score import Score
 from app.models.user import User
 from app.models.course import Course
 from app.models.tee_set import TeeSet
+from app.services.handicap_index_service import HandicapIndexService
+from app.services.handicap_service import HandicapService
+from app.services.hole_statistics_service import HoleStatisticsService
+from app.services.loader_profiles import LoaderProfiles
+from app.services.pagination import KeysetPagination
+from app.services.statistics_service import StatisticsService
+from app.replica import read_only
+from app.serializers import ROUND
 
 
 class RoundService:
     """Service class for round business logic"""
 
     @staticmethod
-    def get_rounds_by_user(user_id: int, limit: int = 20) -> List[Dict[str, Any]]:
-        """Get recent rounds for a user"""
-        rounds = Round.query.filter_by(user_id=user_id)\
-                          .order_by(Round.date_played.desc())\
-                          .limit(limit).all()
-        return [round.to_dict() for round in rounds]
+    @read_only
+    def get_rounds_by_user(user_id: int, limit: int = 20, completed: Optional[bool] = None) -> List[Dict[str, Any]]:
+        """Get recent rounds for a user, optionally only complete or incomplete ones"""
+        query = Round.query.filter_by(user_id=user_id)
+        if completed is not None:
+            query = query.filter(Round.is_complete == completed)
+        rounds = query.order_by(Round.date_played.desc(), Round.id.desc()).limit(limit).all()
+        return ROUND.many(rounds)
 
     @staticmethod
-    def get_round_by_id(round_id: int, include_scores: bool = False) -> Optional[Dict[str, Any]]:
-        """Get a specific round by ID"""
-        round = Round.query.get(round_id)
-        return round.to_dict(include_scores=include_scores) if round else None
+    @read_only
+    def list_rounds_by_user(user_id: int, limit: int = KeysetPagination.DEFAULT_LIMIT,
+                            completed: Optional[bool] = None, cursor: Optional[str] = None,
+                            total: Optional[str] = None, fields: Optional[str] = None,
+                            include: Optional[str] = None) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Get a user's rounds, most recent first, with keyset (cursor) pagination.
+        
+        Served by the (user_id, date_played, id) index.
+        
+        Args:
+            user_id: The user ID
+            limit: Page size
+            completed: Only complete (True) or incomplete (False) rounds
+            cursor: Cursor from the previous page, or None for the first page
+            total: 'exact' or 'estimate' to include a total count
+            fields: Comma-separated round fields to return (default: all)
+            include: Comma-separated expansions ('scores')
+            
+        Returns:
+            Tuple of (rounds, meta) with next_cursor and has_more in meta
+            
+        Raises:
+            ValueError: If the cursor, paging parameters or fields are invalid
+        """
+        keys = ROUND.select(fields, include)
+        # Only the requested columns, plus the sort keys for the next cursor
+        query = Round.query.options(*ROUND.load_options(keys, always=('date_played',))).filter_by(user_id=user_id)
+        if completed is not None:
+            query = query.filter(Round.is_complete == completed)
+        rounds, meta = KeysetPagination.paginate(
+            query,
+            [(Round.date_played, True), (Round.id, True)],
+            limit=limit,
+            cursor=cursor,
+            total=total
+        )
+        return ROUND.many(rounds, keys), meta
+
+    @staticmethod
+    @read_only
+    def get_round_by_id(round_id: int, include_scores: bool = False, fields: Optional[str] = None,
+                        include: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get a specific round by ID.
+        
+        Args:
+            round_id: The round ID
+            include_scores: Include the round's scores (same as include='scores')
+            fields: Comma-separated round fields to return (default: all)
+            include: Comma-separated expansions ('scores')
+            
+        Returns:
+            Round dictionary or None if not found
+            
+        Raises:
+            ValueError: If a field or expansion is unknown
+        """
+        keys = ROUND.select(fields, include, expand=('scores',) if include_scores else ())
+        round = Round.query.options(*ROUND.load_options(keys)).get(round_id)
+        return ROUND.one(round, keys) if round else None
 
     @staticmethod
     def create_round(round_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -58,16 +128,23 @@ class RoundService:
             raise ValueError("Tee set must belong to the selected course")
 
         try:
+            # Assign the loaded objects so the ratings can be stamped before flush
             round = Round(
-                user_id=round_data['user_id'],
-                course_id=round_data['course_id'],
-                tee_set_id=round_data['tee_set_id'],
-                date_played=round_data.get('date_played', date.today()),
-                handicap_used=round_data.get('handicap_used')
+                user=user,
+                course=course,
+                tee_set=tee_set,
+                date_played=round_data.get('date_played') or date.today(),
+                handicap_used=round_data.get('handicap_used'),
+                expected_holes=course.holes_count
             )
             
             # Stamp course/slope ratings from tee set
             round.stamp_ratings_from_tee_set()
+
+            # Default to the player's handicap on the day the round was played
+            if round.handicap_used is None:
+                handicap = Handicap.get_handicap_on_date(user.id, round.date_played)
+                round.handicap_used = handicap.handicap_value if handicap else None
             
             # Calculate course handicap if handicap_used provided
             if round.handicap_used:
@@ -82,6 +159,71 @@ class RoundService:
             db.session.rollback()
             raise ValueError("Failed to create round due to database constraints")
 
+    @staticmethod
+    def import_rounds(rounds_data: List[Dict[str, Any]]) -> Tuple[List[Tuple[int, Round]], List[Tuple[int, Dict[str, List[str]]]]]:
+        """
+        Build a batch of rounds for bulk import, stamped like create_round.
+
+        Users, courses and tee sets are loaded once for the batch, and the
+        handicaps of rounds without handicap_used are resolved with one join
+        against the handicap timeline. The rounds are returned unsaved so the
+        caller can attach scores and add them in one flush.
+
+        Args:
+            rounds_data: Round dictionaries with user_id, course_id, tee_set_id
+                and optional date_played and handicap_used
+
+        Returns:
+            Tuple of (built rounds, failures), each item paired with the
+            position of its input in rounds_data; failures carry field errors
+        """
+        sexes = dict(db.session.execute(
+            select(User.id, User.sex).where(User.id.in_({data['user_id'] for data in rounds_data}))
+        ).all())
+        holes_counts = dict(db.session.execute(
+            select(Course.id, Course.holes_count).where(Course.id.in_({data['course_id'] for data in rounds_data}))
+        ).all())
+        tee_sets = {
+            tee_set.id: tee_set
+            for tee_set in TeeSet.query.filter(TeeSet.id.in_({data['tee_set_id'] for data in rounds_data}))
+        }
+
+        rounds, failed = [], []
+        for position, data in enumerate(rounds_data):
+            tee_set = tee_sets.get(data['tee_set_id'])
+            if data['user_id'] not in sexes:
+                failed.append((position, {'user_id': ['User not found']}))
+                continue
+            if data['course_id'] not in holes_counts:
+                failed.append((position, {'course_id': ['Course not found']}))
+                continue
+            if not tee_set or tee_set.course_id != data['course_id']:
+                failed.append((position, {'tee_set_id': ['Tee set not found for this course']}))
+                continue
+
+            ratings = tee_set.get_rating_for_gender(sexes[data['user_id']])
+            rounds.append((position, Round(
+                user_id=data['user_id'],
+                course_id=data['course_id'],
+                tee_set_id=data['tee_set_id'],
+                date_played=data.get('date_played') or date.today(),
+                handicap_used=data.get('handicap_used'),
+                course_rating=ratings['course_rating'],
+                slope_rating=ratings['slope_rating'],
+                expected_holes=holes_counts[data['course_id']]
+            )))
+
+        handicaps = HandicapService.get_handicap_values_on_dates(
+            (round.user_id, round.date_played) for _, round in rounds if round.handicap_used is None
+        )
+        for _, round in rounds:
+            if round.handicap_used is None:
+                round.handicap_used = handicaps[(round.user_id, round.date_played)]
+            if round.handicap_used:
+                round.course_handicap = round.calculate_course_handicap()
+
+        return rounds, failed
+
     @staticmethod
     def update_round(round_id: int, round_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Update an existing round"""
@@ -116,19 +258,22 @@ class RoundService:
         if not round:
             return False
 
+        HoleStatisticsService.remove_scores(Score.round_id == round_id)
         db.session.delete(round)
         db.session.commit()
+        
         return True
 
     @staticmethod
     def finalize_round(round_id: int) -> Optional[Dict[str, Any]]:
         """Finalize a round by calculating all totals and differential"""
-        round = Round.query.get(round_id)
+        round = LoaderProfiles.apply(Round.query, 'round_with_scores').get(round_id)
         if not round:
             return None
         
-        # Calculate totals from scores
+        # Calculate totals and completion from scores
         round.calculate_totals()
+        round.update_completion()
         
         # Update Stableford points for all scores if course handicap exists
         if round.course_handicap:
@@ -136,30 +281,55 @@ class RoundService:
                 score.update_stableford_points(round.course_handicap)
         
         db.session.commit()
-        return round.to_dict(include_scores=True)
+        data = round.to_dict(include_scores=True)
+        
+        # Fold the new differential into the player's WHS handicap index
+        data['handicap_index'] = HandicapIndexService.record_round(round)
+        return data
 
     @staticmethod
+    @read_only
     def get_user_stats(user_id: int) -> Dict[str, Any]:
-        """Get basic statistics for a user's rounds"""
-        rounds = Round.query.filter_by(user_id=user_id).all()
-        completed_rounds = [r for r in rounds if r.is_complete]
+        """Get basic statistics for a user's rounds (single aggregate query)"""
+        stats = StatisticsService.get_round_statistics(user_id)
         
-        if not completed_rounds:
-            return {
-                'total_rounds': len(rounds),
-                'completed_rounds': 0,
-                'average_score': None,
-                'best_score': None,
-                'latest_differential': None
-            }
+        return {
+            'total_rounds': stats['total_rounds'],
+            'completed_rounds': stats['completed_rounds'],
+            'average_score': stats['average_score'],
+            'best_score': stats['best_score'],
+            'latest_differential': stats['latest_differential'],
+            'rounds_per_period': stats['rounds_per_period']
+        }
+
+    @staticmethod
+    def backfill_completion() -> int:
+        """
+        Recompute holes_played, expected_holes and is_complete for every round.
         
-        scores = [r.total_score for r in completed_rounds if r.total_score]
-        differentials = [r.differential for r in completed_rounds if r.differential]
+        Uses set-based UPDATEs so existing data can be backfilled without
+        loading rounds into memory.
         
-        return {
-            'total_rounds': len(rounds),
-            'completed_rounds': len(completed_rounds),
-            'average_score': round(sum(scores) / len(scores), 1) if scores else None,
-            'best_score': min(scores) if scores else None,
-            'latest_differential': differentials[-1] if differentials else None
-        } 
\ No newline at end of file
+        Returns:
+            Number of rounds updated
+        """
+        holes_played = select(func.count(Score.id))\
+            .where(Score.round_id == Round.id)\
+            .scalar_subquery()
+        expected_holes = select(Course.holes_count)\
+            .where(Course.id == Round.course_id)\
+            .scalar_subquery()
+        
+        result = db.session.execute(
+            Round.__table__.update().values(
+                holes_played=holes_played,
+                expected_holes=expected_holes
+            )
+        )
+        db.session.execute(
+            Round.__table__.update().values(
+                is_complete=Round.__table__.c.holes_played == Round.__table__.c.expected_holes
+            )
+        )
+        db.session.commit()
+        return result.rowcount
@@ -4,30 +4,71 @@ Score Service
 Contains all business logic for score operations.
 Simple and focused on core golf scoring.
 """
+from collections import Counter
+from datetime import date, datetime
 from typing import List, Optional, Dict, Any
+from marshmallow import ValidationError
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import contains_eager
+from sqlalchemy.orm.attributes import set_committed_value
 from app.extensions import db
 from app.models.score import Score
 from app.models.round import Round
 from app.models.hole import Hole
+from app.schemas.score_schema import HoleScoreSchema
+from app.services.loader_profiles import LoaderProfiles
+from app.services.hole_statistics_service import HoleStatisticsService
+from app.serializers import SCORE
 
 
 class ScoreService:
     """Service class for score business logic"""
 
+    BULK_BATCH_SIZE = 5000
+
     @staticmethod
-    def get_scores_by_round(round_id: int) -> List[Dict[str, Any]]:
-        """Get all scores for a round, ordered by hole number"""
+    def get_scores_by_round(round_id: int, fields: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Get all scores for a round, ordered by hole number.
+        
+        Args:
+            round_id: The round ID
+            fields: Comma-separated score fields to return (default: all)
+            
+        Returns:
+            List of score dictionaries
+            
+        Raises:
+            ValueError: If a field is unknown
+        """
+        keys = SCORE.select(fields)
+        # The hole is joined for ordering anyway
         scores = Score.query.filter_by(round_id=round_id)\
                           .join(Hole)\
+                          .options(contains_eager(Score.hole), *SCORE.load_options(keys, eager=False))\
                           .order_by(Hole.hole_number).all()
-        return [score.to_dict() for score in scores]
+        return SCORE.many(scores, keys)
 
     @staticmethod
-    def get_score_by_id(score_id: int) -> Optional[Dict[str, Any]]:
-        """Get a specific score by ID"""
-        score = Score.query.get(score_id)
-        return score.to_dict() if score else None
+    def get_score_by_id(score_id: int, fields: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get a specific score by ID.
+        
+        Args:
+            score_id: The score ID
+            fields: Comma-separated score fields to return (default: all)
+            
+        Returns:
+            Score dictionary or None if not found
+            
+        Raises:
+            ValueError: If a field is unknown
+        """
+        keys = SCORE.select(fields)
+        score = Score.query.options(*SCORE.load_options(keys)).get(score_id)
+        return SCORE.one(score, keys) if score else None
 
     @staticmethod
     def create_score(score_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -68,10 +109,12 @@ class ScoreService:
                 score.update_stableford_points(round.course_handicap)
             
             db.session.add(score)
+            HoleStatisticsService.apply(Counter({(hole.id, strokes): 1}))
             db.session.commit()
             
-            # Update round totals
+            # Update round totals and completion
             round.calculate_totals()
+            round.update_completion()
             db.session.commit()
             
             return score.to_dict()
@@ -93,6 +136,9 @@ class ScoreService:
                 strokes = score_data['strokes']
                 if strokes < 1 or strokes > 20:
                     raise ValueError("Strokes must be between 1 and 20")
+                deltas = Counter()
+                HoleStatisticsService.record(deltas, score.hole_id, score.strokes, strokes)
+                HoleStatisticsService.apply(deltas)
                 score.strokes = strokes
                 
                 # Recalculate Stableford points
@@ -119,11 +165,13 @@ class ScoreService:
             return False
 
         round = score.round
+        HoleStatisticsService.apply(Counter({(score.hole_id, score.strokes): -1}))
         db.session.delete(score)
         db.session.commit()
         
-        # Update round totals
+        # Update round totals and completion
         round.calculate_totals()
+        round.update_completion()
         db.session.commit()
         
         return True
@@ -137,6 +185,7 @@ class ScoreService:
             raise ValueError("Round not found")
         
         created_scores = []
+        deltas = Counter()
         
         try:
             for hole_score in hole_scores:
@@ -170,11 +219,14 @@ class ScoreService:
                 
                 db.session.add(score)
                 created_scores.append(score)
+                HoleStatisticsService.record(deltas, hole.id, new_strokes=strokes)
             
+            HoleStatisticsService.apply(deltas)
             db.session.commit()
             
-            # Update round totals
+            # Update round totals and completion
             round.calculate_totals()
+            round.update_completion()
             db.session.commit()
             
             return [score.to_dict() for score in created_scores]
@@ -183,10 +235,149 @@ class ScoreService:
             db.session.rollback()
             raise ValueError(f"Failed to create scores: {str(e)}")
 
+    @staticmethod
+    def submit_scorecard(round_id: int, hole_scores: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Submit a full or partial scorecard for a round in one transaction.
+        
+        All holes are resolved with one query and all strokes validated up
+        front. Only holes whose strokes or points differ from what is stored
+        are written, with a single multi-row INSERT ... ON CONFLICT DO UPDATE
+        on (round_id, hole_id), so live scoring can resend the card after
+        every hole. Stableford points and the round totals are computed in
+        memory and everything is committed once.
+        
+        Args:
+            round_id: The round ID
+            hole_scores: List of {'hole_number', 'strokes'} dictionaries
+            
+        Returns:
+            Dictionary with the updated round, the written scores and the
+            number of unchanged holes
+            
+        Raises:
+            ValueError: If the round or a hole is not found, or the card is invalid
+        """
+        round = db.session.get(Round, round_id)
+        if not round:
+            raise ValueError("Round not found")
+        
+        strokes_by_number = ScoreService._validate_scorecard(hole_scores)
+        
+        holes = Hole.query.filter(
+            Hole.course_id == round.course_id,
+            Hole.hole_number.in_(strokes_by_number)
+        ).all()
+        holes_by_number = {hole.hole_number: hole for hole in holes}
+        missing = sorted(set(strokes_by_number) - set(holes_by_number))
+        if missing:
+            raise ValueError(f"Holes not found on this course: {', '.join(map(str, missing))}")
+        
+        # Current card as hole_id -> (strokes, points)
+        card = {
+            hole_id: (strokes, points) for hole_id, strokes, points in db.session.execute(
+                select(Score.hole_id, Score.strokes, Score.points).where(Score.round_id == round_id)
+            )
+        }
+        
+        now = datetime.utcnow()
+        rows = []
+        deltas = Counter()
+        for number, strokes in strokes_by_number.items():
+            hole = holes_by_number[number]
+            points = None
+            if round.course_handicap:
+                points = Score.stableford_points(strokes, hole.par, hole.stroke_index, round.course_handicap)
+            if card.get(hole.id) == (strokes, points):
+                continue
+            HoleStatisticsService.record(deltas, hole.id, card.get(hole.id, (None, None))[0], strokes)
+            card[hole.id] = (strokes, points)
+            rows.append({
+                'round_id': round_id, 'hole_id': hole.id, 'strokes': strokes, 'points': points,
+                'created_at': now, 'updated_at': now
+            })
+        
+        written = []
+        if rows:
+            written = ScoreService._upsert_scores(rows)
+            HoleStatisticsService.apply(deltas)
+            
+            # Totals mirror Round.calculate_totals(), from the in-memory card
+            round.total_score = sum(strokes for strokes, _ in card.values() if strokes)
+            round.total_points = sum(points for _, points in card.values() if points)
+            round.differential = round.calculate_differential()
+            round.update_completion(len(card))
+            # Set explicitly so the flush does not have to read it back
+            round.updated_at = now
+            db.session.flush()
+        
+        # Serialize before the commit expires the round and hole instances
+        holes_by_id = {hole.id: hole for hole in holes}
+        scores = []
+        for row in written:
+            score = Score(id=row.id, round_id=round_id, hole_id=row.hole_id, strokes=row.strokes,
+                          points=row.points, created_at=row.created_at, updated_at=row.updated_at)
+            set_committed_value(score, 'hole', holes_by_id[row.hole_id])
+            scores.append(score.to_dict())
+        scores.sort(key=lambda score: score['hole_number'])
+        data = {
+            'round': round.to_dict(),
+            'scores': scores,
+            'unchanged': len(strokes_by_number) - len(written)
+        }
+        
+        if rows:
+            db.session.commit()
+        return data
+
+    @staticmethod
+    def _validate_scorecard(hole_scores: List[Dict[str, Any]]) -> Dict[int, int]:
+        """Validate a scorecard payload with HoleScoreSchema, reporting every bad hole at once"""
+        if not hole_scores:
+            raise ValueError("At least one hole score is required")
+        
+        schema = HoleScoreSchema()
+        strokes_by_number = {}
+        errors = []
+        for hole_score in hole_scores:
+            try:
+                row = schema.load(hole_score)
+            except ValidationError as e:
+                number = hole_score.get('hole_number') if isinstance(hole_score, dict) else None
+                for field, messages in e.messages.items():
+                    errors.append(f"{field} for hole {number}: {' '.join(messages)}")
+                continue
+            if row['hole_number'] in strokes_by_number:
+                errors.append(f"hole {row['hole_number']} is listed more than once")
+            else:
+                strokes_by_number[row['hole_number']] = row['strokes']
+        
+        if errors:
+            raise ValueError("Invalid scorecard: " + "; ".join(errors))
+        return strokes_by_number
+
+    @staticmethod
+    def _upsert_scores(rows: List[Dict[str, Any]]) -> List[Any]:
+        """Insert or update scores on (round_id, hole_id) with one statement"""
+        # PostgreSQL and SQLite share the ON CONFLICT syntax
+        dialect = db.session.get_bind().dialect.name
+        stmt = postgresql.insert(Score) if dialect == 'postgresql' else sqlite.insert(Score)
+        stmt = stmt.values(rows)
+        # Column.onupdate does not apply to ON CONFLICT, so updated_at is set explicitly
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Score.round_id, Score.hole_id],
+            set_={
+                'strokes': stmt.excluded.strokes,
+                'points': stmt.excluded.points,
+                'updated_at': stmt.excluded.updated_at
+            }
+        ).returning(Score.id, Score.hole_id, Score.strokes, Score.points, Score.created_at, Score.updated_at)
+        return list(db.session.execute(stmt))
+
     @staticmethod
     def recalculate_round_points(round_id: int) -> Dict[str, Any]:
         """Recalculate Stableford points for all scores in a round"""
-        round = Round.query.get(round_id)
+        round = LoaderProfiles.apply(Round.query, 'round_with_scores').get(round_id)
         if not round:
             raise ValueError("Round not found")
         
@@ -201,4 +392,100 @@ class ScoreService:
         round.calculate_totals()
         
         db.session.commit()
-        return round.to_dict(include_scores=True) 
\ No newline at end of file
+        return round.to_dict(include_scores=True)
+
+    @staticmethod
+    def bulk_recalculate_points(course_id: Optional[int] = None,
+                                tee_set_id: Optional[int] = None,
+                                hole_id: Optional[int] = None,
+                                date_from: Optional[date] = None,
+                                date_to: Optional[date] = None,
+                                batch_size: int = BULK_BATCH_SIZE) -> Dict[str, int]:
+        """
+        Recalculate Stableford points for every score matching the filters.
+        
+        Scores are streamed as plain (strokes, par, stroke_index, course_handicap)
+        columns instead of ORM objects and points are computed per batch. Only
+        changed rows are written: since points can only be 0-5, changed score ids
+        are grouped by their new value and written with one `UPDATE ... WHERE id IN`
+        per value and batch. Round.total_points is then refreshed with set-based
+        UPDATEs for the affected rounds.
+        Rounds without a course handicap are skipped, as in finalize_round.
+        
+        Args:
+            course_id: Limit to rounds played on this course
+            tee_set_id: Limit to rounds played from this tee set
+            hole_id: Limit to scores on this hole
+            date_from: Limit to rounds played on or after this date
+            date_to: Limit to rounds played on or before this date
+            batch_size: Rows per fetch and per UPDATE batch
+            
+        Returns:
+            Dictionary with scores_checked, scores_updated and rounds_updated
+            
+        Raises:
+            ValueError: If the date range or batch size is invalid
+        """
+        if date_from and date_to and date_from > date_to:
+            raise ValueError("date_from must be on or before date_to")
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
+        
+        stmt = select(Score.id, Score.round_id, Score.points, Score.strokes,
+                      Hole.par, Hole.stroke_index, Round.course_handicap)\
+            .join(Hole, Score.hole_id == Hole.id)\
+            .join(Round, Score.round_id == Round.id)\
+            .where(Round.course_handicap.isnot(None))
+        if course_id is not None:
+            stmt = stmt.where(Round.course_id == course_id)
+        if tee_set_id is not None:
+            stmt = stmt.where(Round.tee_set_id == tee_set_id)
+        if hole_id is not None:
+            stmt = stmt.where(Score.hole_id == hole_id)
+        if date_from is not None:
+            stmt = stmt.where(Round.date_played >= date_from)
+        if date_to is not None:
+            stmt = stmt.where(Round.date_played <= date_to)
+        
+        checked = 0
+        changes: Dict[int, List[int]] = {}
+        round_ids = set()
+        result = db.session.execute(stmt.order_by(Score.id).execution_options(yield_per=batch_size))
+        for rows in result.partitions():
+            ids, score_round_ids, old_points, strokes, pars, stroke_indexes, handicaps = zip(*rows)
+            new_points = list(map(Score.stableford_points, strokes, pars, stroke_indexes, handicaps))
+            checked += len(ids)
+            
+            for score_id, round_id, old, new in zip(ids, score_round_ids, old_points, new_points):
+                if old != new:
+                    changes.setdefault(new, []).append(score_id)
+                    round_ids.add(round_id)
+        
+        for points, score_ids in changes.items():
+            for start in range(0, len(score_ids), batch_size):
+                db.session.execute(
+                    update(Score)
+                    .where(Score.id.in_(score_ids[start:start + batch_size]))
+                    .values(points=points)
+                    .execution_options(synchronize_session=False)
+                )
+        
+        # Round totals mirror Round.calculate_totals(): the sum of truthy points
+        total_points = select(func.coalesce(func.sum(Score.points), 0))\
+            .where(Score.round_id == Round.id)\
+            .scalar_subquery()
+        affected = sorted(round_ids)
+        for start in range(0, len(affected), batch_size):
+            db.session.execute(
+                update(Round)
+                .where(Round.id.in_(affected[start:start + batch_size]))
+                .values(total_points=total_points)
+                .execution_options(synchronize_session=False)
+            )
+        
+        db.session.commit()
+        return {
+            'scores_checked': checked,
+            'scores_updated': sum(len(score_ids) for score_ids in changes.values()),
+            'rounds_updated': len(affected)
+        }
@@ -0,0 +1,131 @@
+"""
+Statistics Service
+
+Aggregate-query statistics engine for a user's rounds.
+Computes counts, averages, best score, rounds per period and latest
+differentials in a single SQL round-trip instead of loading every round.
+"""
+from typing import Dict, Any, List
+from sqlalchemy import and_, case, extract, func, select
+from sqlalchemy.orm import aliased
+from app.extensions import db
+from app.models.round import Round
+from app.replica import read_only
+
+
+class StatisticsService:
+    """Service class for SQL-aggregated round statistics"""
+
+    PERIODS = ('month', 'year')
+
+    @staticmethod
+    @read_only
+    def get_round_statistics(user_id: int, period: str = 'month') -> Dict[str, Any]:
+        """
+        Get aggregated round statistics for a user.
+
+        Rows are grouped per period; window functions carry the user-wide
+        totals on every row and scalar subqueries pick the latest
+        differentials, so everything arrives in one statement.
+
+        Args:
+            user_id: The user ID
+            period: Grouping for rounds_per_period ('month' or 'year')
+
+        Returns:
+            Dictionary with total_rounds, completed_rounds, average_score,
+            best_score, latest_differential, latest_round_differential and
+            rounds_per_period
+
+        Raises:
+            ValueError: If period is not supported
+        """
+        if period not in StatisticsService.PERIODS:
+            raise ValueError(f"Period must be one of: {', '.join(StatisticsService.PERIODS)}")
+
+        period_columns = [extract('year', Round.date_played).label('year')]
+        if period == 'month':
+            period_columns.append(extract('month', Round.date_played).label('month'))
+
+        # Completed rounds with a recorded (non-zero) total score
+        scored = and_(Round.is_complete.is_(True), Round.total_score.isnot(None), Round.total_score != 0)
+        completed = case((Round.is_complete.is_(True), 1))
+        scored_total = case((scored, Round.total_score))
+
+        # Most recently entered completed round with a non-zero differential
+        entered = aliased(Round)
+        latest_differential = select(entered.differential)\
+            .where(
+                entered.user_id == user_id,
+                entered.is_complete.is_(True),
+                entered.differential.isnot(None),
+                entered.differential != 0
+            )\
+            .order_by(entered.id.desc())\
+            .limit(1)\
+            .scalar_subquery()
+
+        # Differential of the most recently played completed round
+        played = aliased(Round)
+        latest_round_differential = select(played.differential)\
+            .where(played.user_id == user_id, played.is_complete.is_(True))\
+            .order_by(played.date_played.desc(), played.id.asc())\
+            .limit(1)\
+            .scalar_subquery()
+
+        stmt = select(
+            *period_columns,
+            func.count(Round.id).label('period_rounds'),
+            func.count(completed).label('period_completed'),
+            func.sum(func.count(Round.id)).over().label('total_rounds'),
+            func.sum(func.count(completed)).over().label('completed_rounds'),
+            func.sum(func.sum(scored_total)).over().label('score_sum'),
+            func.sum(func.count(scored_total)).over().label('score_count'),
+            func.min(func.min(scored_total)).over().label('best_score'),
+            latest_differential.label('latest_differential'),
+            latest_round_differential.label('latest_round_differential')
+        ).where(Round.user_id == user_id)\
+         .group_by(*period_columns)\
+         .order_by(*period_columns)
+
+        rows = db.session.execute(stmt).all()
+
+        if not rows:
+            return {
+                'total_rounds': 0,
+                'completed_rounds': 0,
+                'average_score': None,
+                'best_score': None,
+                'latest_differential': None,
+                'latest_round_differential': None,
+                'rounds_per_period': []
+            }
+
+        totals = rows[0]
+        score_count = int(totals.score_count or 0)
+
+        return {
+            'total_rounds': int(totals.total_rounds),
+            'completed_rounds': int(totals.completed_rounds),
+            'average_score': round(int(totals.score_sum) / score_count, 1) if score_count else None,
+            'best_score': int(totals.best_score) if totals.best_score is not None else None,
+            'latest_differential': totals.latest_differential,
+            'latest_round_differential': totals.latest_round_differential,
+            'rounds_per_period': StatisticsService._format_periods(rows, period)
+        }
+
+    @staticmethod
+    def _format_periods(rows, period: str) -> List[Dict[str, Any]]:
+        """Convert grouped rows into period dictionaries ordered oldest first"""
+        periods = []
+        for row in rows:
+            if period == 'month':
+                label = f"{int(row.year):04d}-{int(row.month):02d}"
+            else:
+                label = f"{int(row.year):04d}"
+            periods.append({
+                'period': label,
+                'rounds': int(row.period_rounds),
+                'completed_rounds': int(row.period_completed)
+            })
+        return periods
@@ -4,12 +4,18 @@ TeePosition Service
 Contains all business logic for tee position operations.
 Follows the "Fat Services, Thin Routes" pattern.
 """
+from datetime import datetime
 from typing import List, Optional, Dict, Any
+from sqlalchemy import case, insert, select, update
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import contains_eager
+from sqlalchemy.orm.attributes import set_committed_value
 from app.extensions import db
 from app.models.tee_position import TeePosition
 from app.models.hole import Hole
 from app.models.tee_set import TeeSet
+from app.services.loader_profiles import LoaderProfiles
+from app.services.course_catalog_cache import CourseCatalogCache
 
 
 class TeePositionService:
@@ -27,7 +33,10 @@ class TeePositionService:
         Returns:
             List of tee position dictionaries ordered by hole number
         """
-        positions = TeePosition.query.filter_by(tee_set_id=tee_set_id).join(Hole).order_by(Hole.hole_number).all()
+        positions = TeePosition.query.filter_by(tee_set_id=tee_set_id)\
+                                     .join(Hole)\
+                                     .options(contains_eager(TeePosition.hole))\
+                                     .order_by(Hole.hole_number).all()
         return [position.to_dict(unit=unit) for position in positions]
 
     @staticmethod
@@ -42,7 +51,7 @@ class TeePositionService:
         Returns:
             List of tee position dictionaries
         """
-        positions = TeePosition.query.filter_by(hole_id=hole_id).all()
+        positions = LoaderProfiles.apply(TeePosition.query, 'tee_position_with_hole').filter_by(hole_id=hole_id).all()
         return [position.to_dict(unit=unit) for position in positions]
 
     @staticmethod
@@ -57,7 +66,7 @@ class TeePositionService:
         Returns:
             Tee position dictionary or None if not found
         """
-        position = TeePosition.query.get(position_id)
+        position = LoaderProfiles.apply(TeePosition.query, 'tee_position_with_hole').get(position_id)
         return position.to_dict(unit=unit) if position else None
 
     @staticmethod
@@ -107,6 +116,7 @@ class TeePositionService:
             )
             
             db.session.add(position)
+            CourseCatalogCache.bump(course_id=tee_set.course_id)
             db.session.commit()
             
             return position.to_dict()
@@ -142,6 +152,7 @@ class TeePositionService:
                     raise ValueError("Length must be between 50 and 700 meters")
                 position.length = length
 
+            CourseCatalogCache.bump(course_id=position.tee_set.course_id)
             db.session.commit()
             return position.to_dict()
             
@@ -164,6 +175,7 @@ class TeePositionService:
         if not position:
             return False
 
+        CourseCatalogCache.bump(course_id=position.tee_set.course_id)
         db.session.delete(position)
         db.session.commit()
         return True
@@ -183,47 +195,30 @@ class TeePositionService:
         Raises:
             ValueError: If tee set not found or invalid data
         """
-        # Verify tee set exists
-        tee_set = TeeSet.query.get(tee_set_id)
-        if not tee_set:
-            raise ValueError("Tee set not found")
-        
-        # Get course holes
-        holes = Hole.query.filter_by(course_id=tee_set.course_id).order_by(Hole.hole_number).all()
-        
-        if len(distances) != len(holes):
-            raise ValueError(f"Number of distances ({len(distances)}) must match number of holes ({len(holes)})")
-        
-        # Check if tee set already has positions
-        existing_positions = TeePosition.query.filter_by(tee_set_id=tee_set_id).count()
-        if existing_positions > 0:
-            raise ValueError("Tee set already has positions")
+        return TeePositionService.create_tee_positions_for_tee_sets({tee_set_id: distances})
 
-        created_positions = []
+    @staticmethod
+    def create_tee_positions_for_tee_sets(distances_by_tee_set: Dict[int, List[int]]) -> List[Dict[str, Any]]:
+        """
+        Create tee positions for all holes of many tee sets at once.
         
-        try:
-            for i, hole in enumerate(holes):
-                position_data = {
-                    'hole_id': hole.id,
-                    'tee_set_id': tee_set_id,
-                    'length': distances[i]
-                }
-                
-                position = TeePosition(
-                    hole_id=hole.id,
-                    tee_set_id=tee_set_id,
-                    length=distances[i]
-                )
-                
-                db.session.add(position)
-                created_positions.append(position)
+        Takes a fixed number of statements however many tee sets are given:
+        the tee sets, their courses' holes, an existing-position check, one
+        multi-row INSERT and the catalog version bump. Positions are
+        serialized from the loaded holes, without a query per row.
+        
+        Args:
+            distances_by_tee_set: Distances in meters (one per hole, in hole
+                number order) by tee set ID
             
-            db.session.commit()
-            return [position.to_dict() for position in created_positions]
+        Returns:
+            List of created tee position dictionaries, by tee set then hole number
             
-        except Exception as e:
-            db.session.rollback()
-            raise ValueError(f"Failed to create tee positions: {str(e)}")
+        Raises:
+            ValueError: If a tee set is not found or invalid data
+        """
+        tee_sets, holes_by_course = TeePositionService._load_layouts(list(distances_by_tee_set))
+        return TeePositionService._insert_positions(tee_sets, holes_by_course, distances_by_tee_set)
 
     @staticmethod
     def create_standard_distances_by_par(tee_set_id: int, difficulty_level: str = 'medium') -> List[Dict[str, Any]]:
@@ -251,13 +246,9 @@ class TeePositionService:
         if difficulty_level not in distance_ranges:
             raise ValueError("Difficulty level must be 'easy', 'medium', 'hard', or 'championship'")
         
-        # Verify tee set exists
-        tee_set = TeeSet.query.get(tee_set_id)
-        if not tee_set:
-            raise ValueError("Tee set not found")
-        
-        # Get course holes
-        holes = Hole.query.filter_by(course_id=tee_set.course_id).order_by(Hole.hole_number).all()
+        # Verify tee set exists and get course holes
+        tee_sets, holes_by_course = TeePositionService._load_layouts([tee_set_id])
+        holes = holes_by_course[tee_sets[tee_set_id].course_id]
         
         if not holes:
             raise ValueError("Course has no holes")
@@ -277,7 +268,7 @@ class TeePositionService:
                 # Fallback for unusual par values
                 distances.append(300)
         
-        return TeePositionService.create_tee_positions_for_tee_set(tee_set_id, distances)
+        return TeePositionService._insert_positions(tee_sets, holes_by_course, {tee_set_id: distances})
 
     @staticmethod
     def get_tee_position_statistics(tee_set_id: int) -> Optional[Dict[str, Any]]:
@@ -294,7 +285,9 @@ class TeePositionService:
         if not tee_set:
             return None
         
-        positions = TeePosition.query.filter_by(tee_set_id=tee_set_id).join(Hole).all()
+        positions = TeePosition.query.filter_by(tee_set_id=tee_set_id)\
+                                     .join(Hole)\
+                                     .options(contains_eager(TeePosition.hole)).all()
         
         if not positions:
             return {
@@ -354,42 +347,150 @@ class TeePositionService:
         Raises:
             ValueError: If invalid data
         """
-        # Verify tee set exists
-        tee_set = TeeSet.query.get(tee_set_id)
-        if not tee_set:
-            raise ValueError("Tee set not found")
+        return TeePositionService.bulk_update_distances_for_tee_sets({tee_set_id: distances})
+
+    @staticmethod
+    def bulk_update_distances_for_tee_sets(updates: Dict[int, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Bulk update distances for many tee sets at once.
         
-        updated_positions = []
+        The tee sets and all their positions (with holes) are loaded in two
+        queries and every length is written by a single UPDATE ... CASE,
+        whatever the number of tee sets and holes.
         
-        try:
+        Args:
+            updates: Lists of dicts with 'hole_number' and 'length' by tee set ID
+            
+        Returns:
+            List of updated tee position dictionaries
+            
+        Raises:
+            ValueError: If a tee set or tee position is not found or invalid data
+        """
+        tee_sets = TeePositionService._load_tee_sets(list(updates))
+        
+        positions = TeePosition.query.join(Hole)\
+                                     .options(contains_eager(TeePosition.hole))\
+                                     .filter(TeePosition.tee_set_id.in_(list(updates))).all()
+        positions_by_key = {(position.tee_set_id, position.hole.hole_number): position for position in positions}
+        
+        lengths = {}
+        updated_positions = []
+        errors = []
+        for tee_set_id, distances in updates.items():
             for distance_update in distances:
                 hole_number = distance_update.get('hole_number')
                 new_length = distance_update.get('length')
                 
                 if hole_number is None or new_length is None:
-                    raise ValueError("Each distance update must have 'hole_number' and 'length'")
-                
-                # Find the hole
-                hole = Hole.query.filter_by(course_id=tee_set.course_id, hole_number=hole_number).first()
-                if not hole:
-                    raise ValueError(f"Hole {hole_number} not found")
-                
-                # Find the tee position
-                position = TeePosition.query.filter_by(tee_set_id=tee_set_id, hole_id=hole.id).first()
+                    errors.append("each distance update must have 'hole_number' and 'length'")
+                    continue
+                position = positions_by_key.get((tee_set_id, hole_number))
                 if not position:
-                    raise ValueError(f"Tee position for hole {hole_number} not found")
-                
-                # Validate length
-                if new_length < 50 or new_length > 700:
-                    raise ValueError(f"Length for hole {hole_number} must be between 50 and 700 meters")
-                
-                # Update length
-                position.length = new_length
-                updated_positions.append(position)
+                    errors.append(f"tee position for hole {hole_number} of tee set {tee_set_id} not found")
+                elif new_length < 50 or new_length > 700:
+                    errors.append(f"length for hole {hole_number} must be between 50 and 700 meters")
+                else:
+                    if position.id not in lengths:
+                        updated_positions.append(position)
+                    lengths[position.id] = new_length
+        
+        if errors:
+            raise ValueError("Failed to bulk update distances: " + "; ".join(errors))
+        
+        try:
+            now = datetime.utcnow()
+            db.session.execute(
+                update(TeePosition)
+                .where(TeePosition.id.in_(list(lengths)))
+                .values(length=case(lengths, value=TeePosition.id), updated_at=now)
+                .execution_options(synchronize_session=False)
+            )
+            CourseCatalogCache.bump(course_ids=[tee_sets[tee_set_id].course_id for tee_set_id in updates])
             
+            # Serialize before the commit expires the loaded positions
+            for position in updated_positions:
+                set_committed_value(position, 'length', lengths[position.id])
+                set_committed_value(position, 'updated_at', now)
+            result = [position.to_dict() for position in updated_positions]
             db.session.commit()
-            return [position.to_dict() for position in updated_positions]
+            return result
             
         except Exception as e:
             db.session.rollback()
-            raise ValueError(f"Failed to bulk update distances: {str(e)}") 
\ No newline at end of file
+            raise ValueError(f"Failed to bulk update distances: {str(e)}")
+
+    @staticmethod
+    def _load_tee_sets(tee_set_ids: List[int]) -> Dict[int, TeeSet]:
+        """Load tee sets by ID in one query, failing on any unknown ID"""
+        tee_sets = {tee_set.id: tee_set for tee_set in TeeSet.query.filter(TeeSet.id.in_(tee_set_ids)).all()}
+        missing = [tee_set_id for tee_set_id in tee_set_ids if tee_set_id not in tee_sets]
+        if len(tee_set_ids) == 1 and missing:
+            raise ValueError("Tee set not found")
+        if missing:
+            raise ValueError(f"Tee sets not found: {', '.join(map(str, missing))}")
+        return tee_sets
+
+    @staticmethod
+    def _load_layouts(tee_set_ids: List[int]):
+        """Load tee sets and their courses' holes (in hole number order) in two queries"""
+        tee_sets = TeePositionService._load_tee_sets(tee_set_ids)
+        course_ids = {tee_set.course_id for tee_set in tee_sets.values()}
+        holes_by_course = {course_id: [] for course_id in course_ids}
+        for hole in Hole.query.filter(Hole.course_id.in_(course_ids)).order_by(Hole.hole_number).all():
+            holes_by_course[hole.course_id].append(hole)
+        return tee_sets, holes_by_course
+
+    @staticmethod
+    def _insert_positions(tee_sets: Dict[int, TeeSet], holes_by_course: Dict[int, List[Hole]],
+                          distances_by_tee_set: Dict[int, List[int]]) -> List[Dict[str, Any]]:
+        """Validate and insert positions for loaded tee sets with one multi-row INSERT"""
+        for tee_set_id, distances in distances_by_tee_set.items():
+            holes = holes_by_course[tee_sets[tee_set_id].course_id]
+            if len(distances) != len(holes):
+                raise ValueError(f"Number of distances ({len(distances)}) must match number of holes ({len(holes)})")
+            for hole, length in zip(holes, distances):
+                if length < 50 or length > 700:
+                    raise ValueError(f"Length for hole {hole.hole_number} must be between 50 and 700 meters")
+        
+        # Check if tee sets already have positions
+        existing = db.session.execute(
+            select(TeePosition.tee_set_id).where(TeePosition.tee_set_id.in_(list(distances_by_tee_set))).distinct()
+        ).scalars().all()
+        if existing:
+            if len(distances_by_tee_set) == 1:
+                raise ValueError("Tee set already has positions")
+            raise ValueError(f"Tee sets already have positions: {', '.join(map(str, sorted(existing)))}")
+        
+        now = datetime.utcnow()
+        rows = []
+        holes_by_id = {}
+        for tee_set_id, distances in distances_by_tee_set.items():
+            for hole, length in zip(holes_by_course[tee_sets[tee_set_id].course_id], distances):
+                rows.append({
+                    'hole_id': hole.id, 'tee_set_id': tee_set_id, 'length': length,
+                    'created_at': now, 'updated_at': now
+                })
+                holes_by_id[hole.id] = hole
+        
+        try:
+            # One multi-row INSERT; (tee_set_id, hole_id) is unique, so RETURNING order does not matter
+            inserted = db.session.execute(
+                insert(TeePosition).values(rows).returning(TeePosition.id, TeePosition.tee_set_id, TeePosition.hole_id)
+            ).all()
+            ids = {(tee_set_id, hole_id): position_id for position_id, tee_set_id, hole_id in inserted}
+            CourseCatalogCache.bump(course_ids=[tee_sets[tee_set_id].course_id for tee_set_id in distances_by_tee_set])
+            
+            # Serialize from the loaded holes; the positions never enter the session
+            created_positions = []
+            for row in rows:
+                position = TeePosition(id=ids[(row['tee_set_id'], row['hole_id'])], **row)
+                set_committed_value(position, 'hole', holes_by_id[row['hole_id']])
+                created_positions.append(position.to_dict())
+            
+            db.session.commit()
+            return created_positions
+            
+        except Exception as e:
+            db.session.rollback()
+            raise ValueError(f"Failed to create tee positions: {str(e)}")
@@ -9,40 +9,62 @@ from sqlalchemy.exc import IntegrityError
 from app.extensions import db
 from app.models.tee_set import TeeSet
 from app.models.course import Course
+from app.serializers import TEE_SET
+from app.services.course_catalog_cache import CourseCatalogCache
 
 
 class TeeSetService:
     """Service class for tee set business logic"""
 
     @staticmethod
-    def get_tee_sets_by_course(course_id: int, include_positions: bool = False) -> List[Dict[str, Any]]:
+    def get_tee_sets_by_course(course_id: int, include_positions: bool = False, fields: Optional[str] = None,
+                               include: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Get all tee sets for a specific course.
         
+        Tee sets come from the cached course snapshot, which is already
+        serialized, so fields= only trims the payload.
+        
         Args:
             course_id: The course ID
-            include_positions: Whether to include tee position data
+            include_positions: Whether to include tee position data (same as include='tee_positions')
+            fields: Comma-separated tee set fields to return (default: all)
+            include: Comma-separated expansions ('tee_positions')
             
         Returns:
             List of tee set dictionaries
+            
+        Raises:
+            ValueError: If a field or expansion is unknown
         """
-        tee_sets = TeeSet.query.filter_by(course_id=course_id).all()
-        return [tee_set.to_dict(include_positions=include_positions) for tee_set in tee_sets]
+        keys = TEE_SET.select(fields, include, expand=('tee_positions',) if include_positions else ())
+        snapshot = CourseCatalogCache.get_snapshot(course_id)
+        if not snapshot:
+            return []
+        return [TEE_SET.pick(tee_set, keys) for tee_set in snapshot['tee_sets']]
 
     @staticmethod
-    def get_tee_set_by_id(tee_set_id: int, include_positions: bool = False) -> Optional[Dict[str, Any]]:
+    def get_tee_set_by_id(tee_set_id: int, include_positions: bool = False, fields: Optional[str] = None,
+                          include: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
         Get a specific tee set by ID.
         
         Args:
             tee_set_id: The tee set ID
-            include_positions: Whether to include tee position data
+            include_positions: Whether to include tee position data (same as include='tee_positions')
+            fields: Comma-separated tee set fields to return (default: all)
+            include: Comma-separated expansions ('tee_positions')
             
         Returns:
             Tee set dictionary or None if not found
+            
+        Raises:
+            ValueError: If a field or expansion is unknown
         """
-        tee_set = TeeSet.query.get(tee_set_id)
-        return tee_set.to_dict(include_positions=include_positions) if tee_set else None
+        keys = TEE_SET.select(fields, include, expand=('tee_positions',) if include_positions else ())
+        # Tee positions are only loaded for total_length_meters or include=tee_positions
+        tee_set = TeeSet.query.options(*TEE_SET.load_options(keys)).get(tee_set_id)
+        return TEE_SET.one(tee_set, keys) if tee_set else None
 
     @staticmethod
     def create_tee_set(tee_set_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -102,6 +124,7 @@ class TeeSetService:
             )
             
             db.session.add(tee_set)
+            CourseCatalogCache.bump(course_id=tee_set.course_id)
             db.session.commit()
             
             return tee_set.to_dict()
@@ -160,6 +183,7 @@ class TeeSetService:
                     raise ValueError("Women's course rating must be between 50 and 90")
                 tee_set.women_course_rating = women_course
 
+            CourseCatalogCache.bump(course_id=tee_set.course_id)
             db.session.commit()
             return tee_set.to_dict()
             
@@ -193,6 +217,7 @@ class TeeSetService:
         if tee_set.course and tee_set.course.default_tee_set_id == tee_set_id:
             raise ValueError(f"Cannot delete tee set '{tee_set.name}' - it is the default tee set for the course")
 
+        CourseCatalogCache.bump(course_id=tee_set.course_id)
         db.session.delete(tee_set)
         db.session.commit()
         return True
@@ -7,11 +7,20 @@ Focused on core user management functionality.
 from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy import or_, and_, func
+from sqlalchemy import or_, and_, func, select
 from app.extensions import db
 from app.models.user import User
 from app.models.club import Club
 from app.models.theme import Theme
+from app.models.round import Round
+from app.models.score import Score
+from app.services.auth_service import AuthorizationCache
+from app.services.hole_statistics_service import HoleStatisticsService
+from app.services.loader_profiles import LoaderProfiles
+from app.services.pagination import KeysetPagination
+from app.services.statistics_service import StatisticsService
+from app.serializers import USER, USER_SENSITIVE
+from app.replica import read_only
 
 
 class UserService:
@@ -19,8 +28,72 @@ class UserService:
 
     @staticmethod
     def get_all_users(page: int = 1, per_page: int = 20, search: str = None, 
-                     club_id: int = None, is_active: bool = None, is_admin: bool = None) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
-        """Get all users with pagination and filtering"""
+                     club_id: int = None, is_active: bool = None, is_admin: bool = None,
+                     fields: Optional[str] = None) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """Get all users with page-number pagination and filtering (see list_users for cursors)"""
+        keys = USER_SENSITIVE.select(fields)
+        query = UserService._filtered_query(search, club_id, is_active, is_admin)
+        query = query.options(*USER_SENSITIVE.load_options(keys))
+        
+        # Apply pagination
+        pagination = query.order_by(User.last_name, User.first_name).paginate(
+            page=page, per_page=per_page, error_out=False
+        )
+        
+        # Get users with sensitive data (admin info and current handicap)
+        users = USER_SENSITIVE.many(pagination.items, keys)
+        
+        meta = {
+            'total': pagination.total,
+            'page': pagination.page,
+            'per_page': pagination.per_page,
+            'pages': pagination.pages,
+            'has_prev': pagination.has_prev,
+            'has_next': pagination.has_next
+        }
+        
+        return users, meta
+
+    @staticmethod
+    def list_users(cursor: Optional[str] = None, limit: int = KeysetPagination.DEFAULT_LIMIT,
+                   search: str = None, club_id: int = None, is_active: bool = None,
+                   is_admin: bool = None, total: Optional[str] = None,
+                   fields: Optional[str] = None) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Get users ordered by name with keyset (cursor) pagination.
+        
+        Args:
+            cursor: Cursor from the previous page, or None for the first page
+            limit: Page size
+            search: Case-insensitive match on email, first or last name
+            club_id: Filter by home club
+            is_active: Filter by active status
+            is_admin: Filter by admin status
+            total: 'exact' or 'estimate' to include a total count
+            fields: Comma-separated user fields to return (default: all)
+            
+        Returns:
+            Tuple of (users, meta) with next_cursor and has_more in meta
+            
+        Raises:
+            ValueError: If the cursor, paging parameters or fields are invalid
+        """
+        keys = USER_SENSITIVE.select(fields)
+        query = UserService._filtered_query(search, club_id, is_active, is_admin)
+        # Only the requested columns, plus the sort keys for the next cursor
+        query = query.options(*USER_SENSITIVE.load_options(keys, always=('last_name', 'first_name')))
+        users, meta = KeysetPagination.paginate(
+            query,
+            [(User.last_name, False), (User.first_name, False), (User.id, False)],
+            limit=limit,
+            cursor=cursor,
+            total=total
+        )
+        return USER_SENSITIVE.many(users, keys), meta
+
+    @staticmethod
+    def _filtered_query(search: str = None, club_id: int = None, is_active: bool = None, is_admin: bool = None):
+        """Build the user listing query with its filters applied (loader options are the caller's)"""
         query = User.query
         
         # Apply filters
@@ -44,30 +117,29 @@ class UserService:
         if is_admin is not None:
             query = query.filter(User.is_admin == is_admin)
         
-        # Apply pagination
-        pagination = query.order_by(User.last_name, User.first_name).paginate(
-            page=page, per_page=per_page, error_out=False
-        )
-        
-        # Get users with sensitive data (admin info and current handicap)
-        users = [user.to_dict(include_sensitive=True) for user in pagination.items]
-        
-        meta = {
-            'total': pagination.total,
-            'page': pagination.page,
-            'per_page': pagination.per_page,
-            'pages': pagination.pages,
-            'has_prev': pagination.has_prev,
-            'has_next': pagination.has_next
-        }
-        
-        return users, meta
+        return query
 
     @staticmethod
-    def get_user_by_id(user_id: int, include_sensitive: bool = False) -> Optional[Dict[str, Any]]:
-        """Get a user by ID"""
-        user = User.query.get(user_id)
-        return user.to_dict(include_sensitive=include_sensitive) if user else None
+    def get_user_by_id(user_id: int, include_sensitive: bool = False,
+                       fields: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get a user by ID.
+        
+        Args:
+            user_id: The user ID
+            include_sensitive: Include admin status and password reset data
+            fields: Comma-separated user fields to return (default: all)
+            
+        Returns:
+            User dictionary or None if not found
+            
+        Raises:
+            ValueError: If a field is unknown (sensitive fields need include_sensitive)
+        """
+        serializer = USER_SENSITIVE if include_sensitive else USER
+        keys = serializer.select(fields)
+        user = User.query.options(*serializer.load_options(keys)).get(user_id)
+        return serializer.one(user, keys) if user else None
 
     @staticmethod
     def get_user_by_email(email: str) -> Optional[Dict[str, Any]]:
@@ -168,6 +240,9 @@ class UserService:
             user.updated_at = datetime.utcnow()
             db.session.commit()
             
+            if 'is_active' in user_data:
+                AuthorizationCache.invalidate(user_id)
+            
             return user.to_dict()
             
         except IntegrityError:
@@ -202,6 +277,7 @@ class UserService:
         user.is_active = False
         user.updated_at = datetime.utcnow()
         db.session.commit()
+        AuthorizationCache.invalidate(user_id)
         
         return True
 
@@ -215,6 +291,7 @@ class UserService:
         user.is_active = True
         user.updated_at = datetime.utcnow()
         db.session.commit()
+        AuthorizationCache.invalidate(user_id)
         
         return True
 
@@ -228,6 +305,7 @@ class UserService:
         user.is_admin = not user.is_admin
         user.updated_at = datetime.utcnow()
         db.session.commit()
+        AuthorizationCache.invalidate(user_id)
         
         return user.to_dict(include_sensitive=True)
 
@@ -239,8 +317,10 @@ class UserService:
             return False
 
         # Note: Related data (rounds, scores, handicaps) will be deleted due to cascade
+        HoleStatisticsService.remove_scores(Score.round_id.in_(select(Round.id).where(Round.user_id == user_id)))
         db.session.delete(user)
         db.session.commit()
+        AuthorizationCache.invalidate(user_id)
         return True
 
     @staticmethod
@@ -254,14 +334,15 @@ class UserService:
     @staticmethod
     def get_users_by_club(club_id: int) -> List[Dict[str, Any]]:
         """Get all users belonging to a specific club"""
-        users = User.query.filter_by(home_club_id=club_id, is_active=True).all()
+        users = LoaderProfiles.apply(User.query, 'user_summary')\
+                              .filter_by(home_club_id=club_id, is_active=True).all()
         return [user.to_dict() for user in users]
 
     @staticmethod
     def search_users(search_term: str, limit: int = 10) -> List[Dict[str, Any]]:
         """Search users by name or email"""
         search_pattern = f"%{search_term}%"
-        users = User.query.filter(
+        users = LoaderProfiles.apply(User.query, 'user_summary').filter(
             and_(
                 User.is_active == True,
                 or_(
@@ -275,35 +356,35 @@ class UserService:
         return [user.to_dict() for user in users]
 
     @staticmethod
+    @read_only
     def get_user_statistics(user_id: int) -> Dict[str, Any]:
         """Get basic statistics for a user"""
-        user = User.query.get(user_id)
+        user = LoaderProfiles.apply(User.query, 'user_statistics').get(user_id)
         if not user:
             raise ValueError("User not found")
         
+        # Round aggregates come from a single statistics query
+        round_stats = StatisticsService.get_round_statistics(user_id)
+        
         # Basic user info
         stats = {
             'user_id': user_id,
             'member_since': user.created_at.isoformat() if user.created_at else None,
             'last_login': user.last_login.isoformat() if user.last_login else None,
-            'total_rounds': len(user.rounds),
+            'total_rounds': round_stats['total_rounds'],
             'current_handicap': user.current_handicap,
-            'home_club': user.home_club.name if user.home_club else None
+            'home_club': user.home_club.name if user.home_club else None,
+            'completed_rounds': round_stats['completed_rounds'],
+            'rounds_per_period': round_stats['rounds_per_period']
         }
         
-        # Calculate completed rounds
-        completed_rounds = [r for r in user.rounds if r.is_complete]
-        stats['completed_rounds'] = len(completed_rounds)
-        
-        if completed_rounds:
+        if round_stats['completed_rounds']:
             # Best score and latest round
-            scores = [r.total_score for r in completed_rounds if r.total_score]
-            if scores:
-                stats['best_score'] = min(scores)
-                stats['average_score'] = round(sum(scores) / len(scores), 1)
+            if round_stats['best_score'] is not None:
+                stats['best_score'] = round_stats['best_score']
+                stats['average_score'] = round_stats['average_score']
             
-            # Latest differential
-            latest_round = max(completed_rounds, key=lambda r: r.date_played)
-            stats['latest_differential'] = latest_round.differential
+            # Differential of the most recently played completed round
+            stats['latest_differential'] = round_stats['latest_round_differential']
         
         return stats 
\ No newline at end of file
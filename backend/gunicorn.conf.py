@@ -0,0 +1,91 @@
+"""
+Gunicorn configuration
+
+    gunicorn --config gunicorn.conf.py wsgi:app
+
+Workers are sized from the CPU count: sync workers (2 x CPUs + 1, one
+request each) by default, or threaded workers (one per CPU with
+GUNICORN_THREADS threads each) with GUNICORN_WORKER_CLASS=gthread. Every
+setting can be overridden through the environment.
+
+The app is preloaded in the master. Each worker uses the 'sync' or
+'threaded' engine profile (DB_ENGINE_PROFILE) with its database pool sized
+to its threads (DB_POOL_SIZE) plus room for the email outbox and import
+threads (DB_MAX_OVERFLOW). The database must accept
+workers x (DB_POOL_SIZE + DB_MAX_OVERFLOW) connections.
+
+Reloading:
+    kill -HUP <master>     restart workers gracefully (same code and config)
+    kill -USR2 <master>    start a new master with new code, then
+    kill -QUIT <old master> once the new workers are up
+"""
+import multiprocessing
+import os
+
+cpus = multiprocessing.cpu_count()
+
+# Binding
+bind = os.environ.get('GUNICORN_BIND') or f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+
+# Workers
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'sync')
+if worker_class == 'gthread':
+    workers = int(os.environ.get('GUNICORN_WORKERS', cpus))
+    threads = int(os.environ.get('GUNICORN_THREADS', 4))
+else:
+    workers = int(os.environ.get('GUNICORN_WORKERS', cpus * 2 + 1))
+    threads = 1
+
+# Recycle workers now and then to bound memory growth; jitter avoids restarting them all at once
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', 1000))
+max_requests_jitter = int(os.environ.get('GUNICORN_MAX_REQUESTS_JITTER', 100))
+
+# Timeouts (graceful_timeout lets in-flight requests and outbox batches finish on reload)
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 30))
+graceful_timeout = int(os.environ.get('GUNICORN_GRACEFUL_TIMEOUT', 30))
+keepalive = int(os.environ.get('GUNICORN_KEEPALIVE', 5))
+
+# Import the app once in the master; workers fork from it
+preload_app = True
+wsgi_app = 'wsgi:app'
+
+# Logging
+accesslog = os.environ.get('GUNICORN_ACCESS_LOG', '-') or None  # Empty disables access logs
+errorlog = '-'
+loglevel = os.environ.get('GUNICORN_LOG_LEVEL', 'info')
+
+# Engine profile for the worker model (app/config.py ENGINE_PROFILES); one pooled
+# connection per request thread, overflow for the background worker threads
+os.environ.setdefault('DB_ENGINE_PROFILE', 'threaded' if worker_class == 'gthread' else 'sync')
+background_threads = int(os.environ.get('MAIL_OUTBOX_WORKERS', 2)) + int(os.environ.get('IMPORT_WORKERS', 1))
+os.environ.setdefault('DB_POOL_SIZE', str(threads))
+os.environ.setdefault('DB_MAX_OVERFLOW', str(background_threads))
+
+
+def when_ready(server):
+    """Log the sizing the database has to accommodate"""
+    per_worker = int(os.environ['DB_POOL_SIZE']) + int(os.environ['DB_MAX_OVERFLOW'])
+    server.log.info(
+        "%s %s worker(s) x %s thread(s), engine profile %s; up to %s database connection(s) in total",
+        workers, worker_class, threads, os.environ['DB_ENGINE_PROFILE'], workers * per_worker
+    )
+
+
+def post_fork(server, worker):
+    """Drop database connections the worker inherited from the preloading master"""
+    from wsgi import app
+    from app.extensions import db
+
+    # Every bind, including the read replica
+    with app.app_context():
+        for engine in db.engines.values():
+            engine.dispose(close=False)
+
+
+def worker_exit(server, worker):
+    """Let background threads finish their current batch before the worker exits"""
+    from app.services.email_outbox_service import EmailOutboxWorker
+    from app.services.import_service import ImportWorker
+
+    EmailOutboxWorker.stop()
+    ImportWorker.stop()
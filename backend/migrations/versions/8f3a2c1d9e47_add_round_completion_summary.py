@@ -0,0 +1,40 @@
+"""Add denormalized completion summary columns to rounds
+
+Revision ID: 8f3a2c1d9e47
+Revises: 56cf5853168d
+Create Date: 2026-10-17 09:12:04.518220
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8f3a2c1d9e47'
+down_revision = '56cf5853168d'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('rounds', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('holes_played', sa.Integer(), nullable=False, server_default='0'))
+        batch_op.add_column(sa.Column('expected_holes', sa.Integer(), nullable=False, server_default='18'))
+        batch_op.add_column(sa.Column('is_complete', sa.Boolean(), nullable=False, server_default=sa.false()))
+        batch_op.create_index(batch_op.f('ix_rounds_is_complete'), ['is_complete'], unique=False)
+
+    # Backfill existing rows (same logic as `flask rounds backfill-summary`)
+    op.execute("""
+        UPDATE rounds SET
+            holes_played = (SELECT COUNT(scores.id) FROM scores WHERE scores.round_id = rounds.id),
+            expected_holes = (SELECT courses.holes_count FROM courses WHERE courses.id = rounds.course_id)
+    """)
+    op.execute("UPDATE rounds SET is_complete = (holes_played = expected_holes)")
+
+
+def downgrade():
+    with op.batch_alter_table('rounds', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_rounds_is_complete'))
+        batch_op.drop_column('is_complete')
+        batch_op.drop_column('expected_holes')
+        batch_op.drop_column('holes_played')
@@ -0,0 +1,37 @@
+"""Add materialized hole statistics
+
+Revision ID: a8c2e5f7d913
+Revises: f5a3d8e1c702
+Create Date: 2026-10-17 19:05:12.184406
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a8c2e5f7d913'
+down_revision = 'f5a3d8e1c702'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('hole_statistics',
+    sa.Column('hole_id', sa.Integer(), nullable=False),
+    sa.Column('strokes', sa.Integer(), nullable=False),
+    sa.Column('score_count', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['hole_id'], ['holes.id'], ),
+    sa.PrimaryKeyConstraint('hole_id', 'strokes')
+    )
+
+    # Backfill from the scores recorded so far
+    op.execute(
+        "INSERT INTO hole_statistics (hole_id, strokes, score_count, updated_at) "
+        "SELECT hole_id, strokes, COUNT(id), CURRENT_TIMESTAMP FROM scores GROUP BY hole_id, strokes"
+    )
+
+
+def downgrade():
+    op.drop_table('hole_statistics')
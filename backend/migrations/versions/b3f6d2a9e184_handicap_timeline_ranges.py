@@ -0,0 +1,47 @@
+"""Enforce a non-overlapping handicap timeline
+
+Revision ID: b3f6d2a9e184
+Revises: a8c2e5f7d913
+Create Date: 2026-10-17 21:04:19.730652
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b3f6d2a9e184'
+down_revision = 'a8c2e5f7d913'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Entries now cover [start_date, end_date). Earlier inserts on an existing
+    # start date left an entry that ends where it starts; it is empty under
+    # the half-open ranges and is removed so start dates become unique.
+    op.execute(
+        "DELETE FROM handicaps WHERE end_date IS NOT NULL AND end_date <= start_date "
+        "AND EXISTS (SELECT 1 FROM handicaps AS other WHERE other.user_id = handicaps.user_id "
+        "AND other.start_date = handicaps.start_date AND other.id <> handicaps.id)"
+    )
+
+    with op.batch_alter_table('handicaps', schema=None) as batch_op:
+        batch_op.drop_index('ix_handicaps_user_id_start_date')
+        batch_op.create_index('ix_handicaps_user_id_start_date', ['user_id', 'start_date'], unique=True)
+
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute('CREATE EXTENSION IF NOT EXISTS btree_gist')
+        op.execute(
+            "ALTER TABLE handicaps ADD CONSTRAINT ex_handicaps_user_id_validity "
+            "EXCLUDE USING gist (user_id WITH =, daterange(start_date, end_date, '[)') WITH &&)"
+        )
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute('ALTER TABLE handicaps DROP CONSTRAINT ex_handicaps_user_id_validity')
+
+    with op.batch_alter_table('handicaps', schema=None) as batch_op:
+        batch_op.drop_index('ix_handicaps_user_id_start_date')
+        batch_op.create_index('ix_handicaps_user_id_start_date', ['user_id', 'start_date'], unique=False)
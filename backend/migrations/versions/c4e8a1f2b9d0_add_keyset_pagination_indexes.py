@@ -0,0 +1,38 @@
+"""Add composite indexes for keyset pagination
+
+Revision ID: c4e8a1f2b9d0
+Revises: b7d41e2a6c53
+Create Date: 2026-10-17 15:12:44.318206
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4e8a1f2b9d0'
+down_revision = 'b7d41e2a6c53'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('rounds', schema=None) as batch_op:
+        batch_op.create_index('ix_rounds_user_id_date_played_id', ['user_id', 'date_played', 'id'], unique=False)
+
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.create_index('ix_users_last_name_first_name_id', ['last_name', 'first_name', 'id'], unique=False)
+
+    with op.batch_alter_table('courses', schema=None) as batch_op:
+        batch_op.create_index('ix_courses_name_id', ['name', 'id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('courses', schema=None) as batch_op:
+        batch_op.drop_index('ix_courses_name_id')
+
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_index('ix_users_last_name_first_name_id')
+
+    with op.batch_alter_table('rounds', schema=None) as batch_op:
+        batch_op.drop_index('ix_rounds_user_id_date_played_id')
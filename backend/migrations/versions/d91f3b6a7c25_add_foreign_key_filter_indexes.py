@@ -0,0 +1,62 @@
+"""Add indexes for hot foreign key and lookup filters
+
+rounds.user_id, scores.round_id and holes.course_id are already served as
+the leading column of ix_rounds_user_id_date_played_id, unique_score_per_hole
+and unique_hole_per_course respectively, so they get no separate index.
+
+Revision ID: d91f3b6a7c25
+Revises: c4e8a1f2b9d0
+Create Date: 2026-10-17 16:05:12.540913
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd91f3b6a7c25'
+down_revision = 'c4e8a1f2b9d0'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('handicaps', schema=None) as batch_op:
+        batch_op.create_index('ix_handicaps_user_id_start_date', ['user_id', 'start_date'], unique=False)
+        batch_op.create_index('ix_handicaps_user_id_end_date', ['user_id', 'end_date'], unique=False)
+        batch_op.create_index(
+            'ix_handicaps_current_user_id', ['user_id'], unique=False,
+            postgresql_where=sa.text('end_date IS NULL'),
+            sqlite_where=sa.text('end_date IS NULL')
+        )
+
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_users_password_reset_token'), ['password_reset_token'], unique=False)
+
+    with op.batch_alter_table('rounds', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_rounds_course_id'), ['course_id'], unique=False)
+
+    with op.batch_alter_table('scores', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_scores_hole_id'), ['hole_id'], unique=False)
+
+    with op.batch_alter_table('tee_positions', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_tee_positions_tee_set_id'), ['tee_set_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('tee_positions', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_tee_positions_tee_set_id'))
+
+    with op.batch_alter_table('scores', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_scores_hole_id'))
+
+    with op.batch_alter_table('rounds', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_rounds_course_id'))
+
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_users_password_reset_token'))
+
+    with op.batch_alter_table('handicaps', schema=None) as batch_op:
+        batch_op.drop_index('ix_handicaps_current_user_id')
+        batch_op.drop_index('ix_handicaps_user_id_end_date')
+        batch_op.drop_index('ix_handicaps_user_id_start_date')
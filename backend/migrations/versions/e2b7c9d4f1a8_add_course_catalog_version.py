@@ -0,0 +1,26 @@
+"""Add catalog version to courses for the course catalog cache
+
+Revision ID: e2b7c9d4f1a8
+Revises: d91f3b6a7c25
+Create Date: 2026-10-17 17:21:36.804452
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e2b7c9d4f1a8'
+down_revision = 'd91f3b6a7c25'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('courses', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('catalog_version', sa.Integer(), nullable=False, server_default='1'))
+
+
+def downgrade():
+    with op.batch_alter_table('courses', schema=None) as batch_op:
+        batch_op.drop_column('catalog_version')
@@ -17,6 +17,7 @@ setup(
         "marshmallow==3.19.0",
         "flask-marshmallow==0.15.0",
         "marshmallow-sqlalchemy==0.29.0",
+        "openpyxl==3.1.2",
     ],
     extras_require={
         "dev": [
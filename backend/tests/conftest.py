@@ -2,12 +2,21 @@
 Pytest configuration and fixtures
 """
 import pytest
-from datetime import datetime, timedelta
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from sqlalchemy import event
 from app import create_app
 from app.extensions import db
+from app.instrumentation import RequestMetrics
 from app.models.user import User
 from app.models.club import Club
 from app.models.theme import Theme
+from app.models.course import Course
+from app.models.hole import Hole
+from app.models.round import Round
+from app.models.score import Score
+from app.models.tee_set import TeeSet
+from app.services.auth_service import AuthorizationCache
 
 
 @pytest.fixture
@@ -19,6 +28,10 @@ def app():
         db.create_all()
         yield app
         db.drop_all()
+    
+    # In-process caches are keyed by row ids, which restart with every test database
+    RequestMetrics.reset()
+    AuthorizationCache.invalidate()
 
 
 @pytest.fixture
@@ -33,6 +46,37 @@ def runner(app):
     return app.test_cli_runner()
 
 
+@pytest.fixture
+def query_budget(app):
+    """
+    Guard that fails the test when a block issues more SQL statements than declared.
+
+    Usage:
+        with query_budget(2):
+            client.get('/api/v1/rounds/user/1', headers=auth_headers)
+    """
+    @contextmanager
+    def _budget(max_queries):
+        statements = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(db.engine, 'before_cursor_execute', _record)
+        try:
+            yield statements
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', _record)
+
+        if len(statements) > max_queries:
+            pytest.fail(
+                f"Query budget exceeded: {len(statements)} statements issued, "
+                f"budget was {max_queries}:\n" + "\n".join(statements)
+            )
+
+    return _budget
+
+
 @pytest.fixture
 def test_user(app):
     """Create a test user"""
@@ -110,6 +154,78 @@ def test_theme(app):
         return theme
 
 
+@pytest.fixture
+def test_course(app, test_club):
+    """Create an 18-hole test course with a single tee set"""
+    with app.app_context():
+        club = db.session.merge(test_club)
+        course = Course(name='Test Course', holes_count=18, club_id=club.id)
+        db.session.add(course)
+        db.session.commit()
+        
+        par_layout = [4, 4, 3, 4, 5, 4, 3, 4, 4, 4, 5, 4, 3, 4, 5, 4, 3, 5]
+        for number, par in enumerate(par_layout, start=1):
+            db.session.add(Hole(
+                course_id=course.id,
+                hole_number=number,
+                par=par,
+                stroke_index=number
+            ))
+        
+        tee_set = TeeSet(
+            name='Yellow',
+            slope_rating=125,
+            course_rating=72.1,
+            course_id=course.id
+        )
+        db.session.add(tee_set)
+        db.session.commit()
+        
+        # Refresh to avoid detached instance issues
+        db.session.refresh(course)
+        return course
+
+
+@pytest.fixture
+def make_round(app, test_user, test_course):
+    """
+    Factory for rounds played by the test user on the test course.
+
+    Keyword arguments override Round columns. `strokes` adds one score per
+    hole in hole order, each worth `points`, and refreshes the completion
+    summary. Returns the new round's id.
+
+    Usage:
+        round_id = make_round(date_played=date(2024, 5, 1), strokes=[4] * 18)
+    """
+    tee_set = TeeSet.query.filter_by(course_id=test_course.id).first()
+    holes = Hole.query.filter_by(course_id=test_course.id).order_by(Hole.hole_number).all()
+
+    def _make(strokes=None, points=None, **columns):
+        values = {
+            'user_id': test_user.id,
+            'course_id': test_course.id,
+            'tee_set_id': tee_set.id,
+            'date_played': date(2024, 6, 1),
+            'course_rating': tee_set.course_rating,
+            'slope_rating': tee_set.slope_rating,
+            'expected_holes': len(holes)
+        }
+        values.update(columns)
+        round = Round(**values)
+        db.session.add(round)
+        db.session.flush()
+        if strokes is not None:
+            for hole, count in zip(holes, strokes):
+                db.session.add(Score(round_id=round.id, hole_id=hole.id, strokes=count, points=points))
+            db.session.flush()
+            round.update_completion()
+        db.session.commit()
+        return round.id
+
+    return _make
+
+
 @pytest.fixture
 def auth_headers(client, test_user):
     """Get authentication headers for test user"""
@@ -0,0 +1,94 @@
+"""
+Authorization cache tests: admin_required must stay cheap without trusting stale state
+"""
+from app.extensions import db
+from app.models.user import User
+from app.services.auth_service import AuthorizationCache
+from app.services.user_service import UserService
+
+METRICS_URL = '/api/v1/metrics/requests'
+
+
+class TestAuthorizationCache:
+    """Test admin_required flag lookups"""
+
+    def test_flags_loaded_once(self, app, client, admin_headers, admin_user, query_budget):
+        """Repeated admin calls only pay for the JWT user lookup"""
+        client.get(METRICS_URL, headers=admin_headers)
+
+        # JWT user lookup only; the flags come from the loaded user row
+        with query_budget(1):
+            response = client.get(METRICS_URL, headers=admin_headers)
+
+        assert response.status_code == 200
+        assert AuthorizationCache.get_status(admin_user.id) == (True, True)
+
+    def test_toggle_admin_applies_immediately(self, client, admin_headers, auth_headers, test_user):
+        """Granting and revoking admin rights take effect on the next request"""
+        assert client.get(METRICS_URL, headers=auth_headers).status_code == 403
+
+        client.post(f'/api/v1/users/{test_user.id}/toggle-admin', headers=admin_headers)
+        assert client.get(METRICS_URL, headers=auth_headers).status_code == 200
+
+        client.post(f'/api/v1/users/{test_user.id}/toggle-admin', headers=admin_headers)
+        assert client.get(METRICS_URL, headers=auth_headers).status_code == 403
+
+    def test_deactivate_applies_immediately(self, app, client, admin_headers, admin_user):
+        """Deactivated admins are rejected despite a cached entry"""
+        client.get(METRICS_URL, headers=admin_headers)
+
+        UserService.deactivate_user(admin_user.id)
+        response = client.get(METRICS_URL, headers=admin_headers)
+
+        assert response.status_code == 403
+        assert response.get_json()['error'] == 'Account deactivated'
+
+        UserService.activate_user(admin_user.id)
+        assert client.get(METRICS_URL, headers=admin_headers).status_code == 200
+
+    def test_update_user_is_active_invalidates(self, app, admin_user):
+        """Profile updates that change is_active drop the cached flags"""
+        assert AuthorizationCache.get_status(admin_user.id) == (True, True)
+
+        UserService.update_user(admin_user.id, {'is_active': False})
+
+        assert AuthorizationCache.get_status(admin_user.id) == (False, True)
+
+    def test_change_by_another_process_applies_immediately(self, app, client, admin_headers, admin_user):
+        """Flags changed outside this process's UserService are seen on the next request"""
+        assert client.get(METRICS_URL, headers=admin_headers).status_code == 200
+
+        User.query.filter_by(id=admin_user.id).update({'is_admin': False})
+        db.session.commit()
+
+        assert client.get(METRICS_URL, headers=admin_headers).status_code == 403
+
+    def test_admin_flags_not_cached(self, app, admin_user):
+        """Admin lookups outside a request always go to the database"""
+        assert AuthorizationCache.get_status(admin_user.id) == (True, True)
+
+        User.query.filter_by(id=admin_user.id).update({'is_admin': False})
+        db.session.commit()
+
+        assert AuthorizationCache.get_status(admin_user.id) == (True, False)
+
+    def test_non_admin_flags_cached(self, app, test_user, query_budget):
+        """Active non-admin lookups are served from the cache within the TTL"""
+        assert AuthorizationCache.get_status(test_user.id) == (True, False)
+
+        with query_budget(0):
+            assert AuthorizationCache.get_status(test_user.id) == (True, False)
+
+    def test_entries_expire(self, app, test_user):
+        """Changes made outside UserService are seen once the TTL passes"""
+        app.config['ADMIN_STATUS_CACHE_TTL'] = 0
+        assert AuthorizationCache.get_status(test_user.id) == (True, False)
+
+        User.query.filter_by(id=test_user.id).update({'is_admin': True})
+        db.session.commit()
+
+        assert AuthorizationCache.get_status(test_user.id) == (True, True)
+
+    def test_unknown_user(self, app):
+        """Missing users have no authorization flags"""
+        assert AuthorizationCache.get_status(9999) is None
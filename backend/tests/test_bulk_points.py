@@ -0,0 +1,112 @@
+"""
+Bulk Stableford recalculation tests: results must match the per-round calculation
+"""
+import pytest
+from datetime import date, timedelta
+from app.extensions import db
+from app.models.hole import Hole
+from app.models.round import Round
+from app.models.score import Score
+from app.services.hole_service import HoleService
+from app.services.score_service import ScoreService
+
+
+# Strokes relative to par, cycled over the holes of each round
+STROKE_PATTERN = [0, 1, -1, 2, 0, 3, 1, -2, 0]
+
+
+def _seed(make_round, count=6, course_handicap=18):
+    """Create `count` full rounds with deliberately stale (zero) points"""
+    pars = [hole.par for hole in Hole.query.order_by(Hole.hole_number)]
+    for i in range(count):
+        make_round(
+            date_played=date(2024, 6, 1) + timedelta(days=i),
+            course_handicap=course_handicap + i,
+            strokes=[par + STROKE_PATTERN[(i + j) % len(STROKE_PATTERN)] for j, par in enumerate(pars)],
+            points=0,
+            total_points=0
+        )
+
+
+def _expected_points():
+    """Reference: the per-score ORM calculation used by recalculate_round_points"""
+    return {
+        score.id: score.calculate_stableford_points(score.round.course_handicap)
+        for score in Score.query.all()
+    }
+
+
+class TestBulkRecalculatePoints:
+    """Test the bulk Stableford recalculation job"""
+
+    def test_matches_per_score_calculation(self, app, make_round, test_course):
+        """Bulk results equal Score.calculate_stableford_points for every score"""
+        _seed(make_round)
+        expected = _expected_points()
+
+        result = ScoreService.bulk_recalculate_points(course_id=test_course.id, batch_size=7)
+
+        db.session.expire_all()
+        assert {score.id: score.points for score in Score.query.all()} == expected
+        assert result['scores_checked'] == 6 * 18
+        assert result['rounds_updated'] == 6
+        for round in Round.query.all():
+            assert round.total_points == sum(score.points for score in round.scores)
+
+    def test_only_changed_rows_written(self, app, make_round):
+        """A second run finds nothing to update"""
+        _seed(make_round, count=2)
+        ScoreService.bulk_recalculate_points()
+
+        result = ScoreService.bulk_recalculate_points()
+
+        assert result['scores_updated'] == 0
+        assert result['rounds_updated'] == 0
+
+    def test_date_range_filter(self, app, make_round):
+        """Only rounds inside the date range are touched"""
+        _seed(make_round, count=4)
+
+        result = ScoreService.bulk_recalculate_points(date_from=date(2024, 6, 2), date_to=date(2024, 6, 3))
+
+        db.session.expire_all()
+        assert result['rounds_updated'] == 2
+        untouched = Round.query.filter(Round.date_played.in_([date(2024, 6, 1), date(2024, 6, 4)])).all()
+        assert all(round.total_points == 0 for round in untouched)
+
+    def test_rounds_without_course_handicap_skipped(self, app, make_round):
+        """Rounds without a course handicap keep their points"""
+        _seed(make_round, count=1)
+        Round.query.update({'course_handicap': None})
+        db.session.commit()
+
+        result = ScoreService.bulk_recalculate_points()
+
+        assert result['scores_checked'] == 0
+
+    def test_invalid_date_range(self, app):
+        """Reversed date ranges are rejected"""
+        with pytest.raises(ValueError):
+            ScoreService.bulk_recalculate_points(date_from=date(2024, 2, 1), date_to=date(2024, 1, 1))
+
+    def test_update_hole_recalculates_history(self, app, make_round, test_course):
+        """Correcting a hole's stroke index refreshes historical points on that hole"""
+        _seed(make_round, count=3)
+        ScoreService.bulk_recalculate_points()
+        hole = Hole.query.filter_by(course_id=test_course.id, hole_number=1).one()
+
+        HoleService.update_hole(hole.id, {'stroke_index': 18, 'par': 5})
+
+        db.session.expire_all()
+        assert {score.id: score.points for score in Score.query.all()} == _expected_points()
+        for round in Round.query.all():
+            assert round.total_points == sum(score.points for score in round.scores)
+
+    def test_cli_command(self, app, make_round, runner, test_course):
+        """The recalculate-points command reports the work done"""
+        _seed(make_round, count=2)
+
+        result = runner.invoke(args=['rounds', 'recalculate-points', '--course-id', str(test_course.id)])
+
+        assert result.exit_code == 0
+        assert 'Checked 36 score(s)' in result.output
@@ -0,0 +1,119 @@
+"""
+Conditional request tests: ETag / Last-Modified validators and 304 responses
+"""
+from datetime import datetime, timedelta
+from werkzeug.http import http_date
+from app.extensions import db
+from app.models.hole import Hole
+from app.models.theme import Theme
+from app.services.hole_service import HoleService
+
+
+class TestConditionalRequests:
+    """Test validators on catalog and history endpoints"""
+
+    def test_validators_on_response(self, client, auth_headers, test_course):
+        """GET responses carry a weak ETag, Last-Modified and revalidation headers"""
+        response = client.get(f'/api/v1/courses/{test_course.id}', headers=auth_headers)
+
+        assert response.status_code == 200
+        assert response.headers['ETag'].startswith('W/"')
+        assert 'Last-Modified' in response.headers
+        assert response.headers['Cache-Control'] == 'private, no-cache'
+        assert 'Authorization' in response.headers['Vary']
+
+    def test_matching_etag_not_modified(self, client, auth_headers, test_course, query_budget):
+        """A matching If-None-Match is answered with 304 from a single validator query"""
+        url = f'/api/v1/courses/{test_course.id}?full_details=true'
+        etag = client.get(url, headers=auth_headers).headers['ETag']
+
+        # The JWT user lookup plus the validator query
+        with query_budget(2):
+            response = client.get(url, headers={**auth_headers, 'If-None-Match': etag})
+
+        assert response.status_code == 304
+        assert response.data == b''
+        assert response.headers['ETag'] == etag
+
+    def test_layout_change_changes_etag(self, client, auth_headers, test_course):
+        """Updating a hole changes the course, hole and tee set validators"""
+        urls = [
+            f'/api/v1/courses/{test_course.id}',
+            f'/api/v1/holes/course/{test_course.id}',
+            f'/api/v1/tee-sets/course/{test_course.id}',
+        ]
+        etags = [client.get(url, headers=auth_headers).headers['ETag'] for url in urls]
+        hole = Hole.query.filter_by(course_id=test_course.id, hole_number=1).first()
+
+        HoleService.update_hole(hole.id, {'par': 5})
+
+        for url, etag in zip(urls, etags):
+            response = client.get(url, headers={**auth_headers, 'If-None-Match': etag})
+            assert response.status_code == 200, url
+            assert response.headers['ETag'] != etag
+
+    def test_query_string_part_of_etag(self, client, auth_headers, test_course):
+        """Different includes of a resource never share a tag"""
+        plain = client.get(f'/api/v1/holes/course/{test_course.id}', headers=auth_headers)
+        detailed = client.get(
+            f'/api/v1/holes/course/{test_course.id}?include_tee_positions=true', headers=auth_headers
+        )
+
+        assert plain.headers['ETag'] != detailed.headers['ETag']
+
+    def test_if_modified_since(self, client, auth_headers, test_course):
+        """If-Modified-Since is honoured for single resources"""
+        later = http_date(datetime.utcnow() + timedelta(minutes=1))
+        earlier = http_date(datetime.utcnow() - timedelta(days=1))
+        url = f'/api/v1/courses/{test_course.id}'
+
+        assert client.get(url, headers={**auth_headers, 'If-Modified-Since': later}).status_code == 304
+        assert client.get(url, headers={**auth_headers, 'If-Modified-Since': earlier}).status_code == 200
+
+    def test_collection_ignores_if_modified_since(self, client, auth_headers, app):
+        """Deleting a row does not move Last-Modified, so collections need the ETag"""
+        db.session.add(Theme(name='Classic'))
+        db.session.commit()
+        later = http_date(datetime.utcnow() + timedelta(minutes=1))
+
+        response = client.get('/api/v1/themes', headers={**auth_headers, 'If-Modified-Since': later})
+
+        assert response.status_code == 200
+
+    def test_collection_delete_changes_etag(self, client, auth_headers, test_club):
+        """Row counts are part of collection validators"""
+        url = '/api/v1/clubs'
+        etag = client.get(url, headers=auth_headers).headers['ETag']
+        assert client.get(url, headers={**auth_headers, 'If-None-Match': etag}).status_code == 304
+
+        db.session.delete(db.session.merge(test_club))
+        db.session.commit()
+
+        assert client.get(url, headers={**auth_headers, 'If-None-Match': etag}).status_code == 200
+
+    def test_missing_resource_has_no_validators(self, client, auth_headers):
+        """404 responses are not conditional"""
+        response = client.get('/api/v1/courses/999', headers=auth_headers)
+
+        assert response.status_code == 404
+        assert 'ETag' not in response.headers
+
+    def test_my_handicaps_per_user(self, client, auth_headers, admin_headers):
+        """The same URL has different tags for different users"""
+        mine = client.get('/api/v1/handicaps/my-handicaps', headers=auth_headers)
+        theirs = client.get('/api/v1/handicaps/my-handicaps', headers=admin_headers)
+
+        assert mine.status_code == theirs.status_code == 200
+        assert mine.headers['ETag'] != theirs.headers['ETag']
+
+    def test_other_players_round_never_not_modified(self, client, auth_headers, admin_headers,
+                                                     admin_user, make_round):
+        """A 304 is only sent to the round's owner or an admin"""
+        round_id = make_round(user_id=admin_user.id)
+        for url in (f'/api/v1/rounds/{round_id}', f'/api/v1/rounds/user/{admin_user.id}'):
+            etag = client.get(url, headers=admin_headers).headers['ETag']
+
+            response = client.get(url, headers={**auth_headers, 'If-None-Match': etag})
+
+            assert response.status_code != 304
+            assert 'ETag' not in response.headers
@@ -0,0 +1,127 @@
+"""
+Course catalog cache tests: versioned snapshots, invalidation and backends
+"""
+import pytest
+from app.extensions import db
+from app.models.course import Course
+from app.models.hole import Hole
+from app.services.course_catalog_cache import CourseCatalogCache, MemoryCatalogBackend
+from app.services.course_service import CourseService
+from app.services.club_service import ClubService
+from app.services.hole_service import HoleService
+from app.services.tee_set_service import TeeSetService
+
+
+class TestCourseCatalogCache:
+    """Test read-through caching of course snapshots"""
+
+    def test_hit_costs_one_query(self, app, test_course, query_budget):
+        """A warm snapshot is served after a single version lookup"""
+        CourseService.get_course_with_full_details(test_course.id)
+
+        with query_budget(1):
+            details = CourseService.get_course_with_full_details(test_course.id)
+
+        assert details['club']['name'] == 'Test Golf Club'
+        assert details['total_par'] == 72
+        assert CourseCatalogCache.stats()['hits'] == 1
+
+    def test_missing_course(self, app):
+        """Unknown courses have no snapshot"""
+        assert CourseCatalogCache.get_snapshot(999) is None
+        assert CourseService.get_course_with_full_details(999) is None
+        assert HoleService.get_holes_by_course(999) == []
+
+    def test_hole_update_bumps_version(self, app, test_course):
+        """Updating a hole serves a fresh snapshot"""
+        assert CourseService.get_course_with_full_details(test_course.id)['total_par'] == 72
+        hole = Hole.query.filter_by(course_id=test_course.id, hole_number=1).first()
+
+        HoleService.update_hole(hole.id, {'par': 5})
+
+        assert db.session.get(Course, test_course.id).catalog_version == 2
+        assert CourseService.get_course_with_full_details(test_course.id)['total_par'] == 73
+        assert HoleService.get_holes_by_course(test_course.id)[0]['par'] == 5
+
+    def test_club_update_reflected(self, app, test_course):
+        """Course snapshots embed the club and follow its updates"""
+        CourseService.get_course_with_full_details(test_course.id)
+
+        ClubService.update_club(test_course.club_id, {'name': 'Renamed Golf Club'})
+
+        details = CourseService.get_course_with_full_details(test_course.id)
+        assert details['club']['name'] == 'Renamed Golf Club'
+
+    def test_tee_positions_optional(self, app, test_course):
+        """Callers not asking for tee positions do not get them"""
+        holes = HoleService.get_holes_by_course(test_course.id)
+        tee_sets = TeeSetService.get_tee_sets_by_course(test_course.id, include_positions=True)
+
+        assert [hole['hole_number'] for hole in holes] == list(range(1, 19))
+        assert 'tee_positions' not in holes[0]
+        assert tee_sets[0]['name'] == 'Yellow'
+        assert 'tee_positions' in tee_sets[0]
+
+    def test_disabled_backend(self, app, test_course):
+        """COURSE_CACHE_BACKEND=none builds every snapshot from the database"""
+        app.config['COURSE_CACHE_BACKEND'] = 'none'
+        app.extensions.pop('course_catalog_cache', None)
+
+        CourseService.get_course_with_full_details(test_course.id)
+        CourseService.get_course_with_full_details(test_course.id)
+
+        assert CourseCatalogCache.stats()['misses'] == 2
+
+    def test_unknown_backend_rejected(self, app):
+        """Unknown backend names are rejected"""
+        with pytest.raises(ValueError):
+            CourseCatalogCache._create_backend({'COURSE_CACHE_BACKEND': 'memcached'})
+
+    def test_redis_backend_requires_package(self, app):
+        """The redis backend fails loudly when the client is not installed"""
+        try:
+            import redis  # noqa: F401
+        except ImportError:
+            with pytest.raises(RuntimeError):
+                CourseCatalogCache._create_backend({'COURSE_CACHE_BACKEND': 'redis'})
+        else:
+            pytest.skip('redis is installed')
+
+
+class TestMemoryCatalogBackend:
+    """Test the in-process LRU backend"""
+
+    def test_evicts_least_recently_used(self):
+        """The oldest untouched entry goes first once max_entries is reached"""
+        backend = MemoryCatalogBackend(max_entries=2, max_bytes=1024)
+        backend.set('a', '1')
+        backend.set('b', '2')
+        backend.get('a')
+        backend.set('c', '3')
+
+        assert backend.get('a') == '1'
+        assert backend.get('b') is None
+        assert backend.size() == {'entries': 2, 'bytes': 2}
+
+    def test_evicts_by_size(self):
+        """Total size stays within max_bytes"""
+        backend = MemoryCatalogBackend(max_entries=10, max_bytes=10)
+        backend.set('a', 'x' * 6)
+        backend.set('b', 'y' * 6)
+        backend.set('too-big', 'z' * 11)
+
+        assert backend.get('a') is None
+        assert backend.get('b') == 'y' * 6
+        assert backend.get('too-big') is None
+
+    def test_delete_prefix(self):
+        """Deleting a course drops all its versions"""
+        backend = MemoryCatalogBackend(max_entries=10, max_bytes=1024)
+        backend.set('course:1:v1', 'a')
+        backend.set('course:1:v2', 'b')
+        backend.set('course:10:v1', 'c')
+
+        backend.delete_prefix('course:1:')
+
+        assert backend.size()['entries'] == 1
+        assert backend.get('course:10:v1') == 'c'
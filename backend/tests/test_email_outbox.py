@@ -0,0 +1,226 @@
+"""
+Email outbox tests: enqueue-and-return, batched delivery, retries and the worker pool
+"""
+import socketserver
+import threading
+import time
+import pytest
+from datetime import datetime, timedelta
+from app.extensions import db
+from app.models.email_outbox import EmailOutbox
+from app.services.email_outbox_service import EmailOutboxService, EmailOutboxWorker
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    """Minimal SMTP dialogue: enough for smtplib.sendmail"""
+
+    def reply(self, line):
+        self.wfile.write(f'{line}\r\n'.encode())
+
+    def handle(self):
+        server = self.server
+        server.connections += 1
+        self.reply('220 localhost test SMTP')
+        recipients = []
+        while True:
+            line = self.rfile.readline().decode().strip()
+            if not line:
+                return
+            command = line[:4].upper()
+            if command in ('EHLO', 'HELO'):
+                self.reply('250 localhost')
+            elif command == 'MAIL':
+                recipients = []
+                self.reply('250 OK')
+            elif command == 'RCPT':
+                address = line.split(':', 1)[1].strip().strip('<>')
+                if address in server.rejected:
+                    self.reply('550 Mailbox unavailable')
+                else:
+                    recipients.append(address)
+                    self.reply('250 OK')
+            elif command == 'DATA':
+                self.reply('354 End data with <CR><LF>.<CR><LF>')
+                data = []
+                while True:
+                    chunk = self.rfile.readline()
+                    if chunk in (b'.\r\n', b''):
+                        break
+                    data.append(chunk)
+                server.messages.append((recipients, b''.join(data)))
+                self.reply('250 OK')
+            elif command == 'QUIT':
+                self.reply('221 Bye')
+                return
+            else:
+                self.reply('250 OK')
+
+
+class _SMTPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), _SMTPHandler)
+        self.connections = 0
+        self.messages = []
+        self.rejected = set()
+
+
+@pytest.fixture
+def smtp_server(app):
+    """Local SMTP stand-in wired into Flask-Mail"""
+    server = _SMTPServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    state = app.extensions['mail']
+    state.suppress = False
+    state.server, state.port = server.server_address
+    state.use_tls = state.use_ssl = False
+    state.username = state.password = None
+    app.config['MAIL_DEFAULT_SENDER'] = state.default_sender = 'noreply@example.com'
+
+    yield server
+
+    EmailOutboxWorker.stop()
+    server.shutdown()
+    server.server_close()
+
+
+def _enqueue(count, recipient='player{}@example.com'):
+    from flask_mail import Message
+    return [
+        EmailOutboxService.enqueue(Message(subject=f'Message {i}', recipients=[recipient.format(i)], html='<p>Hi</p>'))
+        for i in range(count)
+    ]
+
+
+class TestEmailOutbox:
+    """Test the outbox and its delivery"""
+
+    def test_register_returns_before_sending(self, app, client, smtp_server):
+        """Registration only enqueues the welcome email"""
+        response = client.post('/api/v1/auth/register', json={
+            'email': 'new@example.com',
+            'password': 'password123',
+            'first_name': 'New',
+            'last_name': 'Player'
+        })
+
+        assert response.status_code == 201
+        assert smtp_server.connections == 0
+        entry = EmailOutbox.query.one()
+        assert entry.status == EmailOutbox.STATUS_PENDING
+        assert entry.recipient_list == ['new@example.com']
+
+    def test_batch_sent_over_one_connection(self, app, smtp_server):
+        """Due messages share a single SMTP connection"""
+        _enqueue(3)
+
+        result = EmailOutboxService.send_due()
+
+        assert result['sent'] == 3
+        assert smtp_server.connections == 1
+        assert len(smtp_server.messages) == 3
+        assert EmailOutboxService.get_status_counts() == {EmailOutbox.STATUS_SENT: 3}
+
+    def test_connection_rotated_every_max_emails(self, app, smtp_server):
+        """At most MAIL_MAX_EMAILS messages go over one connection"""
+        app.config['MAIL_MAX_EMAILS'] = app.extensions['mail'].max_emails = 2
+        _enqueue(5)
+
+        result = EmailOutboxService.send_due()
+
+        assert result['sent'] == 5
+        assert smtp_server.connections == 3
+
+    def test_rejected_recipient_retried_with_backoff(self, app, smtp_server):
+        """A refused message is rescheduled without blocking the rest of the batch"""
+        smtp_server.rejected.add('player1@example.com')
+        _enqueue(3)
+
+        result = EmailOutboxService.send_due()
+
+        assert result['sent'] == 2
+        assert result['retried'] == 1
+        entry = EmailOutbox.query.filter_by(status=EmailOutbox.STATUS_PENDING).one()
+        assert entry.attempts == 1
+        assert 'SMTPRecipientsRefused' in entry.last_error
+        assert entry.next_attempt_at > datetime.utcnow() + timedelta(seconds=25)
+
+        # Not due yet
+        assert EmailOutboxService.send_due()['claimed'] == 0
+
+    def test_gives_up_after_max_attempts(self, app, smtp_server):
+        """Messages fail permanently after MAIL_OUTBOX_MAX_ATTEMPTS"""
+        app.config['MAIL_OUTBOX_MAX_ATTEMPTS'] = 2
+        smtp_server.rejected.add('player0@example.com')
+        _enqueue(1)
+
+        EmailOutboxService.send_due()
+        EmailOutbox.query.update({'next_attempt_at': datetime.utcnow()})
+        db.session.commit()
+        result = EmailOutboxService.send_due()
+
+        assert result['failed'] == 1
+        assert EmailOutbox.query.one().status == EmailOutbox.STATUS_FAILED
+
+    def test_server_down_schedules_retry(self, app, smtp_server):
+        """Connection failures keep every message queued"""
+        app.extensions['mail'].port = 1
+        _enqueue(2)
+
+        result = EmailOutboxService.send_due()
+
+        assert result['retried'] == 2
+        assert all(entry.attempts == 1 for entry in EmailOutbox.query.all())
+
+    def test_stale_claims_recovered(self, app, smtp_server):
+        """Messages left 'sending' by a dead worker are claimed again"""
+        _enqueue(1)
+        EmailOutbox.query.update({
+            'status': EmailOutbox.STATUS_SENDING,
+            'claimed_at': datetime.utcnow() - timedelta(hours=1)
+        })
+        db.session.commit()
+
+        assert EmailOutboxService.send_due()['sent'] == 1
+
+    def test_worker_pool_delivers(self, app, smtp_server):
+        """Background workers pick up enqueued messages"""
+        # In-memory SQLite shares one connection between threads, so a single
+        # worker keeps claims from interleaving on it
+        app.config['MAIL_OUTBOX_WORKERS'] = 1
+        _enqueue(2)
+
+        deadline = time.time() + 5
+        while len(smtp_server.messages) < 2 and time.time() < deadline:
+            time.sleep(0.05)
+
+        assert len(smtp_server.messages) == 2
+
+    def test_dead_workers_restarted(self, app, smtp_server):
+        """A pool whose threads have died is restarted by the next enqueue"""
+        app.config['MAIL_OUTBOX_WORKERS'] = 1
+        dead = threading.Thread(target=lambda: None)
+        dead.start()
+        dead.join()
+        EmailOutboxWorker._threads = [dead]
+
+        _enqueue(1)
+
+        assert any(thread.is_alive() for thread in EmailOutboxWorker._threads)
+        deadline = time.time() + 5
+        while not smtp_server.messages and time.time() < deadline:
+            time.sleep(0.05)
+        assert len(smtp_server.messages) == 1
+
+    def test_cli_command(self, app, runner, smtp_server):
+        """send-outbox drains the queue"""
+        _enqueue(2)
+
+        result = runner.invoke(args=['email', 'send-outbox'])
+
+        assert result.exit_code == 0
+        assert 'Sent 2 email(s)' in result.output
@@ -18,7 +18,7 @@ class TestEmailService:
             service = EmailService()
             assert service is not None
     
-    @patch('app.services.email_service.mail.send')
+    @patch('app.services.email_service.EmailOutboxService.enqueue')
     def test_send_password_reset_email(self, mock_send, app, test_user):
         """Test sending password reset email"""
         with app.app_context():
@@ -35,7 +35,7 @@ class TestEmailService:
             assert user.password_reset_expires is not None
             assert user.password_reset_expires > datetime.utcnow()
     
-    @patch('app.services.email_service.mail.send')
+    @patch('app.services.email_service.EmailOutboxService.enqueue')
     def test_send_welcome_email(self, mock_send, app, test_user):
         """Test sending welcome email"""
         with app.app_context():
@@ -46,7 +46,7 @@ class TestEmailService:
             assert result is True
             assert mock_send.called
     
-    @patch('app.services.email_service.mail.send')
+    @patch('app.services.email_service.EmailOutboxService.enqueue')
     def test_send_password_changed_notification(self, mock_send, app, test_user):
         """Test sending password changed notification"""
         with app.app_context():
@@ -130,11 +130,11 @@ class TestEmailService:
             assert user.password_reset_token is None
             assert user.password_reset_expires is None
     
-    @patch('app.services.email_service.mail.send')
+    @patch('app.services.email_service.EmailOutboxService.enqueue')
     def test_email_sending_failure(self, mock_send, app, test_user):
         """Test handling email sending failures"""
         with app.app_context():
-            # Mock mail.send to raise an exception
+            # Mock the outbox to raise an exception
             mock_send.side_effect = Exception("SMTP Error")
             
             service = EmailService()
@@ -189,7 +189,7 @@ class TestEmailServiceIntegration:
             assert app.config.get('MAIL_SERVER') is not None
             assert app.config.get('MAIL_PORT') is not None
     
-    @patch('app.services.email_service.mail.send')
+    @patch('app.services.email_service.EmailOutboxService.enqueue')
     def test_email_context_rendering(self, mock_send, app, test_user):
         """Test that email templates render with proper context"""
         with app.app_context():
@@ -0,0 +1,160 @@
+"""
+Database engine tests: engine profiles, idle pings and pool metrics
+"""
+import pytest
+from sqlalchemy import exc, text
+from sqlalchemy.pool import StaticPool
+from app import create_app
+from app.config import TestingConfig, engine_profile
+from app.engine import PoolMetrics, TimedNullPool, TimedQueuePool, engine_options
+from app.extensions import db
+
+POSTGRES_URI = 'postgresql://localhost/rgs'
+
+
+@pytest.fixture
+def pooled_app(monkeypatch, tmp_path):
+    """App on a SQLite file with a real pool; settings tweak the 'sync' profile"""
+    def make(**settings):
+        monkeypatch.setattr(TestingConfig, 'SQLALCHEMY_DATABASE_URI', f"sqlite:///{tmp_path / 'pool.db'}")
+        monkeypatch.setattr(TestingConfig, 'DB_ENGINE', {**engine_profile('sync'), **settings})
+        PoolMetrics.reset()
+        return create_app('testing')
+    yield make
+    PoolMetrics.reset()
+
+
+class TestEngineProfiles:
+    """Test profile resolution and engine options"""
+
+    def test_environment_overrides(self, monkeypatch):
+        """DB_* variables override single settings of a profile"""
+        monkeypatch.setenv('DB_POOL_SIZE', '7')
+        monkeypatch.setenv('DB_PRE_PING', 'none')
+
+        settings = engine_profile('threaded')
+
+        assert settings['name'] == 'threaded'
+        assert settings['pool_size'] == 7
+        assert settings['max_overflow'] == 20
+        assert settings['pre_ping'] == 'none'
+
+    def test_unknown_profile(self):
+        """Typos in DB_ENGINE_PROFILE fail loudly"""
+        with pytest.raises(ValueError, match="Unknown DB_ENGINE_PROFILE 'fast'"):
+            engine_profile('fast')
+
+    def test_threaded_postgresql(self):
+        """Pooled profiles size the pool and set the statement timeout as a startup option"""
+        options = engine_options(engine_profile('threaded'), POSTGRES_URI, {'connect_args': {'sslmode': 'require'}})
+
+        assert options['poolclass'] is TimedQueuePool
+        assert (options['pool_size'], options['max_overflow'], options['pool_timeout']) == (10, 20, 10)
+        assert options['pool_use_lifo'] is True
+        # Idle connections are pinged by a checkout listener instead
+        assert options['pool_pre_ping'] is False
+        assert options['connect_args'] == {'sslmode': 'require', 'options': '-c statement_timeout=30000'}
+
+    def test_pgbouncer(self):
+        """PgBouncer mode leaves pooling to PgBouncer and sends no startup options"""
+        options = engine_options(engine_profile('pgbouncer'), POSTGRES_URI)
+
+        assert options['poolclass'] is TimedNullPool
+        assert 'pool_size' not in options
+        assert 'connect_args' not in options
+
+    def test_sqlite_has_no_statement_timeout(self):
+        """Statement timeouts only apply to PostgreSQL"""
+        options = engine_options(engine_profile('sync'), 'sqlite:///rgs.db')
+
+        assert 'connect_args' not in options
+
+    def test_testing_profile_keeps_static_pool(self, app):
+        """In-memory SQLite keeps the pool SQLAlchemy chooses"""
+        assert isinstance(db.engine.pool, StaticPool)
+
+
+class TestPoolBehaviour:
+    """Test idle pings and checkout metrics on a real pool"""
+
+    def test_checkouts_are_measured(self, pooled_app):
+        """Every checkout is counted with its wait time"""
+        app = pooled_app()
+        with app.app_context():
+            for _ in range(3):
+                with db.engine.connect() as connection:
+                    connection.execute(text('SELECT 1'))
+
+            data = PoolMetrics.snapshot(db.engine, app.config['DB_ENGINE'])
+
+        assert data['profile'] == 'sync'
+        assert data['pool_class'] == 'TimedQueuePool'
+        assert data['checkouts'] == 3
+        assert data['pool_size'] == 1
+        assert data['checked_out'] == 0
+        assert data['saturation'] == 0.0
+
+    def test_saturation_and_timeouts(self, pooled_app):
+        """A full pool reports saturation and counts checkouts that time out"""
+        app = pooled_app(max_overflow=0, pool_timeout=1)
+        with app.app_context():
+            held = db.engine.connect()
+            try:
+                assert PoolMetrics.snapshot(db.engine, app.config['DB_ENGINE'])['saturation'] == 1.0
+                with pytest.raises(exc.TimeoutError):
+                    db.engine.connect()
+            finally:
+                held.close()
+
+            data = PoolMetrics.snapshot(db.engine, app.config['DB_ENGINE'])
+
+        assert data['timeouts'] == 1
+        assert data['max_wait_ms'] >= 900
+
+    def test_only_idle_connections_are_pinged(self, pooled_app):
+        """Connections returned moments ago skip the ping"""
+        app = pooled_app(ping_idle_seconds=3600)
+        with app.app_context():
+            for _ in range(3):
+                with db.engine.connect() as connection:
+                    connection.execute(text('SELECT 1'))
+            assert PoolMetrics.snapshot(db.engine, app.config['DB_ENGINE'])['pings'] == 0
+
+    def test_idle_connections_are_pinged(self, pooled_app):
+        """Connections idle past the threshold are pinged on checkout"""
+        app = pooled_app(ping_idle_seconds=0)
+        with app.app_context():
+            for _ in range(3):
+                with db.engine.connect() as connection:
+                    connection.execute(text('SELECT 1'))
+            data = PoolMetrics.snapshot(db.engine, app.config['DB_ENGINE'])
+
+        # The first checkout opens a new connection; the next two reuse it
+        assert data['pings'] == 2
+        assert data['ping_failures'] == 0
+
+
+class TestPoolMetricsEndpoint:
+    """Test GET /metrics/pool"""
+
+    def test_pool_metrics(self, client, admin_headers):
+        """Admins see the profile and checkout aggregates"""
+        response = client.get('/api/v1/metrics/pool', headers=admin_headers)
+
+        assert response.status_code == 200
+        data = response.get_json()['data']
+        assert data['profile'] == 'testing'
+        assert data['pool_class'] == 'StaticPool'
+        assert 'avg_wait_ms' in data
+
+    def test_reset(self, client, admin_headers):
+        """Aggregates can be cleared"""
+        PoolMetrics.record_checkout(0.01)
+
+        client.delete('/api/v1/metrics/pool', headers=admin_headers)
+
+        assert client.get('/api/v1/metrics/pool', headers=admin_headers).get_json()['data']['checkouts'] == 0
+
+    def test_admin_only(self, client, auth_headers):
+        """Regular users cannot read pool metrics"""
+        assert client.get('/api/v1/metrics/pool', headers=auth_headers).status_code == 403
@@ -0,0 +1,123 @@
+"""
+Export tests: streamed NDJSON/CSV round exports with gzip
+"""
+import csv
+import gzip
+import io
+import json
+import pytest
+from datetime import date
+from app.extensions import db
+from app.models.round import Round
+from app.models.tee_set import TeeSet
+from app.services.export_service import ExportService
+from app.services.score_service import ScoreService
+
+
+@pytest.fixture
+def rounds(app, test_user, admin_user, test_course):
+    """Five scored rounds for the test user and one for the admin"""
+    tee_set = TeeSet.query.filter_by(course_id=test_course.id).first()
+    played = []
+    for day, user in [(1, test_user), (2, test_user), (3, test_user), (4, test_user), (5, test_user), (6, admin_user)]:
+        round = Round(
+            user_id=user.id, course_id=test_course.id, tee_set_id=tee_set.id,
+            date_played=date(2024, 6, day), course_handicap=18, course_rating=72.1, slope_rating=125
+        )
+        db.session.add(round)
+        db.session.commit()
+        card = [{'hole_number': number, 'strokes': 4 + day % 2} for number in range(1, 19 if day != 5 else 10)]
+        ScoreService.submit_scorecard(round.id, card)
+        played.append(round.id)
+    return played
+
+
+def _ndjson(response):
+    return [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+
+class TestExportService:
+    """Test ExportService streaming"""
+
+    def test_batches_cost_one_query_each(self, app, rounds, test_user, query_budget):
+        """Every fetched batch of rounds adds one score query"""
+        db.session.expire_all()
+
+        # Rounds cursor plus scores for batches of 2, 2 and 1
+        with query_budget(4):
+            exported = list(ExportService.iter_rounds(user_id=test_user.id, batch_size=2))
+
+        assert [columns['date_played'].day for columns, _ in exported] == [1, 2, 3, 4, 5]
+        assert [len(scores) for _, scores in exported] == [18, 18, 18, 18, 9]
+        assert exported[0][1][0] == {'hole_number': 1, 'hole_par': 4, 'strokes': 5, 'points': 2, 'score_to_par': 1}
+
+    def test_filters(self, app, rounds, test_user, test_course):
+        """Club and date range filters combine"""
+        exported = ExportService.iter_rounds(club_id=test_course.club_id, date_from=date(2024, 6, 3),
+                                             date_to=date(2024, 6, 6))
+
+        assert [columns['id'] for columns, _ in exported] == rounds[2:]
+        assert list(ExportService.iter_rounds(club_id=999)) == []
+
+    def test_gzip_stream(self):
+        """Compressed chunks decompress to the original stream"""
+        chunks = [f'line {i}\n'.encode() for i in range(1000)]
+
+        assert gzip.decompress(b''.join(ExportService.gzip_stream(iter(chunks)))) == b''.join(chunks)
+
+
+class TestExportRoutes:
+    """Test GET /exports/rounds"""
+
+    def test_own_rounds_ndjson(self, client, auth_headers, rounds, test_user):
+        """Players stream their own rounds with scores"""
+        response = client.get(f'/api/v1/exports/rounds?user_id={test_user.id}', headers=auth_headers)
+
+        assert response.status_code == 200
+        assert response.is_streamed
+        assert response.mimetype == 'application/x-ndjson'
+        records = _ndjson(response)
+        assert len(records) == 5
+        assert records[0]['date_played'] == '2024-06-01'
+        assert records[0]['total_score'] == 90
+        assert records[0]['net_score'] == 72
+        assert len(records[4]['scores']) == 9
+
+    def test_csv_reimports(self, client, auth_headers, rounds, test_user):
+        """CSV rows carry hole_N columns in the round import format"""
+        response = client.get(f'/api/v1/exports/rounds?user_id={test_user.id}&format=csv', headers=auth_headers)
+
+        assert response.status_code == 200
+        assert response.mimetype == 'text/csv'
+        rows = list(csv.DictReader(io.StringIO(response.get_data(as_text=True))))
+        assert len(rows) == 5
+        assert rows[1]['total_score'] == '72'
+        assert rows[1]['hole_18'] == '4'
+        assert rows[4]['hole_10'] == ''
+
+    def test_gzip(self, client, auth_headers, rounds, test_user):
+        """The body is gzipped when the client accepts it"""
+        response = client.get(
+            f'/api/v1/exports/rounds?user_id={test_user.id}',
+            headers={**auth_headers, 'Accept-Encoding': 'gzip'}
+        )
+
+        assert response.headers['Content-Encoding'] == 'gzip'
+        lines = gzip.decompress(response.get_data()).decode().splitlines()
+        assert len(lines) == 5
+
+    def test_other_players_admin_only(self, client, auth_headers, admin_headers, rounds, admin_user):
+        """Exports beyond a player's own rounds need admin rights"""
+        assert client.get(f'/api/v1/exports/rounds?user_id={admin_user.id}', headers=auth_headers).status_code == 403
+        assert client.get('/api/v1/exports/rounds?date_from=2024-06-01', headers=auth_headers).status_code == 403
+
+        response = client.get('/api/v1/exports/rounds?date_from=2024-06-02', headers=admin_headers)
+        assert response.status_code == 200
+        assert len(_ndjson(response)) == 5
+
+    def test_invalid_parameters(self, client, auth_headers, test_user):
+        """Unknown formats and reversed ranges are rejected"""
+        url = f'/api/v1/exports/rounds?user_id={test_user.id}'
+
+        assert client.get(f'{url}&format=xml', headers=auth_headers).status_code == 400
+        assert client.get(f'{url}&date_from=2024-02-01&date_to=2024-01-01', headers=auth_headers).status_code == 400
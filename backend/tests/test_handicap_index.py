@@ -0,0 +1,172 @@
+"""
+WHS handicap index tests: calculation rules and index updates on finalize
+"""
+import pytest
+from datetime import date, timedelta
+from app.extensions import db
+from app.models.handicap import Handicap
+from app.models.round import Round
+from app.models.score import Score
+from app.services.handicap_index_service import HandicapIndexService
+from app.services.round_service import RoundService
+from app.services.score_service import ScoreService
+
+PARS = [4, 4, 3, 4, 5, 4, 3, 4, 4, 4, 5, 4, 3, 4, 5, 4, 3, 5]
+
+
+@pytest.fixture
+def play_round(make_round):
+    """Factory for full 18-hole rounds `over_par` strokes over par, finalized"""
+    def play(played, over_par):
+        round_id = make_round(date_played=played)
+        card = [{'hole_number': i + 1, 'strokes': par} for i, par in enumerate(PARS)]
+        for i in range(over_par):
+            card[i % 18]['strokes'] += 1
+        ScoreService.create_scores_for_holes(round_id, card)
+        return RoundService.finalize_round(round_id)
+    return play
+
+
+class TestHandicapIndexCalculation:
+    """Test the WHS calculation rules"""
+
+    @pytest.mark.parametrize('count, expected', [
+        (3, (1, -2.0)), (4, (1, -1.0)), (5, (1, 0.0)), (6, (2, -1.0)),
+        (8, (2, 0.0)), (11, (3, 0.0)), (12, (4, 0.0)), (16, (5, 0.0)),
+        (18, (6, 0.0)), (19, (7, 0.0)), (20, (8, 0.0))
+    ])
+    def test_differentials_used_table(self, count, expected):
+        """Number of differentials used and adjustment follow the WHS table"""
+        assert HandicapIndexService.differentials_used(count) == expected
+
+    def test_fewer_than_three_scores(self):
+        """No index until three scores exist"""
+        assert HandicapIndexService.calculate_index([12.0, 14.0]) is None
+
+    def test_three_scores_adjustment(self):
+        """Lowest differential minus 2.0 with three scores"""
+        assert HandicapIndexService.calculate_index([14.0, 10.0, 12.0]) == 8.0
+
+    def test_best_eight_of_twenty(self):
+        """Average of the lowest 8 of the most recent 20"""
+        differentials = [30.0] * 5 + [float(d) for d in range(1, 21)]
+        # Only the last 20 count: 1..20 -> lowest eight are 1..8
+        assert HandicapIndexService.calculate_index(differentials) == 4.5
+
+    def test_rounds_half_up(self):
+        """Index is rounded to the nearest tenth, halves up"""
+        assert HandicapIndexService.calculate_index([12.25, 20.0, 20.0, 20.0, 20.0]) == 12.3
+
+    def test_soft_cap(self):
+        """Increases above 3.0 over the low index are halved"""
+        differentials = [15.0] * 20
+        assert HandicapIndexService.calculate_index(differentials, low_handicap_index=10.0) == 14.0
+
+    def test_hard_cap(self):
+        """Increases never exceed 5.0 over the low index"""
+        differentials = [25.0] * 20
+        assert HandicapIndexService.calculate_index(differentials, low_handicap_index=10.0) == 15.0
+
+    def test_caps_need_full_record(self):
+        """Caps only apply with 20 scores"""
+        assert HandicapIndexService.calculate_index([25.0] * 10, low_handicap_index=10.0) == 25.0
+
+    def test_maximum_index(self):
+        """Index is limited to 54.0"""
+        assert HandicapIndexService.calculate_index([80.0] * 20) == 54.0
+
+
+class TestHandicapIndexUpdates:
+    """Test index updates when rounds are finalized"""
+
+    def test_index_written_after_three_rounds(self, app, play_round, test_user):
+        """The third finalized round writes a handicap timeline entry"""
+        start = date(2024, 5, 1)
+        first = play_round(start, 10)
+        assert first['handicap_index'] is None
+        play_round(start + timedelta(days=1), 14)
+        third = play_round(start + timedelta(days=2), 18)
+
+        # Differentials: (82 - 72.1) * 113 / 125 = 8.9 -> lowest minus 2.0
+        assert third['handicap_index']['handicap_index'] == 6.9
+        handicap = Handicap.query.filter_by(user_id=test_user.id, end_date=None).one()
+        assert handicap.handicap_value == 6.9
+        assert handicap.start_date == start + timedelta(days=2)
+
+    def test_finalize_reads_limited_window(self, app, play_round, test_user, query_budget):
+        """The window is read with a single LIMIT 20 query"""
+        start = date(2024, 5, 1)
+        for day in range(3):
+            play_round(start + timedelta(days=day), 12)
+        with query_budget(1) as statements:
+            assert len(HandicapIndexService.get_window(test_user.id)) == 3
+        assert 'LIMIT' in statements[0]
+
+        play_round(start + timedelta(days=3), 6)
+
+        window = HandicapIndexService.get_window(test_user.id)
+        assert len(window) == 4
+        assert window[-1][0] == start + timedelta(days=3)
+        current = Handicap.query.filter_by(user_id=test_user.id, end_date=None).one()
+        # Lowest of four (6 over -> 5.3) minus 1.0
+        assert current.handicap_value == 4.3
+
+    def test_window_as_of_date(self, app, play_round, test_user):
+        """Rounds played after the as-of date are left out of the window"""
+        start = date(2024, 5, 1)
+        for day in (0, 5, 10):
+            play_round(start + timedelta(days=day), 12)
+
+        window = HandicapIndexService.get_window(test_user.id, start + timedelta(days=5))
+        assert [entry[0] for entry in window] == [start, start + timedelta(days=5)]
+
+    def test_backdated_round_recomputes_later_indexes(self, app, play_round, test_user):
+        """A round played before existing ones rewrites every later index"""
+        start = date(2024, 6, 1)
+        for day in range(3):
+            play_round(start + timedelta(days=day), 18)
+        current = Handicap.query.filter_by(user_id=test_user.id, end_date=None).one()
+        # (90 - 72.1) * 113 / 125 = 16.2 -> minus 2.0
+        assert current.handicap_value == 14.2
+
+        backdated = play_round(date(2023, 1, 1), 0)
+
+        # Only one round existed on 2023-01-01, so no index for that date
+        assert backdated['handicap_index'] is None
+        assert Handicap.get_handicap_on_date(test_user.id, date(2023, 1, 1)) is None
+        # Level par gives -0.1: three scores on 06-02, four on 06-03
+        assert Handicap.get_handicap_on_date(test_user.id, start + timedelta(days=1)).handicap_value == -2.1
+        current = Handicap.query.filter_by(user_id=test_user.id, end_date=None).one()
+        assert current.handicap_value == -1.1
+        assert current.start_date == start + timedelta(days=2)
+
+    def test_score_edit_then_finalize(self, app, play_round, test_user):
+        """Editing a finalized round's score is seen by the next finalize"""
+        start = date(2024, 5, 1)
+        rounds = [play_round(start + timedelta(days=d), 12) for d in range(3)]
+        # Hole 1 was played one over par; a 1 there makes the round 8 over
+        score = Score.query.filter_by(round_id=rounds[0]['id']).order_by(Score.hole_id).first()
+        ScoreService.update_score(score.id, {'strokes': 1})
+
+        fourth = play_round(start + timedelta(days=3), 12)
+
+        edited = db.session.get(Round, rounds[0]['id']).differential
+        assert edited < rounds[0]['differential']
+        assert [entry[2] for entry in HandicapIndexService.get_window(test_user.id)][0] == edited
+        # Lowest of four minus 1.0
+        assert fourth['handicap_index']['handicap_index'] == round(edited - 1.0, 1)
+
+    def test_delete_round_leaves_window(self, app, play_round, test_user):
+        """A deleted round is no longer part of the window"""
+        start = date(2024, 5, 1)
+        rounds = [play_round(start + timedelta(days=d), 12) for d in range(3)]
+        RoundService.delete_round(rounds[0]['id'])
+
+        assert len(HandicapIndexService.get_window(test_user.id)) == 2
+
+    def test_incomplete_round_ignored(self, app, make_round):
+        """Rounds without a full card do not affect the index"""
+        round_id = make_round()
+        ScoreService.create_scores_for_holes(round_id, [{'hole_number': 1, 'strokes': 4}])
+
+        assert RoundService.finalize_round(round_id)['handicap_index'] is None
@@ -0,0 +1,118 @@
+"""
+Handicap timeline tests: non-overlapping ranges, atomic insertion and batch lookups
+"""
+from datetime import date
+from app.models.handicap import Handicap
+from app.services.handicap_service import HandicapService
+
+
+def _add(user_id, value, start, created_by_id):
+    HandicapService._insert_handicap_into_timeline(user_id, value, start, created_by_id, 'test')
+
+
+def _timeline(user_id):
+    return [
+        (handicap.handicap_value, handicap.start_date, handicap.end_date)
+        for handicap in Handicap.query.filter_by(user_id=user_id).order_by(Handicap.start_date)
+    ]
+
+
+class TestHandicapTimeline:
+    """Test inserting into and reading the handicap timeline"""
+
+    def test_mid_history_insert(self, app, test_user):
+        """A handicap entered between two others ends the earlier one and runs until the later one"""
+        _add(test_user.id, 10.0, date(2024, 1, 1), test_user.id)
+        _add(test_user.id, 11.0, date(2025, 1, 1), test_user.id)
+        _add(test_user.id, 12.0, date(2024, 6, 1), test_user.id)
+        _add(test_user.id, 9.0, date(2023, 6, 1), test_user.id)
+
+        assert _timeline(test_user.id) == [
+            (9.0, date(2023, 6, 1), date(2024, 1, 1)),
+            (10.0, date(2024, 1, 1), date(2024, 6, 1)),
+            (12.0, date(2024, 6, 1), date(2025, 1, 1)),
+            (11.0, date(2025, 1, 1), None),
+        ]
+
+    def test_same_start_date_replaces(self, app, test_user, admin_user):
+        """Entering a handicap on an existing start date corrects that entry"""
+        _add(test_user.id, 10.0, date(2024, 1, 1), test_user.id)
+        _add(test_user.id, 11.0, date(2024, 3, 1), test_user.id)
+        _add(test_user.id, 10.5, date(2024, 1, 1), admin_user.id)
+
+        assert _timeline(test_user.id) == [
+            (10.5, date(2024, 1, 1), date(2024, 3, 1)),
+            (11.0, date(2024, 3, 1), None),
+        ]
+        assert Handicap.query.filter_by(start_date=date(2024, 1, 1)).one().created_by_id == admin_user.id
+
+    def test_insert_is_two_writes(self, app, test_user, query_budget):
+        """The lock, the UPDATE and the INSERT are the only statements"""
+        _add(test_user.id, 10.0, date(2024, 1, 1), test_user.id)
+        _add(test_user.id, 11.0, date(2025, 1, 1), test_user.id)
+
+        with query_budget(3) as statements:
+            _add(test_user.id, 12.0, date(2024, 6, 1), test_user.id)
+
+        assert [statement.split()[0] for statement in statements] == ['SELECT', 'UPDATE', 'INSERT']
+
+    def test_lookup_boundaries(self, app, test_user):
+        """Ranges are half-open: the new handicap applies from its start date"""
+        _add(test_user.id, 10.0, date(2024, 1, 1), test_user.id)
+        _add(test_user.id, 12.0, date(2024, 6, 1), test_user.id)
+
+        assert Handicap.get_handicap_on_date(test_user.id, date(2023, 12, 31)) is None
+        assert Handicap.get_handicap_on_date(test_user.id, date(2024, 5, 31)).handicap_value == 10.0
+        assert Handicap.get_handicap_on_date(test_user.id, date(2024, 6, 1)).handicap_value == 12.0
+        assert HandicapService.get_handicap_on_date(test_user.id, date(2030, 1, 1))['handicap_value'] == 12.0
+
+    def test_lookup_in_gap(self, app, test_user):
+        """Dates in a gap left by a deleted entry have no handicap"""
+        _add(test_user.id, 10.0, date(2024, 1, 1), test_user.id)
+        _add(test_user.id, 12.0, date(2024, 6, 1), test_user.id)
+        _add(test_user.id, 11.0, date(2025, 1, 1), test_user.id)
+        HandicapService.delete_handicap(Handicap.query.filter_by(handicap_value=12.0).one().id)
+
+        assert Handicap.get_handicap_on_date(test_user.id, date(2024, 7, 1)) is None
+        assert HandicapService.get_handicap_values_on_dates([(test_user.id, date(2024, 7, 1))]) == {
+            (test_user.id, date(2024, 7, 1)): None
+        }
+
+
+class TestHandicapBatchLookup:
+    """Test HandicapService.get_handicap_values_on_dates"""
+
+    def test_many_pairs_one_query(self, app, test_user, admin_user, query_budget):
+        """All pairs are resolved from a single query"""
+        _add(test_user.id, 10.0, date(2024, 1, 1), test_user.id)
+        _add(test_user.id, 12.0, date(2024, 6, 1), test_user.id)
+        _add(admin_user.id, 5.0, date(2024, 3, 1), admin_user.id)
+        lookups = [
+            (test_user.id, date(2023, 1, 1)),
+            (test_user.id, date(2024, 2, 1)),
+            (test_user.id, date(2024, 6, 1)),
+            (admin_user.id, date(2024, 2, 1)),
+            (admin_user.id, date(2024, 12, 1)),
+            (999, date(2024, 2, 1)),
+        ]
+
+        with query_budget(1):
+            values = HandicapService.get_handicap_values_on_dates(lookups)
+
+        assert [values[pair] for pair in lookups] == [None, 10.0, 12.0, None, 5.0, None]
+
+    def test_matches_single_lookups(self, app, test_user):
+        """Batch results agree with get_handicap_on_date for every day"""
+        for value, start in [(20.0, date(2024, 1, 10)), (18.0, date(2024, 1, 20)), (19.0, date(2024, 1, 15))]:
+            _add(test_user.id, value, start, test_user.id)
+        days = [date(2024, 1, day) for day in range(1, 32)]
+
+        values = HandicapService.get_handicap_values_on_dates((test_user.id, day) for day in days)
+
+        for day in days:
+            single = Handicap.get_handicap_on_date(test_user.id, day)
+            assert values[(test_user.id, day)] == (single.handicap_value if single else None)
+
+    def test_empty(self, app):
+        """No pairs need no query"""
+        assert HandicapService.get_handicap_values_on_dates([]) == {}
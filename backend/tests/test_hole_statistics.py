@@ -0,0 +1,97 @@
+"""
+Hole statistics tests: incrementally maintained per-hole scoring counts
+"""
+from app.extensions import db
+from app.models.hole import Hole
+from app.models.score import Score
+from app.services.hole_service import HoleService
+from app.services.hole_statistics_service import HoleStatisticsService
+from app.services.round_service import RoundService
+from app.services.score_service import ScoreService
+
+
+def _hole(test_course, number=1):
+    return Hole.query.filter_by(course_id=test_course.id, hole_number=number).first()
+
+
+def _reference(hole):
+    """Statistics as the old per-score scan computed them"""
+    scores = [score.strokes for score in Score.query.filter_by(hole_id=hole.id)]
+    return {
+        'total_rounds': len(scores),
+        'average_score': round(sum(scores) / len(scores), 2),
+        'best_score': min(scores),
+        'worst_score': max(scores),
+        'eagles_or_better': len([s for s in scores if s <= hole.par - 2]),
+        'birdies': len([s for s in scores if s == hole.par - 1]),
+        'pars': len([s for s in scores if s == hole.par]),
+        'bogeys': len([s for s in scores if s == hole.par + 1]),
+        'double_bogeys_or_worse': len([s for s in scores if s >= hole.par + 2])
+    }
+
+
+class TestHoleStatistics:
+    """Test the materialized hole statistics"""
+
+    def test_every_write_path_keeps_counts(self, app, make_round, test_course):
+        """Create, update, delete, scorecards and round deletes all stay consistent"""
+        hole = _hole(test_course)
+        first, second, third = make_round(), make_round(), make_round()
+
+        score = ScoreService.create_score({'round_id': first, 'hole_id': hole.id, 'strokes': 4})
+        ScoreService.update_score(score['id'], {'strokes': 2})
+        ScoreService.create_scores_for_holes(second, [{'hole_number': 1, 'strokes': 6}, {'hole_number': 2, 'strokes': 3}])
+        ScoreService.submit_scorecard(third, [{'hole_number': 1, 'strokes': 5}])
+        ScoreService.submit_scorecard(third, [{'hole_number': 1, 'strokes': 9}])
+
+        assert HoleStatisticsService.check() == []
+        assert HoleStatisticsService.get_scoring_stats(hole.id, hole.par) == _reference(hole)
+
+        ScoreService.delete_score(score['id'])
+        RoundService.delete_round(second)
+
+        assert HoleStatisticsService.check() == []
+        stats = HoleStatisticsService.get_scoring_stats(hole.id, hole.par)
+        assert stats['total_rounds'] == 1
+        assert stats['best_score'] == stats['worst_score'] == 9
+
+    def test_hole_statistics_read_is_constant(self, app, make_round, test_course, query_budget):
+        """Reading statistics does not load the hole's scores"""
+        for strokes in (3, 4, 4, 5, 7):
+            ScoreService.submit_scorecard(make_round(), [{'hole_number': 1, 'strokes': strokes}])
+        hole = _hole(test_course)
+        db.session.expire_all()
+
+        with query_budget(3) as statements:
+            stats = HoleService.get_hole_statistics(hole.id)
+
+        assert not any('FROM scores' in statement for statement in statements)
+        assert stats['scoring_stats'] == _reference(hole)
+        assert stats['scoring_stats']['birdies'] == 1
+
+    def test_par_change_needs_no_rebuild(self, app, make_round, test_course):
+        """Buckets follow the hole's current par"""
+        ScoreService.submit_scorecard(make_round(), [{'hole_number': 1, 'strokes': 5}])
+        hole = _hole(test_course)
+
+        HoleService.update_hole(hole.id, {'par': 5})
+
+        assert HoleService.get_hole_statistics(hole.id)['scoring_stats']['pars'] == 1
+
+    def test_no_scores(self, app, test_course):
+        """Holes without scores have no scoring statistics"""
+        assert HoleService.get_hole_statistics(_hole(test_course).id)['scoring_stats'] is None
+
+    def test_rebuild(self, app, make_round, test_course, runner):
+        """The rebuild command repairs drifted counts"""
+        ScoreService.submit_scorecard(make_round(), [{'hole_number': 1, 'strokes': 4}])
+        db.session.add(Score(round_id=make_round(), hole_id=_hole(test_course).id, strokes=6))
+        db.session.commit()
+
+        result = runner.invoke(args=['holes', 'rebuild-stats', '--check'])
+        assert result.exit_code == 1
+        assert 'Found 1 mismatching count(s)' in result.output
+
+        result = runner.invoke(args=['holes', 'rebuild-stats'])
+        assert 'Rebuilt hole statistics: 2 count row(s)' in result.output
+        assert HoleStatisticsService.check() == []
@@ -0,0 +1,203 @@
+"""
+Importer tests: streaming CSV/XLSX imports in chunks with per-row errors
+"""
+import io
+import os
+import openpyxl
+import pytest
+from datetime import date, datetime
+from werkzeug.datastructures import FileStorage
+from app.extensions import db
+from app.models.club import Club
+from app.models.course import Course
+from app.models.hole import Hole
+from app.models.import_job import ImportJob
+from app.models.round import Round
+from app.models.tee_position import TeePosition
+from app.models.tee_set import TeeSet
+from app.services.hole_statistics_service import HoleStatisticsService
+from app.services.import_service import ImportService, _cell_to_str
+
+
+@pytest.fixture
+def upload_folder(app, tmp_path):
+    """Uploads go to a temporary folder; chunks are small so several are written"""
+    app.config['IMPORT_UPLOAD_FOLDER'] = str(tmp_path)
+    app.config['IMPORT_CHUNK_SIZE'] = 2
+    return tmp_path
+
+
+def _upload(text, kind, filename='data.csv'):
+    """Queue CSV text and run the job"""
+    file = FileStorage(io.BytesIO(text.encode('utf-8')), filename=filename)
+    job = ImportService.create_job(file, kind)
+    assert ImportService.claim_next() == job['id']
+    return ImportService.run_job(job['id'])
+
+
+class TestImportService:
+    """Test ImportService jobs"""
+
+    def test_clubs_in_chunks(self, app, upload_folder):
+        """Valid rows are imported, bad rows are reported by spreadsheet row number"""
+        text = '\ufeffName,City,Website\n' + ''.join(f'Club {i},Oslo,\n' for i in range(5)) + ',Bergen,\n'
+
+        result = _upload(text, 'clubs')
+
+        assert result['status'] == ImportJob.STATUS_COMPLETED
+        assert result['rows_processed'] == 6
+        assert result['rows_imported'] == 5
+        assert result['rows_failed'] == 1
+        assert result['errors'] == [{'row': 7, 'errors': {'name': ['Missing data for required field.']}}]
+        assert result['progress'] == 1.0
+        assert Club.query.count() == 5
+        assert Club.query.filter_by(name='Club 3').first().city == 'Oslo'
+        # The upload is removed once imported
+        assert os.listdir(upload_folder) == []
+
+    def test_chunk_is_one_insert(self, app, upload_folder, query_budget):
+        """Each chunk is written with a single INSERT"""
+        app.config['IMPORT_CHUNK_SIZE'] = 1000
+        text = 'name\n' + ''.join(f'Club {i}\n' for i in range(50))
+        job = ImportService.create_job(FileStorage(io.BytesIO(text.encode()), filename='clubs.csv'), 'clubs')
+        ImportService.claim_next()
+
+        with query_budget(12) as statements:
+            result = ImportService.run_job(job['id'])
+
+        assert result['rows_imported'] == 50
+        assert sum(statement.startswith('INSERT INTO clubs') for statement in statements) == 1
+
+    def test_duplicates_reported(self, app, upload_folder, test_club):
+        """Existing and repeated names fail per row, the rest is imported"""
+        result = _upload('name\nTest Golf Club\nNew Club\nNew Club\nOther Club\n', 'clubs')
+
+        assert result['rows_imported'] == 2
+        assert [error['row'] for error in result['errors']] == [2, 4]
+        assert 'already exists' in result['errors'][0]['errors']['name'][0]
+
+    def test_course_layout(self, app, upload_folder, test_club):
+        """Courses, holes, tee sets and tee positions import in sequence"""
+        result = _upload(f'name,club_id,holes_count\nNine,{test_club.id},9\nBad,999,9\n', 'courses')
+        assert result['rows_imported'] == 1
+        assert result['errors'][0]['errors'] == {'club_id': ['Club not found']}
+        course = Course.query.filter_by(name='Nine').first()
+
+        holes = 'hole_number,par,stroke_index,course_id\n' + ''.join(
+            f'{number},4,{number},{course.id}\n' for number in range(1, 11)
+        )
+        result = _upload(holes, 'holes')
+        assert result['rows_imported'] == 9
+        assert result['errors'] == [{'row': 11, 'errors': {'hole_number': ['Course only has 9 holes']}}]
+
+        result = _upload(f'name,slope_rating,course_rating,course_id\nYellow,120,68.5,{course.id}\n', 'tee_sets')
+        assert result['rows_imported'] == 1
+        tee_set = TeeSet.query.filter_by(course_id=course.id).first()
+
+        positions = 'hole_id,tee_set_id,length\n' + ''.join(
+            f'{hole.id},{tee_set.id},{300 + hole.hole_number}\n' for hole in Hole.query.filter_by(course_id=course.id)
+        )
+        result = _upload(positions, 'tee_positions')
+        assert result['rows_imported'] == 9
+        assert TeePosition.query.filter_by(tee_set_id=tee_set.id).count() == 9
+        # Every layout chunk moved the catalog version
+        assert db.session.get(Course, course.id).catalog_version > 1
+
+    def test_rounds_with_scores(self, app, upload_folder, test_user, test_course):
+        """Round rows stamp ratings and turn hole_N columns into scores"""
+        tee_set = TeeSet.query.filter_by(course_id=test_course.id).first()
+        header = 'user_id,course_id,tee_set_id,date_played,handicap_used,' + ','.join(f'hole_{n}' for n in range(1, 19))
+        full = ','.join(['5'] * 18)
+        text = (
+            f'{header}\n'
+            f'{test_user.id},{test_course.id},{tee_set.id},2024-05-01,18.0,{full}\n'
+            f'{test_user.id},{test_course.id},{tee_set.id},2024-05-08,,4,4,4' + ',' * 15 + '\n'
+            f'{test_user.id},{test_course.id},{tee_set.id},2024-05-09,,x' + ',' * 17 + '\n'
+            f'999,{test_course.id},{tee_set.id},2024-05-10,' + ',' * 18 + '\n'
+        )
+
+        result = _upload(text, 'rounds')
+
+        assert result['rows_imported'] == 2
+        assert [error['row'] for error in result['errors']] == [4, 5]
+        assert result['errors'][0]['errors'] == {'hole_1': ['Not a valid integer.']}
+        full_round, partial_round = Round.query.order_by(Round.date_played).all()
+        assert full_round.total_score == 90
+        assert full_round.is_complete is True
+        assert full_round.course_rating == tee_set.course_rating
+        assert full_round.course_handicap is not None
+        assert full_round.differential == full_round.calculate_differential()
+        assert partial_round.holes_played == 3
+        assert partial_round.is_complete is False
+        # Imported scores are counted in the hole statistics
+        assert HoleStatisticsService.check() == []
+
+    def test_missing_column_fails_job(self, app, upload_folder):
+        """A file without a required column is rejected before anything is written"""
+        result = _upload('city\nOslo\n', 'clubs')
+
+        assert result['status'] == ImportJob.STATUS_FAILED
+        assert 'Missing required column(s) for clubs: name' in result['last_error']
+        assert Club.query.count() == 0
+
+    def test_rejects_unknown_kind_and_format(self, app, upload_folder):
+        """Only known kinds and CSV/XLSX files are queued"""
+        with pytest.raises(ValueError, match='Unknown import kind'):
+            ImportService.create_job(FileStorage(io.BytesIO(b''), filename='a.csv'), 'players')
+        with pytest.raises(ValueError, match='.csv and .xlsx'):
+            ImportService.create_job(FileStorage(io.BytesIO(b''), filename='a.txt'), 'clubs')
+
+    def test_xlsx(self, app, upload_folder):
+        """XLSX sheets are read in read-only mode"""
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        sheet.append(['name', 'postal_code'])
+        sheet.append(['Sheet Club', 1234])
+        buffer = io.BytesIO()
+        workbook.save(buffer)
+        buffer.seek(0)
+
+        job = ImportService.create_job(FileStorage(buffer, filename='clubs.xlsx'), 'clubs')
+        ImportService.claim_next()
+        result = ImportService.run_job(job['id'])
+
+        assert result['rows_imported'] == 1
+        assert Club.query.first().postal_code == '1234'
+
+    def test_xlsx_cells(self):
+        """XLSX cell values are normalised to their CSV text"""
+        assert _cell_to_str(None) == ''
+        assert _cell_to_str(' Sheet Club ') == 'Sheet Club'
+        assert _cell_to_str(1234.0) == '1234'
+        assert _cell_to_str(72.5) == '72.5'
+        assert _cell_to_str(date(2024, 6, 1)) == '2024-06-01'
+        assert _cell_to_str(datetime(2024, 6, 1)) == '2024-06-01'
+        assert _cell_to_str(datetime(2024, 6, 1, 9, 30)) == '2024-06-01T09:30:00'
+
+
+class TestImportRoutes:
+    """Test the /imports endpoints"""
+
+    def test_upload_and_progress(self, client, admin_headers, upload_folder):
+        """Uploads are queued with 202 and their progress can be polled"""
+        response = client.post('/api/v1/imports', headers=admin_headers, data={
+            'kind': 'clubs',
+            'file': (io.BytesIO(b'name\nRoute Club\n'), 'clubs.csv')
+        }, content_type='multipart/form-data')
+
+        assert response.status_code == 202
+        job_id = response.get_json()['data']['id']
+        assert response.get_json()['data']['status'] == ImportJob.STATUS_PENDING
+
+        ImportService.run_pending()
+
+        data = client.get(f'/api/v1/imports/{job_id}', headers=admin_headers).get_json()['data']
+        assert data['status'] == ImportJob.STATUS_COMPLETED
+        assert data['rows_imported'] == 1
+        assert client.get('/api/v1/imports', headers=admin_headers).get_json()['count'] == 1
+
+    def test_admin_only(self, client, auth_headers):
+        """Regular users cannot import"""
+        response = client.get('/api/v1/imports', headers=auth_headers)
+
+        assert response.status_code == 403
@@ -0,0 +1,42 @@
+"""
+Index tests: hot lookups are served by an index instead of a table scan
+"""
+import pytest
+from datetime import date
+from app.extensions import db
+from app.models.handicap import Handicap
+from app.models.user import User
+from app.models.score import Score
+from app.models.tee_position import TeePosition
+
+
+def _plan(statement):
+    """SQLite query plan details for a statement"""
+    compiled = statement.compile(dialect=db.engine.dialect, compile_kwargs={'literal_binds': True})
+    rows = db.session.connection().exec_driver_sql(f'EXPLAIN QUERY PLAN {compiled}').fetchall()
+    return ' '.join(row[-1] for row in rows)
+
+
+class TestLookupIndexes:
+    """Test that lookup paths use their indexes"""
+
+    @pytest.mark.parametrize('statement, index', [
+        (lambda: db.select(Handicap).where(
+            Handicap.user_id == 1,
+            Handicap.start_date <= date(2024, 1, 1)
+        ).order_by(Handicap.start_date.desc()).limit(1), 'ix_handicaps_user_id_start_date'),
+        (lambda: db.select(User).where(User.password_reset_token == 'token'), 'ix_users_password_reset_token'),
+        (lambda: db.select(Score.id).where(Score.hole_id == 1), 'ix_scores_hole_id'),
+        (lambda: db.select(TeePosition).where(TeePosition.tee_set_id == 1), 'ix_tee_positions_tee_set_id'),
+    ])
+    def test_lookup_uses_index(self, app, statement, index):
+        """Each lookup searches its index"""
+        plan = _plan(statement())
+        assert index in plan
+
+    def test_current_handicap_index_is_partial(self, app):
+        """The current handicap index only covers open-ended rows"""
+        sql = db.session.execute(db.text(
+            "SELECT sql FROM sqlite_master WHERE name = 'ix_handicaps_current_user_id'"
+        )).scalar()
+        assert 'WHERE end_date IS NULL' in sql
@@ -0,0 +1,107 @@
+"""
+Request instrumentation tests: Server-Timing headers, logs and admin aggregates
+"""
+import logging
+import re
+import pytest
+from flask import g
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from app import create_app
+from app.config import TestingConfig
+from app.extensions import db
+from app.instrumentation import RequestMetrics, _finish_request, _start_request
+
+
+def _timing(response):
+    """Parse a Server-Timing header into {name: (duration, description)}"""
+    entries = {}
+    for part in response.headers['Server-Timing'].split(', '):
+        name, *params = part.split(';')
+        values = dict(param.split('=', 1) for param in params)
+        entries[name] = (float(values['dur']), values.get('desc', '').strip('"'))
+    return entries
+
+
+class TestServerTiming:
+    """Test the Server-Timing header"""
+
+    def test_header_on_api_response(self, client, auth_headers, test_user):
+        """Authenticated API calls report their SQL, serialization and total time"""
+        response = client.get(f'/api/v1/rounds/user/{test_user.id}', headers=auth_headers)
+
+        timing = _timing(response)
+        assert set(timing) == {'db', 'json', 'app', 'total'}
+        # JWT user lookup, the ETag validator and the rounds query
+        assert timing['db'][1] == '3 queries'
+        assert timing['total'][0] >= timing['db'][0]
+
+    def test_header_without_database(self, client):
+        """Requests without SQL report zero queries"""
+        response = client.get('/health')
+
+        assert _timing(response)['db'] == (0.0, '0 queries')
+
+    def test_structured_log_line(self, client, auth_headers, test_user, caplog):
+        """Each request writes one structured timing log line"""
+        with caplog.at_level(logging.INFO, logger='app.instrumentation'):
+            client.get(f'/api/v1/rounds/user/{test_user.id}', headers=auth_headers)
+
+        record = caplog.records[-1]
+        assert re.search(r'endpoint=api_v1\.round_api\.\w+ status=200 sql_count=3', record.getMessage())
+        assert record.sql_count == 3
+        assert set(record.timings) == {'db', 'json', 'app', 'total'}
+
+    def test_failed_statement_is_counted(self, app):
+        """A statement that raises is timed and leaves nothing on the pooled connection"""
+        with app.test_request_context('/api/v1/health'):
+            _start_request()
+            with pytest.raises(OperationalError):
+                db.session.execute(text('SELECT * FROM missing_table'))
+            db.session.rollback()
+            db.session.execute(text('SELECT 1'))
+
+            assert g.sql_count == 2
+            assert 'query_start' not in db.session.connection().info
+            _finish_request(app.response_class())
+
+    def test_can_be_disabled(self, monkeypatch):
+        """INSTRUMENTATION_ENABLED=False leaves responses untouched"""
+        monkeypatch.setattr(TestingConfig, 'INSTRUMENTATION_ENABLED', False)
+        app = create_app('testing')
+
+        response = app.test_client().get('/health')
+
+        assert 'Server-Timing' not in response.headers
+
+
+class TestRequestMetricsEndpoint:
+    """Test the admin aggregates endpoint"""
+
+    def test_aggregates_per_endpoint(self, client, admin_headers):
+        """Requests are aggregated per endpoint"""
+        RequestMetrics.reset()
+        for _ in range(3):
+            client.get('/health')
+
+        response = client.get('/api/v1/metrics/requests', headers=admin_headers)
+
+        assert response.status_code == 200
+        health = response.get_json()['data']['health_check']
+        assert health['requests'] == 3
+        assert health['sql_count'] == 0
+        assert health['avg_total_ms'] <= health['max_total_ms']
+
+    def test_reset(self, client, admin_headers):
+        """Aggregates can be cleared"""
+        client.get('/health')
+
+        client.delete('/api/v1/metrics/requests', headers=admin_headers)
+
+        assert 'health_check' not in RequestMetrics.snapshot()
+
+    def test_admin_only(self, client, auth_headers):
+        """Regular users cannot read the aggregates"""
+        response = client.get('/api/v1/metrics/requests', headers=auth_headers)
+
+        assert response.status_code == 403
@@ -0,0 +1,149 @@
+"""
+Keyset pagination tests: cursor traversal, tampered cursors and flat page cost
+"""
+import pytest
+from datetime import date, timedelta
+from app.extensions import db
+from app.models.club import Club
+from app.models.user import User
+from app.services.pagination import KeysetPagination
+from app.services.club_service import ClubService
+from app.services.round_service import RoundService
+from app.services.user_service import UserService
+
+
+def _seed_rounds(make_round, count):
+    """Create `count` rounds, several on the same day so the id tiebreak matters"""
+    for i in range(count):
+        make_round(date_played=date.today() - timedelta(days=i // 3))
+
+
+def _walk(fetch):
+    """Follow next_cursor until the last page, returning every row"""
+    rows, cursor = [], None
+    while True:
+        page, meta = fetch(cursor)
+        rows.extend(page)
+        if not meta['has_more']:
+            assert meta['next_cursor'] is None
+            return rows
+        cursor = meta['next_cursor']
+
+
+class TestCursorEncoding:
+    """Test cursor encoding"""
+
+    def test_round_trip_with_dates(self):
+        """Dates, strings and integers survive encoding"""
+        values = [date(2024, 5, 1), 'Smith', 42]
+        cursor = KeysetPagination.encode_cursor(values)
+        assert KeysetPagination.decode_cursor(cursor, 3) == values
+
+    @pytest.mark.parametrize('cursor', ['not-base64!!', 'bm90IGpzb24', KeysetPagination.encode_cursor([1])])
+    def test_invalid_cursor_rejected(self, cursor):
+        """Garbage and cursors with the wrong number of keys raise ValueError"""
+        with pytest.raises(ValueError, match='Invalid cursor'):
+            KeysetPagination.decode_cursor(cursor, 2)
+
+
+class TestKeysetPagination:
+    """Test keyset listing through the services and routes"""
+
+    def test_rounds_traversed_without_gaps(self, app, make_round, test_user):
+        """Walking the cursor chain returns every round once, newest first"""
+        _seed_rounds(make_round, 23)
+
+        rounds = _walk(lambda cursor: RoundService.list_rounds_by_user(test_user.id, limit=5, cursor=cursor))
+
+        assert len(rounds) == 23
+        assert len({r['id'] for r in rounds}) == 23
+        keys = [(r['date_played'], r['id']) for r in rounds]
+        assert keys == sorted(keys, reverse=True)
+
+    def test_users_traversed_in_name_order(self, app, admin_user):
+        """Users with equal names are split across pages by id"""
+        for i in range(12):
+            user = User(email=f'player{i}@example.com', first_name='Player', last_name=f'Name{i % 3}')
+            user.set_password('password123')
+            db.session.add(user)
+        db.session.commit()
+
+        users = _walk(lambda cursor: UserService.list_users(cursor=cursor, limit=4))
+
+        assert len(users) == 13
+        keys = [(u['last_name'], u['first_name'], u['id']) for u in users]
+        assert keys == sorted(keys)
+
+    def test_deep_page_costs_one_query(self, app, make_round, test_user, query_budget):
+        """A page deep into the list is one row-value range query, with no COUNT"""
+        _seed_rounds(make_round, 30)
+        _, meta = RoundService.list_rounds_by_user(test_user.id, limit=25)
+        db.session.expire_all()
+
+        with query_budget(1) as statements:
+            rounds, meta = RoundService.list_rounds_by_user(test_user.id, limit=25, cursor=meta['next_cursor'])
+
+        assert len(rounds) == 5
+        assert meta['has_more'] is False
+        assert '(rounds.date_played, rounds.id) <' in statements[0]
+        assert 'count(' not in statements[0].lower()
+
+    def test_totals(self, app, test_club):
+        """Totals are only counted on request; estimates fall back to a count off PostgreSQL"""
+        for i in range(4):
+            db.session.add(Club(name=f'Club {i}', country='Norway'))
+        db.session.commit()
+
+        _, meta = ClubService.list_clubs(limit=2)
+        assert 'total' not in meta
+
+        _, meta = ClubService.list_clubs(limit=2, total='exact')
+        assert meta['total'] == 5
+        assert meta['total_is_estimate'] is False
+
+        _, meta = ClubService.list_clubs(limit=2, country='Norway', total='estimate')
+        assert meta['total'] == 4
+
+        with pytest.raises(ValueError):
+            ClubService.list_clubs(total='roughly')
+
+    def test_round_endpoint_cursor(self, app, make_round, client, auth_headers, test_user):
+        """The rounds endpoint returns a cursor and rejects tampered ones"""
+        _seed_rounds(make_round, 3)
+
+        response = client.get(f'/api/v1/rounds/user/{test_user.id}?limit=2', headers=auth_headers)
+        data = response.get_json()
+        assert response.status_code == 200
+        assert data['count'] == 2
+        assert data['meta']['has_more'] is True
+
+        response = client.get(
+            f'/api/v1/rounds/user/{test_user.id}?limit=2&cursor={data["meta"]["next_cursor"]}',
+            headers=auth_headers
+        )
+        assert response.get_json()['count'] == 1
+
+        response = client.get(f'/api/v1/rounds/user/{test_user.id}?cursor=tampered', headers=auth_headers)
+        assert response.status_code == 400
+
+    def test_course_endpoint_cursor(self, app, client, auth_headers, test_course):
+        """Courses are listed with pagination metadata"""
+        response = client.get('/api/v1/courses?total=exact', headers=auth_headers)
+        data = response.get_json()
+
+        assert response.status_code == 200
+        assert data['data'][0]['name'] == test_course.name
+        assert data['meta']['total'] == 1
+        assert data['meta']['has_more'] is False
+
+    def test_user_endpoint_modes(self, app, client, admin_headers, test_user):
+        """Users are cursor-paginated unless a page number is given"""
+        response = client.get('/api/v1/users/?limit=1', headers=admin_headers)
+        meta = response.get_json()['data']['meta']
+        assert meta['has_more'] is True
+        assert meta['next_cursor']
+
+        response = client.get('/api/v1/users/?page=1&per_page=1', headers=admin_headers)
+        meta = response.get_json()['data']['meta']
+        assert meta['total'] == 2
+        assert meta['pages'] == 2
@@ -0,0 +1,136 @@
+"""
+Loader profile tests: service read paths must stay within their query budgets
+"""
+import pytest
+from datetime import date, timedelta
+from app.extensions import db
+from app.models.handicap import Handicap
+from app.models.hole import Hole
+from app.models.round import Round
+from app.models.user import User
+from app.services.loader_profiles import LoaderProfiles
+from app.services.round_service import RoundService
+from app.services.score_service import ScoreService
+from app.services.user_service import UserService
+from app.services.course_service import CourseService
+
+
+def _seed_rounds(make_round, count=5, holes=18):
+    """Create `count` rounds with `holes` scores each"""
+    pars = [hole.par for hole in Hole.query.order_by(Hole.hole_number)]
+    for i in range(count):
+        make_round(
+            date_played=date.today() - timedelta(days=i),
+            course_handicap=18,
+            strokes=[par + 1 for par in pars[:holes]],
+            points=2
+        )
+
+
+class TestLoaderProfiles:
+    """Test the loader profile registry"""
+
+    def test_unknown_profile_raises(self, app):
+        """Unknown profile names are rejected"""
+        with pytest.raises(ValueError):
+            LoaderProfiles.options('does_not_exist')
+
+    def test_all_profiles_build(self, app):
+        """Every registered profile produces loader options"""
+        for name in LoaderProfiles.names():
+            assert LoaderProfiles.options(name)
+
+
+class TestQueryBudgets:
+    """Test that list endpoints do not issue one query per row"""
+
+    def test_rounds_by_user_constant_queries(self, app, make_round, test_user, query_budget):
+        """Listing rounds costs the same number of queries regardless of row count"""
+        _seed_rounds(make_round, count=10)
+        db.session.expire_all()
+
+        with query_budget(1):
+            rounds = RoundService.get_rounds_by_user(test_user.id)
+
+        assert len(rounds) == 10
+        assert all(r['is_complete'] for r in rounds)
+
+    def test_round_with_scores_constant_queries(self, app, make_round, query_budget):
+        """A round with all its scores loads in a fixed number of queries"""
+        _seed_rounds(make_round, count=1)
+        round_id = Round.query.first().id
+        db.session.expire_all()
+
+        with query_budget(2):
+            data = RoundService.get_round_by_id(round_id, include_scores=True)
+
+        assert len(data['scores']) == 18
+        assert all(score['hole_number'] for score in data['scores'])
+
+    def test_scores_by_round_constant_queries(self, app, make_round, query_budget):
+        """Scores for a round are joined to their holes in one query"""
+        _seed_rounds(make_round, count=1)
+        round_id = Round.query.first().id
+        db.session.expire_all()
+
+        with query_budget(1):
+            scores = ScoreService.get_scores_by_round(round_id)
+
+        assert [s['hole_number'] for s in scores] == list(range(1, 19))
+
+    def test_all_users_constant_queries(self, app, admin_user, query_budget):
+        """Paginated user listing loads current handicaps in one extra query"""
+        for i in range(10):
+            user = User(email=f'player{i}@example.com', first_name='Player', last_name=f'{i:02d}')
+            user.set_password('password123')
+            db.session.add(user)
+            db.session.flush()
+            db.session.add(Handicap(
+                handicap_value=10 + i,
+                start_date=date.today(),
+                user_id=user.id,
+                created_by_id=admin_user.id
+            ))
+        db.session.commit()
+        db.session.expire_all()
+
+        # COUNT for pagination, the page itself, and the handicap selectin
+        with query_budget(3):
+            users, meta = UserService.get_all_users(per_page=50)
+
+        assert meta['total'] == 11
+        assert sorted(u['current_handicap'] for u in users if u['current_handicap'] is not None) == \
+            [float(10 + i) for i in range(10)]
+
+    def test_course_full_details_constant_queries(self, app, test_course, query_budget):
+        """Full course details load holes, tee sets and positions without lazy loads"""
+        db.session.expire_all()
+
+        with query_budget(4):
+            data = CourseService.get_course_with_full_details(test_course.id)
+
+        assert data['total_par'] == 72
+        assert len(data['holes']) == 18
+        assert data['club']['name'] == 'Test Golf Club'
+
+    def test_budget_guard_fails_when_exceeded(self, app, make_round, test_user, query_budget):
+        """The guard itself reports lazy-loading code paths"""
+        _seed_rounds(make_round, count=3)
+        db.session.expire_all()
+
+        with pytest.raises(pytest.fail.Exception):
+            with query_budget(2):
+                rounds = Round.query.filter_by(user_id=test_user.id).all()
+                [r.to_dict(include_scores=True) for r in rounds]
+
+    def test_round_list_endpoint_budget(self, app, make_round, client, auth_headers, test_user, query_budget):
+        """The rounds endpoint stays within budget end to end"""
+        _seed_rounds(make_round, count=5)
+        db.session.expire_all()
+
+        # JWT user lookup, the ETag validator and the rounds page
+        with query_budget(3):
+            response = client.get(f'/api/v1/rounds/user/{test_user.id}', headers=auth_headers)
+
+        assert response.status_code == 200
+        assert response.get_json()['count'] == 5
@@ -0,0 +1,135 @@
+"""
+Read replica routing tests
+
+The primary and the replica are two SQLite files; the replica is seeded
+without the newest handicap to stand in for replication lag.
+"""
+import time
+import pytest
+from datetime import date
+from flask_jwt_extended import create_access_token
+from sqlalchemy.orm import Session
+from app import create_app
+from app.config import TestingConfig
+from app.extensions import db
+from app.models.handicap import Handicap
+from app.models.user import User
+from app.replica import REPLICA_BIND, STICKY_COOKIE, ReplicaRouter
+from app.services.handicap_service import HandicapService
+
+
+def _seed(session, latest=True):
+    """One user with an old handicap, plus the newest one on the primary"""
+    user = User(id=1, email='replica@example.com', first_name='Replica', last_name='User',
+                sex='M', is_active=True, is_admin=False)
+    user.set_password('testpass123')
+    session.add(user)
+    session.add(Handicap(user_id=1, created_by_id=1, handicap_value=18.0,
+                         start_date=date(2026, 1, 1), end_date=date(2026, 6, 1) if latest else None))
+    if latest:
+        session.add(Handicap(user_id=1, created_by_id=1, handicap_value=15.0, start_date=date(2026, 6, 1)))
+    session.commit()
+
+
+@pytest.fixture
+def replica_app(monkeypatch, tmp_path):
+    """App with a primary and a lagging replica"""
+    monkeypatch.setattr(TestingConfig, 'SQLALCHEMY_DATABASE_URI', f"sqlite:///{tmp_path / 'primary.db'}")
+    monkeypatch.setattr(TestingConfig, 'SQLALCHEMY_REPLICA_URI', f"sqlite:///{tmp_path / 'replica.db'}")
+    app = create_app('testing')
+    with app.app_context():
+        db.create_all()
+        replica = db.engines[REPLICA_BIND]
+        db.metadata.create_all(replica)
+        _seed(db.session)
+        with Session(replica) as session:
+            _seed(session, latest=False)
+        yield app
+        db.session.remove()
+        db.metadata.drop_all(replica)
+        db.drop_all()
+
+
+@pytest.fixture
+def replica_headers(replica_app):
+    """Token for the seeded user"""
+    with replica_app.app_context():
+        return {'Authorization': f"Bearer {create_access_token(identity='1')}"}
+
+
+def _values(response):
+    assert response.status_code == 200
+    return sorted(entry['handicap_value'] for entry in response.get_json()['data'])
+
+
+class TestReplicaRouting:
+    """Test which database read-only service methods use"""
+
+    def test_read_only_get_uses_replica(self, replica_app, replica_headers):
+        """GETs of read-only service methods see the replica's data"""
+        client = replica_app.test_client()
+
+        response = client.get('/api/v1/handicaps/my-handicaps', headers=replica_headers)
+
+        assert _values(response) == [18.0]
+        assert STICKY_COOKIE not in response.headers.get('Set-Cookie', '')
+
+    def test_outside_requests_use_primary(self, replica_app):
+        """CLI commands and workers (no request) always read the primary"""
+        history = HandicapService.get_user_handicap_history(1)
+
+        assert sorted(entry['handicap_value'] for entry in history) == [15.0, 18.0]
+        assert ReplicaRouter.use_replica() is False
+
+    def test_write_pins_client_to_primary(self, replica_app, replica_headers):
+        """After a write the client reads its own writes from the primary"""
+        client = replica_app.test_client()
+
+        response = client.post('/api/v1/handicaps/my-handicaps', headers=replica_headers,
+                               json={'user_id': 1, 'created_by_id': 1, 'handicap_value': 12.0,
+                                     'start_date': '2026-09-01'})
+        assert response.status_code == 201
+        assert STICKY_COOKIE in response.headers['Set-Cookie']
+
+        assert _values(client.get('/api/v1/handicaps/my-handicaps', headers=replica_headers)) == [12.0, 15.0, 18.0]
+
+    def test_stickiness_expires(self, replica_app, replica_headers):
+        """Once the window has passed, reads go back to the replica"""
+        client = replica_app.test_client()
+        client.set_cookie(STICKY_COOKIE, f'{time.time() + 60:.3f}')
+        assert _values(client.get('/api/v1/handicaps/my-handicaps', headers=replica_headers)) == [15.0, 18.0]
+
+        client.set_cookie(STICKY_COOKIE, f'{time.time() - 1:.3f}')
+        assert _values(client.get('/api/v1/handicaps/my-handicaps', headers=replica_headers)) == [18.0]
+
+    def test_request_after_write_uses_primary(self, replica_app):
+        """Reads after a flush in the same request stay on the primary"""
+        with replica_app.test_request_context('/', method='GET'):
+            assert len(HandicapService.get_user_handicap_history(1)) == 1
+
+            db.session.add(Handicap(user_id=1, created_by_id=1, handicap_value=10.0, start_date=date(2026, 10, 1)))
+            db.session.flush()
+
+            assert len(HandicapService.get_user_handicap_history(1)) == 3
+            db.session.rollback()
+
+    def test_locking_reads_use_primary(self, replica_app):
+        """SELECT ... FOR UPDATE never goes to the replica"""
+        with replica_app.test_request_context('/', method='GET'):
+            with ReplicaRouter.reads():
+                bind = db.session.get_bind(clause=db.select(Handicap).with_for_update())
+
+        assert bind is db.engine
+
+
+class TestWithoutReplica:
+    """Test that routing is inert without a replica"""
+
+    def test_no_replica_bind(self, app, client, auth_headers):
+        """Without SQLALCHEMY_REPLICA_URI reads use the primary and no cookie is set"""
+        assert REPLICA_BIND not in db.engines
+
+        response = client.get('/api/v1/handicaps/my-handicaps', headers=auth_headers)
+
+        assert response.status_code == 200
+        assert STICKY_COOKIE not in response.headers.get('Set-Cookie', '')
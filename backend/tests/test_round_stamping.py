@@ -0,0 +1,105 @@
+"""
+Round stamping tests: handicap, ratings and course handicap resolved on creation and bulk import
+"""
+from datetime import date
+from app.extensions import db
+from app.models.tee_set import TeeSet
+from app.services.handicap_service import HandicapService
+from app.services.round_service import RoundService
+
+
+def _handicap(user_id, value, start):
+    HandicapService._insert_handicap_into_timeline(user_id, value, start, user_id, 'test')
+
+
+class TestCreateRoundStamping:
+    """Test RoundService.create_round handicap stamping"""
+
+    def test_handicap_from_timeline(self, app, test_user, test_course):
+        """Rounds without handicap_used get the handicap valid on the day played"""
+        _handicap(test_user.id, 20.0, date(2024, 1, 1))
+        _handicap(test_user.id, 15.0, date(2024, 6, 1))
+        tee_set = TeeSet.query.filter_by(course_id=test_course.id).first()
+
+        round = RoundService.create_round({
+            'user_id': test_user.id, 'course_id': test_course.id,
+            'tee_set_id': tee_set.id, 'date_played': date(2024, 5, 31)
+        })
+
+        assert round['handicap_used'] == 20.0
+        # 20.0 * 125 / 113 = 22.1
+        assert round['course_handicap'] == 22
+
+    def test_explicit_handicap_kept(self, app, test_user, test_course):
+        """A handicap sent by the client wins over the timeline"""
+        _handicap(test_user.id, 20.0, date(2024, 1, 1))
+        tee_set = TeeSet.query.filter_by(course_id=test_course.id).first()
+
+        round = RoundService.create_round({
+            'user_id': test_user.id, 'course_id': test_course.id,
+            'tee_set_id': tee_set.id, 'date_played': date(2024, 5, 31), 'handicap_used': 10.0
+        })
+
+        assert round['handicap_used'] == 10.0
+
+    def test_no_handicap_on_date(self, app, test_user, test_course):
+        """Rounds played before the first handicap stay without one"""
+        _handicap(test_user.id, 20.0, date(2024, 1, 1))
+        tee_set = TeeSet.query.filter_by(course_id=test_course.id).first()
+
+        round = RoundService.create_round({
+            'user_id': test_user.id, 'course_id': test_course.id,
+            'tee_set_id': tee_set.id, 'date_played': date(2023, 12, 31)
+        })
+
+        assert round['handicap_used'] is None
+        assert round['course_handicap'] is None
+
+
+class TestImportRounds:
+    """Test RoundService.import_rounds"""
+
+    def test_batch_is_stamped_with_fixed_queries(self, app, test_user, admin_user, test_course, query_budget):
+        """Users, courses, tee sets and handicaps cost one query each for the whole batch"""
+        tee_set = TeeSet.query.filter_by(course_id=test_course.id).first()
+        tee_set.women_course_rating, tee_set.women_slope_rating = 74.0, 130
+        db.session.commit()
+        _handicap(test_user.id, 20.0, date(2024, 1, 1))
+        _handicap(test_user.id, 15.0, date(2024, 6, 1))
+        _handicap(admin_user.id, 30.0, date(2024, 1, 1))
+        db.session.expire_all()
+        base = {'course_id': test_course.id, 'tee_set_id': tee_set.id}
+        rounds_data = [
+            {**base, 'user_id': test_user.id, 'date_played': date(2024, 2, 1)},
+            {**base, 'user_id': test_user.id, 'date_played': date(2024, 7, 1)},
+            {**base, 'user_id': test_user.id, 'date_played': date(2024, 7, 1), 'handicap_used': 5.0},
+            {**base, 'user_id': admin_user.id, 'date_played': date(2024, 7, 1)},
+            {**base, 'user_id': admin_user.id, 'date_played': date(2023, 7, 1)},
+        ]
+
+        with query_budget(4):
+            rounds, failed = RoundService.import_rounds(rounds_data)
+
+        assert failed == []
+        assert [round.handicap_used for _, round in rounds] == [20.0, 15.0, 5.0, 30.0, None]
+        assert [round.course_handicap for _, round in rounds] == [22, 17, 6, 35, None]
+        assert [(round.course_rating, round.slope_rating) for _, round in rounds][2:4] == [(72.1, 125), (74.0, 130)]
+
+    def test_invalid_rows_reported_by_position(self, app, test_user, test_course):
+        """Unknown users, courses and mismatched tee sets fail without stopping the batch"""
+        tee_set = TeeSet.query.filter_by(course_id=test_course.id).first()
+        base = {'user_id': test_user.id, 'course_id': test_course.id, 'tee_set_id': tee_set.id}
+
+        rounds, failed = RoundService.import_rounds([
+            {**base, 'user_id': 999},
+            base,
+            {**base, 'course_id': 999},
+            {**base, 'tee_set_id': 999},
+        ])
+
+        assert [position for position, _ in rounds] == [1]
+        assert failed == [
+            (0, {'user_id': ['User not found']}),
+            (2, {'course_id': ['Course not found']}),
+            (3, {'tee_set_id': ['Tee set not found for this course']}),
+        ]
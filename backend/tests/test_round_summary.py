@@ -0,0 +1,100 @@
+"""
+Round completion summary tests: denormalized holes_played / expected_holes / is_complete
+"""
+from app.extensions import db
+from app.models.hole import Hole
+from app.models.round import Round
+from app.models.score import Score
+from app.models.tee_set import TeeSet
+from app.services.course_service import CourseService
+from app.services.round_service import RoundService
+from app.services.score_service import ScoreService
+
+
+def _full_card(par_offset=0):
+    pars = [4, 4, 3, 4, 5, 4, 3, 4, 4, 4, 5, 4, 3, 4, 5, 4, 3, 5]
+    return [{'hole_number': i + 1, 'strokes': par + par_offset} for i, par in enumerate(pars)]
+
+
+class TestRoundCompletionSummary:
+    """Test that completion columns track score writes"""
+
+    def test_new_round_expects_course_holes(self, app, test_user, test_course):
+        """Rounds start empty and expect the course's hole count"""
+        tee_set = TeeSet.query.filter_by(course_id=test_course.id).first()
+        round = RoundService.create_round({
+            'user_id': test_user.id,
+            'course_id': test_course.id,
+            'tee_set_id': tee_set.id
+        })
+        assert round['holes_played'] == 0
+        assert round['expected_holes'] == 18
+        assert round['is_complete'] is False
+
+    def test_score_writes_update_summary(self, app, make_round, test_course):
+        """Creating and deleting scores keeps holes_played and is_complete current"""
+        round_id = make_round()
+        ScoreService.create_scores_for_holes(round_id, _full_card()[:17])
+
+        stored = Round.query.get(round_id)
+        assert stored.holes_played == 17
+        assert stored.is_complete is False
+
+        last_hole = Hole.query.filter_by(course_id=test_course.id, hole_number=18).first()
+        score = ScoreService.create_score({'round_id': round_id, 'hole_id': last_hole.id, 'strokes': 5})
+        stored = Round.query.get(round_id)
+        assert stored.holes_played == 18
+        assert stored.is_complete is True
+
+        ScoreService.delete_score(score['id'])
+        stored = Round.query.get(round_id)
+        assert stored.holes_played == 17
+        assert stored.is_complete is False
+
+    def test_filter_rounds_by_completion(self, app, make_round, test_user):
+        """Listing can filter on completeness in SQL"""
+        complete_id = make_round()
+        ScoreService.create_scores_for_holes(complete_id, _full_card())
+        make_round()
+
+        assert [r['id'] for r in RoundService.get_rounds_by_user(test_user.id, completed=True)] == [complete_id]
+        assert len(RoundService.get_rounds_by_user(test_user.id, completed=False)) == 1
+        assert len(RoundService.get_rounds_by_user(test_user.id)) == 2
+
+    def test_course_hole_count_change_updates_rounds(self, app, make_round, test_course):
+        """Changing a course's hole count re-evaluates completion of its rounds"""
+        round_id = make_round()
+        ScoreService.create_scores_for_holes(round_id, _full_card()[:9])
+
+        CourseService.update_course(test_course.id, {'holes_count': 9})
+
+        stored = Round.query.get(round_id)
+        assert stored.expected_holes == 9
+        assert stored.is_complete is True
+
+    def test_backfill_completion(self, app, test_user, test_course):
+        """Backfill recomputes the summary for rows written outside the services"""
+        tee_set = TeeSet.query.filter_by(course_id=test_course.id).first()
+        round = Round(user_id=test_user.id, course_id=test_course.id, tee_set_id=tee_set.id, expected_holes=0)
+        db.session.add(round)
+        db.session.flush()
+        for hole in Hole.query.filter_by(course_id=test_course.id).all():
+            db.session.add(Score(round_id=round.id, hole_id=hole.id, strokes=4))
+        db.session.commit()
+        assert round.is_complete is False
+
+        updated = RoundService.backfill_completion()
+
+        db.session.expire_all()
+        stored = Round.query.get(round.id)
+        assert updated == 1
+        assert stored.holes_played == 18
+        assert stored.expected_holes == 18
+        assert stored.is_complete is True
+
+    def test_backfill_cli_command(self, app, make_round, runner):
+        """The backfill is exposed as a Flask CLI command"""
+        make_round()
+        result = runner.invoke(args=['rounds', 'backfill-summary'])
+        assert result.exit_code == 0
+        assert 'Backfilled completion summary for 1 round(s)' in result.output
@@ -0,0 +1,152 @@
+"""
+Scorecard submission tests: one-transaction upsert of a round's scores
+"""
+import pytest
+from datetime import date
+from app.extensions import db
+from app.models.round import Round
+from app.models.score import Score
+from app.models.tee_set import TeeSet
+from app.services.score_service import ScoreService
+
+
+@pytest.fixture
+def test_round(app, test_user, test_course):
+    """An empty round on the test course with a course handicap of 18"""
+    tee_set = TeeSet.query.filter_by(course_id=test_course.id).first()
+    round = Round(
+        user_id=test_user.id,
+        course_id=test_course.id,
+        tee_set_id=tee_set.id,
+        date_played=date(2024, 6, 1),
+        course_handicap=18,
+        course_rating=72.1,
+        slope_rating=125
+    )
+    db.session.add(round)
+    db.session.commit()
+    return round
+
+
+def _full_card(strokes=5):
+    return [{'hole_number': number, 'strokes': strokes} for number in range(1, 19)]
+
+
+def _reference(round_id):
+    """Round totals as the per-object calculation computes them"""
+    round = db.session.get(Round, round_id)
+    db.session.refresh(round)
+    points = {score.hole.hole_number: score.calculate_stableford_points(round.course_handicap)
+              for score in round.scores}
+    return round, points
+
+
+class TestSubmitScorecard:
+    """Test ScoreService.submit_scorecard"""
+
+    def test_full_card_in_few_queries(self, app, test_round, query_budget):
+        """An 18-hole card costs a fixed handful of statements"""
+        round_id = test_round.id
+        db.session.expire_all()
+
+        # Round, holes, current card, the upsert, hole statistics and the round UPDATE
+        with query_budget(6):
+            result = ScoreService.submit_scorecard(round_id, _full_card())
+
+        assert len(result['scores']) == 18
+        assert result['unchanged'] == 0
+        assert result['round']['total_score'] == 90
+        assert result['round']['holes_played'] == 18
+        assert result['round']['is_complete'] is True
+
+    def test_matches_per_score_calculation(self, app, test_round):
+        """Points, totals and differential match the ORM calculation"""
+        card = [{'hole_number': number, 'strokes': 3 + number % 4} for number in range(1, 19)]
+        result = ScoreService.submit_scorecard(test_round.id, card)
+
+        round, points = _reference(test_round.id)
+        assert {score['hole_number']: score['points'] for score in result['scores']} == points
+        assert round.total_points == sum(points.values())
+        assert round.total_score == sum(hole['strokes'] for hole in card)
+        assert round.differential == round.calculate_differential()
+        assert result['scores'][0]['score_name'] is not None
+
+    def test_partial_card_updates_only_changes(self, app, test_round):
+        """Resending a card writes only the holes that changed"""
+        ScoreService.submit_scorecard(test_round.id, _full_card()[:9])
+        first = {score.hole_id: score.id for score in Score.query.filter_by(round_id=test_round.id)}
+
+        card = _full_card()[:10]
+        card[2]['strokes'] = 3
+        result = ScoreService.submit_scorecard(test_round.id, card)
+
+        assert sorted(score['hole_number'] for score in result['scores']) == [3, 10]
+        assert result['unchanged'] == 8
+        assert result['round']['holes_played'] == 10
+        assert result['round']['is_complete'] is False
+        # Updated in place, not re-created
+        updated = Score.query.filter_by(round_id=test_round.id).all()
+        assert all(first[score.hole_id] == score.id for score in updated if score.hole_id in first)
+
+    def test_unchanged_card_writes_nothing(self, app, test_round, query_budget):
+        """An identical resend is read-only"""
+        ScoreService.submit_scorecard(test_round.id, _full_card())
+        db.session.expire_all()
+
+        with query_budget(3) as statements:
+            result = ScoreService.submit_scorecard(test_round.id, _full_card())
+
+        assert result['scores'] == []
+        assert result['unchanged'] == 18
+        assert all(statement.lstrip().upper().startswith('SELECT') for statement in statements)
+
+    def test_invalid_card_reports_every_error(self, app, test_round):
+        """All bad holes are reported together and nothing is written"""
+        card = [
+            {'hole_number': 1, 'strokes': 0},
+            {'hole_number': 2, 'strokes': 25},
+            {'hole_number': 3, 'strokes': 4},
+            {'hole_number': 3, 'strokes': 5},
+        ]
+        with pytest.raises(ValueError) as excinfo:
+            ScoreService.submit_scorecard(test_round.id, card)
+
+        message = str(excinfo.value)
+        assert 'hole 1' in message and 'hole 2' in message and 'hole 3 is listed' in message
+        assert Score.query.count() == 0
+
+    def test_unknown_hole(self, app, test_round):
+        """Holes missing from the course are rejected"""
+        with pytest.raises(ValueError, match='19'):
+            ScoreService.submit_scorecard(test_round.id, [{'hole_number': 19, 'strokes': 4}])
+
+    def test_unknown_round(self, app):
+        """Unknown rounds are rejected"""
+        with pytest.raises(ValueError, match='Round not found'):
+            ScoreService.submit_scorecard(999, _full_card())
+
+    def test_endpoint(self, client, auth_headers, test_round):
+        """PUT /scores/round/<id>/scorecard saves the card"""
+        response = client.put(
+            f'/api/v1/scores/round/{test_round.id}/scorecard',
+            json={'hole_scores': _full_card(4)},
+            headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data['count'] == 18
+        assert data['data']['round']['total_score'] == 72
+
+    def test_endpoint_validates_rows(self, client, auth_headers, test_round):
+        """Rows are checked by HoleScoreSchema before the service runs"""
+        response = client.put(
+            f'/api/v1/scores/round/{test_round.id}/scorecard',
+            json={'hole_scores': [{'hole_number': 1, 'strokes': 0}, {'hole_number': 2}]},
+            headers=auth_headers
+        )
+
+        assert response.status_code == 400
+        details = response.get_json()['details']['hole_scores']
+        assert 'strokes' in details['0'] and 'strokes' in details['1']
+        assert Score.query.count() == 0
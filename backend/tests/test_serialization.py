@@ -0,0 +1,143 @@
+"""
+Response serialization tests: FastJSONProvider and compiled model serializers
+"""
+import json
+import pytest
+from datetime import date, datetime
+from decimal import Decimal
+from app.extensions import db
+from app.instrumentation import TimedJSONProvider
+from app.json_provider import FastJSONProvider, orjson
+from app.models.club import Club
+from app.models.course import Course
+from app.models.handicap import Handicap
+from app.models.round import Round
+from app.models.score import Score
+from app.models.tee_set import TeeSet
+from app.models.user import User
+from app.serializers import CLUB, COURSE, HANDICAP, ROUND, SCORE, TEE_SET, USER_SENSITIVE, ModelSerializer
+from app.services.round_service import RoundService
+from app.services.score_service import ScoreService
+
+
+@pytest.fixture
+def played_round(app, test_user, test_course):
+    """A round with three scores and a current handicap for the player"""
+    tee_set = TeeSet.query.filter_by(course_id=test_course.id).first()
+    round = RoundService.create_round({
+        'user_id': test_user.id,
+        'course_id': test_course.id,
+        'tee_set_id': tee_set.id,
+        'date_played': date(2024, 6, 1),
+        'handicap_used': 12.0
+    })
+    ScoreService.create_scores_for_holes(round['id'], [
+        {'hole_number': 1, 'strokes': 3}, {'hole_number': 2, 'strokes': 4}, {'hole_number': 3, 'strokes': 6}
+    ])
+    db.session.add(Handicap(user_id=test_user.id, created_by_id=test_user.id,
+                            handicap_value=12.0, start_date=date(2024, 1, 1)))
+    db.session.commit()
+    return db.session.get(Round, round['id'])
+
+
+def _encoded(app, data):
+    """Decoded JSON as clients see it"""
+    return json.loads(app.json.dumps(data))
+
+
+class TestModelSerializers:
+    """Test that compiled serializers encode like to_dict()"""
+
+    def test_round_matches_to_dict(self, app, played_round):
+        """Rounds, including computed net_score and is_complete"""
+        assert _encoded(app, ROUND.serialize(played_round)) == played_round.to_dict()
+
+    def test_score_matches_to_dict(self, app, played_round):
+        """Scores, including score_to_par, score_name and hole details"""
+        for score in played_round.scores:
+            assert _encoded(app, SCORE.serialize(score)) == score.to_dict()
+        assert list(SCORE.serialize(played_round.scores[0])) == list(played_round.scores[0].to_dict())
+
+    def test_user_matches_to_dict(self, app, played_round):
+        """Users with sensitive fields, full_address and current_handicap"""
+        user = db.session.get(User, played_round.user_id)
+        user.city, user.country, user.last_login = 'Oslo', 'Norway', datetime(2024, 6, 1, 12, 30, 15, 250)
+
+        assert _encoded(app, USER_SENSITIVE.serialize(user)) == user.to_dict(include_sensitive=True)
+
+    def test_catalog_matches_to_dict(self, app, played_round):
+        """Clubs, courses with holes and tee sets, and handicaps"""
+        course = db.session.get(Course, played_round.course_id)
+        club = db.session.get(Club, course.club_id)
+        handicap = Handicap.query.filter_by(user_id=played_round.user_id).one()
+
+        assert _encoded(app, CLUB.serialize(club)) == club.to_dict()
+        assert _encoded(app, COURSE.one(course, COURSE.default + ('holes', 'tee_sets'))) == \
+            course.to_dict(include_holes=True, include_tee_sets=True)
+        assert _encoded(app, TEE_SET.one(course.tee_sets[0], TEE_SET.default + ('tee_positions',))) == \
+            course.tee_sets[0].to_dict(include_positions=True)
+        assert _encoded(app, HANDICAP.serialize(handicap)) == handicap.to_dict()
+
+    def test_values_stay_native(self, played_round):
+        """Dates are left to the JSON provider"""
+        data = ROUND.serialize(played_round)
+        assert data['date_played'] == date(2024, 6, 1)
+        assert isinstance(data['created_at'], datetime)
+
+    def test_field_sets_are_compiled_once(self):
+        """A field set compiles to one cached function"""
+        subset = ROUND.compile(('id', 'total_score'))
+
+        assert ROUND.compile(('id', 'total_score')) is subset
+        assert subset(Round(id=7, total_score=85)) == {'id': 7, 'total_score': 85}
+
+    def test_invalid_declarations(self):
+        """Unknown fields and non-attribute paths are rejected"""
+        with pytest.raises(ValueError):
+            ROUND.compile(('id', 'password'))
+        with pytest.raises(ValueError):
+            ModelSerializer('bad', Round, {'id': 'id); import os; (x'})
+
+
+class TestFastJSONProvider:
+    """Test the application JSON provider"""
+
+    def test_installed_under_instrumentation(self, app):
+        """Instrumentation times the fast provider"""
+        assert isinstance(app.json, TimedJSONProvider)
+        assert isinstance(app.json.provider, FastJSONProvider)
+        assert app.json.provider.backend == ('orjson' if orjson else 'stdlib')
+
+    def test_native_types(self, app):
+        """Datetimes and dates encode as ISO 8601, decimals as strings"""
+        data = {'played': date(2024, 6, 1), 'at': datetime(2024, 6, 1, 9, 5), 'rating': Decimal('72.1'), 3: 'key'}
+
+        assert _encoded(app, data) == {
+            'played': '2024-06-01', 'at': '2024-06-01T09:05:00', 'rating': '72.1', '3': 'key'
+        }
+
+    def test_stdlib_backend(self, app):
+        """The stdlib backend produces compact responses"""
+        provider = FastJSONProvider(app, 'stdlib')
+        with app.test_request_context():
+            response = provider.response({'b': 1, 'a': date(2024, 6, 1)})
+
+        assert response.get_data(as_text=True) == '{"b":1,"a":"2024-06-01"}\n'
+        assert response.mimetype == 'application/json'
+
+    def test_backend_validation(self, app):
+        """Unknown backends fail, and orjson must be installed when required"""
+        with pytest.raises(ValueError):
+            FastJSONProvider(app, 'ujson')
+        if orjson is None:
+            with pytest.raises(RuntimeError):
+                FastJSONProvider(app, 'orjson')
+
+    def test_list_endpoints(self, app, client, auth_headers, played_round):
+        """Round and score lists keep their wire format"""
+        rounds = client.get(f'/api/v1/rounds/user/{played_round.user_id}', headers=auth_headers).get_json()['data']
+        scores = client.get(f'/api/v1/scores/round/{played_round.id}', headers=auth_headers).get_json()['data']
+
+        assert rounds == [db.session.get(Round, played_round.id).to_dict()]
+        assert scores == [score.to_dict() for score in Score.query.filter_by(round_id=played_round.id)
+                          .order_by(Score.hole_id)]
@@ -0,0 +1,203 @@
+"""
+Sparse fieldset tests: fields= / include= on /api/v1 list and detail endpoints
+"""
+import pytest
+from datetime import date
+from app.extensions import db
+from app.models.tee_set import TeeSet
+from app.models.handicap import Handicap
+from app.services.course_service import CourseService
+from app.services.handicap_service import HandicapService
+from app.services.round_service import RoundService
+from app.services.score_service import ScoreService
+from app.services.user_service import UserService
+
+
+@pytest.fixture
+def rounds(app, test_user, test_course):
+    """Three rounds of three scores each"""
+    tee_set = TeeSet.query.filter_by(course_id=test_course.id).first()
+    created = []
+    for day in (1, 2, 3):
+        round = RoundService.create_round({
+            'user_id': test_user.id,
+            'course_id': test_course.id,
+            'tee_set_id': tee_set.id,
+            'date_played': date(2024, 6, day),
+            'handicap_used': 12.0
+        })
+        ScoreService.create_scores_for_holes(round['id'], [
+            {'hole_number': n, 'strokes': 4} for n in (1, 2, 3)
+        ])
+        created.append(round['id'])
+    db.session.expire_all()
+    return created
+
+
+class TestRoundFields:
+    """Test sparse rounds"""
+
+    def test_list_selects_requested_columns(self, app, test_user, rounds, query_budget):
+        """Only the requested fields are returned and selected"""
+        with query_budget(1) as statements:
+            data, meta = RoundService.list_rounds_by_user(test_user.id, limit=2, fields='id,total_score')
+
+        assert data == [{'id': rounds[2], 'total_score': 12}, {'id': rounds[1], 'total_score': 12}]
+        assert meta['has_more'] is True
+        assert 'rounds.total_score' in statements[0]
+        assert 'rounds.course_handicap' not in statements[0]
+
+        # The cursor still works (sort keys are loaded even when not requested)
+        data, _ = RoundService.list_rounds_by_user(test_user.id, limit=2, cursor=meta['next_cursor'], fields='id')
+        assert data == [{'id': rounds[0]}]
+
+    def test_include_scores(self, app, test_user, rounds, query_budget):
+        """include=scores nests the scores without one query per round"""
+        with query_budget(2):
+            data, _ = RoundService.list_rounds_by_user(test_user.id, fields='id', include='scores')
+
+        assert [len(round['scores']) for round in data] == [3, 3, 3]
+        assert data[0]['scores'][0]['hole_par'] == 4
+
+    def test_detail_endpoint(self, client, auth_headers, rounds):
+        """Round details accept fields= and keep include_scores"""
+        response = client.get(f'/api/v1/rounds/{rounds[0]}?fields=date_played,net_score&include_scores=true',
+                              headers=auth_headers)
+
+        data = response.get_json()['data']
+        assert set(data) == {'date_played', 'net_score', 'scores'}
+        assert data['date_played'] == '2024-06-01'
+
+    def test_unknown_field(self, client, auth_headers, test_user, rounds):
+        """Unknown fields and includes are rejected with 400"""
+        response = client.get(f'/api/v1/rounds/user/{test_user.id}?fields=id,password', headers=auth_headers)
+        assert response.status_code == 400
+        assert 'password' in response.get_json()['message']
+
+        response = client.get(f'/api/v1/rounds/{rounds[0]}?include=course', headers=auth_headers)
+        assert response.status_code == 400
+
+    def test_etag_covers_included_scores(self, client, auth_headers, test_user, rounds):
+        """With include=scores a score change invalidates the list's ETag"""
+        url = f'/api/v1/rounds/user/{test_user.id}?fields=id&include=scores'
+        etag = client.get(url, headers=auth_headers).headers['ETag']
+        assert etag != client.get(f'/api/v1/rounds/user/{test_user.id}', headers=auth_headers).headers['ETag']
+
+        score = ScoreService.get_scores_by_round(rounds[0], fields='id')[0]
+        ScoreService.update_score(score['id'], {'strokes': 5})
+
+        response = client.get(url, headers={**auth_headers, 'If-None-Match': etag})
+        assert response.status_code == 200
+
+
+class TestScoreFields:
+    """Test sparse scores"""
+
+    def test_list_and_detail(self, client, auth_headers, rounds):
+        """Scores honour fields= in lists and details"""
+        scores = client.get(f'/api/v1/scores/round/{rounds[0]}?fields=hole_number,score_name',
+                            headers=auth_headers).get_json()['data']
+        assert scores == [
+            {'score_name': name, 'hole_number': n} for n, name in ((1, 'Par'), (2, 'Par'), (3, 'Bogey'))
+        ]
+
+        score = ScoreService.get_score_by_id(ScoreService.get_scores_by_round(rounds[0])[0]['id'], fields='strokes')
+        assert score == {'strokes': 4}
+
+
+class TestUserFields:
+    """Test sparse users"""
+
+    def test_list_skips_current_handicap(self, app, admin_user, test_user, query_budget):
+        """Without current_handicap the handicap query is skipped"""
+        with query_budget(1) as statements:
+            users, _ = UserService.list_users(fields='id,email')
+
+        assert users == [{'id': admin_user.id, 'email': admin_user.email},
+                         {'id': test_user.id, 'email': test_user.email}]
+        assert 'handicaps' not in statements[0]
+
+        # Page, current handicaps and the page-number count
+        with query_budget(3):
+            users, _ = UserService.get_all_users(fields='full_name,current_handicap')
+        assert users[0] == {'full_name': 'Admin User', 'current_handicap': None}
+
+    def test_list_endpoint(self, client, admin_headers, admin_user):
+        """The admin user list accepts fields="""
+        response = client.get('/api/v1/users/?fields=id,is_admin', headers=admin_headers)
+
+        assert response.status_code == 200
+        assert {'id': admin_user.id, 'is_admin': True} in response.get_json()['data']['users']
+
+    def test_sensitive_fields_need_admin(self, client, auth_headers, test_user):
+        """Users reading themselves cannot select sensitive fields"""
+        response = client.get(f'/api/v1/users/{test_user.id}?fields=id,full_address', headers=auth_headers)
+        assert response.get_json()['data'] == {'id': test_user.id, 'full_address': ''}
+
+        response = client.get(f'/api/v1/users/{test_user.id}?fields=password_reset_token', headers=auth_headers)
+        assert response.status_code == 400
+
+
+class TestCatalogFields:
+    """Test sparse clubs, courses, holes and tee sets"""
+
+    def test_course_list_skips_holes(self, app, test_course, query_budget):
+        """Holes are only loaded when total_par is requested"""
+        with query_budget(1) as statements:
+            courses, _ = CourseService.list_courses(fields='id,name')
+        assert courses == [{'id': test_course.id, 'name': 'Test Course'}]
+        assert 'holes' not in statements[0]
+
+        with query_budget(2):
+            courses, _ = CourseService.list_courses(fields='total_par')
+        assert courses == [{'total_par': 72}]
+
+    def test_club_and_course_details(self, client, auth_headers, test_course):
+        """Details accept fields= and include= alongside the legacy flags"""
+        club = client.get(f'/api/v1/clubs/{test_course.club_id}?include_courses=true&fields=name',
+                          headers=auth_headers).get_json()['data']
+        assert set(club) == {'name', 'courses', 'course_count'}
+        assert club['course_count'] == 1
+        assert club['courses'][0]['total_par'] == 72
+
+        course = client.get(f'/api/v1/courses/{test_course.id}?fields=id&include=tee_sets',
+                            headers=auth_headers).get_json()['data']
+        assert course['id'] == test_course.id
+        assert [tee_set['name'] for tee_set in course['tee_sets']] == ['Yellow']
+
+        course = client.get(f'/api/v1/courses/{test_course.id}?full_details=true&fields=name',
+                            headers=auth_headers).get_json()['data']
+        assert set(course) == {'name', 'holes', 'tee_sets', 'club'}
+
+    def test_cached_layouts_are_trimmed(self, client, auth_headers, test_course):
+        """Holes and tee sets served from the catalog snapshot honour fields="""
+        holes = client.get(f'/api/v1/holes/course/{test_course.id}?fields=hole_number,par',
+                           headers=auth_headers).get_json()['data']
+        assert holes[:2] == [{'hole_number': 1, 'par': 4}, {'hole_number': 2, 'par': 4}]
+
+        tee_sets = client.get(f'/api/v1/tee-sets/course/{test_course.id}?fields=name&include=tee_positions',
+                              headers=auth_headers).get_json()['data']
+        assert tee_sets == [{'name': 'Yellow', 'tee_positions': []}]
+
+    def test_unknown_fields(self, client, auth_headers, test_course):
+        """Unknown fields are rejected with 400 on catalog endpoints too"""
+        for url in ('/api/v1/courses?fields=slope', f'/api/v1/clubs/{test_course.club_id}?include=members',
+                    f'/api/v1/holes/course/{test_course.id}?fields=yardage'):
+            response = client.get(url, headers=auth_headers)
+            assert response.status_code == 400, url
+
+
+class TestHandicapFields:
+    """Test sparse handicaps"""
+
+    def test_history_fields(self, client, auth_headers, test_user):
+        """Handicap history and current handicap accept fields="""
+        db.session.add(Handicap(user_id=test_user.id, created_by_id=test_user.id,
+                                handicap_value=12.0, start_date=date(2024, 1, 1)))
+        db.session.commit()
+
+        assert HandicapService.get_user_handicap_history(test_user.id, fields='handicap_value,is_current') == \
+            [{'handicap_value': 12.0, 'is_current': True}]
+
+        response = client.get('/api/v1/handicaps/my-handicaps/current?fields=start_date', headers=auth_headers)
+        assert response.get_json()['data'] == {'start_date': '2024-01-01'}
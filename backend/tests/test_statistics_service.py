@@ -0,0 +1,130 @@
+"""
+Statistics engine tests: SQL aggregates must match the original Python computations
+"""
+import pytest
+from datetime import date
+from app.models.round import Round
+from app.services.round_service import RoundService
+from app.services.statistics_service import StatisticsService
+from app.services.user_service import UserService
+
+
+# (date_played, total_score, differential, is_complete)
+ROUNDS = [
+    (date(2024, 4, 2), 90, 16.0, True),
+    (date(2024, 4, 20), 84, 10.7, True),
+    (date(2024, 5, 11), None, None, True),
+    (date(2024, 5, 11), 0, 0.0, True),
+    (date(2024, 5, 30), 101, None, False),
+    (date(2025, 1, 5), 88, 14.2, True),
+    (date(2025, 1, 5), 86, 12.4, True),
+    (date(2024, 12, 24), 95, 0.0, True),
+]
+
+
+def _seed(make_round, rounds=ROUNDS):
+    for played, total, differential, complete in rounds:
+        make_round(
+            date_played=played,
+            total_score=total,
+            differential=differential,
+            holes_played=18 if complete else 9,
+            is_complete=complete
+        )
+
+
+def _python_round_stats(user_id):
+    """Reference implementation of the original RoundService.get_user_stats loop"""
+    rounds = Round.query.filter_by(user_id=user_id).order_by(Round.id).all()
+    completed = [r for r in rounds if r.is_complete]
+    scores = [r.total_score for r in completed if r.total_score]
+    differentials = [r.differential for r in completed if r.differential]
+    return {
+        'total_rounds': len(rounds),
+        'completed_rounds': len(completed),
+        'average_score': round(sum(scores) / len(scores), 1) if scores else None,
+        'best_score': min(scores) if scores else None,
+        'latest_differential': differentials[-1] if differentials else None
+    }
+
+
+class TestStatisticsService:
+    """Test the aggregate statistics engine"""
+
+    def test_matches_python_round_stats(self, app, make_round, test_user):
+        """RoundService.get_user_stats returns the same values as the old loop"""
+        _seed(make_round)
+        expected = _python_round_stats(test_user.id)
+
+        stats = RoundService.get_user_stats(test_user.id)
+
+        for key, value in expected.items():
+            assert stats[key] == value, key
+
+    def test_user_statistics_latest_played_round(self, app, make_round, test_user):
+        """UserService picks the differential of the most recently played completed round"""
+        _seed(make_round)
+
+        stats = UserService.get_user_statistics(test_user.id)
+
+        # Two completed rounds on 2025-01-05: the first entered wins, as max() did
+        assert stats['latest_differential'] == 14.2
+        assert stats['best_score'] == 84
+        assert stats['average_score'] == round((90 + 84 + 88 + 86 + 95) / 5, 1)
+        assert stats['total_rounds'] == 8
+        assert stats['completed_rounds'] == 7
+
+    def test_rounds_per_period(self, app, make_round, test_user):
+        """Rounds are grouped per month and per year, oldest first"""
+        _seed(make_round)
+
+        monthly = StatisticsService.get_round_statistics(test_user.id)['rounds_per_period']
+        yearly = StatisticsService.get_round_statistics(test_user.id, period='year')['rounds_per_period']
+
+        assert monthly == [
+            {'period': '2024-04', 'rounds': 2, 'completed_rounds': 2},
+            {'period': '2024-05', 'rounds': 3, 'completed_rounds': 2},
+            {'period': '2024-12', 'rounds': 1, 'completed_rounds': 1},
+            {'period': '2025-01', 'rounds': 2, 'completed_rounds': 2},
+        ]
+        assert yearly == [
+            {'period': '2024', 'rounds': 6, 'completed_rounds': 5},
+            {'period': '2025', 'rounds': 2, 'completed_rounds': 2},
+        ]
+
+    def test_no_rounds(self, app, test_user):
+        """Users without rounds get empty statistics"""
+        stats = RoundService.get_user_stats(test_user.id)
+        assert stats['total_rounds'] == 0
+        assert stats['average_score'] is None
+        assert stats['rounds_per_period'] == []
+
+        user_stats = UserService.get_user_statistics(test_user.id)
+        assert user_stats['completed_rounds'] == 0
+        assert 'best_score' not in user_stats
+        assert 'latest_differential' not in user_stats
+
+    def test_only_incomplete_rounds(self, app, make_round, test_user):
+        """Incomplete rounds count towards totals only"""
+        _seed(make_round, rounds=[(date(2024, 6, 1), 45, 3.0, False)])
+
+        assert RoundService.get_user_stats(test_user.id) == {
+            'total_rounds': 1,
+            'completed_rounds': 0,
+            'average_score': None,
+            'best_score': None,
+            'latest_differential': None,
+            'rounds_per_period': [{'period': '2024-06', 'rounds': 1, 'completed_rounds': 0}]
+        }
+
+    def test_single_round_trip(self, app, make_round, test_user, query_budget):
+        """All aggregates are computed in one statement"""
+        _seed(make_round)
+
+        with query_budget(1):
+            StatisticsService.get_round_statistics(test_user.id)
+
+    def test_invalid_period(self, app, test_user):
+        """Unsupported periods are rejected"""
+        with pytest.raises(ValueError):
+            StatisticsService.get_round_statistics(test_user.id, period='week')
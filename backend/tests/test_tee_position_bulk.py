@@ -0,0 +1,133 @@
+"""
+Bulk tee position tests: set-based creation and distance updates across tee sets
+"""
+import pytest
+from app.extensions import db
+from app.models.course import Course
+from app.models.tee_position import TeePosition
+from app.models.tee_set import TeeSet
+from app.services.tee_position_service import TeePositionService
+
+
+DISTANCES = [380, 165, 420, 340, 520, 380, 155, 410, 390, 350, 545, 380, 175, 360, 495, 370, 145, 525]
+
+
+@pytest.fixture
+def tee_sets(app, test_course):
+    """The course's Yellow tee set plus Red and White"""
+    for name in ('Red', 'White'):
+        db.session.add(TeeSet(name=name, slope_rating=120, course_rating=70.0, course_id=test_course.id))
+    db.session.commit()
+    return [tee_set.id for tee_set in TeeSet.query.order_by(TeeSet.id).all()]
+
+
+class TestCreateTeePositions:
+    """Test set-based tee position creation"""
+
+    def test_many_tee_sets_in_fixed_queries(self, app, tee_sets, query_budget):
+        """Three tee sets cost the same statements as one"""
+        db.session.expire_all()
+        distances = {tee_set_id: [d - 10 * i for d in DISTANCES] for i, tee_set_id in enumerate(tee_sets)}
+
+        # Tee sets, holes, existing check, INSERT, version bump
+        with query_budget(5):
+            positions = TeePositionService.create_tee_positions_for_tee_sets(distances)
+
+        assert len(positions) == 54
+        assert TeePosition.query.count() == 54
+        assert positions[0]['hole_number'] == 1 and positions[0]['par'] == 4
+        assert positions[18]['tee_set_id'] == tee_sets[1]
+        assert positions[18]['length'] == DISTANCES[0] - 10
+
+    def test_single_tee_set(self, app, tee_sets, test_course):
+        """The single tee set form keeps its behaviour and bumps the catalog"""
+        positions = TeePositionService.create_tee_positions_for_tee_set(tee_sets[0], DISTANCES)
+
+        assert [position['length'] for position in positions] == DISTANCES
+        assert all(position['id'] for position in positions)
+        assert db.session.get(Course, test_course.id).catalog_version == 2
+
+        with pytest.raises(ValueError, match='already has positions'):
+            TeePositionService.create_tee_positions_for_tee_set(tee_sets[0], DISTANCES)
+
+    def test_wrong_count_writes_nothing(self, app, tee_sets):
+        """A bad tee set rejects the whole batch"""
+        with pytest.raises(ValueError, match='must match number of holes'):
+            TeePositionService.create_tee_positions_for_tee_sets({tee_sets[0]: DISTANCES, tee_sets[1]: DISTANCES[:9]})
+
+        assert TeePosition.query.count() == 0
+
+    def test_unknown_tee_sets(self, app, tee_sets):
+        """Unknown tee sets are all reported"""
+        with pytest.raises(ValueError, match='998, 999'):
+            TeePositionService.create_tee_positions_for_tee_sets({998: DISTANCES, 999: DISTANCES})
+
+    def test_standard_distances(self, app, tee_sets):
+        """Standard distances go through the same insert"""
+        positions = TeePositionService.create_standard_distances_by_par(tee_sets[0], 'hard')
+
+        assert len(positions) == 18
+        assert all(150 <= position['length'] <= 550 for position in positions)
+
+
+class TestBulkUpdateDistances:
+    """Test set-based distance updates"""
+
+    def test_many_tee_sets_in_fixed_queries(self, app, tee_sets, query_budget):
+        """Updates across tee sets are one UPDATE statement"""
+        TeePositionService.create_tee_positions_for_tee_sets({tee_set_id: DISTANCES for tee_set_id in tee_sets})
+        db.session.expire_all()
+        updates = {
+            tee_set_id: [{'hole_number': number, 'length': 200 + i} for number in (1, 5, 18)]
+            for i, tee_set_id in enumerate(tee_sets)
+        }
+
+        # Tee sets, positions with holes, UPDATE, version bump
+        with query_budget(4) as statements:
+            positions = TeePositionService.bulk_update_distances_for_tee_sets(updates)
+
+        assert sum(statement.startswith('UPDATE tee_positions') for statement in statements) == 1
+        assert len(positions) == 9
+        assert {position['length'] for position in positions} == {200, 201, 202}
+        db.session.expire_all()
+        lengths = {(p.tee_set_id, p.hole.hole_number): p.length for p in TeePosition.query.all()}
+        assert lengths[(tee_sets[2], 18)] == 202
+        assert lengths[(tee_sets[2], 2)] == DISTANCES[1]
+
+    def test_single_tee_set(self, app, tee_sets):
+        """The single tee set form keeps its behaviour"""
+        TeePositionService.create_tee_positions_for_tee_set(tee_sets[0], DISTANCES)
+
+        positions = TeePositionService.bulk_update_distances(tee_sets[0], [{'hole_number': 2, 'length': 180}])
+
+        assert positions[0]['hole_number'] == 2
+        assert positions[0]['length'] == 180
+
+    def test_errors_reported_together(self, app, tee_sets):
+        """Every bad entry is reported and nothing is written"""
+        TeePositionService.create_tee_positions_for_tee_set(tee_sets[0], DISTANCES)
+
+        with pytest.raises(ValueError) as excinfo:
+            TeePositionService.bulk_update_distances(tee_sets[0], [
+                {'hole_number': 1, 'length': 10},
+                {'hole_number': 2, 'length': 200},
+                {'hole_number': 19, 'length': 200},
+            ])
+
+        assert 'hole 1 must be between' in str(excinfo.value)
+        assert 'hole 19' in str(excinfo.value)
+        db.session.expire_all()
+        assert {p.length for p in TeePosition.query.filter_by(tee_set_id=tee_sets[0])} == set(DISTANCES)
+
+    def test_endpoint_accepts_many_tee_sets(self, client, admin_headers, tee_sets):
+        """The bulk endpoints take a 'tee_sets' list"""
+        response = client.post('/api/v1/tee-positions/bulk', headers=admin_headers, json={
+            'tee_sets': [{'tee_set_id': tee_set_id, 'distances': DISTANCES} for tee_set_id in tee_sets]
+        })
+        assert response.status_code == 201
+        assert response.get_json()['count'] == 54
+
+        response = client.put('/api/v1/tee-positions/bulk-update', headers=admin_headers, json={
+            'tee_sets': [{'tee_set_id': tee_sets[0], 'distances': [{'hole_number': 1, 'length': 300}]}] * 2
+        })
+        assert response.status_code == 400
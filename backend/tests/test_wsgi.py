@@ -0,0 +1,77 @@
+"""
+WSGI serving tests: gunicorn sizing and pool configuration
+"""
+import os
+import runpy
+import sys
+import types
+import pytest
+from app import create_app
+from app.config import TestingConfig, engine_profile
+from app.extensions import db
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), '..', 'gunicorn.conf.py')
+
+
+@pytest.fixture
+def load_config(monkeypatch):
+    """Load gunicorn.conf.py with a clean environment and a fixed CPU count"""
+    for name in ['DB_ENGINE_PROFILE', 'DB_POOL_SIZE', 'DB_MAX_OVERFLOW', 'GUNICORN_WORKERS', 'GUNICORN_THREADS',
+                 'GUNICORN_WORKER_CLASS', 'GUNICORN_BIND', 'PORT', 'MAIL_OUTBOX_WORKERS', 'IMPORT_WORKERS']:
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setattr('multiprocessing.cpu_count', lambda: 4)
+
+    def load(**env):
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+        return runpy.run_path(CONFIG_PATH)
+    return load
+
+
+class TestGunicornConfig:
+    """Test gunicorn.conf.py sizing"""
+
+    def test_sync_workers(self, load_config):
+        """Sync workers default to 2 x CPUs + 1 with one pooled connection per worker"""
+        config = load_config()
+
+        assert config['worker_class'] == 'sync'
+        assert config['workers'] == 9
+        assert config['threads'] == 1
+        assert config['preload_app'] is True
+        assert config['bind'] == '0.0.0.0:5000'
+        assert os.environ['DB_ENGINE_PROFILE'] == 'sync'
+        assert os.environ['DB_POOL_SIZE'] == '1'
+        # Email outbox (2) and import (1) threads
+        assert os.environ['DB_MAX_OVERFLOW'] == '3'
+
+    def test_threaded_workers(self, load_config):
+        """Threaded workers default to one per CPU, each pooling a connection per thread"""
+        config = load_config(GUNICORN_WORKER_CLASS='gthread', GUNICORN_THREADS='8', PORT='8000')
+
+        assert config['workers'] == 4
+        assert config['threads'] == 8
+        assert config['bind'] == '0.0.0.0:8000'
+        assert os.environ['DB_ENGINE_PROFILE'] == 'threaded'
+        assert os.environ['DB_POOL_SIZE'] == '8'
+
+    def test_explicit_pool_size_wins(self, load_config):
+        """Pool sizes set in the environment are kept"""
+        load_config(DB_POOL_SIZE='20', DB_MAX_OVERFLOW='0')
+
+        settings = engine_profile(os.environ['DB_ENGINE_PROFILE'])
+        assert (settings['pool_size'], settings['max_overflow']) == (20, 0)
+
+    def test_post_fork_disposes_every_engine(self, load_config, monkeypatch, tmp_path):
+        """Workers drop the pools of the primary and the replica inherited from the master"""
+        monkeypatch.setattr(TestingConfig, 'SQLALCHEMY_REPLICA_URI', f"sqlite:///{tmp_path / 'replica.db'}")
+        app = create_app('testing')
+        monkeypatch.setitem(sys.modules, 'wsgi', types.SimpleNamespace(app=app))
+
+        with app.app_context():
+            pools = {key: engine.pool for key, engine in db.engines.items()}
+        load_config()['post_fork'](None, None)
+
+        with app.app_context():
+            assert len(pools) == 2
+            assert all(db.engines[key].pool is not pool for key, pool in pools.items())
@@ -0,0 +1,12 @@
+"""
+WSGI entry point for production servers
+
+    gunicorn --config gunicorn.conf.py wsgi:app
+
+The app is created once at import; gunicorn.conf.py preloads it in the
+master so workers fork with the code already imported.
+"""
+import os
+from app import create_app
+
+app = create_app(os.getenv('FLASK_CONFIG') or 'production')
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Index Benchmark Script
+
+Seeds a synthetic dataset, then runs the hot lookup queries with and
+without the foreign key / lookup index set and prints each query plan and
+its median time side by side.
+
+Usage (from the repository root):
+    python scripts/benchmark-indexes.py                          # temporary SQLite file
+    python scripts/benchmark-indexes.py --database-url postgresql://localhost/rgs_bench
+    python scripts/benchmark-indexes.py --users 2000 --rounds-per-user 20
+
+The target database is dropped and recreated, so never point it at real data.
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+# Add the backend directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend'))
+
+# Indexes under test, by table (created by migration d91f3b6a7c25 and c4e8a1f2b9d0)
+BENCHMARK_INDEXES = {
+    'handicaps': ['ix_handicaps_user_id_start_date', 'ix_handicaps_user_id_end_date', 'ix_handicaps_current_user_id'],
+    'users': ['ix_users_password_reset_token'],
+    'rounds': ['ix_rounds_user_id_date_played_id', 'ix_rounds_course_id'],
+    'scores': ['ix_scores_hole_id'],
+    'tee_positions': ['ix_tee_positions_tee_set_id'],
+}
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Compare query plans before and after the index set')
+    parser.add_argument('--database-url', help='Scratch database (default: temporary SQLite file)')
+    parser.add_argument('--users', type=int, default=1000)
+    parser.add_argument('--rounds-per-user', type=int, default=10)
+    parser.add_argument('--handicaps-per-user', type=int, default=8)
+    parser.add_argument('--courses', type=int, default=10)
+    parser.add_argument('--repeat', type=int, default=50, help='Executions per query for the median')
+    return parser.parse_args()
+
+
+def seed(db, args):
+    """Bulk insert clubs, courses, holes, tee sets, users, handicaps, rounds and scores"""
+    from app.models import Club, Course, Hole, TeeSet, TeePosition, User, Handicap, Round, Score
+
+    def insert(model, rows):
+        if rows:
+            db.session.execute(db.insert(model), rows)
+
+    print(f"🌱 Seeding {args.users} users, {args.users * args.rounds_per_user} rounds...")
+    insert(Club, [{'id': 1, 'name': 'Benchmark Golf Club', 'country': 'Norway'}])
+
+    holes, tee_sets, positions = [], [], []
+    for c in range(1, args.courses + 1):
+        tee_sets.append({'id': c, 'name': 'Yellow', 'course_id': c, 'slope_rating': 125, 'course_rating': 72.0})
+        for n in range(1, 19):
+            hole_id = (c - 1) * 18 + n
+            holes.append({'id': hole_id, 'course_id': c, 'hole_number': n, 'par': 4, 'stroke_index': n})
+            positions.append({'hole_id': hole_id, 'tee_set_id': c, 'length': 350})
+    insert(Course, [{'id': c, 'name': f'Course {c}', 'club_id': 1} for c in range(1, args.courses + 1)])
+    insert(TeeSet, tee_sets)
+    insert(Hole, holes)
+    insert(TeePosition, positions)
+
+    users, handicaps, rounds = [], [], []
+    today = date.today()
+    for u in range(1, args.users + 1):
+        users.append({
+            'id': u, 'email': f'player{u}@bench.test', 'password_hash': 'x',
+            'first_name': 'Player', 'last_name': f'{u:06d}',
+            'password_reset_token': f'token-{u}' if u % 10 == 0 else None
+        })
+        start = today - timedelta(days=30 * args.handicaps_per_user)
+        for h in range(args.handicaps_per_user):
+            end = start + timedelta(days=29) if h < args.handicaps_per_user - 1 else None
+            handicaps.append({
+                'user_id': u, 'created_by_id': u, 'handicap_value': 10 + h % 5,
+                'start_date': start, 'end_date': end
+            })
+            start += timedelta(days=30)
+        for r in range(args.rounds_per_user):
+            rounds.append({
+                'user_id': u, 'course_id': 1 + (u + r) % args.courses, 'tee_set_id': 1 + (u + r) % args.courses,
+                'date_played': today - timedelta(days=r * 7)
+            })
+    insert(User, users)
+    insert(Handicap, handicaps)
+    insert(Round, rounds)
+    db.session.commit()
+
+    scores = []
+    for round_id, course_id in db.session.execute(db.select(Round.id, Round.course_id)):
+        for n in range(18):
+            scores.append({'round_id': round_id, 'hole_id': (course_id - 1) * 18 + n + 1, 'strokes': 5, 'points': 1})
+        if len(scores) >= 50000:
+            insert(Score, scores)
+            scores = []
+    insert(Score, scores)
+    db.session.commit()
+
+
+def benchmark_queries(db, args):
+    """The hot lookups the index set targets, as (label, statement) pairs"""
+    from app.models import Handicap, User, Round, Score, TeePosition
+
+    user_id = args.users // 2
+    on_date = date.today() - timedelta(days=45)
+    return [
+        ('Handicap.get_handicap_on_date', db.select(Handicap).where(
+            Handicap.user_id == user_id,
+            Handicap.start_date <= on_date,
+            db.or_(Handicap.end_date.is_(None), Handicap.end_date >= on_date)
+        ).limit(1)),
+        ('current handicap (end_date IS NULL)', db.select(Handicap).where(
+            Handicap.user_id == user_id, Handicap.end_date.is_(None)
+        ).limit(1)),
+        ('EmailService.verify_reset_token', db.select(User).where(
+            User.password_reset_token == f'token-{args.users // 10 * 10}'
+        ).limit(1)),
+        ('RoundService.get_rounds_by_user', db.select(Round).where(
+            Round.user_id == user_id
+        ).order_by(Round.date_played.desc(), Round.id.desc()).limit(20)),
+        ('rounds by course (bulk recalculation)', db.select(Round.id).where(Round.course_id == 1)),
+        ('scores by hole (bulk recalculation)', db.select(Score.id).where(Score.hole_id == 1)),
+        ('tee positions by tee set', db.select(TeePosition).where(TeePosition.tee_set_id == 1)),
+    ]
+
+
+def explain(db, statement):
+    """Query plan text for a statement on the current dialect"""
+    bind = db.session.get_bind()
+    compiled = statement.compile(dialect=bind.dialect, compile_kwargs={'literal_binds': True})
+    prefix = 'EXPLAIN QUERY PLAN' if bind.dialect.name == 'sqlite' else 'EXPLAIN'
+    rows = db.session.connection().exec_driver_sql(f'{prefix} {compiled}').fetchall()
+    if bind.dialect.name == 'sqlite':
+        return [row[-1] for row in rows]
+    return [row[0] for row in rows]
+
+
+def time_query(db, statement, repeat):
+    """Median execution time in milliseconds"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        db.session.execute(statement).fetchall()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def set_indexes(db, present):
+    """Create or drop the benchmarked indexes"""
+    bind = db.session.connection()
+    for table_name, names in BENCHMARK_INDEXES.items():
+        for index in db.metadata.tables[table_name].indexes:
+            if index.name in names:
+                if present:
+                    index.create(bind, checkfirst=True)
+                else:
+                    index.drop(bind, checkfirst=True)
+    db.session.commit()
+    # Refresh planner statistics
+    db.session.execute(db.text('ANALYZE'))
+    db.session.commit()
+
+
+def main():
+    args = parse_args()
+    scratch = None
+    if not args.database_url:
+        scratch = tempfile.NamedTemporaryFile(suffix='.db', delete=False)
+        args.database_url = f'sqlite:///{scratch.name}'
+    os.environ['DEV_DATABASE_URL'] = args.database_url
+
+    from app import create_app
+    from app.extensions import db
+
+    app = create_app('development')
+    app.config['SQLALCHEMY_ECHO'] = False
+
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        seed(db, args)
+
+        queries = benchmark_queries(db, args)
+        results = {}
+        for label, present in (('before', False), ('after', True)):
+            set_indexes(db, present)
+            for name, statement in queries:
+                results.setdefault(name, {})[label] = (
+                    explain(db, statement),
+                    time_query(db, statement, args.repeat)
+                )
+
+        print(f"\n📊 {db.session.get_bind().dialect.name}, median of {args.repeat} runs\n")
+        for name, runs in results.items():
+            before_plan, before_ms = runs['before']
+            after_plan, after_ms = runs['after']
+            speedup = before_ms / after_ms if after_ms else float('inf')
+            print(f"▶ {name}: {before_ms:.3f} ms → {after_ms:.3f} ms ({speedup:.1f}x)")
+            print("   before: " + "\n           ".join(before_plan))
+            print("   after:  " + "\n           ".join(after_plan))
+            print()
+
+        db.session.remove()
+        db.drop_all()
+
+    if scratch:
+        os.unlink(scratch.name)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+Synthetic Data Generator
+
+Fills a database with realistic clubs, courses, holes, tee sets, tee
+positions, users, handicap histories and years of rounds and scores for
+performance work. Rows are written with bulk inserts in chunks, so large
+datasets (100k users, 5M scores) load in minutes and in bounded memory.
+
+Every generated user can log in with the shared password, and an admin
+account is created alongside (see --password and ADMIN_EMAIL).
+
+Usage (from the repository root):
+    python scripts/generate-data.py --database-url sqlite:///rgs_bench.db --reset
+    python scripts/generate-data.py --database-url postgresql://localhost/rgs_bench --reset --scale large
+    python scripts/generate-data.py --users 5000 --rounds-per-user 40 --years 4
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+# Add the backend directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend'))
+
+USER_EMAIL = 'player{}@rgs.bench'
+ADMIN_EMAIL = 'admin@rgs.bench'
+DEFAULT_PASSWORD = 'BenchPass123!'
+
+# Preset sizes: 'large' is ~100k users and ~5M scores
+SCALES = {
+    'small': {'users': 1000, 'rounds_per_user': 20, 'clubs': 20},
+    'medium': {'users': 10000, 'rounds_per_user': 20, 'clubs': 100},
+    'large': {'users': 100000, 'rounds_per_user': 2.8, 'clubs': 400},
+}
+
+FIRST_NAMES = ['Ola', 'Kari', 'Per', 'Anne', 'Lars', 'Ingrid', 'Jon', 'Sofie', 'Erik', 'Nora',
+               'James', 'Emma', 'Oliver', 'Mia', 'Lucas', 'Ella', 'Henrik', 'Maja', 'Magnus', 'Sara']
+LAST_NAMES = ['Hansen', 'Johansen', 'Olsen', 'Larsen', 'Andersen', 'Pedersen', 'Nilsen', 'Kristiansen',
+              'Jensen', 'Karlsen', 'Smith', 'Brown', 'Wilson', 'Taylor', 'Berg', 'Haugen', 'Bakken']
+CITIES = [('Oslo', 'Norway'), ('Bergen', 'Norway'), ('Trondheim', 'Norway'), ('Stavanger', 'Norway'),
+          ('Stockholm', 'Sweden'), ('Gothenburg', 'Sweden'), ('Copenhagen', 'Denmark'),
+          ('Edinburgh', 'United Kingdom'), ('Dublin', 'Ireland'), ('Hamburg', 'Germany')]
+TEE_SETS = [  # name, course rating offset from par, slope, length factor
+    ('White', 2.5, 135, 1.10),
+    ('Yellow', 0.5, 128, 1.00),
+    ('Blue', -1.0, 122, 0.93),
+    ('Red', -3.0, 115, 0.85),
+]
+HOLE_PARS = [4, 4, 3, 5, 4, 4, 3, 4, 5, 4, 3, 4, 5, 4, 4, 3, 5, 4]  # Par 72
+HOLE_LENGTHS = {3: (130, 200), 4: (300, 420), 5: (440, 540)}
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Generate synthetic RGS data with bulk inserts')
+    parser.add_argument('--database-url', help='Target database (default: DEV_DATABASE_URL)')
+    parser.add_argument('--scale', choices=SCALES, default='small', help='Preset dataset size')
+    parser.add_argument('--users', type=int, help='Number of users (overrides --scale)')
+    parser.add_argument('--rounds-per-user', type=float, help='Mean rounds per user (overrides --scale)')
+    parser.add_argument('--clubs', type=int, help='Number of clubs (overrides --scale)')
+    parser.add_argument('--courses-per-club', type=int, default=2)
+    parser.add_argument('--years', type=int, default=3, help='Years of round history')
+    parser.add_argument('--password', default=DEFAULT_PASSWORD, help='Password for every generated user')
+    parser.add_argument('--chunk-size', type=int, default=1000, help='Users generated per insert batch')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed for reproducible datasets')
+    parser.add_argument('--reset', action='store_true', help='Drop and recreate all tables first (DESTRUCTIVE)')
+    args = parser.parse_args()
+
+    for key, value in SCALES[args.scale].items():
+        if getattr(args, key) is None:
+            setattr(args, key, value)
+    return args
+
+
+class DataGenerator:
+    """Generates and bulk inserts a synthetic dataset"""
+
+    def __init__(self, db, args):
+        self.db = db
+        self.args = args
+        self.random = random.Random(args.seed)
+        self.today = date.today()
+        self.ids = {}
+        self.courses = []  # [(course_id, club_id, holes, tee_sets)]
+        self.counts = {}
+
+    def run(self):
+        """Generate the full dataset"""
+        from app.models import User, Score
+        from werkzeug.security import generate_password_hash
+
+        self.stableford_points = Score.stableford_points
+        self.password_hash = generate_password_hash(self.args.password)
+        for table in ('clubs', 'courses', 'holes', 'tee_sets', 'tee_positions', 'users', 'handicaps', 'rounds', 'scores'):
+            self.ids[table] = self._max_id(table)
+
+        admin_id = self.db.session.execute(
+            self.db.select(User.id).where(User.email == ADMIN_EMAIL)
+        ).scalar()
+        if admin_id is None:
+            admin_id = self._next_id('users')
+            self._insert('users', [self._user_row(admin_id, 'Admin', 'Bench', is_admin=True, email=ADMIN_EMAIL)])
+        self.admin_id = admin_id
+
+        self._generate_catalog()
+        self.db.session.commit()
+
+        started = time.perf_counter()
+        first_user = self.ids['users'] + 1
+        for offset in range(0, self.args.users, self.args.chunk_size):
+            count = min(self.args.chunk_size, self.args.users - offset)
+            self._generate_players(first_user + offset, count)
+            self.db.session.commit()
+            done = offset + count
+            rate = self.counts.get('scores', 0) / max(time.perf_counter() - started, 1e-9)
+            print(f"   {done}/{self.args.users} users, {self.counts.get('scores', 0)} scores ({rate:,.0f} scores/s)")
+
+        self._reset_sequences()
+        return self.counts
+
+    def _generate_catalog(self):
+        """Clubs with courses, 18 holes each, four tee sets and their tee positions"""
+        clubs, courses, holes, tee_sets, positions = [], [], [], [], []
+        for c in range(self.args.clubs):
+            club_id = self._next_id('clubs')
+            city, country = self.random.choice(CITIES)
+            clubs.append({
+                'id': club_id, 'name': f'{city} Golf Club {club_id}', 'city': city, 'country': country,
+                'timezone': 'Europe/Oslo', 'description': f'Synthetic club in {city}'
+            })
+            for n in range(self.args.courses_per_club):
+                course_id = self._next_id('courses')
+                courses.append({'id': course_id, 'name': f'{city} {["Old", "New", "Park", "Links"][n % 4]} Course',
+                                'holes_count': 18, 'club_id': club_id})
+
+                stroke_indexes = list(range(1, 19))
+                self.random.shuffle(stroke_indexes)
+                course_holes = []
+                for number, par in enumerate(HOLE_PARS, start=1):
+                    hole_id = self._next_id('holes')
+                    hole = {'id': hole_id, 'course_id': course_id, 'hole_number': number,
+                            'par': par, 'stroke_index': stroke_indexes[number - 1]}
+                    holes.append(hole)
+                    course_holes.append(hole)
+
+                course_tee_sets = []
+                difficulty = self.random.uniform(-1.5, 1.5)
+                for name, rating_offset, slope, length_factor in TEE_SETS:
+                    tee_set_id = self._next_id('tee_sets')
+                    tee_set = {
+                        'id': tee_set_id, 'name': name, 'course_id': course_id,
+                        'course_rating': round(72 + rating_offset + difficulty, 1),
+                        'slope_rating': slope + round(difficulty * 4),
+                        'women_course_rating': round(72 + rating_offset + difficulty + 3.5, 1),
+                        'women_slope_rating': slope + round(difficulty * 4) + 6
+                    }
+                    tee_sets.append(tee_set)
+                    course_tee_sets.append(tee_set)
+                    for hole in course_holes:
+                        low, high = HOLE_LENGTHS[hole['par']]
+                        positions.append({'id': self._next_id('tee_positions'), 'hole_id': hole['id'],
+                                          'tee_set_id': tee_set_id,
+                                          'length': int(self.random.randint(low, high) * length_factor)})
+                self.courses.append((course_id, club_id, course_holes, course_tee_sets))
+
+        self._insert('clubs', clubs)
+        self._insert('courses', courses)
+        self._insert('holes', holes)
+        self._insert('tee_sets', tee_sets)
+        self._insert('tee_positions', positions)
+        # Default tee set is the yellow one
+        from app.models import Course
+        for course_id, _, _, course_tee_sets in self.courses:
+            self.db.session.execute(
+                self.db.update(Course).where(Course.id == course_id).values(default_tee_set_id=course_tee_sets[1]['id'])
+            )
+
+    def _generate_players(self, first_id, count):
+        """Users with a home course, a handicap history and rounds with scores"""
+        users, handicaps, rounds, scores = [], [], [], []
+        history_start = self.today - timedelta(days=365 * self.args.years)
+        for user_id in range(first_id, first_id + count):
+            self.ids['users'] = user_id
+            sex = 'F' if self.random.random() < 0.3 else 'M'
+            user = self._user_row(user_id, self.random.choice(FIRST_NAMES), self.random.choice(LAST_NAMES), sex=sex)
+            home = self.random.choice(self.courses)
+            user['home_club_id'] = home[1]
+            users.append(user)
+
+            # Ability drifts over the years; handicap records follow it
+            ability = max(self.random.gauss(20, 9), 0)
+            n_rounds = self._round_count()
+            dates = sorted(history_start + timedelta(days=self.random.randint(0, 365 * self.args.years))
+                           for _ in range(n_rounds))
+            current = round(ability + self.random.uniform(-2, 2), 1)
+            handicap = self._handicap_row(user_id, current, history_start - timedelta(days=30), 'initial')
+            handicaps.append(handicap)
+
+            for number, played in enumerate(dates):
+                if number and number % 5 == 0:
+                    # New index every five rounds
+                    ability = max(ability + self.random.gauss(-0.2, 1.2), 0)
+                    new_value = min(round(ability, 1), 54.0)
+                    if new_value != current and played > handicap['start_date']:
+                        handicap['end_date'] = played - timedelta(days=1)
+                        current = new_value
+                        handicap = self._handicap_row(user_id, current, played, 'Synthetic WHS update')
+                        handicaps.append(handicap)
+
+                course_id, _, course_holes, course_tee_sets = home if self.random.random() < 0.6 \
+                    else self.random.choice(self.courses)
+                tee_set = self.random.choice(course_tee_sets[1:] if sex == 'F' else course_tee_sets[:3])
+                rounds_row, round_scores = self._round(user_id, sex, ability, current, played,
+                                                       course_id, course_holes, tee_set)
+                rounds.append(rounds_row)
+                scores.extend(round_scores)
+
+        self._insert('users', users)
+        self._insert('handicaps', handicaps)
+        self._insert('rounds', rounds)
+        self._insert('scores', scores)
+
+    def _round(self, user_id, sex, ability, handicap_used, played, course_id, holes, tee_set):
+        """One round with its scores; most rounds are complete 18-hole rounds"""
+        female = sex == 'F'
+        course_rating = tee_set['women_course_rating'] if female else tee_set['course_rating']
+        slope_rating = tee_set['women_slope_rating'] if female else tee_set['slope_rating']
+        course_handicap = round(handicap_used * slope_rating / 113)
+        round_id = self._next_id('rounds')
+
+        played_holes = holes if self.random.random() < 0.95 else holes[:self.random.randint(1, 17)]
+        scores = []
+        for hole in played_holes:
+            # Extra strokes concentrate on the hardest holes
+            expected = ability * (1.4 - hole['stroke_index'] / 30) / 18
+            strokes = max(1, min(hole['par'] + round(self.random.gauss(expected, 0.9)), hole['par'] + 5))
+            scores.append({
+                'id': self._next_id('scores'), 'round_id': round_id, 'hole_id': hole['id'], 'strokes': strokes,
+                'points': self.stableford_points(strokes, hole['par'], hole['stroke_index'], course_handicap)
+            })
+
+        complete = len(scores) == 18
+        total_score = sum(score['strokes'] for score in scores)
+        created = datetime.combine(played, datetime.min.time()) + timedelta(hours=self.random.randint(8, 18))
+        return {
+            'id': round_id, 'user_id': user_id, 'course_id': course_id, 'tee_set_id': tee_set['id'],
+            'date_played': played, 'handicap_used': handicap_used, 'course_handicap': course_handicap,
+            'course_rating': course_rating, 'slope_rating': slope_rating,
+            'total_score': total_score, 'total_points': sum(score['points'] for score in scores),
+            'differential': round((total_score - course_rating) * 113 / slope_rating, 1) if complete else None,
+            'holes_played': len(scores), 'expected_holes': 18, 'is_complete': complete,
+            'created_at': created, 'updated_at': created
+        }, scores
+
+    def _round_count(self):
+        """Rounds for one player: skewed so a few players play a lot"""
+        mean = self.args.rounds_per_user
+        return int(self.random.expovariate(1 / mean) + 0.5) if mean > 0 else 0
+
+    def _user_row(self, user_id, first_name, last_name, sex='M', is_admin=False, email=None):
+        city, country = self.random.choice(CITIES)
+        return {
+            'id': user_id, 'email': email or USER_EMAIL.format(user_id), 'password_hash': self.password_hash,
+            'first_name': first_name, 'last_name': last_name, 'sex': sex,
+            'is_active': True, 'is_admin': is_admin, 'distance_unit': 'meters',
+            'timezone': 'Europe/Oslo', 'city': city, 'country': country,
+            'created_at': datetime.utcnow(), 'updated_at': datetime.utcnow()
+        }
+
+    def _handicap_row(self, user_id, value, start_date, reason):
+        return {
+            'id': self._next_id('handicaps'), 'user_id': user_id, 'created_by_id': self.admin_id,
+            'handicap_value': value, 'start_date': start_date, 'end_date': None, 'reason': reason
+        }
+
+    def _next_id(self, table):
+        self.ids[table] += 1
+        return self.ids[table]
+
+    def _max_id(self, table):
+        return self.db.session.execute(self.db.text(f'SELECT COALESCE(MAX(id), 0) FROM {table}')).scalar()
+
+    def _insert(self, table, rows):
+        """Bulk insert rows in executemany batches"""
+        if not rows:
+            return
+        statement = self.db.metadata.tables[table].insert()
+        for start in range(0, len(rows), 10000):
+            self.db.session.execute(statement, rows[start:start + 10000])
+        self.counts[table] = self.counts.get(table, 0) + len(rows)
+
+    def _reset_sequences(self):
+        """Move PostgreSQL id sequences past the explicitly inserted ids"""
+        if self.db.engine.dialect.name != 'postgresql':
+            return
+        for table in self.ids:
+            self.db.session.execute(self.db.text(
+                f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), COALESCE(MAX(id), 1)) FROM {table}"
+            ))
+        self.db.session.commit()
+
+
+def main():
+    args = parse_args()
+    if args.database_url:
+        os.environ['DEV_DATABASE_URL'] = args.database_url
+
+    from app import create_app
+    from app.extensions import db
+
+    app = create_app('development')
+    with app.app_context():
+        if args.reset:
+            print("🗑️  Dropping and recreating tables...")
+            db.drop_all()
+            db.create_all()
+
+        print(f"🌱 Generating {args.clubs} clubs, {args.users} users, ~{int(args.users * args.rounds_per_user)} rounds "
+              f"over {args.years} years (seed {args.seed})")
+        started = time.perf_counter()
+        counts = DataGenerator(db, args).run()
+        elapsed = time.perf_counter() - started
+
+        print(f"\n✅ Done in {elapsed:.1f}s")
+        for table, count in counts.items():
+            print(f"   {table:15} {count:>12,}")
+        print(f"\n🔑 Users: {USER_EMAIL.format('<id>')} / admin: {ADMIN_EMAIL}, password: {args.password}")
+
+
+if __name__ == '__main__':
+    main()
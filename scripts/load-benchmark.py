@@ -0,0 +1,422 @@
+#!/usr/bin/env python3
+"""
+Load Benchmark Script
+
+Drives the main /api/v1 endpoints concurrently with a weighted request mix
+played by many logged-in users, then reports p50/p95/p99 latency and
+throughput per endpoint. Results are written as JSON so runs can be
+compared with --compare.
+
+Expects a database filled by generate-data.py (its users and password).
+Uses only the standard library, so it runs anywhere the backend runs.
+
+Usage (from the repository root):
+    # Against a running server
+    python scripts/load-benchmark.py --url http://127.0.0.1:5000 --concurrency 16 --duration 30
+
+    # Start the app in-process on a local database
+    python scripts/load-benchmark.py --serve --database-url sqlite:///rgs_bench.db
+
+    # Compare against an earlier run
+    python scripts/load-benchmark.py --serve --database-url sqlite:///rgs_bench.db \\
+        --compare benchmark-results/load-20240501-120000.json
+"""
+import argparse
+import http.client
+import json
+import logging
+import os
+import platform
+import random
+import subprocess
+import sys
+import threading
+import time
+from datetime import date, datetime, timedelta
+from urllib.parse import urlsplit
+
+# Add the backend directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend'))
+
+ADMIN_EMAIL = 'admin@rgs.bench'
+DEFAULT_PASSWORD = 'BenchPass123!'
+API = '/api/v1'
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Concurrent load benchmark for the RGS API')
+    parser.add_argument('--url', default='http://127.0.0.1:5000', help='Base URL of a running server')
+    parser.add_argument('--serve', action='store_true', help='Start the app in-process instead of using --url')
+    parser.add_argument('--database-url', help='Database for --serve (default: DEV_DATABASE_URL)')
+    parser.add_argument('--concurrency', type=int, default=16, help='Concurrent clients')
+    parser.add_argument('--duration', type=float, default=30, help='Measured seconds')
+    parser.add_argument('--warmup', type=float, default=3, help='Unmeasured seconds before measuring')
+    parser.add_argument('--players', type=int, default=50, help='Users to log in and play the mix as')
+    parser.add_argument('--password', default=DEFAULT_PASSWORD, help='Password of the generated users')
+    parser.add_argument('--only', help='Comma-separated scenario names to run (default: all reads)')
+    parser.add_argument('--writes', action='store_true', help='Include round submission in the mix')
+    parser.add_argument('--label', help='Free-text label stored with the results')
+    parser.add_argument('--output', help='Results file (default: benchmark-results/load-<timestamp>.json)')
+    parser.add_argument('--compare', help='Earlier results file to compare against')
+    parser.add_argument('--seed', type=int, default=42)
+    return parser.parse_args()
+
+
+class Client:
+    """Keep-alive HTTP client for one worker thread that records every request"""
+
+    def __init__(self, base_url, recorder):
+        parts = urlsplit(base_url)
+        self.host = parts.hostname
+        self.port = parts.port or (443 if parts.scheme == 'https' else 80)
+        self.https = parts.scheme == 'https'
+        self.recorder = recorder
+        self.connection = None
+
+    def request(self, name, method, path, token=None, body=None):
+        """
+        Send a request and record its latency under `name`.
+
+        Returns:
+            Tuple of (status, parsed JSON body or None)
+        """
+        headers = {'Accept': 'application/json'}
+        if token:
+            headers['Authorization'] = f'Bearer {token}'
+        payload = None
+        if body is not None:
+            payload = json.dumps(body)
+            headers['Content-Type'] = 'application/json'
+
+        start = time.perf_counter()
+        try:
+            if self.connection is None:
+                connection_class = http.client.HTTPSConnection if self.https else http.client.HTTPConnection
+                self.connection = connection_class(self.host, self.port, timeout=60)
+            self.connection.request(method, path, body=payload, headers=headers)
+            response = self.connection.getresponse()
+            raw = response.read()
+            status = response.status
+        except (OSError, http.client.HTTPException):
+            self.close()
+            status, raw = 0, b''
+        elapsed = (time.perf_counter() - start) * 1000
+
+        if self.recorder is not None:
+            self.recorder(name, status, elapsed)
+        try:
+            return status, json.loads(raw) if raw else None
+        except ValueError:
+            return status, None
+
+    def close(self):
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+
+# Scenarios: name -> (weight, function(client, player, rng)); reads by default
+def _rounds_list(client, player, rng):
+    client.request('rounds:list', 'GET', f"{API}/rounds/user/{player['id']}?limit=20", player['token'])
+
+
+def _rounds_detail(client, player, rng):
+    if player['round_ids']:
+        round_id = rng.choice(player['round_ids'])
+        client.request('rounds:detail', 'GET', f'{API}/rounds/{round_id}?include_scores=true', player['token'])
+
+
+def _rounds_stats(client, player, rng):
+    client.request('rounds:stats', 'GET', f"{API}/rounds/user/{player['id']}/stats", player['token'])
+
+
+def _scores_by_round(client, player, rng):
+    if player['round_ids']:
+        round_id = rng.choice(player['round_ids'])
+        client.request('scores:round', 'GET', f'{API}/scores/round/{round_id}', player['token'])
+
+
+def _user_statistics(client, player, rng):
+    client.request('users:statistics', 'GET', f"{API}/users/{player['id']}/statistics", player['token'])
+
+
+def _user_profile(client, player, rng):
+    client.request('users:profile', 'GET', f'{API}/users/profile', player['token'])
+
+
+def _auth_me(client, player, rng):
+    client.request('auth:me', 'GET', f'{API}/auth/me', player['token'])
+
+
+def _handicap_current(client, player, rng):
+    client.request('handicaps:current', 'GET', f'{API}/handicaps/my-handicaps/current', player['token'])
+
+
+def _handicap_history(client, player, rng):
+    client.request('handicaps:history', 'GET', f'{API}/handicaps/my-handicaps', player['token'])
+
+
+def _clubs_list(client, player, rng):
+    client.request('clubs:list', 'GET', f'{API}/clubs?limit=20', player['token'])
+
+
+def _courses_list(client, player, rng):
+    client.request('courses:list', 'GET', f'{API}/courses?limit=20', player['token'])
+
+
+def _course_detail(client, player, rng):
+    course = rng.choice(player['courses'])
+    client.request('courses:detail', 'GET', f"{API}/courses/{course['id']}?full_details=true", player['token'])
+
+
+def _users_list(client, player, rng):
+    client.request('users:list', 'GET', f'{API}/users/?limit=20', player['admin_token'])
+
+
+def _round_submit(client, player, rng):
+    """Create a round, post all 18 scores in bulk and finalize it"""
+    course = rng.choice([c for c in player['courses'] if c['tee_set_ids']])
+    status, body = client.request('rounds:create', 'POST', f'{API}/rounds', player['token'], {
+        'user_id': player['id'],
+        'course_id': course['id'],
+        'tee_set_id': rng.choice(course['tee_set_ids']),
+        'date_played': (date.today() - timedelta(days=rng.randint(0, 30))).isoformat()
+    })
+    if status != 201 or not body:
+        return
+    round_id = body['data']['id']
+    client.request('scores:bulk', 'POST', f'{API}/scores/bulk', player['token'], {
+        'round_id': round_id,
+        'hole_scores': [{'hole_number': n, 'strokes': rng.randint(3, 7)} for n in range(1, 19)]
+    })
+    client.request('rounds:finalize', 'POST', f'{API}/rounds/{round_id}/finalize', player['token'])
+
+
+READ_SCENARIOS = {
+    'rounds:list': (20, _rounds_list),
+    'rounds:detail': (15, _rounds_detail),
+    'rounds:stats': (5, _rounds_stats),
+    'scores:round': (5, _scores_by_round),
+    'users:statistics': (5, _user_statistics),
+    'users:profile': (10, _user_profile),
+    'auth:me': (10, _auth_me),
+    'handicaps:current': (10, _handicap_current),
+    'handicaps:history': (5, _handicap_history),
+    'clubs:list': (5, _clubs_list),
+    'courses:list': (5, _courses_list),
+    'courses:detail': (5, _course_detail),
+    'users:list': (2, _users_list),
+}
+WRITE_SCENARIOS = {
+    'rounds:submit': (3, _round_submit),
+}
+
+
+def start_server(database_url):
+    """Serve the app from a background thread; returns its base URL"""
+    if database_url:
+        os.environ['DEV_DATABASE_URL'] = database_url
+    from werkzeug.serving import make_server
+    from app import create_app
+
+    logging.getLogger('werkzeug').setLevel(logging.ERROR)
+    app = create_app('development')
+    app.config['DEBUG'] = False
+    server = make_server('127.0.0.1', 0, app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f'http://127.0.0.1:{server.server_port}'
+
+
+def login(client, email, password):
+    status, body = client.request('auth:login', 'POST', f'{API}/auth/login', body={'email': email, 'password': password})
+    if status != 200:
+        raise SystemExit(f"❌ Login failed for {email} ({status}); run generate-data.py first")
+    return body['access_token'], body['user']
+
+
+def prepare_players(base_url, args, rng):
+    """Log in a sample of generated users and discover their rounds and the course catalog"""
+    client = Client(base_url, None)
+    admin_token, _ = login(client, ADMIN_EMAIL, args.password)
+
+    user_ids, cursor = [], None
+    while len(user_ids) < args.players * 4:
+        path = f'{API}/users/?limit=100' + (f'&cursor={cursor}' if cursor else '')
+        _, body = client.request('setup', 'GET', path, admin_token)
+        user_ids.extend(u['id'] for u in body['data']['users'] if not u['is_admin'])
+        cursor = body['data']['meta'].get('next_cursor')
+        if not cursor:
+            break
+    if not user_ids:
+        raise SystemExit("❌ No users found; run generate-data.py first")
+
+    _, body = client.request('setup', 'GET', f'{API}/courses?limit=100', admin_token)
+    courses = [{'id': course['id'], 'tee_set_ids': []} for course in body['data']]
+    if args.writes:
+        for course in courses:
+            _, detail = client.request('setup', 'GET', f"{API}/courses/{course['id']}?full_details=true", admin_token)
+            course['tee_set_ids'] = [tee_set['id'] for tee_set in detail['data'].get('tee_sets', [])]
+
+    players = []
+    for user_id in rng.sample(user_ids, min(args.players, len(user_ids))):
+        token, user = login(client, f'player{user_id}@rgs.bench', args.password)
+        _, rounds = client.request('setup', 'GET', f'{API}/rounds/user/{user_id}?limit=50', token)
+        players.append({
+            'id': user['id'],
+            'token': token,
+            'admin_token': admin_token,
+            'round_ids': [r['id'] for r in rounds['data']],
+            'courses': courses
+        })
+    client.close()
+    return players
+
+
+def percentile(sorted_values, fraction):
+    """Linear-interpolated percentile of pre-sorted values"""
+    if not sorted_values:
+        return None
+    position = (len(sorted_values) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def summarize(samples, duration):
+    """Latency percentiles and throughput for a list of (status, ms) samples"""
+    latencies = sorted(ms for _, ms in samples)
+    errors = sum(1 for status, _ in samples if status == 0 or status >= 400)
+    return {
+        'requests': len(samples),
+        'errors': errors,
+        'throughput_rps': round(len(samples) / duration, 2),
+        'mean_ms': round(sum(latencies) / len(latencies), 3) if latencies else None,
+        'p50_ms': round(percentile(latencies, 0.50), 3) if latencies else None,
+        'p95_ms': round(percentile(latencies, 0.95), 3) if latencies else None,
+        'p99_ms': round(percentile(latencies, 0.99), 3) if latencies else None,
+        'max_ms': round(latencies[-1], 3) if latencies else None,
+    }
+
+
+def run_load(base_url, players, scenarios, args):
+    """Run the weighted mix from `concurrency` threads; returns samples per endpoint"""
+    names = list(scenarios)
+    weights = [scenarios[name][0] for name in names]
+    samples = {}
+    lock = threading.Lock()
+    measure_from = time.perf_counter() + args.warmup
+    stop_at = measure_from + args.duration
+
+    def worker(number):
+        rng = random.Random(args.seed + number)
+        local = {}
+
+        def record(name, status, elapsed):
+            if time.perf_counter() >= measure_from:
+                local.setdefault(name, []).append((status, elapsed))
+
+        client = Client(base_url, record)
+        while time.perf_counter() < stop_at:
+            name = rng.choices(names, weights)[0]
+            scenarios[name][1](client, rng.choice(players), rng)
+        client.close()
+        with lock:
+            for name, values in local.items():
+                samples.setdefault(name, []).extend(values)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(args.concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return samples
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_report(results, previous=None):
+    """Print the per-endpoint table, with deltas against an earlier run"""
+    header = f"{'endpoint':20} {'reqs':>7} {'err':>5} {'rps':>8} {'p50':>9} {'p95':>9} {'p99':>9} {'max':>9}"
+    if previous:
+        header += f" {'Δp95':>8} {'Δrps':>8}"
+    print(header)
+    print('-' * len(header))
+
+    rows = sorted(results['endpoints'].items()) + [('TOTAL', results['overall'])]
+    for name, stats in rows:
+        line = (f"{name:20} {stats['requests']:>7} {stats['errors']:>5} {stats['throughput_rps']:>8.1f} "
+                f"{stats['p50_ms']:>9.2f} {stats['p95_ms']:>9.2f} {stats['p99_ms']:>9.2f} {stats['max_ms']:>9.2f}")
+        if previous:
+            before = previous['overall'] if name == 'TOTAL' else previous['endpoints'].get(name)
+            if before and before.get('p95_ms'):
+                line += f" {(stats['p95_ms'] / before['p95_ms'] - 1) * 100:>+7.1f}%"
+                line += f" {(stats['throughput_rps'] / before['throughput_rps'] - 1) * 100:>+7.1f}%"
+        print(line)
+
+
+def main():
+    args = parse_args()
+    rng = random.Random(args.seed)
+
+    scenarios = dict(READ_SCENARIOS)
+    if args.writes:
+        scenarios.update(WRITE_SCENARIOS)
+    if args.only:
+        wanted = {name.strip() for name in args.only.split(',')}
+        unknown = wanted - set(READ_SCENARIOS) - set(WRITE_SCENARIOS)
+        if unknown:
+            raise SystemExit(f"❌ Unknown scenario(s): {', '.join(sorted(unknown))}")
+        scenarios = {name: scenario for name, scenario in {**READ_SCENARIOS, **WRITE_SCENARIOS}.items()
+                     if name in wanted}
+
+    base_url = start_server(args.database_url) if args.serve else args.url.rstrip('/')
+    print(f"🔐 Logging in {args.players} players at {base_url}...")
+    players = prepare_players(base_url, args, rng)
+
+    print(f"🚀 {args.concurrency} clients, {args.warmup:g}s warmup + {args.duration:g}s measured, "
+          f"{len(scenarios)} scenarios")
+    started_at = datetime.utcnow()
+    samples = run_load(base_url, players, scenarios, args)
+
+    results = {
+        'meta': {
+            'label': args.label,
+            'started_at': started_at.isoformat() + 'Z',
+            'url': None if args.serve else base_url,
+            'served_in_process': args.serve,
+            'database': args.database_url if args.serve else None,
+            'concurrency': args.concurrency,
+            'duration_s': args.duration,
+            'warmup_s': args.warmup,
+            'players': len(players),
+            'scenarios': {name: scenario[0] for name, scenario in scenarios.items()},
+            'git_commit': git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+        },
+        'overall': summarize([s for values in samples.values() for s in values], args.duration),
+        'endpoints': {name: summarize(values, args.duration) for name, values in samples.items()},
+    }
+
+    previous = None
+    if args.compare:
+        with open(args.compare) as f:
+            previous = json.load(f)
+
+    print()
+    print_report(results, previous)
+
+    output = args.output or os.path.join('benchmark-results', f"load-{started_at:%Y%m%d-%H%M%S}.json")
+    os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"\n💾 Results saved to {output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Serialization Benchmark Script
+
+Times large round, score and user list payloads through the old path
+(model.to_dict() + Flask's default JSON provider) and the new one (compiled
+serializers from app/serializers.py + FastJSONProvider), with the stdlib
+encoder and, when installed, orjson. Objects are built in memory, so no
+database is needed and only serialization is measured.
+
+Usage (from the repository root):
+    python scripts/serialization-benchmark.py
+    python scripts/serialization-benchmark.py --rows 50000 --repeat 5
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+# Add the backend directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend'))
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Compare to_dict + jsonify with compiled serializers')
+    parser.add_argument('--rows', type=int, default=10000, help='Objects per payload')
+    parser.add_argument('--repeat', type=int, default=7, help='Runs per measurement for the median')
+    return parser.parse_args()
+
+
+def build_payloads(rows):
+    """Transient rounds, scores (with holes) and users (with a current handicap)"""
+    from app.models import Handicap, Hole, Round, Score, User
+
+    now = datetime(2024, 6, 1, 12, 0, 0, 123456)
+    holes = [Hole(id=n, hole_number=n, par=3 + n % 3, stroke_index=n) for n in range(1, 19)]
+    rounds, scores, users = [], [], []
+    for i in range(rows):
+        rounds.append(Round(
+            id=i, date_played=date(2024, 1, 1) + timedelta(days=i % 365), handicap_used=12.4,
+            course_handicap=14, course_rating=72.1, slope_rating=125, total_score=80 + i % 20,
+            total_points=30 + i % 10, differential=9.8, holes_played=18, expected_holes=18,
+            is_complete=True, user_id=i % 500, course_id=1, tee_set_id=1, created_at=now, updated_at=now
+        ))
+        hole = holes[i % 18]
+        scores.append(Score(
+            id=i, strokes=hole.par + i % 4 - 1, points=2, round_id=i // 18, hole_id=hole.id,
+            hole=hole, created_at=now, updated_at=now
+        ))
+        user = User(
+            id=i, email=f'player{i}@bench.test', first_name='Player', last_name=f'{i:06d}', sex='M',
+            is_active=True, is_admin=False, distance_unit='meters', timezone='Europe/Oslo',
+            country='Norway', city='Oslo', address='Golfveien 1', postal_code='0150',
+            created_at=now, updated_at=now, last_login=now
+        )
+        user.current_handicap_record = Handicap(handicap_value=12.4, start_date=date(2024, 1, 1))
+        users.append(user)
+    return {'rounds': rounds, 'scores': scores, 'users': users}
+
+
+def median_ms(function, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    args = parse_args()
+
+    from flask.json.provider import DefaultJSONProvider
+    from app import create_app
+    from app.json_provider import FastJSONProvider, orjson
+    from app.serializers import ROUND, SCORE, USER_SENSITIVE
+
+    app = create_app('testing')
+    baseline = DefaultJSONProvider(app)
+    providers = {'stdlib': FastJSONProvider(app, 'stdlib')}
+    if orjson is not None:
+        providers['orjson'] = FastJSONProvider(app, 'orjson')
+    else:
+        print("ℹ️  orjson is not installed; measuring the stdlib backend only")
+
+    print(f"🏗️  Building {args.rows} rounds, scores and users...")
+    payloads = build_payloads(args.rows)
+    old_paths = {
+        'rounds': lambda objects: [o.to_dict() for o in objects],
+        'scores': lambda objects: [o.to_dict() for o in objects],
+        'users': lambda objects: [o.to_dict(include_sensitive=True) for o in objects],
+    }
+    serializers = {'rounds': ROUND, 'scores': SCORE, 'users': USER_SENSITIVE}
+
+    header = f"{'payload':8} {'to_dict+json':>13}"
+    for name in providers:
+        header += f" {'compiled+' + name:>16} {'speedup':>8}"
+    print(f"\n{header}  (median ms, {args.repeat} runs)")
+
+    with app.test_request_context():
+        for payload, objects in payloads.items():
+            old = median_ms(lambda: baseline.response({'success': True, 'data': old_paths[payload](objects)}),
+                            args.repeat)
+            line = f"{payload:8} {old:>13.1f}"
+            for provider in providers.values():
+                new = median_ms(
+                    lambda: provider.response({'success': True, 'data': serializers[payload].many(objects)}),
+                    args.repeat
+                )
+                line += f" {new:>16.1f} {old / new:>7.2f}x"
+            print(line)
+
+
+if __name__ == '__main__':
+    main()
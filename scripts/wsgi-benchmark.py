@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+WSGI Server Benchmark Script
+
+Runs load-benchmark.py against the Flask development server (`python run.py`)
+and then against gunicorn with gunicorn.conf.py, on the same database and
+request mix, and prints requests/second and latency side by side.
+
+Both servers run as subprocesses on free local ports with the development
+configuration, so the only difference is the server. Expects a database
+filled by generate-data.py.
+
+Usage (from the repository root):
+    python scripts/wsgi-benchmark.py --database-url sqlite:///rgs_bench.db
+
+    # PostgreSQL, threaded workers, 64 clients
+    python scripts/wsgi-benchmark.py --database-url postgresql://localhost/rgs_bench \\
+        --worker-class gthread --threads 4 --concurrency 64 --duration 60
+"""
+import argparse
+import http.client
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.join(SCRIPTS_DIR, '..', 'backend')
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Compare the development server with gunicorn')
+    parser.add_argument('--database-url', required=True, help='Database filled by generate-data.py')
+    parser.add_argument('--workers', type=int, help='Gunicorn workers (default: gunicorn.conf.py sizing)')
+    parser.add_argument('--worker-class', choices=['sync', 'gthread'], default='sync')
+    parser.add_argument('--threads', type=int, help='Threads per gthread worker')
+    parser.add_argument('--concurrency', type=int, default=16, help='Concurrent clients')
+    parser.add_argument('--duration', type=float, default=30, help='Measured seconds per server')
+    parser.add_argument('--only', help='Comma-separated scenario names (default: all reads)')
+    parser.add_argument('--writes', action='store_true', help='Include round submission in the mix')
+    parser.add_argument('--output-dir', default='benchmark-results', help='Where to save both result files')
+    return parser.parse_args()
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def wait_until_healthy(port, process, timeout=30):
+    """Poll /health until the server answers"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise SystemExit(f"❌ Server exited with code {process.returncode}")
+        try:
+            connection = http.client.HTTPConnection('127.0.0.1', port, timeout=1)
+            connection.request('GET', '/health')
+            if connection.getresponse().status == 200:
+                return
+        except OSError:
+            pass
+        time.sleep(0.2)
+    raise SystemExit('❌ Server did not become healthy in time')
+
+
+def start_dev_server(args, port):
+    env = dict(os.environ, FLASK_CONFIG='development', DEV_DATABASE_URL=args.database_url,
+               FLASK_RUN_HOST='127.0.0.1', FLASK_RUN_PORT=str(port), FLASK_DEBUG='false')
+    return subprocess.Popen([sys.executable, 'run.py'], cwd=BACKEND_DIR, env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def start_gunicorn(args, port):
+    env = dict(os.environ, FLASK_CONFIG='development', DEV_DATABASE_URL=args.database_url,
+               GUNICORN_BIND=f'127.0.0.1:{port}', GUNICORN_WORKER_CLASS=args.worker_class,
+               GUNICORN_ACCESS_LOG='', GUNICORN_LOG_LEVEL='warning')
+    if args.workers:
+        env['GUNICORN_WORKERS'] = str(args.workers)
+    if args.threads:
+        env['GUNICORN_THREADS'] = str(args.threads)
+    return subprocess.Popen([sys.executable, '-m', 'gunicorn', '--config', 'gunicorn.conf.py'],
+                            cwd=BACKEND_DIR, env=env)
+
+
+def run_benchmark(name, start, args, output, compare=None):
+    """Start a server, drive load-benchmark.py against it and stop it again"""
+    port = free_port()
+    print(f"\n🟢 {name} on port {port}")
+    process = start(args, port)
+    try:
+        wait_until_healthy(port, process)
+        command = [
+            sys.executable, os.path.join(SCRIPTS_DIR, 'load-benchmark.py'),
+            '--url', f'http://127.0.0.1:{port}', '--concurrency', str(args.concurrency),
+            '--duration', str(args.duration), '--label', name, '--output', output
+        ]
+        if args.only:
+            command += ['--only', args.only]
+        if args.writes:
+            command.append('--writes')
+        if compare:
+            command += ['--compare', compare]
+        subprocess.run(command, check=True)
+    finally:
+        process.send_signal(signal.SIGTERM)
+        try:
+            process.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def main():
+    args = parse_args()
+    stamp = f"{datetime.utcnow():%Y%m%d-%H%M%S}"
+    os.makedirs(args.output_dir, exist_ok=True)
+    dev_output = os.path.join(args.output_dir, f'wsgi-dev-{stamp}.json')
+    gunicorn_output = os.path.join(args.output_dir, f'wsgi-gunicorn-{stamp}.json')
+
+    run_benchmark('dev server', start_dev_server, args, dev_output)
+    run_benchmark(f'gunicorn ({args.worker_class})', start_gunicorn, args, gunicorn_output, compare=dev_output)
+
+    with open(dev_output) as f:
+        dev = json.load(f)['overall']
+    with open(gunicorn_output) as f:
+        gunicorn = json.load(f)['overall']
+
+    print(f"\n{'server':12} {'rps':>9} {'p50':>9} {'p95':>9} {'p99':>9} {'errors':>7}")
+    for name, stats in [('dev server', dev), ('gunicorn', gunicorn)]:
+        print(f"{name:12} {stats['throughput_rps']:>9.1f} {stats['p50_ms']:>9.2f} "
+              f"{stats['p95_ms']:>9.2f} {stats['p99_ms']:>9.2f} {stats['errors']:>7}")
+    if dev['throughput_rps']:
+        print(f"\n🚀 gunicorn serves {gunicorn['throughput_rps'] / dev['throughput_rps']:.2f}x the requests/second")
+
+
+if __name__ == '__main__':
+    main()